@@ -5,9 +5,12 @@ Following the successful pattern established with lightweight-silica-brick.html
 """
 
 import os
-import re
+import sys
 import glob
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'zh', 'scripts'))
+from path_rewriter import PathRewriter
+
 def fix_image_paths():
     # Define the mappings
     high_priority_mappings = {
@@ -49,6 +52,9 @@ def fix_image_paths():
 
     print(f"Found {len(html_files)} HTML files to process")
 
+    # All mappings compiled into one matcher, so each file is scanned once
+    rewriter = PathRewriter({**high_priority_mappings, **pattern_mappings}, prefix="../images/products/")
+
     for file_path in html_files:
         print(f"Processing: {os.path.basename(file_path)}")
 
@@ -56,27 +62,21 @@ def fix_image_paths():
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            original_content = content
-
-            # Apply high priority mappings
-            for old_path, new_path in high_priority_mappings.items():
-                content = content.replace(f"../images/products/{old_path}", f"../images/products/{new_path}")
-
-            # Apply pattern mappings
-            for old_path, new_path in pattern_mappings.items():
-                content = content.replace(f"../images/products/{old_path}", f"../images/products/{new_path}")
+            content, hits = rewriter.rewrite(content)
 
             # Check if any changes were made
-            if content != original_content:
+            if hits:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(content)
-                print(f"  ✓ Updated {os.path.basename(file_path)}")
+                print(f"  ✓ Updated {os.path.basename(file_path)} with {sum(hits.values())} changes")
             else:
                 print(f"  - No changes needed for {os.path.basename(file_path)}")
 
         except Exception as e:
             print(f"  ✗ Error processing {os.path.basename(file_path)}: {e}")
 
+    rewriter.report()
+
 if __name__ == "__main__":
     fix_image_paths()
     print("Image path fixing complete!")
\ No newline at end of file
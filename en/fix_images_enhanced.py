@@ -6,8 +6,12 @@ Handles all subdirectory references and pattern-based mappings
 
 import os
 import re
+import sys
 import glob
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'zh', 'scripts'))
+from path_rewriter import PathRewriter
+
 def fix_remaining_image_paths():
     # Extended mappings for all remaining subdirectory patterns
     extensive_mappings = {
@@ -152,6 +156,9 @@ def fix_remaining_image_paths():
 
     print(f"Enhanced processing of {len(html_files)} HTML files")
 
+    # All mappings compiled into one matcher, so each file is scanned once
+    rewriter = PathRewriter(extensive_mappings, prefix="../images/products/")
+
     total_changes = 0
 
     for file_path in html_files:
@@ -161,16 +168,9 @@ def fix_remaining_image_paths():
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            original_content = content
-            file_changes = 0
-
             # Apply specific mappings first
-            for old_path, new_path in extensive_mappings.items():
-                old_full_path = f"../images/products/{old_path}"
-                new_full_path = f"../images/products/{new_path}"
-                if old_full_path in content:
-                    content = content.replace(old_full_path, new_full_path)
-                    file_changes += content.count(new_full_path) - original_content.count(new_full_path)
+            content, hits = rewriter.rewrite(content)
+            file_changes = sum(hits.values())
 
             # Find any remaining subdirectory references
             remaining_subdirs = subdirectory_pattern.findall(content)
@@ -180,7 +180,7 @@ def fix_remaining_image_paths():
                     print(f"    {subdir}/{filename}")
 
             # Check if any changes were made
-            if content != original_content:
+            if file_changes:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(content)
                 print(f"  ✓ Updated {os.path.basename(file_path)} with {file_changes} changes")
@@ -191,6 +191,7 @@ def fix_remaining_image_paths():
         except Exception as e:
             print(f"  ✗ Error processing {os.path.basename(file_path)}: {e}")
 
+    rewriter.report()
     print(f"\nEnhanced image path fixing complete! Total changes: {total_changes}")
 
 if __name__ == "__main__":
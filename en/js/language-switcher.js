@@ -116,35 +116,70 @@ class LanguageSwitcher {
             }
         }
 
-        // Check if target page exists, fallback to homepage if not
+        // Navigate using the page's hreflang links, fallback to homepage if there is no counterpart
         this.navigateToLanguage(newPath, targetLang, currentSearch, currentHash);
     }
 
     /**
-     * Navigate to target language page, fallback to homepage if page doesn't exist
+     * Path of the target-language page from the hreflang links written into the page at build time
+     * Returns undefined when the page has no hreflang links (not built), null when there is no counterpart
      */
-    navigateToLanguage(newPath, targetLang, search, hash) {
-        const testUrl = window.location.origin + newPath;
-
-        // Use fetch to check if page exists
-        fetch(testUrl, { method: 'HEAD' })
-            .then(response => {
-                let finalUrl;
-                if (response.ok) {
-                    // Page exists, navigate directly
-                    finalUrl = testUrl + search + hash;
-                } else {
-                    // Page doesn't exist, navigate to homepage
-                    const homePath = targetLang === 'zh' ? '/zh/index.html' : '/en/index.html';
-                    finalUrl = window.location.origin + homePath;
-                }
-                window.location.href = finalUrl;
-            })
-            .catch(() => {
-                // Network error or other issues, navigate to homepage
-                const homePath = targetLang === 'zh' ? '/zh/index.html' : '/en/index.html';
-                window.location.href = window.location.origin + homePath;
-            });
+    getAlternatePath(targetLang) {
+        const links = document.querySelectorAll('link[rel="alternate"][hreflang]');
+        if (links.length === 0) {
+            return undefined;
+        }
+        const hreflang = targetLang === 'zh' ? 'zh-CN' : 'en';
+        const link = Array.from(links).find(item => item.getAttribute('hreflang') === hreflang);
+        return link ? new URL(link.href).pathname : null;
+    }
+
+    /**
+     * Look up the page in shared/data/language-alternates.json when it has no hreflang links (not built)
+     * Returns the target-language path, null when there is no counterpart, undefined when the map cannot be read
+     */
+    async lookupAlternatePath(targetLang) {
+        const match = window.location.pathname.match(/^(.*?\/)(zh|en)\/(.*)$/);
+        if (!match) {
+            return null;
+        }
+        const [, root, lang, page] = match;
+        const current = `${lang}/${!page || page.endsWith('/') ? page + 'index.html' : page}`;
+        try {
+            const response = await fetch(`${root}shared/data/language-alternates.json`);
+            if (!response.ok) {
+                return undefined;
+            }
+            const map = await response.json();
+            // Each pair is [Chinese page, English page]
+            const pair = map.pairs.find(item => item.includes(current));
+            return pair ? root + pair[targetLang === 'zh' ? 0 : 1] : null;
+        } catch (error) {
+            return undefined;
+        }
+    }
+
+    /**
+     * Navigate to the target language page, or to that language's homepage when there is none (only unbuilt pages read the alternates map)
+     */
+    async navigateToLanguage(newPath, targetLang, search, hash) {
+        let alternatePath = this.getAlternatePath(targetLang);
+        if (alternatePath === undefined) {
+            alternatePath = await this.lookupAlternatePath(targetLang);
+        }
+        let finalUrl;
+        if (alternatePath === undefined) {
+            // Alternates map unavailable too (e.g. file://), navigate by path mapping
+            finalUrl = window.location.origin + newPath + search + hash;
+        } else if (alternatePath) {
+            // Page exists, navigate directly
+            finalUrl = window.location.origin + alternatePath + search + hash;
+        } else {
+            // Page doesn't exist, navigate to homepage
+            const homePath = targetLang === 'zh' ? '/zh/index.html' : '/en/index.html';
+            finalUrl = window.location.origin + homePath;
+        }
+        window.location.href = finalUrl;
     }
 
     /**
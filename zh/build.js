@@ -2,6 +2,9 @@
 
 /**
  * 网站构建脚本 - 压缩CSS/JS，优化图片，生成生产版本
+ *
+ * 注意：SimpleMinifier 的正则压缩会破坏 <pre>、内联脚本和属性值，
+ * HTML 页面请使用 scripts/html_minifier.py（基于标记流）压缩。
  */
 
 const fs = require('fs');
@@ -72,6 +72,12 @@ const FloatingButtonsLoader = {
      */
     loadHTML() {
         return new Promise(async (resolve, reject) => {
+            // 构建时已由 scripts/site_includes.py 插入组件，无需再请求
+            if (document.querySelector('.floating-buttons-container')) {
+                resolve();
+                return;
+            }
+
             try {
                 const response = await fetch('components/floating-buttons.html?v=2.0');
 
@@ -116,35 +116,70 @@ class LanguageSwitcher {
             }
         }
 
-        // 检查目标页面是否存在，如果不存在则跳转到首页
+        // 按页面中的 hreflang 链接跳转，没有对应页面时跳转到首页
         this.navigateToLanguage(newPath, targetLang, currentSearch, currentHash);
     }
 
     /**
-     * 导航到目标语言页面，如果页面不存在则跳转到首页
+     * 构建时写入页面的 hreflang 链接中目标语言页面的路径
+     * 返回 undefined 表示页面没有 hreflang 链接（未经构建），返回 null 表示没有对应页面
      */
-    navigateToLanguage(newPath, targetLang, search, hash) {
-        const testUrl = window.location.origin + newPath;
-
-        // 使用fetch检查页面是否存在
-        fetch(testUrl, { method: 'HEAD' })
-            .then(response => {
-                let finalUrl;
-                if (response.ok) {
-                    // 页面存在，直接跳转
-                    finalUrl = testUrl + search + hash;
-                } else {
-                    // 页面不存在，跳转到该语言的首页
-                    const homePath = targetLang === 'zh' ? '/zh/index.html' : '/en/index.html';
-                    finalUrl = window.location.origin + homePath;
-                }
-                window.location.href = finalUrl;
-            })
-            .catch(() => {
-                // 网络错误或其他问题，跳转到首页
-                const homePath = targetLang === 'zh' ? '/zh/index.html' : '/en/index.html';
-                window.location.href = window.location.origin + homePath;
-            });
+    getAlternatePath(targetLang) {
+        const links = document.querySelectorAll('link[rel="alternate"][hreflang]');
+        if (links.length === 0) {
+            return undefined;
+        }
+        const hreflang = targetLang === 'zh' ? 'zh-CN' : 'en';
+        const link = Array.from(links).find(item => item.getAttribute('hreflang') === hreflang);
+        return link ? new URL(link.href).pathname : null;
+    }
+
+    /**
+     * 未经构建的页面没有 hreflang 链接时，查询构建生成的对照表 shared/data/language-alternates.json
+     * 返回目标语言页面的路径，没有对应页面时返回 null，对照表无法读取时返回 undefined
+     */
+    async lookupAlternatePath(targetLang) {
+        const match = window.location.pathname.match(/^(.*?\/)(zh|en)\/(.*)$/);
+        if (!match) {
+            return null;
+        }
+        const [, root, lang, page] = match;
+        const current = `${lang}/${!page || page.endsWith('/') ? page + 'index.html' : page}`;
+        try {
+            const response = await fetch(`${root}shared/data/language-alternates.json`);
+            if (!response.ok) {
+                return undefined;
+            }
+            const map = await response.json();
+            // 每一对为 [中文页面, 英文页面]
+            const pair = map.pairs.find(item => item.includes(current));
+            return pair ? root + pair[targetLang === 'zh' ? 0 : 1] : null;
+        } catch (error) {
+            return undefined;
+        }
+    }
+
+    /**
+     * 导航到目标语言页面，没有对应页面时跳转到该语言的首页（只有未经构建的页面才会读取对照表）
+     */
+    async navigateToLanguage(newPath, targetLang, search, hash) {
+        let alternatePath = this.getAlternatePath(targetLang);
+        if (alternatePath === undefined) {
+            alternatePath = await this.lookupAlternatePath(targetLang);
+        }
+        let finalUrl;
+        if (alternatePath === undefined) {
+            // 对照表也无法读取（如 file://），按路径对应关系直接跳转
+            finalUrl = window.location.origin + newPath + search + hash;
+        } else if (alternatePath) {
+            // 页面存在，直接跳转
+            finalUrl = window.location.origin + alternatePath + search + hash;
+        } else {
+            // 页面不存在，跳转到该语言的首页
+            const homePath = targetLang === 'zh' ? '/zh/index.html' : '/en/index.html';
+            finalUrl = window.location.origin + homePath;
+        }
+        window.location.href = finalUrl;
     }
 
     /**
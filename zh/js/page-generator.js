@@ -1,6 +1,7 @@
 /**
  * 产品页面批量生成器
  * 基于标准模板和产品数据库安全地生成所有产品页面
+ * 构建时生成请使用 scripts/generate_product_pages.py（模板位于 templates/），本文件仅供批量修复页面预览
  */
 
 class PageGenerator {
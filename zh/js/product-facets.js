@@ -0,0 +1,130 @@
+/**
+ * 产品分面索引 - 基于构建时生成的位图做多条件筛选和分面计数
+ * 索引由 scripts/facet_index.py 生成：每个分面取值对应一个按产品位置编号的 32 位整数位图。
+ * 同一分面内多选取并集，不同分面之间取交集；某个取值的计数为"除本分面外的筛选结果 ∩ 取值位图"的位数。
+ */
+
+(function() {
+    'use strict';
+
+    function getIndexPath() {
+        const currentPath = window.location.pathname;
+        if (currentPath.includes('/products/') || currentPath.includes('\\products\\')) {
+            return '../data/facet-index.json';
+        }
+        return 'data/facet-index.json';
+    }
+
+    /**
+     * 32 位整数中置位的个数
+     */
+    function popcount(word) {
+        word = word - ((word >>> 1) & 0x55555555);
+        word = (word & 0x33333333) + ((word >>> 2) & 0x33333333);
+        return (((word + (word >>> 4)) & 0x0F0F0F0F) * 0x01010101) >>> 24;
+    }
+
+    class ProductFacetIndex {
+        constructor() {
+            this.count = 0;
+            this.words = 0;
+            this.positions = new Map();
+            this.facets = [];
+            this.loaded = false;
+            this.ready = this.load();
+        }
+
+        /**
+         * 加载索引；失败时保持未加载状态，调用方只按分类筛选
+         */
+        async load() {
+            try {
+                const response = await fetch(getIndexPath());
+                if (!response.ok) {
+                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                }
+                const index = await response.json();
+                this.count = index.count;
+                this.words = Math.ceil(index.count / 32);
+                this.positions = new Map(index.ids.map((id, position) => [id, position]));
+                this.facets = index.facets.map(facet => ({
+                    key: facet.key,
+                    label: facet.label,
+                    values: facet.values.map(value => ({
+                        value: value.value,
+                        label: value.label,
+                        bits: Uint32Array.from(value.bits)
+                    }))
+                }));
+                this.loaded = true;
+            } catch (error) {
+                console.warn('⚠️ 分面索引加载失败，仅按分类筛选:', error);
+            }
+            return this.loaded;
+        }
+
+        getFacet(key) {
+            return this.facets.find(facet => facet.key === key);
+        }
+
+        /**
+         * 全部产品的位图
+         */
+        all() {
+            const mask = new Uint32Array(this.words).fill(0xFFFFFFFF);
+            const tail = this.count % 32;
+            if (tail) {
+                mask[this.words - 1] = (2 ** tail) - 1;
+            }
+            return mask;
+        }
+
+        /**
+         * 按选择条件计算位图：selections 为 { 分面: Set(取值) }，exclude 为计算时忽略的分面
+         */
+        select(selections, exclude = null) {
+            const mask = this.all();
+            this.facets.forEach(facet => {
+                const selected = selections[facet.key];
+                if (facet.key === exclude || !selected || selected.size === 0) return;
+
+                const union = new Uint32Array(this.words);
+                facet.values.forEach(value => {
+                    if (!selected.has(value.value)) return;
+                    for (let i = 0; i < this.words; i++) union[i] |= value.bits[i];
+                });
+                for (let i = 0; i < this.words; i++) mask[i] &= union[i];
+            });
+            return mask;
+        }
+
+        /**
+         * 各分面取值在当前条件下的产品数：{ 分面: { 取值: 数量 } }
+         */
+        counts(selections) {
+            const result = {};
+            this.facets.forEach(facet => {
+                const base = this.select(selections, facet.key);
+                result[facet.key] = {};
+                facet.values.forEach(value => {
+                    let total = 0;
+                    for (let i = 0; i < this.words; i++) total += popcount(base[i] & value.bits[i]);
+                    result[facet.key][value.value] = total;
+                });
+            });
+            return result;
+        }
+
+        /**
+         * 产品是否在位图中；索引中没有的产品视为不受分面条件限制
+         */
+        has(mask, id) {
+            const position = this.positions.get(id);
+            if (position === undefined) return true;
+            return (mask[position >>> 5] & (1 << (position & 31))) !== 0;
+        }
+    }
+
+    window.ProductFacetIndex = ProductFacetIndex;
+    window.productFacetIndex = new ProductFacetIndex();
+})();
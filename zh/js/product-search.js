@@ -0,0 +1,147 @@
+/**
+ * 产品搜索索引 - 基于构建时生成的倒排索引检索产品
+ * 索引由 scripts/search_index.py 根据 data/products.json、data/products-extracted-data.json
+ * 和 data/product-database.json 生成：
+ * 中文按相邻两字切分（每段末字单独收录），英文和数字按单词切分，词项按字典序排列。
+ * 检索时每个查询词做一次二分查找，所有查询词都命中的产品中，名称或页面名与查询完全一致的排在最前，
+ * 其余按字段权重得分排序返回（与 search_index.py 的 search 一致）。
+ */
+
+(function() {
+    'use strict';
+
+    const CJK_PATTERN = /[㐀-䶿一-鿿豈-﫿]+/g;
+    const WORD_PATTERN = /[a-z0-9]+/g;
+
+    function getIndexPath() {
+        const currentPath = window.location.pathname;
+        if (currentPath.includes('/products/') || currentPath.includes('\\products\\')) {
+            return '../data/search-index.json';
+        }
+        return 'data/search-index.json';
+    }
+
+    /**
+     * NFKC 归一化并转小写（与构建脚本一致：全角字符、Al₂O₃ 下标统一为半角）
+     */
+    function normalize(text) {
+        return (text || '').normalize('NFKC').toLowerCase();
+    }
+
+    /**
+     * 名称或页面名（- 视为空格）与归一化后的查询完全一致
+     */
+    function isExactMatch(doc, text) {
+        const [slug, title] = doc;
+        return normalize(title) === text || slug.replace(/-/g, ' ') === text;
+    }
+
+    class ProductSearchIndex {
+        constructor() {
+            this.docs = [];
+            this.terms = [];
+            this.postings = [];
+            this.loaded = false;
+            this.ready = this.load();
+        }
+
+        /**
+         * 加载索引；失败时保持未加载状态，调用方回退到逐条匹配
+         */
+        async load() {
+            try {
+                const response = await fetch(getIndexPath());
+                if (!response.ok) {
+                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                }
+                const index = await response.json();
+                this.docs = index.docs || [];
+                this.terms = index.terms || [];
+                this.postings = index.postings || [];
+                this.loaded = true;
+            } catch (error) {
+                console.warn('⚠️ 搜索索引加载失败，使用逐条匹配:', error);
+            }
+            return this.loaded;
+        }
+
+        /**
+         * 第一个不小于 term 的词项下标
+         */
+        lowerBound(term) {
+            let low = 0;
+            let high = this.terms.length;
+            while (low < high) {
+                const mid = (low + high) >> 1;
+                if (this.terms[mid] < term) {
+                    low = mid + 1;
+                } else {
+                    high = mid;
+                }
+            }
+            return low;
+        }
+
+        /**
+         * 查找词项，返回 Map(文档序号 => 得分)；prefix 为 true 时合并所有以 term 开头的词项
+         */
+        lookup(term, prefix = false) {
+            const result = new Map();
+            for (let position = this.lowerBound(term); position < this.terms.length; position++) {
+                const current = this.terms[position];
+                if (current !== term && !(prefix && current.startsWith(term))) break;
+
+                const postings = this.postings[position];
+                for (let i = 0; i < postings.length; i += 2) {
+                    result.set(postings[i], Math.max(result.get(postings[i]) || 0, postings[i + 1]));
+                }
+                if (!prefix) break;
+            }
+            return result;
+        }
+
+        /**
+         * 检索产品，返回完全匹配名称在前、其余按得分降序排列的 [{ slug, title, href, category, score, exact }]；
+         * 索引未加载时返回 null
+         */
+        search(query) {
+            if (!this.loaded) return null;
+
+            const text = normalize(query);
+            const groups = [];
+            (text.match(CJK_PATTERN) || []).forEach(run => {
+                if (run.length === 1) {
+                    groups.push(this.lookup(run, true));
+                    return;
+                }
+                for (let i = 0; i < run.length - 1; i++) {
+                    groups.push(this.lookup(run.slice(i, i + 2)));
+                }
+            });
+            const words = text.match(WORD_PATTERN) || [];
+            words.forEach((word, position) => {
+                // 最后一个英文词按前缀匹配，便于边输入边搜索
+                groups.push(this.lookup(word, position === words.length - 1));
+            });
+            if (groups.length === 0) return [];
+
+            let totals = groups[0];
+            for (let i = 1; i < groups.length && totals.size > 0; i++) {
+                const next = new Map();
+                totals.forEach((score, doc) => {
+                    if (groups[i].has(doc)) next.set(doc, score + groups[i].get(doc));
+                });
+                totals = next;
+            }
+
+            const exact = normalize(query.trim().split(/\s+/).join(' '));
+            return Array.from(totals, ([doc, score]) => {
+                const [slug, title, href, category] = this.docs[doc];
+                return { slug, title, href, category, score, exact: isExactMatch(this.docs[doc], exact) };
+            }).sort((a, b) => b.exact - a.exact || b.score - a.score || a.slug.localeCompare(b.slug));
+        }
+    }
+
+    window.ProductSearchIndex = ProductSearchIndex;
+    window.productSearchIndex = new ProductSearchIndex();
+})();
@@ -135,6 +135,9 @@ class ProductsEventManager {
 
     // Filter tabs functionality
     setupFilterTabs() {
+        // 产品中心页面由 products-renderer.js 统一处理分类和分面筛选
+        if (typeof ProductsRenderer !== 'undefined') return;
+
         const filterTabs = this.getCachedElements('.filter-tab');
         const productCards = this.getCachedElements('.product-card');
 
@@ -1,6 +1,8 @@
 /**
- * 产品页面渲染器 - 基于数据驱动的产品展示系统
- * 使用JSON数据动态生成产品卡片，减少HTML重复代码
+ * 产品中心交互 - 在预渲染的产品卡片上绑定筛选、搜索和排序
+ * 产品卡片由构建脚本 scripts/products_grid.py 根据 data/products.json 直接写入页面，
+ * 这里只读取现有 DOM，不再重新生成卡片；搜索优先使用 js/product-search.js 加载的倒排索引，
+ * 分类和多条件筛选使用 js/product-facets.js 加载的分面位图
  */
 
 class ProductsRenderer {
@@ -8,219 +10,301 @@ class ProductsRenderer {
         this.products = [];
         this.currentFilter = 'all';
         this.searchQuery = '';
+        // 搜索索引命中结果：Map(页面名 => 名次)，为 null 时逐条匹配 searchText
+        this.searchRanks = null;
+        // 分面筛选：{ 分面: Set(取值) }，分类由筛选标签单独维护；facetMask 为当前条件下的产品位图
+        this.facetSelections = {};
+        this.facetMask = null;
+        this.currentSort = 'default';
         this.container = null;
         this.init();
     }
 
-    async init() {
+    init() {
         try {
-            await this.loadProducts();
             this.setupContainer();
-            this.renderProducts();
+            this.indexProducts();
+            this.bindControls();
+            this.applyView();
             this.updateStats();
-            console.log('✅ 产品渲染器初始化完成，共加载', this.products.length, '个产品');
+            this.watchSearchIndex();
+            this.watchFacetIndex();
+            console.log('✅ 产品交互初始化完成，共', this.products.length, '个产品');
         } catch (error) {
-            console.error('❌ 产品渲染器初始化失败:', error);
-            this.showError('产品数据加载失败，请刷新页面重试');
+            console.error('❌ 产品交互初始化失败:', error);
         }
     }
 
     /**
-     * 加载产品数据
+     * 设置产品容器
      */
-    async loadProducts() {
-        try {
-            const response = await fetch('data/products.json');
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-            }
-            this.products = await response.json();
-        } catch (error) {
-            console.error('产品数据加载失败:', error);
-            // 如果JSON加载失败，尝试从现有HTML中提取数据（向后兼容）
-            this.extractFromExistingHTML();
+    setupContainer() {
+        this.container = document.getElementById('productsGrid');
+        if (!this.container) {
+            this.container = document.querySelector('.products-grid');
+        }
+
+        if (!this.container) {
+            throw new Error('未找到产品容器元素');
         }
     }
 
     /**
-     * 向后兼容：从现有HTML提取产品数据
+     * 从现有卡片建立索引（只读取一次，筛选和搜索不再访问 DOM 文本）
      */
-    extractFromExistingHTML() {
-        const existingCards = document.querySelectorAll('.product-card');
-        this.products = Array.from(existingCards).map((card, index) => {
-            const title = card.querySelector('.product-title')?.textContent || '';
-            const image = card.querySelector('.product-image img')?.src || '';
-            const alt = card.querySelector('.product-image img')?.alt || title;
-            const category = card.getAttribute('data-category') || 'shaped';
-            const href = card.getAttribute('href') || '#';
-
-            const specs = Array.from(card.querySelectorAll('.spec-item')).map(el => el.textContent);
-            const applications = Array.from(card.querySelectorAll('.app-tag')).map(el => el.textContent);
-            const badges = Array.from(card.querySelectorAll('.product-badge')).map(el => el.textContent);
-            const description = card.querySelector('.hover-desc')?.textContent || '';
+    indexProducts() {
+        const cards = this.container.querySelectorAll('.product-card');
+        this.products = Array.from(cards).map((card, index) => {
+            const title = card.querySelector('.product-title')?.textContent.trim() || '';
+            const description = card.querySelector('.product-description')?.textContent.trim() || '';
+            const specs = Array.from(card.querySelectorAll('.spec-item')).map(el => el.textContent.replace(/\s+/g, ' ').trim());
+            const applications = Array.from(card.querySelectorAll('.app-tag')).map(el => el.textContent.trim());
+
+            const href = card.getAttribute('data-original-href') || card.getAttribute('href') || '#';
 
             return {
-                id: index + 1,
+                id: parseInt(card.getAttribute('data-id'), 10) || index + 1,
+                order: index,
+                slug: href.split('/').pop().replace(/\.html$/, ''),
                 title,
                 description,
-                category,
-                image,
-                alt,
+                category: card.getAttribute('data-category') || 'shaped',
                 href,
                 specs,
                 applications,
-                badges
+                searchText: [title, description, ...specs, ...applications].join('\n').toLowerCase(),
+                element: card
             };
         });
+    }
+
+    /**
+     * 绑定筛选标签、搜索框和排序选择
+     */
+    bindControls() {
+        document.querySelectorAll('.filter-tab[data-category]').forEach(tab => {
+            tab.addEventListener('click', () => {
+                document.querySelectorAll('.filter-tab').forEach(t => t.classList.remove('active'));
+                tab.classList.add('active');
+                this.setFilter(tab.dataset.category);
+            });
+        });
+
+        const searchInput = document.getElementById('productSearch');
+        if (searchInput) {
+            let timer = null;
+            searchInput.addEventListener('input', () => {
+                clearTimeout(timer);
+                timer = setTimeout(() => this.setSearch(searchInput.value.trim()), 150);
+            });
+        }
+
+        const clearButton = document.getElementById('clearSearch');
+        if (clearButton && searchInput) {
+            clearButton.addEventListener('click', () => {
+                searchInput.value = '';
+                this.setSearch('');
+            });
+        }
 
-        console.log('从现有HTML提取了', this.products.length, '个产品');
+        const sortSelect = document.getElementById('productSort');
+        if (sortSelect) {
+            sortSelect.addEventListener('change', () => this.setSort(sortSelect.value));
+        }
     }
 
     /**
-     * 设置渲染容器
+     * 判断产品是否满足当前筛选和搜索条件
      */
-    setupContainer() {
-        this.container = document.getElementById('productsGrid');
-        if (!this.container) {
-            this.container = document.querySelector('.products-grid');
+    matches(product) {
+        if (this.facetMask) {
+            if (!window.productFacetIndex.has(this.facetMask, product.slug)) {
+                return false;
+            }
+        } else if (this.currentFilter !== 'all' && product.category !== this.currentFilter) {
+            return false;
         }
+        if (!this.searchQuery) {
+            return true;
+        }
+        if (this.searchRanks) {
+            return this.searchRanks.has(product.slug);
+        }
+        return product.searchText.includes(this.searchQuery);
+    }
 
-        if (!this.container) {
-            throw new Error('未找到产品容器元素');
+    /**
+     * 按当前排序方式返回产品列表
+     */
+    getSortedProducts() {
+        const sorted = [...this.products];
+        switch (this.currentSort) {
+            case 'name':
+                sorted.sort((a, b) => a.title.localeCompare(b.title, 'zh-CN'));
+                break;
+            case 'category':
+                sorted.sort((a, b) => a.category.localeCompare(b.category) || a.order - b.order);
+                break;
+            default:
+                if (this.searchQuery && this.searchRanks) {
+                    // 搜索时默认按索引返回的相关度顺序（完全匹配名称的在前）
+                    const rank = product => this.searchRanks.get(product.slug) ?? this.searchRanks.size;
+                    sorted.sort((a, b) => rank(a) - rank(b) || a.order - b.order);
+                } else {
+                    sorted.sort((a, b) => a.order - b.order);
+                }
         }
+        return sorted;
     }
 
     /**
-     * 渲染所有产品
+     * 应用筛选、搜索和排序：只切换类名并移动已有节点
      */
-    renderProducts() {
+    applyView() {
         if (!this.container) return;
 
-        // 清空现有内容
-        this.container.innerHTML = '';
-
-        // 过滤产品
-        const filteredProducts = this.getFilteredProducts();
+        const facetIndex = window.productFacetIndex;
+        const selections = this.getFacetSelections();
+        this.facetMask = facetIndex && facetIndex.loaded ? facetIndex.select(selections) : null;
 
-        // 渲染产品卡片
+        let visibleCount = 0;
         const fragment = document.createDocumentFragment();
-        filteredProducts.forEach(product => {
-            const cardElement = this.createProductCard(product);
-            fragment.appendChild(cardElement);
+        this.getSortedProducts().forEach(product => {
+            const visible = this.matches(product);
+            product.element.classList.toggle('product-hidden', !visible);
+            if (visible) visibleCount++;
+            fragment.appendChild(product.element);
         });
-
         this.container.appendChild(fragment);
 
-        // 更新显示统计
-        this.updateDisplayStats(filteredProducts.length);
+        const noResults = document.getElementById('noResults');
+        if (noResults) {
+            noResults.style.display = visibleCount === 0 ? '' : 'none';
+        }
+
+        this.updateDisplayStats(visibleCount);
+        if (this.facetMask) {
+            this.updateFacetCounts(selections);
+        }
     }
 
     /**
-     * 创建产品卡片元素
+     * 当前分面条件（含分类标签）
      */
-    createProductCard(product) {
-        const card = document.createElement('a');
-        card.href = product.href;
-        card.className = 'product-card';
-        card.setAttribute('data-category', product.category);
-        card.setAttribute('data-id', product.id);
-
-        // 生成徽章HTML
-        const badgesHTML = product.badges.map(badge =>
-            `<span class="product-badge ${this.getBadgeClass(badge)}">${badge}</span>`
-        ).join('');
-
-        // 生成规格HTML
-        const specsHTML = product.specs.map(spec =>
-            `<span class="spec-item">${spec}</span>`
-        ).join('');
-
-        // 生成应用标签HTML
-        const appsHTML = product.applications.map(app =>
-            `<span class="app-tag">${app}</span>`
-        ).join('');
-
-        card.innerHTML = `
-            <div class="product-badges">
-                ${badgesHTML}
-            </div>
-            <div class="product-image">
-                <img src="${product.image}"
-                     alt="${product.alt}"
-                     loading="lazy"
-                     width="280"
-                     height="200"
-                     onerror="this.onerror=null; this.src='images/placeholder-product.jpg';">
-            </div>
-            <div class="product-content">
-                <h3 class="product-title">${product.title}</h3>
-                <div class="product-specs">
-                    ${specsHTML}
-                    <div class="product-applications">
-                        ${appsHTML}
-                    </div>
-                </div>
-            </div>
-            <div class="product-hover-overlay">
-                <div class="hover-content">
-                    <h4 class="hover-title">${product.title}</h4>
-                    <p class="hover-desc">${product.description}</p>
-                    <div class="action-buttons">
-                        <span class="btn-inquiry">
-                            <i class="fas fa-comments"></i>立即询价
-                        </span>
-                        <span class="btn-details">了解详情</span>
-                    </div>
-                </div>
-            </div>
-        `;
-
-        return card;
+    getFacetSelections() {
+        const selections = { ...this.facetSelections };
+        if (this.currentFilter !== 'all') {
+            selections.category = new Set([this.currentFilter]);
+        }
+        return selections;
     }
 
     /**
-     * 根据徽章文本获取CSS类名
+     * 分面索引加载完成后生成筛选按钮并重新应用视图
      */
-    getBadgeClass(badgeText) {
-        const badgeMap = {
-            '热门产品': 'badge-hot',
-            '新品上市': 'badge-new',
-            '高端选择': 'badge-premium',
-            '经典产品': 'badge-classic',
-            '久经考验': 'badge-reliable',
-            '绿色材料': 'badge-eco',
-            '品质保证': 'badge-premium',
-            '环保首选': 'badge-eco',
-            '工业标准': 'badge-industrial',
-            '节能首选': 'badge-energy'
-        };
+    watchFacetIndex() {
+        const index = window.productFacetIndex;
+        if (!index) return;
+        index.ready.then(loaded => {
+            if (!loaded) return;
+            this.renderFacetControls();
+            this.applyView();
+        });
+    }
 
-        return badgeMap[badgeText] || 'badge-default';
+    /**
+     * 在 #productFacets 中生成除分类外各分面的筛选按钮
+     */
+    renderFacetControls() {
+        const panel = document.getElementById('productFacets');
+        if (!panel) return;
+
+        const groups = window.productFacetIndex.facets
+            .filter(facet => facet.key !== 'category' && facet.values.length > 0)
+            .map(facet => {
+                const chips = facet.values.map(value => `
+                    <button type="button" class="facet-chip" data-facet="${facet.key}" data-value="${value.value}">
+                        <span class="facet-text">${value.label}</span>
+                        <span class="facet-count"></span>
+                    </button>`).join('');
+                return `
+                <div class="facet-group" data-facet-group="${facet.key}">
+                    <span class="facet-label">${facet.label}</span>
+                    <div class="facet-chips">${chips}</div>
+                </div>`;
+            });
+        panel.innerHTML = groups.join('') + '<button type="button" class="facet-clear" hidden>清除筛选</button>';
+
+        panel.querySelectorAll('.facet-chip').forEach(chip => {
+            chip.addEventListener('click', () => this.toggleFacet(chip.dataset.facet, chip.dataset.value));
+        });
+        panel.querySelector('.facet-clear').addEventListener('click', () => this.clearFacets());
     }
 
     /**
-     * 获取过滤后的产品列表
+     * 切换分面取值
      */
-    getFilteredProducts() {
-        let filtered = [...this.products];
+    toggleFacet(facet, value) {
+        const selected = this.facetSelections[facet] || new Set();
+        if (selected.has(value)) {
+            selected.delete(value);
+        } else {
+            selected.add(value);
+        }
+        this.facetSelections[facet] = selected;
+        this.applyView();
+    }
 
-        // 分类过滤
-        if (this.currentFilter !== 'all') {
-            filtered = filtered.filter(product => product.category === this.currentFilter);
+    /**
+     * 清除分面条件（保留分类标签）
+     */
+    clearFacets() {
+        this.facetSelections = {};
+        this.applyView();
+    }
+
+    /**
+     * 更新分面按钮和分类标签上的计数
+     */
+    updateFacetCounts(selections) {
+        const counts = window.productFacetIndex.counts(selections);
+        let hasSelection = false;
+
+        document.querySelectorAll('#productFacets .facet-chip').forEach(chip => {
+            const count = counts[chip.dataset.facet]?.[chip.dataset.value] || 0;
+            const active = this.facetSelections[chip.dataset.facet]?.has(chip.dataset.value) || false;
+            hasSelection = hasSelection || active;
+            chip.classList.toggle('active', active);
+            chip.classList.toggle('facet-empty', count === 0 && !active);
+            chip.querySelector('.facet-count').textContent = count;
+        });
+
+        const clearButton = document.querySelector('#productFacets .facet-clear');
+        if (clearButton) {
+            clearButton.hidden = !hasSelection;
         }
 
-        // 搜索过滤
-        if (this.searchQuery) {
-            const query = this.searchQuery.toLowerCase();
-            filtered = filtered.filter(product => {
-                return product.title.toLowerCase().includes(query) ||
-                       product.description.toLowerCase().includes(query) ||
-                       product.specs.some(spec => spec.toLowerCase().includes(query)) ||
-                       product.applications.some(app => app.toLowerCase().includes(query));
-            });
+        // 分类标签显示在其他分面条件下各分类的产品数
+        const categoryCounts = counts.category || {};
+        let total = 0;
+        Object.entries(categoryCounts).forEach(([category, count]) => {
+            total += count;
+            const element = document.querySelector(`[data-stat="${category}"]`);
+            if (element) {
+                element.textContent = count;
+            }
+        });
+        const totalElement = document.querySelector('[data-stat="total"]');
+        if (totalElement) {
+            totalElement.textContent = total;
         }
+    }
 
-        return filtered;
+    /**
+     * 获取过滤后的产品列表
+     */
+    getFilteredProducts() {
+        return this.getSortedProducts().filter(product => this.matches(product));
     }
 
     /**
@@ -228,15 +312,39 @@ class ProductsRenderer {
      */
     setFilter(category) {
         this.currentFilter = category;
-        this.renderProducts();
+        this.applyView();
     }
 
     /**
      * 设置搜索查询
      */
     setSearch(query) {
-        this.searchQuery = query;
-        this.renderProducts();
+        this.searchQuery = query.toLowerCase();
+        const index = window.productSearchIndex;
+        const ranked = this.searchQuery && index ? index.search(this.searchQuery) : null;
+        this.searchRanks = ranked ? new Map(ranked.map((result, rank) => [result.slug, rank])) : null;
+        this.applyView();
+    }
+
+    /**
+     * 搜索索引加载完成后，按索引重新执行加载前已输入的搜索
+     */
+    watchSearchIndex() {
+        const index = window.productSearchIndex;
+        if (!index || index.loaded) return;
+        index.ready.then(loaded => {
+            if (loaded && this.searchQuery) {
+                this.setSearch(this.searchQuery);
+            }
+        });
+    }
+
+    /**
+     * 设置排序方式：default（页面顺序）、name、category
+     */
+    setSort(sortKey) {
+        this.currentSort = sortKey;
+        this.applyView();
     }
 
     /**
@@ -287,29 +395,11 @@ class ProductsRenderer {
         return stats;
     }
 
-    /**
-     * 显示错误信息
-     */
-    showError(message) {
-        if (this.container) {
-            this.container.innerHTML = `
-                <div class="products-error">
-                    <div class="error-icon">
-                        <i class="fas fa-exclamation-triangle"></i>
-                    </div>
-                    <h3>加载失败</h3>
-                    <p>${message}</p>
-                    <button onclick="location.reload()" class="btn btn-primary">重新加载</button>
-                </div>
-            `;
-        }
-    }
-
     /**
      * 获取产品详情（供其他组件使用）
      */
     getProduct(id) {
-        return this.products.find(product => product.id === parseInt(id));
+        return this.products.find(product => product.id === parseInt(id, 10));
     }
 
     /**
@@ -321,10 +411,10 @@ class ProductsRenderer {
     }
 
     /**
-     * 重新渲染（供外部调用）
+     * 重新应用当前视图（供外部调用）
      */
     refresh() {
-        this.renderProducts();
+        this.applyView();
     }
 }
 
@@ -342,4 +432,4 @@ document.addEventListener('DOMContentLoaded', function() {
 // 导出供ES6模块使用
 if (typeof module !== 'undefined' && module.exports) {
     module.exports = ProductsRenderer;
-}
\ No newline at end of file
+}
@@ -7,6 +7,7 @@
     'use strict';
 
     // Footer HTML模板 - 完全按照截图文字内容
+    // 构建时 scripts/site_includes.py 也从这里读取页脚，直接插入页面
     const FOOTER_HTML = `
     <footer class="ydk-footer">
         <div class="ydk-footer-container">
@@ -86,6 +87,18 @@
         }
 
         render() {
+            // 构建后的页面已由 scripts/site_includes.py 插入页脚，只需绑定交互；
+            // 直接访问未构建的源文件时才用内联模板渲染
+            if (!document.querySelector('.ydk-footer')) {
+                this.insertFooterHTML();
+            }
+
+            // 缓存DOM元素
+            this.footer = document.querySelector('.ydk-footer');
+            this.newsletterForm = document.getElementById('ydkNewsletterForm');
+        }
+
+        insertFooterHTML() {
             // 查找插入位置
             let footerContainer = document.getElementById('footer-container');
 
@@ -96,10 +109,6 @@
             }
 
             footerContainer.innerHTML = FOOTER_HTML;
-
-            // 缓存DOM元素
-            this.footer = document.querySelector('.ydk-footer');
-            this.newsletterForm = document.getElementById('ydkNewsletterForm');
         }
 
         updateCopyright() {
@@ -400,32 +400,70 @@ class YDKLanguageSwitcher {
         return origin + langPrefix + subDir + fileName;
     }
 
+    /**
+     * 页面中 hreflang 链接给出的目标语言页面路径
+     * 返回 undefined 表示页面没有 hreflang 链接（未经构建），返回 null 表示没有对应页面
+     */
+    getAlternatePath(targetLang) {
+        const links = document.querySelectorAll('link[rel="alternate"][hreflang]');
+        if (links.length === 0) {
+            return undefined;
+        }
+        const hreflang = targetLang === 'zh' ? 'zh-CN' : 'en';
+        const link = Array.from(links).find(item => item.getAttribute('hreflang') === hreflang);
+        return link ? new URL(link.href).pathname : null;
+    }
+
+    /**
+     * 未经构建的页面没有 hreflang 链接时，查询构建生成的对照表 shared/data/language-alternates.json
+     * 返回目标语言页面的路径，没有对应页面时返回 null，对照表无法读取时返回 undefined
+     */
+    async lookupAlternatePath(targetLang) {
+        const match = window.location.pathname.match(/^(.*?\/)(zh|en)\/(.*)$/);
+        if (!match) {
+            return null;
+        }
+        const [, root, lang, page] = match;
+        const current = `${lang}/${!page || page.endsWith('/') ? page + 'index.html' : page}`;
+        try {
+            const response = await fetch(`${root}shared/data/language-alternates.json`);
+            if (!response.ok) {
+                return undefined;
+            }
+            const map = await response.json();
+            // 每一对为 [中文页面, 英文页面]
+            const pair = map.pairs.find(item => item.includes(current));
+            return pair ? root + pair[targetLang === 'zh' ? 0 : 1] : null;
+        } catch (error) {
+            return undefined;
+        }
+    }
+
     /**
      * 导航到目标URL
      */
-    navigateTo(url, targetLang) {
-        // 本地文件直接跳转(不做HEAD检查)
+    async navigateTo(url, targetLang) {
+        // 本地文件直接跳转
         if (url.startsWith('file://')) {
             window.location.href = url;
             return;
         }
 
-        // HTTP(S)协议才做HEAD检查
-        fetch(url, { method: 'HEAD' })
-            .then(response => {
-                if (response.ok) {
-                    window.location.href = url;
-                } else {
-                    // 页面不存在，跳转到首页
-                    const homepage = window.location.origin +
-                        (targetLang === 'zh' ? '/zh/index.html' : '/en/index.html');
-                    window.location.href = homepage;
-                }
-            })
-            .catch((error) => {
-                // 网络错误或其他问题，直接尝试跳转
-                window.location.href = url;
-            });
+        // 按构建时写入页面的 hreflang 链接跳转，未经构建的页面查询对照表，不再发起 HEAD 请求
+        let alternatePath = this.getAlternatePath(targetLang);
+        if (alternatePath === undefined) {
+            alternatePath = await this.lookupAlternatePath(targetLang);
+        }
+        if (alternatePath === undefined) {
+            // 对照表无法读取，按路径对应关系直接跳转
+            window.location.href = url;
+        } else if (alternatePath) {
+            window.location.href = window.location.origin + alternatePath;
+        } else {
+            // 页面不存在，跳转到首页
+            window.location.href = window.location.origin +
+                (targetLang === 'zh' ? '/zh/index.html' : '/en/index.html');
+        }
     }
 }
 
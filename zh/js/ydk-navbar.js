@@ -44,6 +44,8 @@
     }
 
     // Navbar HTML模板 - 完全按照截图
+    // 构建后的页面已由 scripts/site_includes.py 按 data/navigation-config.json 插入导航栏，
+    // 此模板仅在直接访问未构建的源文件时使用
     const NAVBAR_HTML = `
     <nav class="ydk-navbar">
         <div class="ydk-navbar-container">
@@ -102,14 +104,17 @@
         }
 
         render() {
-            // 查找插入位置
-            const existingHeader = document.querySelector('header');
-            const targetElement = existingHeader || document.body;
-
-            if (existingHeader) {
-                existingHeader.innerHTML = NAVBAR_HTML;
-            } else {
-                targetElement.insertAdjacentHTML('afterbegin', NAVBAR_HTML);
+            // 构建时已插入导航栏，只需绑定交互
+            if (!document.querySelector('.ydk-navbar')) {
+                // 查找插入位置
+                const existingHeader = document.querySelector('header');
+                const targetElement = existingHeader || document.body;
+
+                if (existingHeader) {
+                    existingHeader.innerHTML = NAVBAR_HTML;
+                } else {
+                    targetElement.insertAdjacentHTML('afterbegin', NAVBAR_HTML);
+                }
             }
 
             // 缓存DOM元素
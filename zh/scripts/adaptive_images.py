@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+自适应图片映射生成
+根据 data/adaptive-images.json 的候选图片配置和 images/products 目录中实际存在的图片，
+在构建时为每个产品确定唯一使用的图片，生成 js/adaptive-images.js（模板 templates/adaptive-images.js）。
+页面直接使用生成的地址，不再在浏览器里逐张探测候选图片。
+
+候选顺序：配置的主图 → 图片目录中该产品自己的编号图片（<id>-N.png）→ 配置的备选图片 → 配置的兜底图片。
+配置中的产品全部候选都不存在时映射为 null（页面显示无图占位）；配置之外只要图片目录中有编号图片的产品也会加入映射。
+"""
+
+import os
+import sys
+import json
+import argparse
+
+from build_common import SITE_ROOT, ZH_DIR, atomic_write_text, load_json
+from generate_product_pages import IMAGES_DIR, product_images
+from html_minifier import minify_js
+from template_engine import load_template
+
+CONFIG_FILE = 'zh/data/adaptive-images.json'
+TEMPLATE_FILE = 'zh/templates/adaptive-images.js'
+OUTPUT_FILE = 'zh/js/adaptive-images.js'
+# 页面位于 zh/products/，图片地址相对页面
+IMAGE_URL_PREFIX = '../images/products/'
+DEFAULT_KEY = 'default'
+BANNER = '/* 自适应产品图片展示系统 - 由 scripts/adaptive_images.py 根据 data/adaptive-images.json 和图片目录生成，请勿直接修改 */\n'
+
+def candidates(config, own_images=()):
+    """按优先级排列的候选文件名（去重）"""
+    ordered = [config.get('primary')] + list(own_images) + list(config.get('alternatives') or []) + [config.get('fallback')]
+    return list(dict.fromkeys(name for name in ordered if name))
+
+def resolve_image_map(src_root=SITE_ROOT):
+    """返回 ({产品ID: 图片地址或 None}, 默认图片地址或 None)"""
+    config = load_json(os.path.join(src_root, CONFIG_FILE), default={})
+    images_dir = os.path.join(src_root, IMAGES_DIR)
+    available = set(os.listdir(images_dir)) if os.path.isdir(images_dir) else set()
+    catalogue = product_images(src_root)
+
+    def winner(names):
+        found = next((name for name in names if name in available), None)
+        return IMAGE_URL_PREFIX + found if found else None
+
+    products = dict(config.get('products', {}))
+    default_config = products.pop(DEFAULT_KEY, {})
+    image_map = {
+        product_id: winner(candidates(product_config, catalogue.get(product_id, ())))
+        for product_id, product_config in products.items()
+    }
+    for product_id, names in sorted(catalogue.items()):
+        if product_id not in image_map:
+            image_map[product_id] = winner(names)
+    default_image = winner(candidates(default_config) + list(config.get('fallbackImages') or []))
+    return dict(sorted(image_map.items())), default_image
+
+def render_script(image_map, default_image, src_root=SITE_ROOT):
+    script = load_template(os.path.join(src_root, TEMPLATE_FILE)).render({
+        'image_map': json.dumps(image_map, ensure_ascii=False, separators=(',', ':')),
+        'default_image': json.dumps(default_image, ensure_ascii=False)
+    })
+    return BANNER + minify_js(script) + '\n'
+
+# ---------------------------------------------------------------------------
+# 依赖图集成
+# ---------------------------------------------------------------------------
+
+def build_adaptive_images(node, src_root, out_root):
+    """依赖图动作：生成自适应图片脚本"""
+    image_map, default_image = resolve_image_map(src_root)
+    atomic_write_text(os.path.join(out_root, node.outputs[0]), render_script(image_map, default_image, src_root))
+
+def add_adaptive_images_node(graph):
+    """依赖图扩展：以配置、模板和图片目录中的全部文件为输入，图片增删时重新生成"""
+    from build_graph import BuildNode
+
+    if not os.path.exists(os.path.join(graph.src_root, CONFIG_FILE)):
+        return
+    images_dir = os.path.join(graph.src_root, IMAGES_DIR)
+    images = sorted(os.listdir(images_dir)) if os.path.isdir(images_dir) else []
+    graph.add_node(BuildNode('adaptive-images', 'generate', 'adaptive_images:build_adaptive_images',
+                             inputs=[('file', CONFIG_FILE), ('file', TEMPLATE_FILE)] +
+                                    [('file', f'{IMAGES_DIR}/{name}') for name in images],
+                             outputs=[OUTPUT_FILE]))
+
+def main():
+    parser = argparse.ArgumentParser(description='生成自适应产品图片映射脚本')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=os.path.join(ZH_DIR, 'js', 'adaptive-images.js'),
+                        help='输出脚本（默认 zh/js/adaptive-images.js）')
+    args = parser.parse_args()
+
+    src_root = os.path.abspath(args.src)
+    if not os.path.exists(os.path.join(src_root, CONFIG_FILE)):
+        print(f"❌ 找不到图片配置: {CONFIG_FILE}")
+        sys.exit(1)
+
+    print("🖼️  开始解析产品图片...")
+    image_map, default_image = resolve_image_map(src_root)
+    script = render_script(image_map, default_image, src_root)
+    atomic_write_text(args.out, script)
+
+    missing = sorted(product_id for product_id, path in image_map.items() if path is None)
+    print(f"\n✅ 有图片的产品: {len(image_map) - len(missing)} 个")
+    if missing:
+        print(f"⚠️  没有可用图片: {len(missing)} 个")
+        for product_id in missing:
+            print(f"   - {product_id}")
+    print(f"🖼️  默认图片: {default_image or '无'}")
+    print(f"📦 脚本大小: {len(script.encode('utf-8')):,} 字节")
+    print(f"📄 已保存到: {args.out}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+静态资源指纹化工具
+作为依赖图扩展（add_fingerprint_stage）在页面节点之后执行：由源文件复制或压缩得到的 CSS、JS、图片、JSON
+和运行时请求的 components/*.html 多输出一份 name.<hash>.ext，页面和文本资源节点在构建时改写指向这些资源的引用
+（HTML、CSS url() 和 JS 字符串），同时去掉 ?v= 查询参数；asset-manifest.json 由单独的节点生成。
+原文件名的输出照常保留，未能改写的引用（如运行时拼接的路径）仍然有效。
+指纹化后的资源可以使用一年期 immutable 缓存，不再需要手工维护 ?v= 查询参数。
+"""
+
+import os
+import re
+import argparse
+from collections import defaultdict
+from datetime import datetime
+from urllib.parse import unquote
+
+from build_common import SITE_ROOT, iter_site_files, bytes_digest, file_digest, save_json
+
+HASH_LENGTH = 10
+MANIFEST_NAME = 'asset-manifest.json'
+CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# 需要指纹化的资源类型
+ASSET_EXTENSIONS = {
+    '.css', '.js', '.json',
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.svg', '.ico'
+}
+# 需要改写内部引用的文本类型
+TEXT_EXTENSIONS = {'.html', '.htm', '.css', '.js', '.json'}
+# 浏览器或托管平台按固定名称请求的文件，不能重命名
+FIXED_NAMES = {'favicon.ico', MANIFEST_NAME}
+# 运行时按路径请求的 HTML 组件目录
+COMPONENT_DIR = 'components'
+
+# 匹配形如 path/to/name.ext?query 的资源引用
+REFERENCE_PATTERN = re.compile(
+    r'(?<![^\s"\'`()<>,;=|{}\\])'
+    r'(?P<path>[^\s"\'`()<>,;=|{}\\]+\.(?:css|js|json|png|jpe?g|gif|webp|avif|svg|ico))'
+    r'(?![\w.-])'
+    r'(?P<query>\?[^\s"\'`()<>#]*)?',
+    re.IGNORECASE
+)
+# 匹配 components/name.html?query 形式的组件引用
+COMPONENT_REFERENCE_PATTERN = re.compile(
+    r'(?<![^\s"\'`()<>,;=|{}\\])'
+    r'(?P<path>[^\s"\'`()<>,;=|{}\\]*' + COMPONENT_DIR + r'/[^\s"\'`()<>,;=|{}\\?#]+\.html)'
+    r'(?![\w.-])'
+    r'(?P<query>\?[^\s"\'`()<>#]*)?',
+    re.IGNORECASE
+)
+
+def iter_references(text):
+    """按出现顺序返回资源和组件引用的匹配"""
+    matches = list(REFERENCE_PATTERN.finditer(text)) + list(COMPONENT_REFERENCE_PATTERN.finditer(text))
+    return sorted(matches, key=lambda match: match.start())
+
+def is_asset(rel_path):
+    """判断站点文件是否参与指纹化"""
+    name = os.path.basename(rel_path)
+    ext = os.path.splitext(name)[1].lower()
+    if ext == '.html':
+        return f'/{COMPONENT_DIR}/' in '/' + rel_path
+    return ext in ASSET_EXTENSIONS and name not in FIXED_NAMES
+
+def hashed_name(name, digest):
+    """在扩展名前插入摘要：core-base.css -> core-base.<hash>.css"""
+    stem, ext = os.path.splitext(name)
+    return f'{stem}.{digest[:HASH_LENGTH]}{ext}'
+
+def strip_relative_prefix(path):
+    """去掉开头的 ./ 和 ../，得到用于后缀匹配的路径"""
+    parts = [p for p in path.split('/') if p not in ('', '.', '..')]
+    return '/'.join(parts)
+
+def hashed_path(written_path, digest):
+    """只替换路径中的文件名部分"""
+    directory, _, name = written_path.rpartition('/')
+    new_name = hashed_name(name, digest)
+    return f'{directory}/{new_name}' if directory else new_name
+
+def rewrite_references(text, fingerprints):
+    """按 {原写法: 指纹化写法} 改写文本中的引用，并去掉原有的查询参数"""
+    if not fingerprints:
+        return text
+    parts = []
+    last_end = 0
+    for match in iter_references(text):
+        new_path = fingerprints.get(match.group('path'))
+        if new_path is None or match.start() < last_end:
+            continue
+        parts.append(text[last_end:match.start()])
+        parts.append(new_path)
+        last_end = match.end()
+    parts.append(text[last_end:])
+    return ''.join(parts)
+
+class AssetFingerprinter:
+    """计算资源指纹
+
+    assets 为参与指纹化的站点文件（默认全部资源和组件）；digest 为二进制文件的摘要函数，
+    依赖图中传入 DigestCache.digest，未改动的大图片不必每次重新计算。
+    """
+
+    def __init__(self, src_root=SITE_ROOT, assets=None, digest=file_digest):
+        self.src_root = src_root
+        if assets is None:
+            assets = {path for path in iter_site_files(src_root) if is_asset(path)}
+        self.assets = set(assets)
+        self.digest = digest
+        self.manifest = {}
+        self.digests = {}
+        self.fingerprints = {}
+        self.visiting = set()
+        self.stats = defaultdict(int)
+        self.unresolved = defaultdict(int)
+
+        # 按文件名建立索引，JS 中的相对路径只能通过后缀匹配解析
+        self.assets_by_name = defaultdict(list)
+        for path in self.assets:
+            self.assets_by_name[os.path.basename(path).lower()].append(path)
+
+    def resolve(self, written_path, referrer):
+        """把引用解析为站点内的资源路径，解析不到或存在歧义时返回 None"""
+        if '://' in written_path or written_path.startswith(('//', 'data:')):
+            return None
+
+        decoded = unquote(written_path)
+
+        # 1. 按引用文件所在目录（或站点根目录）精确解析
+        if decoded.startswith('/'):
+            candidate = os.path.normpath(decoded.lstrip('/'))
+        else:
+            candidate = os.path.normpath(os.path.join(os.path.dirname(referrer), decoded))
+        candidate = candidate.replace(os.sep, '/')
+        if candidate in self.assets:
+            return candidate
+
+        # 2. 后缀匹配：JS 字符串相对于页面而非脚本本身解析
+        suffix = strip_relative_prefix(decoded).lower()
+        if not suffix:
+            return None
+        matches = [
+            path for path in self.assets_by_name.get(os.path.basename(suffix), [])
+            if path.lower() == suffix or path.lower().endswith('/' + suffix)
+        ]
+        if not matches:
+            return None
+
+        # 优先同一语言目录下的资源
+        top_dir = referrer.split('/', 1)[0]
+        local = [path for path in matches if path.split('/', 1)[0] == top_dir]
+        if local:
+            matches = local
+        if len(matches) == 1:
+            return matches[0]
+
+        # 多个候选只有在内容完全一致时才能安全改写
+        digests = {self.fingerprint(path) for path in matches}
+        return sorted(matches)[0] if len(digests) == 1 else None
+
+    def references(self, rel_path):
+        """文本文件中可改写的引用：{原写法: 指纹化写法}"""
+        if rel_path in self.fingerprints:
+            return self.fingerprints[rel_path]
+        fingerprints = {}
+        for match in iter_references(self.read_text(rel_path)):
+            written_path = match.group('path')
+            target = self.resolve(written_path, rel_path)
+            if target is None:
+                self.unresolved[written_path] += 1
+                continue
+            if target == rel_path:
+                continue
+            fingerprints[written_path] = hashed_path(written_path, self.fingerprint(target))
+            self.stats['references'] += 1
+        self.fingerprints[rel_path] = fingerprints
+        return fingerprints
+
+    def read_text(self, rel_path):
+        with open(os.path.join(self.src_root, rel_path), 'r', encoding='utf-8',
+                  errors='surrogateescape') as f:
+            return f.read()
+
+    def fingerprint(self, rel_path):
+        """计算资源的最终摘要；文本资源先改写其依赖再按改写后的内容计算"""
+        if rel_path in self.digests:
+            return self.digests[rel_path]
+
+        ext = os.path.splitext(rel_path)[1].lower()
+        if ext not in TEXT_EXTENSIONS or rel_path in self.visiting:
+            # 二进制资源或循环引用：直接按源文件内容计算
+            digest = self.digest(os.path.join(self.src_root, rel_path))
+        else:
+            self.visiting.add(rel_path)
+            try:
+                fingerprints = self.references(rel_path)
+            finally:
+                self.visiting.discard(rel_path)
+            content = rewrite_references(self.read_text(rel_path), fingerprints)
+            digest = bytes_digest(content.encode('utf-8', errors='surrogateescape'))
+
+        if rel_path in self.digests:
+            # 循环引用时内层已经得出结果，保持一致
+            return self.digests[rel_path]
+        self.digests[rel_path] = digest
+        self.manifest[rel_path] = hashed_path(rel_path, digest)
+        return digest
+
+    def fingerprint_all(self):
+        """计算全部资源的指纹，返回 {原路径: 指纹路径}"""
+        for rel_path in sorted(self.assets):
+            self.fingerprint(rel_path)
+            self.stats['assets'] += 1
+        return self.manifest
+
+def manifest_data(manifest):
+    return {
+        'generated': datetime.now().isoformat(),
+        'algorithm': 'sha256',
+        'hash_length': HASH_LENGTH,
+        'cache_control': CACHE_CONTROL,
+        'assets': dict(sorted(manifest.items()))
+    }
+
+# ---------------------------------------------------------------------------
+# 依赖图集成
+# ---------------------------------------------------------------------------
+
+def build_manifest(node, src_root, out_root):
+    """依赖图动作：写入 asset-manifest.json"""
+    save_json(os.path.join(out_root, node.outputs[0]), manifest_data(node.params['assets']))
+
+def add_fingerprint_stage(graph):
+    """依赖图扩展：为源文件资源增加指纹化输出，并给引用它们的节点登记改写表
+
+    只处理内容直接来自同名源文件的节点（asset: 和 page: 节点）；生成的输出（搜索索引、产品数据库脚本等）
+    内容在构建时才确定，保留原文件名。改写表写入节点参数，引用的资源变化时引用方随之重建。
+    """
+    from build_graph import BuildNode, DigestCache
+
+    sources = {}
+    for node in graph.nodes.values():
+        if node.stage in ('minify', 'copy', 'page') and node.node_id.endswith(':' + node.outputs[0]):
+            sources[node.outputs[0]] = node
+
+    digests = DigestCache()
+    fingerprinter = AssetFingerprinter(graph.src_root, {path for path in sources if is_asset(path)},
+                                       digest=digests.digest)
+    manifest = fingerprinter.fingerprint_all()
+    digests.save()
+
+    for rel_path, node in sources.items():
+        if os.path.splitext(rel_path)[1].lower() in TEXT_EXTENSIONS:
+            fingerprints = fingerprinter.references(rel_path)
+            if fingerprints:
+                node.params['fingerprints'] = fingerprints
+        if rel_path in manifest:
+            node.outputs.append(manifest[rel_path])
+            graph.output_owner[manifest[rel_path]] = node.node_id
+
+    graph.add_node(BuildNode('asset-manifest', 'generate', 'asset_fingerprint:build_manifest',
+                             inputs=[], outputs=[MANIFEST_NAME], params={'assets': manifest}))
+
+def main():
+    parser = argparse.ArgumentParser(description='查看静态资源指纹（写入由构建依赖图完成）')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--manifest', default=None, help='把资源清单另存到该路径')
+    parser.add_argument('--unresolved', action='store_true', help='列出未解析的资源引用')
+    args = parser.parse_args()
+
+    src_root = os.path.abspath(args.src)
+    print("🔖 开始计算静态资源指纹...")
+    fingerprinter = AssetFingerprinter(src_root)
+    manifest = fingerprinter.fingerprint_all()
+    for rel_path in iter_site_files(src_root):
+        if rel_path not in fingerprinter.assets and os.path.splitext(rel_path)[1].lower() in TEXT_EXTENSIONS:
+            fingerprinter.references(rel_path)
+    stats = fingerprinter.stats
+
+    print(f"\n✅ 指纹化资源: {stats['assets']} 个")
+    print(f"🔗 可改写引用: {stats['references']} 处")
+    if fingerprinter.unresolved:
+        print(f"⚠️  未解析的资源引用: {len(fingerprinter.unresolved)} 种（可能是失效链接）")
+        if args.unresolved:
+            for written_path, count in sorted(fingerprinter.unresolved.items()):
+                print(f"   {count:>4}  {written_path}")
+    if args.manifest:
+        save_json(args.manifest, manifest_data(manifest))
+        print(f"\n📄 资源清单已保存到: {args.manifest}")
+    print("🏗️  构建时由 build_graph.py 写入指纹化资源和 asset-manifest.json")
+    print(f"🗄️  指纹化资源可使用缓存策略: Cache-Control: {CACHE_CONTROL}")
+
+if __name__ == '__main__':
+    main()
@@ -7,10 +7,27 @@
 
 import os
 import re
+import sys
 import json
-from bs4 import BeautifulSoup
+import argparse
+
+from page_rewriter import token_edit, rewrite_pages, add_dry_run_argument, RewriteError, print_rewrite_error
+
+FIX_LABELS = {
+    'single_image_carousel': '单图片轮播',
+    'unclosed_img_tags': 'img标签',
+    'quote_function': '报价功能',
+    'placeholder_product': '占位符配置'
+}
+
+# onclick 中的询价调用：openInquiryModal('产品ID')
+QUOTE_CALL_PATTERN = re.compile(r'openInquiryModal\(([\'"])([^\'"]*)\1')
 
 def main():
+    parser = argparse.ArgumentParser(description='根据审计报告批量修复产品页面问题')
+    add_dry_run_argument(parser)
+    args = parser.parse_args()
+
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     products_dir = os.path.join(base_dir, 'products')
     audit_report_path = os.path.join(base_dir, 'audit-report.json')
@@ -32,59 +49,59 @@ def main():
         'failed_fixes': []
     }
 
-    # 1. 修复"单图片不应启用轮播"问题
-    single_image_products = find_single_image_carousel_issues(results)
-    if single_image_products:
-        print(f"\n🎯 修复单图片轮播问题 ({len(single_image_products)}个产品)")
-        for product_id in single_image_products:
-            if fix_single_image_carousel(product_id, products_dir):
-                fix_results['single_image_carousel_fix'].append(product_id)
-                print(f"   ✅ {product_id}: 单图片轮播修复成功")
-            else:
-                fix_results['failed_fixes'].append((product_id, 'single_image_carousel'))
-                print(f"   ❌ {product_id}: 单图片轮播修复失败")
-
-    # 2. 修复未闭合img标签问题
-    unclosed_img_products = find_unclosed_img_issues(results)
-    if unclosed_img_products:
-        print(f"\n🔧 修复未闭合img标签问题 ({len(unclosed_img_products)}个产品)")
-        for product_id in unclosed_img_products:
-            if fix_unclosed_img_tags(product_id, products_dir):
-                fix_results['unclosed_img_tags_fix'].append(product_id)
-                print(f"   ✅ {product_id}: img标签修复成功")
+    # (修复类型, 标题, 待修复产品, 修复函数)
+    fixes = [
+        ('single_image_carousel', '🎯 修复单图片轮播问题', find_single_image_carousel_issues(results), fix_single_image_carousel),
+        ('unclosed_img_tags', '🔧 修复未闭合img标签问题', find_unclosed_img_issues(results), fix_unclosed_img_tags),
+        ('quote_function', '💰 修复获取报价功能问题', find_quote_function_issues(results), fix_quote_function_images),
+        ('placeholder_product', '🖼️  修复占位符产品配置', find_placeholder_product_issues(results), fix_placeholder_product_config)
+    ]
+
+    # 同一页面的全部修复在内存中依次应用，所有页面成功后一次性提交
+    # 审计报告中已不存在的页面不进入改写计划，直接记为修复失败
+    plan = {}
+    missing = set()
+    for fix_type, title, product_ids, fixer in fixes:
+        for product_id in product_ids:
+            path = page_path(products_dir, product_id)
+            if os.path.exists(path):
+                plan.setdefault(path, []).append(token_edit(fixer, product_id))
             else:
-                fix_results['failed_fixes'].append((product_id, 'unclosed_img_tags'))
-                print(f"   ❌ {product_id}: img标签修复失败")
-
-    # 3. 修复获取报价功能图片显示问题
-    quote_issue_products = find_quote_function_issues(results)
-    if quote_issue_products:
-        print(f"\n💰 修复获取报价功能问题 ({len(quote_issue_products)}个产品)")
-        for product_id in quote_issue_products:
-            if fix_quote_function_images(product_id, products_dir):
-                fix_results['quote_function_fix'].append(product_id)
-                print(f"   ✅ {product_id}: 报价功能修复成功")
-            else:
-                fix_results['failed_fixes'].append((product_id, 'quote_function'))
-                print(f"   ❌ {product_id}: 报价功能修复失败")
-
-    # 4. 修复占位符产品配置
-    placeholder_products = find_placeholder_product_issues(results)
-    if placeholder_products:
-        print(f"\n🖼️  修复占位符产品配置 ({len(placeholder_products)}个产品)")
-        for product_id in placeholder_products:
-            if fix_placeholder_product_config(product_id, products_dir):
-                fix_results['placeholder_product_fix'].append(product_id)
-                print(f"   ✅ {product_id}: 占位符配置修复成功")
+                missing.add(product_id)
+    if missing:
+        print(f"⚠️  审计报告中有 {len(missing)} 个产品页面已不存在，将记为修复失败: {', '.join(sorted(missing))}")
+
+    try:
+        pages = rewrite_pages(plan, dry_run=args.dry_run)
+    except RewriteError as e:
+        print_rewrite_error(e)
+        sys.exit(1)
+
+    for fix_type, title, product_ids, fixer in fixes:
+        if not product_ids:
+            continue
+        print(f"\n{title} ({len(product_ids)}个产品)")
+        for product_id in product_ids:
+            page = pages.get(page_path(products_dir, product_id))
+            if page is None:
+                fix_results['failed_fixes'].append((product_id, fix_type))
+                print(f"   ❌ {product_id}: 产品页面不存在")
+            elif fix_type in page['notes'] and page['changed']:
+                fix_results[f'{fix_type}_fix'].append(product_id)
+                if args.dry_run:
+                    print(f"   🔍 {product_id}: 将修复{FIX_LABELS[fix_type]}")
+                else:
+                    print(f"   ✅ {product_id}: {FIX_LABELS[fix_type]}修复成功")
             else:
-                fix_results['failed_fixes'].append((product_id, 'placeholder_product'))
-                print(f"   ❌ {product_id}: 占位符配置修复失败")
+                fix_results['failed_fixes'].append((product_id, fix_type))
+                print(f"   ❌ {product_id}: {FIX_LABELS[fix_type]}修复失败")
 
     # 输出修复总结
-    print_fix_summary(fix_results)
+    print_fix_summary(fix_results, args.dry_run)
 
-    # 保存修复结果
-    save_fix_results(fix_results, base_dir)
+    # 保存修复结果（预演时不写文件）
+    if not args.dry_run:
+        save_fix_results(fix_results, base_dir)
 
 def find_single_image_carousel_issues(results):
     """找出单图片错误启用轮播的产品"""
@@ -126,129 +143,62 @@ def find_placeholder_product_issues(results):
                 break
     return products
 
-def fix_single_image_carousel(product_id, products_dir):
-    """修复单图片不应启用轮播的问题"""
-    filepath = os.path.join(products_dir, f'{product_id}.html')
+def page_path(products_dir, product_id):
+    return os.path.join(products_dir, f'{product_id}.html')
 
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+# 以下修复函数在同一个页面编辑器上排队编辑（页面只切分一次，未修改的部分原样保留），
+# 返回已完成的修复类型
 
-        # 检查是否只有一张图片
-        data_images_match = re.search(r'data-images="([^"]*)"', content)
-        if data_images_match:
-            images = [img.strip() for img in data_images_match.group(1).split(',') if img.strip()]
-
-            if len(images) == 1:
-                # 单图片应该移除轮播功能
-                # 方法：修改JavaScript逻辑或者移除data-images属性
-                # 这里我们保持data-images，让JavaScript正确处理单图片情况
-                # 问题应该在JavaScript中修复，这里先标记为已处理
-                return True
-
-        return False
-
-    except Exception as e:
-        print(f"      错误: {str(e)}")
-        return False
-
-def fix_unclosed_img_tags(product_id, products_dir):
+def fix_single_image_carousel(editor, product_id):
+    """修复单图片不应启用轮播的问题"""
+    # 检查是否只有一张图片
+    main_image = editor.first('img', 'main-image')
+    if main_image is None:
+        return []
+    images = [img.strip() for img in editor.attribute(main_image, 'data-images', '').split(',') if img.strip()]
+
+    if len(images) == 1:
+        # 单图片应该移除轮播功能
+        # 方法：修改JavaScript逻辑或者移除data-images属性
+        # 这里我们保持data-images，让JavaScript正确处理单图片情况
+        # 问题应该在JavaScript中修复，这里先标记为已处理
+        return ['single_image_carousel']
+
+    return []
+
+def fix_unclosed_img_tags(editor, product_id):
     """修复未闭合的img标签"""
-    filepath = os.path.join(products_dir, f'{product_id}.html')
-
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # 查找并修复未闭合的img标签
-        # 匹配 <img ...> 但不是 <img .../> 的标签
-        def fix_img_tag(match):
-            tag = match.group(0)
-            if tag.endswith('/>'):
-                return tag  # 已经闭合
-            elif tag.endswith('>'):
-                # 移除末尾的 > 并添加 />
-                return tag[:-1] + '/>'
-            else:
-                return tag + '/>'
-
-        # 修复img标签
-        fixed_content = re.sub(r'<img[^>]*(?<!/)>', fix_img_tag, content)
+    # 只修改真正的 <img> 标签，脚本字符串中的 "<img ...>" 不受影响
+    for tag in editor.find('img'):
+        editor.self_close(tag)
 
-        # 如果有修改，保存文件
-        if fixed_content != content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(fixed_content)
-            return True
+    # 没有需要修复的标签也算成功
+    return ['unclosed_img_tags']
 
-        return True  # 没有需要修复的标签也算成功
-
-    except Exception as e:
-        print(f"      错误: {str(e)}")
-        return False
-
-def fix_quote_function_images(product_id, products_dir):
+def fix_quote_function_images(editor, product_id):
     """修复获取报价功能的图片显示问题"""
-    filepath = os.path.join(products_dir, f'{product_id}.html')
-
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # 检查获取报价按钮的onclick属性
-        quote_button_match = re.search(r'onclick="openInquiryModal\([\'"]([^\'"]*)[\'"]', content)
-
-        if quote_button_match:
-            modal_product_id = quote_button_match.group(1)
-
-            # 确保product_id正确
-            if modal_product_id != product_id:
-                # 修复product_id
-                fixed_content = content.replace(
-                    f'openInquiryModal(\'{modal_product_id}\')',
-                    f'openInquiryModal(\'{product_id}\')'
-                )
-                fixed_content = fixed_content.replace(
-                    f'openInquiryModal("{modal_product_id}")',
-                    f'openInquiryModal("{product_id}")'
-                )
-
-                if fixed_content != content:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(fixed_content)
-
-            return True
-
-        return True  # 没有报价按钮也算正常
-
-    except Exception as e:
-        print(f"      错误: {str(e)}")
-        return False
-
-def fix_placeholder_product_config(product_id, products_dir):
+    # 检查所有 onclick 中的 openInquiryModal 调用，确保product_id正确
+    for tag in editor.tokens:
+        if tag.kind != 'start':
+            continue
+        onclick = editor.attribute(tag, 'onclick')
+        if onclick and 'openInquiryModal' in onclick:
+            fixed = QUOTE_CALL_PATTERN.sub(lambda m: f'openInquiryModal({m.group(1)}{product_id}{m.group(1)}', onclick)
+            if fixed != onclick:
+                editor.set_attribute(tag, 'onclick', fixed)
+
+    return ['quote_function']  # 没有报价按钮也算正常
+
+def fix_placeholder_product_config(editor, product_id):
     """修复占位符产品的配置"""
-    filepath = os.path.join(products_dir, f'{product_id}.html')
-
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+    # 检查是否有data-placeholder="true"属性
+    # 这类产品不启用轮播，应该显示专业的"产品图片更新中"信息，无需改动页面
+    return ['placeholder_product']
 
-        # 检查是否有data-placeholder="true"属性
-        if 'data-placeholder="true"' in content:
-            # 确保这类产品不启用轮播
-            # 占位符产品应该显示专业的"产品图片更新中"信息
-            return True
-
-        return True
-
-    except Exception as e:
-        print(f"      错误: {str(e)}")
-        return False
-
-def print_fix_summary(fix_results):
-    """打印修复总结"""
+def print_fix_summary(fix_results, dry_run=False):
+    """打印修复总结；预演时报告将修复的数量"""
     print("\n" + "="*80)
-    print("📊 批量修复结果总结")
+    print("📊 批量修复预演总结（未写入任何页面）" if dry_run else "📊 批量修复结果总结")
     print("="*80)
 
     total_fixed = (
@@ -258,13 +208,17 @@ def print_fix_summary(fix_results):
         len(fix_results['placeholder_product_fix'])
     )
 
-    print(f"✅ 单图片轮播修复: {len(fix_results['single_image_carousel_fix'])} 个产品")
-    print(f"🔧 img标签修复: {len(fix_results['unclosed_img_tags_fix'])} 个产品")
-    print(f"💰 报价功能修复: {len(fix_results['quote_function_fix'])} 个产品")
-    print(f"🖼️  占位符配置修复: {len(fix_results['placeholder_product_fix'])} 个产品")
-    print(f"❌ 修复失败: {len(fix_results['failed_fixes'])} 个问题")
-
-    print(f"\n🎯 总修复数量: {total_fixed} 个修复项")
+    prefix = '将' if dry_run else ''
+    print(f"✅ 单图片轮播{prefix}修复: {len(fix_results['single_image_carousel_fix'])} 个产品")
+    print(f"🔧 img标签{prefix}修复: {len(fix_results['unclosed_img_tags_fix'])} 个产品")
+    print(f"💰 报价功能{prefix}修复: {len(fix_results['quote_function_fix'])} 个产品")
+    print(f"🖼️  占位符配置{prefix}修复: {len(fix_results['placeholder_product_fix'])} 个产品")
+    print(f"❌ {'无法修复' if dry_run else '修复失败'}: {len(fix_results['failed_fixes'])} 个问题")
+
+    if dry_run:
+        print(f"\n🔍 将修复 {total_fixed} 个修复项")
+    else:
+        print(f"\n🎯 总修复数量: {total_fixed} 个修复项")
 
     if fix_results['failed_fixes']:
         print("\n⚠️  修复失败的问题:")
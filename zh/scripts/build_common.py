@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+构建工具公共模块
+提供站点路径、站点文件遍历、内容摘要和原子写入等构建阶段共用的函数
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+
+# 路径配置（站点根目录即仓库根目录，GitHub Pages 从 / 发布）
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ZH_DIR = os.path.dirname(SCRIPTS_DIR)
+SITE_ROOT = os.path.dirname(ZH_DIR)
+EN_DIR = os.path.join(SITE_ROOT, 'en')
+SHARED_DIR = os.path.join(SITE_ROOT, 'shared')
+DIST_DIR = os.path.join(SITE_ROOT, 'dist')
+CACHE_DIR = os.path.join(SITE_ROOT, '.build-cache')
+
+# 不属于线上站点的目录和文件类型
+EXCLUDED_DIRS = {
+    '.git', '.build-cache', 'dist', 'node_modules', 'scripts', 'reports',
+    'docs', 'templates', '__pycache__'
+}
+EXCLUDED_EXTENSIONS = {
+    '.py', '.pyc', '.md', '.ps1', '.bat', '.sh', '.csv', '.jsonl', '.txt'
+}
+# 需要保留的特殊文件（扩展名被排除但站点需要）
+INCLUDED_FILES = {'robots.txt', 'CNAME'}
+
+def iter_site_files(root=SITE_ROOT):
+    """遍历站点发布所需的全部文件，返回相对于 root 的 POSIX 路径"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS)
+        for filename in sorted(filenames):
+            ext = os.path.splitext(filename)[1].lower()
+            if ext in EXCLUDED_EXTENSIONS and filename not in INCLUDED_FILES:
+                continue
+            full_path = os.path.join(dirpath, filename)
+            yield os.path.relpath(full_path, root).replace(os.sep, '/')
+
+def bytes_digest(data):
+    """计算字节内容的 SHA-256 摘要"""
+    return hashlib.sha256(data).hexdigest()
+
+def file_digest(file_path):
+    """分块计算文件的 SHA-256 摘要"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def file_mode(file_path):
+    """替换文件时应保留的权限：已存在时沿用原权限，否则按 umask 计算普通新文件的权限
+    （mkstemp 创建的临时文件是 0600，直接替换会让其他用户运行的 Web 服务器无法读取）"""
+    try:
+        return os.stat(file_path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+def atomic_write_bytes(file_path, data):
+    """先写入同目录临时文件再 os.replace，避免留下写了一半的文件"""
+    directory = os.path.dirname(file_path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, file_mode(file_path))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def atomic_write_text(file_path, text):
+    """以 UTF-8 原子写入文本文件"""
+    atomic_write_bytes(file_path, text.encode('utf-8'))
+
+def load_json(file_path, default=None):
+    """读取 JSON 文件，文件不存在时返回 default"""
+    if not os.path.exists(file_path):
+        return default
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(file_path, data, indent=2):
+    """以与仓库数据文件一致的格式（UTF-8、不转义中文）原子写入 JSON"""
+    text = json.dumps(data, ensure_ascii=False, indent=indent)
+    atomic_write_text(file_path, text + '\n')
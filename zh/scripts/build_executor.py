@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+并行构建执行器
+在进程池中并发执行依赖图中相互独立的节点，依赖全部完成后才调度下游节点。
+构建结束后输出各阶段、各任务的墙钟时间和 CPU 时间报告，并生成 Chrome trace-event JSON
+（在 chrome://tracing 或 Perfetto 中打开），最慢的步骤一目了然。
+"""
+
+import os
+import sys
+import time
+import argparse
+import traceback
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+
+from build_common import SITE_ROOT, DIST_DIR, SCRIPTS_DIR, save_json
+from build_graph import build_site_graph, BuildCache, run_node
+
+TIMING_REPORT_PATH = os.path.join(SCRIPTS_DIR, 'build_timing_report.json')
+TRACE_PATH = os.path.join(SCRIPTS_DIR, 'build_trace.json')
+
+def timed_run(node, src_root, out_root):
+    """在工作进程中执行节点并记录时间，异常以文本形式返回以便主进程汇总"""
+    wall_start = time.time()
+    cpu_start = time.process_time()
+    error = None
+    try:
+        run_node(node, src_root, out_root)
+    except Exception:
+        error = traceback.format_exc()
+    return {
+        'node_id': node.node_id,
+        'stage': node.stage,
+        'start': wall_start,
+        'wall': time.time() - wall_start,
+        'cpu': time.process_time() - cpu_start,
+        'pid': os.getpid(),
+        'error': error
+    }
+
+def execute(graph, cache, workers=None, force=False):
+    """并行执行依赖图，返回执行结果与各任务计时"""
+    order = graph.topological_order()
+    remaining = {node_id: 0 for node_id in order}
+    dependents = defaultdict(list)
+    for node_id in order:
+        for dep in graph.nodes[node_id].deps:
+            if dep in graph.nodes:
+                remaining[node_id] += 1
+                dependents[dep].append(node_id)
+
+    ready = [node_id for node_id in reversed(order) if remaining[node_id] == 0]
+    running = {}
+    signatures = {}
+    timings, skipped, failed, blocked = [], [], [], []
+
+    def release(node_id):
+        for dependent in dependents[node_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+
+    def block(node_id):
+        """依赖失败的节点不再执行"""
+        for dependent in dependents[node_id]:
+            if dependent not in blocked:
+                blocked.append(dependent)
+                block(dependent)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while ready or running:
+            while ready:
+                node_id = ready.pop()
+                if node_id in blocked:
+                    continue
+                node = graph.nodes[node_id]
+                signature = cache.signature(node)
+                if not force and cache.is_fresh(node, signature):
+                    skipped.append(node_id)
+                    release(node_id)
+                    continue
+                signatures[node_id] = signature
+                future = pool.submit(timed_run, node, graph.src_root, graph.out_root)
+                running[future] = node_id
+
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node_id = running.pop(future)
+                timing = future.result()
+                timings.append(timing)
+                if timing['error']:
+                    failed.append(timing)
+                    block(node_id)
+                    continue
+                cache.record(graph.nodes[node_id], signatures[node_id])
+                release(node_id)
+
+    removed = cache.prune(graph) if not failed else 0
+    cache.save()
+    return {
+        'timings': timings,
+        'skipped': skipped,
+        'failed': failed,
+        'blocked': blocked,
+        'removed': removed
+    }
+
+def summarize_stages(timings):
+    """按阶段汇总：墙钟时间为该阶段首个任务开始到最后一个任务结束"""
+    stages = {}
+    for timing in timings:
+        stage = stages.setdefault(timing['stage'], {
+            'tasks': 0, 'cpu': 0.0, 'task_wall': 0.0, 'start': timing['start'], 'end': 0.0
+        })
+        stage['tasks'] += 1
+        stage['cpu'] += timing['cpu']
+        stage['task_wall'] += timing['wall']
+        stage['start'] = min(stage['start'], timing['start'])
+        stage['end'] = max(stage['end'], timing['start'] + timing['wall'])
+    for stage in stages.values():
+        stage['wall'] = stage['end'] - stage['start']
+    return stages
+
+def write_trace(timings, phases, trace_path=TRACE_PATH):
+    """输出 Chrome trace-event 格式（ph=X 完整事件，时间单位为微秒）"""
+    origin = min([t['start'] for t in timings] + [p['start'] for p in phases]) if (timings or phases) else 0
+    events = []
+    for phase in phases:
+        events.append({
+            'name': phase['name'], 'cat': 'driver', 'ph': 'X', 'pid': 0, 'tid': 'main',
+            'ts': round((phase['start'] - origin) * 1e6), 'dur': round(phase['wall'] * 1e6)
+        })
+    for timing in timings:
+        events.append({
+            'name': timing['node_id'], 'cat': timing['stage'], 'ph': 'X',
+            'pid': 1, 'tid': timing['pid'],
+            'ts': round((timing['start'] - origin) * 1e6),
+            'dur': max(1, round(timing['wall'] * 1e6)),
+            'args': {'cpu_ms': round(timing['cpu'] * 1000, 3), 'failed': bool(timing['error'])}
+        })
+    events.append({'name': 'process_name', 'ph': 'M', 'pid': 0, 'args': {'name': 'build driver'}})
+    events.append({'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': 'build workers'}})
+    save_json(trace_path, {'traceEvents': events, 'displayTimeUnit': 'ms'}, indent=None)
+
+def write_timing_report(result, stages, phases, total_wall, report_path=TIMING_REPORT_PATH):
+    tasks = sorted(result['timings'], key=lambda t: t['wall'], reverse=True)
+    save_json(report_path, {
+        'generated': datetime.now().isoformat(),
+        'total_wall_seconds': round(total_wall, 4),
+        'phases': [{'name': p['name'], 'wall_seconds': round(p['wall'], 4)} for p in phases],
+        'stages': {
+            name: {
+                'tasks': stage['tasks'],
+                'wall_seconds': round(stage['wall'], 4),
+                'cpu_seconds': round(stage['cpu'], 4),
+                'task_wall_seconds': round(stage['task_wall'], 4)
+            }
+            for name, stage in sorted(stages.items())
+        },
+        'tasks': [
+            {
+                'node_id': t['node_id'], 'stage': t['stage'],
+                'wall_seconds': round(t['wall'], 5), 'cpu_seconds': round(t['cpu'], 5),
+                'failed': bool(t['error'])
+            }
+            for t in tasks
+        ],
+        'skipped': len(result['skipped']),
+        'blocked': result['blocked']
+    })
+
+def main():
+    parser = argparse.ArgumentParser(description='并行增量构建')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=DIST_DIR, help='输出目录（默认 dist/）')
+    parser.add_argument('--workers', type=int, default=None, help='进程数（默认 CPU 核数）')
+    parser.add_argument('--force', action='store_true', help='忽略缓存，全部重建')
+    args = parser.parse_args()
+
+    src_root = os.path.abspath(args.src)
+    out_root = os.path.abspath(args.out)
+    phases = []
+    build_start = time.time()
+
+    print("🚀 开始并行构建...")
+    phase_start = time.time()
+    graph = build_site_graph(src_root, out_root)
+    cache = BuildCache(src_root, out_root)
+    phases.append({'name': 'graph', 'start': phase_start, 'wall': time.time() - phase_start})
+    print(f"📋 依赖图: {len(graph.nodes)} 个节点")
+
+    phase_start = time.time()
+    result = execute(graph, cache, workers=args.workers, force=args.force)
+    phases.append({'name': 'execute', 'start': phase_start, 'wall': time.time() - phase_start})
+    total_wall = time.time() - build_start
+
+    stages = summarize_stages(result['timings'])
+    write_timing_report(result, stages, phases, total_wall)
+    write_trace(result['timings'], phases)
+
+    print(f"\n{'阶段':<12}{'任务数':>8}{'墙钟(s)':>10}{'CPU(s)':>10}")
+    for name, stage in sorted(stages.items(), key=lambda item: item[1]['wall'], reverse=True):
+        print(f"{name:<12}{stage['tasks']:>8}{stage['wall']:>10.3f}{stage['cpu']:>10.3f}")
+
+    slowest = sorted(result['timings'], key=lambda t: t['wall'], reverse=True)[:10]
+    if slowest:
+        print("\n🐢 最慢的任务:")
+        for timing in slowest:
+            print(f"   {timing['wall'] * 1000:8.1f} ms  {timing['node_id']}")
+
+    print(f"\n✅ 执行: {len(result['timings'])} 个任务，⏭️  跳过: {len(result['skipped'])} 个")
+    print(f"⏱️  总耗时: {total_wall:.3f}s")
+    print(f"📄 计时报告: {TIMING_REPORT_PATH}")
+    print(f"📄 Chrome trace: {TRACE_PATH}")
+
+    if result['failed']:
+        print(f"\n❌ 失败: {len(result['failed'])} 个任务，{len(result['blocked'])} 个下游任务未执行")
+        for timing in result['failed']:
+            print(f"   - {timing['node_id']}")
+            print('     ' + timing['error'].strip().splitlines()[-1])
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
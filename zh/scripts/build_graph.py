@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+增量构建驱动
+把站点构建描述为依赖图：页面依赖其引用的 CSS/JS/图片/组件，生成页面依赖数据文件中的对应记录。
+每个节点的输入摘要和输出摘要保存在 .build-cache/ 中，再次构建时只重建输入发生变化的节点。
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import argparse
+import importlib
+from collections import defaultdict
+from datetime import datetime
+from urllib.parse import unquote
+
+from build_common import (
+    SITE_ROOT, DIST_DIR, CACHE_DIR, iter_site_files, bytes_digest, file_digest,
+    atomic_write_bytes, load_json, save_json
+)
+from asset_fingerprint import REFERENCE_PATTERN, rewrite_references
+
+GRAPH_CACHE_FILE = os.path.join(CACHE_DIR, 'graph.json')
+DIGEST_CACHE_FILE = os.path.join(CACHE_DIR, 'file-digests.json')
+# 修改构建动作的实现时递增，使所有节点失效
+GRAPH_VERSION = 2
+
+PAGE_EXTENSIONS = {'.html', '.htm'}
+COMPONENT_DIR = 'components'
+COMPONENT_PATTERN = re.compile(r'(?<![^\s"\'`()<>])([^\s"\'`()<>]*' + COMPONENT_DIR + r'/[^\s"\'`()<>?#]+\.html)')
+
+# 向依赖图注册额外节点的扩展（"模块:函数"，函数签名为 extension(graph)），按顺序执行；
+# 指纹化需要在全部页面和资源节点登记之后执行，预压缩需要看到全部输出，必须保持在最后
+GRAPH_EXTENSIONS = [
+    'generate_product_pages:add_product_page_nodes',
+    'products_grid:add_products_grid_inputs',
+    'site_includes:add_include_inputs',
+    'language_alternates:add_language_alternates',
+    'search_index:add_search_index_node',
+    'facet_index:add_facet_index_node',
+    'product_database:add_product_database_node',
+    'adaptive_images:add_adaptive_images_node',
+    'asset_fingerprint:add_fingerprint_stage',
+    'compress_assets:add_compression_nodes',
+]
+
+class DigestCache:
+    """按 (大小, mtime) 缓存文件摘要，未改动的大图片不必每次重新计算"""
+
+    def __init__(self, cache_file=DIGEST_CACHE_FILE):
+        self.cache_file = cache_file
+        self.entries = load_json(cache_file, default={})
+        self.dirty = False
+
+    def digest(self, file_path):
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        key = os.path.abspath(file_path)
+        entry = self.entries.get(key)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        digest = file_digest(file_path)
+        self.entries[key] = [stat.st_size, stat.st_mtime_ns, digest]
+        self.dirty = True
+        return digest
+
+    def save(self):
+        if self.dirty:
+            save_json(self.cache_file, self.entries, indent=None)
+            self.dirty = False
+
+class BuildNode:
+    """依赖图节点
+
+    inputs 为输入描述元组 ('file', 相对路径)；生成页面以单个产品的分片作为输入，一个产品变化只会使对应页面失效。
+    action 为 "模块:函数"，在工作进程中按名称导入，函数签名为 action(node, src_root, out_root)。
+    """
+
+    __slots__ = ('node_id', 'stage', 'action', 'inputs', 'outputs', 'deps', 'params')
+
+    def __init__(self, node_id, stage, action, inputs, outputs, deps=(), params=None):
+        self.node_id = node_id
+        self.stage = stage
+        self.action = action
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.deps = list(deps)
+        self.params = params or {}
+
+    def __repr__(self):
+        return f'BuildNode({self.node_id!r})'
+
+def resolve_action(action):
+    """把 "模块:函数" 解析为可调用对象"""
+    module_name, _, func_name = action.partition(':')
+    return getattr(importlib.import_module(module_name), func_name)
+
+def run_node(node, src_root, out_root):
+    """执行单个节点（可在工作进程中调用）"""
+    resolve_action(node.action)(node, src_root, out_root)
+
+class BuildGraph:
+    def __init__(self, src_root=SITE_ROOT, out_root=DIST_DIR):
+        self.src_root = src_root
+        self.out_root = out_root
+        self.nodes = {}
+        self.output_owner = {}
+
+    def add_node(self, node):
+        """添加节点；同一输出只能由一个节点生成，后添加的节点覆盖先前的节点"""
+        previous = self.nodes.get(node.node_id)
+        if previous is not None:
+            for output in previous.outputs:
+                self.output_owner.pop(output, None)
+        for output in node.outputs:
+            owner = self.output_owner.get(output)
+            if owner is not None and owner != node.node_id:
+                self.remove_node(owner)
+            self.output_owner[output] = node.node_id
+        self.nodes[node.node_id] = node
+        return node
+
+    def remove_node(self, node_id):
+        node = self.nodes.pop(node_id, None)
+        if node is None:
+            return
+        for output in node.outputs:
+            if self.output_owner.get(output) == node_id:
+                del self.output_owner[output]
+        for other in self.nodes.values():
+            if node_id in other.deps:
+                other.deps.remove(node_id)
+
+    def topological_order(self):
+        """按依赖顺序返回节点 ID，存在循环依赖时抛出 ValueError"""
+        indegree = {node_id: 0 for node_id in self.nodes}
+        dependents = defaultdict(list)
+        for node in self.nodes.values():
+            for dep in node.deps:
+                if dep in self.nodes:
+                    indegree[node.node_id] += 1
+                    dependents[dep].append(node.node_id)
+
+        ready = sorted(node_id for node_id, degree in indegree.items() if degree == 0)
+        order = []
+        while ready:
+            node_id = ready.pop()
+            order.append(node_id)
+            for dependent in dependents[node_id]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.nodes):
+            cyclic = sorted(node_id for node_id, degree in indegree.items() if degree > 0)
+            raise ValueError(f'依赖图存在循环: {cyclic[:5]}')
+        return order
+
+class BuildCache:
+    """节点签名和输出摘要的持久化缓存"""
+
+    def __init__(self, src_root=SITE_ROOT, out_root=DIST_DIR, cache_file=GRAPH_CACHE_FILE):
+        self.src_root = src_root
+        self.out_root = out_root
+        self.cache_file = cache_file
+        data = load_json(cache_file, default={})
+        if data.get('version') != GRAPH_VERSION or data.get('out_root') != os.path.abspath(out_root):
+            data = {}
+        self.nodes = data.get('nodes', {})
+        self.digests = DigestCache()
+
+    def input_digest(self, spec):
+        kind, rel_path = spec[0], spec[1]
+        file_path = os.path.join(self.src_root, rel_path)
+        if kind == 'file':
+            return self.digests.digest(file_path)
+        raise ValueError(f'未知的输入类型: {kind}')
+
+    def output_digests(self, node):
+        return {
+            output: self.digests.digest(os.path.join(self.out_root, output))
+            for output in node.outputs
+        }
+
+    def signature(self, node):
+        """节点签名：动作、参数、全部输入摘要和依赖节点的输出摘要"""
+        parts = [str(GRAPH_VERSION), node.action, json.dumps(node.params, sort_keys=True)]
+        for spec in node.inputs:
+            parts.append(f'{"|".join(spec)}={self.input_digest(spec)}')
+        for dep in sorted(node.deps):
+            entry = self.nodes.get(dep, {})
+            parts.append(f'{dep}={json.dumps(entry.get("outputs", {}), sort_keys=True)}')
+        return bytes_digest('\n'.join(parts).encode('utf-8'))
+
+    def is_fresh(self, node, signature):
+        entry = self.nodes.get(node.node_id)
+        if not entry or entry.get('signature') != signature:
+            return False
+        # 输出被删除或被手工修改时同样需要重建
+        return self.output_digests(node) == entry.get('outputs')
+
+    def record(self, node, signature):
+        self.nodes[node.node_id] = {
+            'signature': signature,
+            'outputs': self.output_digests(node)
+        }
+
+    def prune(self, graph):
+        """删除已不在依赖图中的节点及其输出文件，返回删除的节点数"""
+        removed = 0
+        for node_id in list(self.nodes):
+            if node_id in graph.nodes:
+                continue
+            for output in self.nodes[node_id].get('outputs', {}):
+                if output not in graph.output_owner:
+                    output_path = os.path.join(self.out_root, output)
+                    if os.path.exists(output_path):
+                        os.remove(output_path)
+            del self.nodes[node_id]
+            removed += 1
+        return removed
+
+    def save(self):
+        save_json(self.cache_file, {
+            'version': GRAPH_VERSION,
+            'out_root': os.path.abspath(self.out_root),
+            'updated': datetime.now().isoformat(),
+            'nodes': self.nodes
+        }, indent=None)
+        self.digests.save()
+
+# ---------------------------------------------------------------------------
+# 构建动作
+# ---------------------------------------------------------------------------
+
+def _read_source(node, src_root):
+    """读取源文件，并按指纹化阶段登记的改写表改写资源引用"""
+    with open(os.path.join(src_root, node.inputs[0][1]), 'rb') as f:
+        text = f.read().decode('utf-8', errors='surrogateescape')
+    return rewrite_references(text, node.params.get('fingerprints'))
+
+def _write_output(node, out_root, text):
+    """写入全部输出（原文件名和指纹化文件名内容相同）"""
+    data = text.encode('utf-8', errors='surrogateescape')
+    for output in node.outputs:
+        atomic_write_bytes(os.path.join(out_root, output), data)
+
+def build_page(node, src_root, out_root):
+    """插入构建时组件和 hreflang 链接并压缩 HTML 页面"""
+    from html_minifier import minify_html
+    from site_includes import apply_includes
+    html = apply_includes(_read_source(node, src_root), node.outputs[0], src_root)
+    if node.params.get('alternates'):
+        from language_alternates import insert_alternate_links
+        html = insert_alternate_links(html, node.params['alternates'])
+    _write_output(node, out_root, minify_html(html))
+
+def build_css(node, src_root, out_root):
+    """压缩样式表"""
+    from html_minifier import minify_css
+    _write_output(node, out_root, minify_css(_read_source(node, src_root)))
+
+def build_js(node, src_root, out_root):
+    """压缩脚本"""
+    from html_minifier import minify_js
+    _write_output(node, out_root, minify_js(_read_source(node, src_root)))
+
+def build_json(node, src_root, out_root):
+    """紧凑输出 JSON，无法解析时原样复制"""
+    text = _read_source(node, src_root)
+    try:
+        text = json.dumps(json.loads(text), ensure_ascii=False, separators=(',', ':'))
+    except ValueError:
+        pass
+    _write_output(node, out_root, text)
+
+def copy_file(node, src_root, out_root):
+    """原样复制"""
+    for output in node.outputs:
+        target = os.path.join(out_root, output)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(os.path.join(src_root, node.inputs[0][1]), target)
+
+ASSET_ACTIONS = {
+    '.css': ('minify', 'build_graph:build_css'),
+    '.js': ('minify', 'build_graph:build_js'),
+    '.json': ('minify', 'build_graph:build_json'),
+}
+
+# ---------------------------------------------------------------------------
+# 依赖发现
+# ---------------------------------------------------------------------------
+
+def _resolve_local(written_path, page_dir, known_files):
+    if '://' in written_path or written_path.startswith(('//', 'data:')):
+        return None
+    decoded = unquote(written_path)
+    if decoded.startswith('/'):
+        candidate = os.path.normpath(decoded.lstrip('/'))
+    else:
+        candidate = os.path.normpath(os.path.join(page_dir, decoded))
+    candidate = candidate.replace(os.sep, '/')
+    return candidate if candidate in known_files else None
+
+def extract_written_paths(text):
+    """提取文本中所有形似站点资源或组件的路径（尚未解析）"""
+    paths = [match.group('path') for match in REFERENCE_PATTERN.finditer(text)]
+    paths.extend(match.group(1) for match in COMPONENT_PATTERN.finditer(text))
+    return paths
+
+def find_references(written_paths, page_dir, known_files):
+    """把路径相对于 page_dir 解析为站点文件"""
+    references = set()
+    for written_path in written_paths:
+        target = _resolve_local(written_path, page_dir, known_files)
+        if target:
+            references.add(target)
+    return references
+
+def scan_page_dependencies(src_root, rel_path, known_files, text=None, script_cache=None):
+    """页面依赖：页面直接引用的资源，以及其脚本（相对页面解析）引用的资源和组件
+
+    script_cache 用于在多个页面之间复用脚本的路径提取结果。
+    """
+    if text is None:
+        with open(os.path.join(src_root, rel_path), 'r', encoding='utf-8', errors='replace') as f:
+            text = f.read()
+    if script_cache is None:
+        script_cache = {}
+    page_dir = os.path.dirname(rel_path)
+    references = find_references(extract_written_paths(text), page_dir, known_files)
+    for script in [ref for ref in references if ref.endswith('.js')]:
+        if script not in script_cache:
+            with open(os.path.join(src_root, script), 'r', encoding='utf-8', errors='replace') as f:
+                script_cache[script] = extract_written_paths(f.read())
+        references |= find_references(script_cache[script], page_dir, known_files)
+    references.discard(rel_path)
+    return references
+
+def build_site_graph(src_root=SITE_ROOT, out_root=DIST_DIR):
+    """生成整站依赖图"""
+    graph = BuildGraph(src_root, out_root)
+    site_files = list(iter_site_files(src_root))
+    known_files = set(site_files)
+    script_cache = {}
+
+    for rel_path in site_files:
+        ext = os.path.splitext(rel_path)[1].lower()
+        if ext in PAGE_EXTENSIONS:
+            continue
+        stage, action = ASSET_ACTIONS.get(ext, ('copy', 'build_graph:copy_file'))
+        graph.add_node(BuildNode(f'asset:{rel_path}', stage, action, [('file', rel_path)], [rel_path]))
+
+    for rel_path in site_files:
+        if os.path.splitext(rel_path)[1].lower() not in PAGE_EXTENSIONS:
+            continue
+        references = scan_page_dependencies(src_root, rel_path, known_files, script_cache=script_cache)
+        deps = sorted(f'asset:{ref}' for ref in references if f'asset:{ref}' in graph.nodes)
+        # 组件 HTML 作为页面的直接输入，组件变化即视为页面变化
+        inputs = [('file', rel_path)] + [
+            ('file', ref) for ref in sorted(references)
+            if os.path.splitext(ref)[1].lower() in PAGE_EXTENSIONS
+        ]
+        graph.add_node(BuildNode(f'page:{rel_path}', 'page', 'build_graph:build_page',
+                                 inputs, [rel_path], deps))
+
+    for extension in GRAPH_EXTENSIONS:
+        resolve_action(extension)(graph)
+
+    return graph
+
+# ---------------------------------------------------------------------------
+# 执行
+# ---------------------------------------------------------------------------
+
+def build(graph, cache, force=False, dry_run=False):
+    """按依赖顺序串行构建，返回 {'rebuilt': [...], 'skipped': [...], 'removed': n}"""
+    rebuilt, skipped = [], []
+    for node_id in graph.topological_order():
+        node = graph.nodes[node_id]
+        signature = cache.signature(node)
+        if not force and cache.is_fresh(node, signature):
+            skipped.append(node_id)
+            continue
+        rebuilt.append(node_id)
+        if dry_run:
+            continue
+        run_node(node, graph.src_root, graph.out_root)
+        cache.record(node, signature)
+
+    removed = 0 if dry_run else cache.prune(graph)
+    if not dry_run:
+        cache.save()
+    return {'rebuilt': rebuilt, 'skipped': skipped, 'removed': removed}
+
+def main():
+    parser = argparse.ArgumentParser(description='增量构建站点')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=DIST_DIR, help='输出目录（默认 dist/）')
+    parser.add_argument('--force', action='store_true', help='忽略缓存，全部重建')
+    parser.add_argument('--dry-run', action='store_true', help='只列出需要重建的节点')
+    args = parser.parse_args()
+
+    src_root = os.path.abspath(args.src)
+    out_root = os.path.abspath(args.out)
+
+    print("🏗️  开始增量构建...")
+    try:
+        graph = build_site_graph(src_root, out_root)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    cache = BuildCache(src_root, out_root)
+    print(f"📋 依赖图: {len(graph.nodes)} 个节点")
+
+    result = build(graph, cache, force=args.force, dry_run=args.dry_run)
+
+    by_stage = defaultdict(int)
+    for node_id in result['rebuilt']:
+        by_stage[graph.nodes[node_id].stage] += 1
+
+    label = "需要重建" if args.dry_run else "重建"
+    print(f"\n✅ {label}: {len(result['rebuilt'])} 个节点")
+    for stage, count in sorted(by_stage.items()):
+        print(f"   - {stage}: {count}")
+    print(f"⏭️  未变化跳过: {len(result['skipped'])} 个节点")
+    if result['removed']:
+        print(f"🧹 清理过期节点: {result['removed']} 个")
+    if args.dry_run or len(result['rebuilt']) <= 20:
+        for node_id in result['rebuilt'][:50]:
+            print(f"   ↻ {node_id}")
+
+if __name__ == '__main__':
+    main()
@@ -1,47 +1,32 @@
 #!/usr/bin/env python3
 """
 检查产品中心页面缺失的产品
-对比39个产品HTML文件和products.html中的卡片
+对比产品HTML文件和products.html中的卡片（数据取自产品目录 product_catalog.py）
 """
 
-import os
-import re
+from product_catalog import open_catalog, product_page_ids
 
-# 路径配置
-PROJECT_ROOT = r"D:\ai\新建文件夹\新建文件夹\7788"
-PRODUCTS_DIR = os.path.join(PROJECT_ROOT, "products")
-PRODUCTS_HTML = os.path.join(PROJECT_ROOT, "products.html")
-
-def get_all_product_files():
+def get_all_product_files(conn):
     """获取所有产品HTML文件列表"""
-    products = []
-    for file in os.listdir(PRODUCTS_DIR):
-        if file.endswith('.html'):
-            product_id = file[:-5]  # 移除.html
-            products.append(product_id)
-    return sorted(products)
-
-def get_products_in_center():
-    """获取产品中心页面中的所有产品"""
-    with open(PRODUCTS_HTML, 'r', encoding='utf-8') as f:
-        content = f.read()
+    return product_page_ids(conn)
 
-    # 查找所有 data-original-href
-    pattern = r'data-original-href="products/([^.]+)\.html"'
-    matches = re.findall(pattern, content)
-
-    return sorted(matches)
+def get_products_in_center(conn):
+    """获取产品中心页面中的所有产品（卡片由 data/products.json 预渲染）"""
+    rows = conn.execute('SELECT id FROM products WHERE card_id IS NOT NULL ORDER BY id')
+    return [row['id'] for row in rows]
 
 def main():
     print("🔍 检查产品中心页面是否包含全部39个产品...")
     print("=" * 60)
 
+    conn = open_catalog()
+
     # 获取所有产品文件
-    all_products = get_all_product_files()
+    all_products = get_all_product_files(conn)
     print(f"📁 products/ 目录中的产品文件: {len(all_products)} 个")
 
     # 获取产品中心页面的产品
-    center_products = get_products_in_center()
+    center_products = get_products_in_center(conn)
     print(f"🏭 products.html 中的产品卡片: {len(center_products)} 个")
 
     # 找出缺失的产品
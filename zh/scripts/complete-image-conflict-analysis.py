@@ -11,6 +11,8 @@ import json
 from pathlib import Path
 from collections import defaultdict
 
+from image_matcher import ImageMatcher
+
 # 路径配置
 PROJECT_ROOT = r"D:\ai\新建文件夹\新建文件夹\7788"
 IMAGES_ROOT = os.path.join(PROJECT_ROOT, "images")
@@ -156,6 +158,9 @@ def analyze_conflicts(image_libraries, html_references):
 
     print(f"   📊 发现 {len(all_referenced_paths)} 个不同的图片引用")
 
+    # 所有图片库共用一个文件名索引
+    matcher = build_image_matcher(image_libraries)
+
     # 分析每个引用的图片
     for ref_path in all_referenced_paths:
         filename = os.path.basename(ref_path)
@@ -169,7 +174,7 @@ def analyze_conflicts(image_libraries, html_references):
             analysis['missing_images'].append({
                 'referenced_path': ref_path,
                 'filename': filename,
-                'potential_matches': find_potential_matches(filename, image_libraries)
+                'potential_matches': find_potential_matches(filename, image_libraries, matcher)
             })
 
     # 查找孤立的图片（存在但未被引用）
@@ -188,34 +193,31 @@ def analyze_conflicts(image_libraries, html_references):
 
     return analysis
 
-def find_potential_matches(missing_filename, image_libraries):
-    """查找可能的图片匹配"""
-    potential_matches = []
+def build_image_matcher(image_libraries):
+    """为所有图片库的文件名建立索引，键为 (图片库, 文件名)"""
+    return ImageMatcher({
+        (lib_name, img_name): img_name
+        for lib_name, lib_images in image_libraries.items()
+        for img_name in lib_images
+    })
 
-    # 提取产品名称用于模糊匹配
-    missing_base = missing_filename.lower().replace('.png', '').replace('.jpg', '').replace('.jpeg', '')
-    missing_parts = re.split(r'[-_]', missing_base)
+def find_potential_matches(missing_filename, image_libraries, matcher=None):
+    """查找可能的图片匹配（文件名索引打分，后缀和编号已归一化）"""
+    if matcher is None:
+        matcher = build_image_matcher(image_libraries)
 
-    # 在所有图片库中查找匹配
-    for lib_name, lib_images in image_libraries.items():
-        for img_name, img_info in lib_images.items():
-            img_base = img_name.lower().replace('.png', '').replace('.jpg', '').replace('.jpeg', '')
-            img_parts = re.split(r'[-_]', img_base)
-
-            # 计算匹配度
-            common_parts = set(missing_parts) & set(img_parts)
-            if len(common_parts) >= 2 or (len(common_parts) >= 1 and len(missing_parts) <= 2):
-                potential_matches.append({
-                    'library': lib_name,
-                    'filename': img_name,
-                    'path': img_info['path'],
-                    'confidence': len(common_parts) / max(len(missing_parts), len(img_parts)),
-                    'size': img_info['size']
-                })
-
-    # 按置信度排序
-    potential_matches.sort(key=lambda x: x['confidence'], reverse=True)
-    return potential_matches[:5]  # 返回前5个最佳匹配
+    potential_matches = []
+    for (lib_name, img_name), confidence in matcher.search(missing_filename, limit=5):
+        img_info = image_libraries[lib_name][img_name]
+        potential_matches.append({
+            'library': lib_name,
+            'filename': img_name,
+            'path': img_info['path'],
+            'confidence': confidence,
+            'size': img_info['size']
+        })
+
+    return potential_matches  # 按置信度排序的前5个最佳匹配
 
 def generate_fix_recommendations(analysis):
     """生成修复建议"""
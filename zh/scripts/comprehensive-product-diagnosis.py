@@ -11,6 +11,8 @@ import re
 import json
 from pathlib import Path
 
+from image_matcher import ImageMatcher
+
 # 路径配置
 PROJECT_ROOT = r"D:\ai\新建文件夹\新建文件夹\7788"
 PRODUCTS_DIR = os.path.join(PROJECT_ROOT, "products")
@@ -167,39 +169,28 @@ def check_image_files_existence(image_config):
 
     return file_check
 
+# {图片目录: 文件名索引}，整个诊断过程只扫描一次图片目录
+_matcher_cache = {}
+
+def get_image_matcher(images_dir=IMAGES_PRODUCTS):
+    if images_dir not in _matcher_cache:
+        filenames = []
+        for ext in ['*.png', '*.jpg', '*.jpeg']:
+            filenames.extend(os.path.basename(img_path) for img_path in glob.glob(os.path.join(images_dir, ext)))
+        _matcher_cache[images_dir] = ImageMatcher(filenames)
+    return _matcher_cache[images_dir]
+
 def find_available_images_for_product(product_id):
-    """查找产品可用的图片文件"""
+    """查找产品可用的图片文件（按 official > new > real > numbered > 其他 排序）"""
     available_images = []
 
-    # 搜索模式
-    patterns = [
-        f"{product_id}*.png",
-        f"{product_id}*.jpg",
-        f"{product_id}*.jpeg"
-    ]
-
-    for pattern in patterns:
-        for img_path in glob.glob(os.path.join(IMAGES_PRODUCTS, pattern)):
-            filename = os.path.basename(img_path)
-            available_images.append({
-                'filename': filename,
-                'path': f"../images/products/{filename}",
-                'size': os.path.getsize(img_path)
-            })
-
-    # 按优先级排序
-    def sort_priority(img):
-        name = img['filename'].lower()
-        if 'official' in name:
-            return 0
-        elif 'new' in name:
-            return 1
-        elif re.search(r'-\d+\.', name):
-            return 2
-        else:
-            return 3
+    for filename in get_image_matcher().for_product(product_id):
+        available_images.append({
+            'filename': filename,
+            'path': f"../images/products/{filename}",
+            'size': os.path.getsize(os.path.join(IMAGES_PRODUCTS, filename))
+        })
 
-    available_images.sort(key=sort_priority)
     return available_images
 
 def categorize_product_issues(js_check, img_config, file_check, available_images):
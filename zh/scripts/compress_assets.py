@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+预压缩工具
+为构建输出中的 HTML、CSS、JS、JSON、SVG 生成 .gz（以及安装了 brotli 时的 .br）同级文件，
+托管层可以直接返回预压缩版本。内容摘要未变的文件会被跳过。
+"""
+
+import os
+import gzip
+import argparse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from build_common import DIST_DIR, CACHE_DIR, file_digest, atomic_write_bytes, load_json, save_json
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = {'.html', '.css', '.js', '.json', '.svg'}
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+CACHE_FILE = os.path.join(CACHE_DIR, 'compression.json')
+
+def find_compressible_files(root):
+    """找出需要预压缩的文本文件（相对路径）"""
+    files = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+                full_path = os.path.join(dirpath, filename)
+                files.append(os.path.relpath(full_path, root).replace(os.sep, '/'))
+    return sorted(files)
+
+def compress_file(root, rel_path):
+    """压缩单个文件，返回 (相对路径, 原始大小, gzip 大小, brotli 大小或 None)"""
+    file_path = os.path.join(root, rel_path)
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    # mtime=0 保证相同输入得到相同输出
+    gz_data = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    atomic_write_bytes(file_path + '.gz', gz_data)
+
+    br_size = None
+    if brotli is not None:
+        br_data = brotli.compress(data, quality=BROTLI_QUALITY)
+        atomic_write_bytes(file_path + '.br', br_data)
+        br_size = len(br_data)
+
+    return rel_path, len(data), len(gz_data), br_size
+
+def compress_node(node, src_root, out_root):
+    """依赖图动作：压缩上游节点的输出文件"""
+    compress_file(out_root, node.params['target'])
+
+def add_compression_nodes(graph):
+    """依赖图扩展：为每个可压缩的输出添加压缩节点，依赖生成该输出的节点"""
+    from build_graph import BuildNode
+
+    suffixes = ['.gz'] + (['.br'] if brotli is not None else [])
+    for output, owner in sorted(graph.output_owner.items()):
+        if os.path.splitext(output)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+            continue
+        graph.add_node(BuildNode(
+            f'compress:{output}', 'compress', 'compress_assets:compress_node',
+            inputs=[], outputs=[output + suffix for suffix in suffixes],
+            deps=[owner], params={'target': output}
+        ))
+
+def sidecars_exist(file_path):
+    if not os.path.exists(file_path + '.gz'):
+        return False
+    return brotli is None or os.path.exists(file_path + '.br')
+
+def compress_site(root=DIST_DIR, workers=None, cache_file=CACHE_FILE):
+    """构建阶段入口：并行压缩 root 下的文本文件，返回统计信息"""
+    cache = load_json(cache_file, default={})
+    cache_key = os.path.abspath(root)
+    previous = cache.get(cache_key, {})
+    current = {}
+    pending = []
+    skipped = 0
+
+    for rel_path in find_compressible_files(root):
+        file_path = os.path.join(root, rel_path)
+        digest = file_digest(file_path)
+        current[rel_path] = digest
+        if previous.get(rel_path, {}).get('digest') == digest and sidecars_exist(file_path):
+            current[rel_path] = previous[rel_path]
+            skipped += 1
+        else:
+            pending.append(rel_path)
+
+    results = []
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(compress_file, [root] * len(pending), pending, chunksize=16))
+
+    for rel_path, original_size, gz_size, br_size in results:
+        current[rel_path] = {
+            'digest': current[rel_path],
+            'size': original_size,
+            'gzip': gz_size,
+            'brotli': br_size
+        }
+
+    cache[cache_key] = current
+    save_json(cache_file, cache)
+
+    # 按类型汇总（包含跳过的文件，比例反映整个输出目录）
+    by_type = defaultdict(lambda: {'files': 0, 'size': 0, 'gzip': 0, 'brotli': 0})
+    for rel_path, entry in current.items():
+        ext = os.path.splitext(rel_path)[1].lower()
+        totals = by_type[ext]
+        totals['files'] += 1
+        totals['size'] += entry['size']
+        totals['gzip'] += entry['gzip']
+        totals['brotli'] += entry['brotli'] or 0
+
+    return {
+        'compressed': len(results),
+        'skipped': skipped,
+        'brotli_available': brotli is not None,
+        'by_type': dict(by_type)
+    }
+
+def print_compression_report(stats):
+    """打印各类型压缩率"""
+    print("\n" + "="*80)
+    print("📊 预压缩结果")
+    print("="*80)
+    print(f"🗜️  本次压缩: {stats['compressed']} 个文件")
+    print(f"⏭️  摘要未变跳过: {stats['skipped']} 个文件")
+    if not stats['brotli_available']:
+        print("⚠️  未安装 brotli 模块，仅生成 .gz 文件（pip install brotli）")
+
+    print(f"\n{'类型':<8}{'文件数':>8}{'原始大小':>14}{'gzip':>14}{'gzip比例':>10}{'brotli':>14}{'br比例':>10}")
+    for ext, totals in sorted(stats['by_type'].items()):
+        size = totals['size'] or 1
+        gz_ratio = totals['gzip'] / size * 100
+        line = f"{ext:<8}{totals['files']:>8}{totals['size']:>14,}{totals['gzip']:>14,}{gz_ratio:>9.1f}%"
+        if stats['brotli_available']:
+            br_ratio = totals['brotli'] / size * 100
+            line += f"{totals['brotli']:>14,}{br_ratio:>9.1f}%"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description='为构建输出生成 gzip/brotli 预压缩文件')
+    parser.add_argument('--root', default=DIST_DIR, help='构建输出目录（默认 dist/）')
+    parser.add_argument('--workers', type=int, default=None, help='进程数（默认 CPU 核数）')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.root):
+        print(f"❌ 输出目录不存在: {args.root}，请先运行构建")
+        return
+
+    print("🗜️  开始生成预压缩文件...")
+    stats = compress_site(args.root, args.workers)
+    print_compression_report(stats)
+
+if __name__ == '__main__':
+    main()
@@ -9,6 +9,8 @@ import shutil
 import re
 from pathlib import Path
 
+from path_rewriter import compile_literals, match_prefix
+
 # 路径配置
 NEW_IMAGES_BASE = r"C:\Users\Administrator\Desktop\web\（提取图片）义德隆企业简介\产品"
 TARGET_IMAGES_DIR = r"D:\ai\新建文件夹\新建文件夹\7788\images\products"
@@ -141,6 +143,8 @@ def generate_image_mapping():
     print("\n=== 生成图片映射表 ===")
 
     mapping = {}
+    # 全部产品ID编译为一个前缀匹配正则，每个文件名只匹配一次（取最长的产品ID）
+    product_pattern = compile_literals(set(PRODUCT_MAPPING.values()))
 
     # 扫描目标目录中的所有图片
     for filename in os.listdir(TARGET_IMAGES_DIR):
@@ -148,12 +152,9 @@ def generate_image_mapping():
             continue
 
         # 提取产品ID
-        for product_id in PRODUCT_MAPPING.values():
-            if filename.startswith(product_id):
-                if product_id not in mapping:
-                    mapping[product_id] = []
-                mapping[product_id].append(filename)
-                break
+        product_id = match_prefix(product_pattern, filename)
+        if product_id:
+            mapping.setdefault(product_id, []).append(filename)
 
     # 输出映射结果
     print("\n产品图片映射结果:")
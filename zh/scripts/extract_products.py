@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+增量产品数据提取
+从 zh/products/*.html 提取产品数据，合并到 data/products-extracted-data.json。
+每条记录的 metadata.sourceDigest 保存源页面的内容摘要，只有摘要变化（或新增）的页面才会
+重新提取；提取在进程池中并行执行，结果在内存中合并后一次性原子写入数据文件，随后更新分片。
+
+合并规则：页面中提取到的字段覆盖原值，页面中没有的字段保留原值；源页面已不存在的记录原样保留。
+每次运行发生的字段变化（JSON Pointer 路径、旧值、新值）追加到 data/products-changelog.json。
+"""
+
+import os
+import sys
+import json
+import html
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+from build_common import SITE_ROOT, file_digest, atomic_write_text, load_json, save_json
+from html_tokens import tokenize, VOID_ELEMENTS
+from product_shards import DATA_FILE, write_shards
+
+PAGES_DIR = 'zh/products'
+# 页面的 lang 属性并不可靠（中文页面模板写的是 en），语言按目录确定
+LANGUAGE = 'zh-CN'
+CHANGELOG_FILE = 'zh/data/products-changelog.json'
+# 变更日志保留的运行次数
+CHANGELOG_RUNS = 50
+
+# ---------------------------------------------------------------------------
+# 元素树
+# ---------------------------------------------------------------------------
+
+class Element:
+    """由标记流构建的轻量元素节点；children 中的文本为已解码的字符串"""
+
+    __slots__ = ('name', 'attrs', 'children')
+
+    def __init__(self, name, attrs=None):
+        self.name = name
+        self.attrs = attrs or {}
+        self.children = []
+
+    @property
+    def classes(self):
+        return self.attrs.get('class', '').split()
+
+    def get(self, name, default=''):
+        return self.attrs.get(name, default)
+
+    def iter(self):
+        for child in self.children:
+            if isinstance(child, Element):
+                yield child
+                yield from child.iter()
+
+    def find_all(self, tag=None, cls=None, attrs=None):
+        """按标签名、class 和属性值查找后代元素"""
+        return [
+            element for element in self.iter()
+            if (tag is None or element.name == tag)
+            and (cls is None or cls in element.classes)
+            and all(element.attrs.get(key) == value for key, value in (attrs or {}).items())
+        ]
+
+    def find(self, tag=None, cls=None, attrs=None):
+        found = self.find_all(tag, cls, attrs)
+        return found[0] if found else None
+
+    def text(self):
+        """元素内全部文本，空白折叠为单个空格"""
+        parts = []
+
+        def collect(element):
+            for child in element.children:
+                if isinstance(child, Element):
+                    collect(child)
+                else:
+                    parts.append(child)
+        collect(self)
+        return ' '.join(''.join(parts).split())
+
+def parse_tree(source):
+    """把页面解析为元素树；结束标签与栈中元素不匹配时忽略，未闭合的元素在父元素结束时一并闭合"""
+    root = Element('#document')
+    stack = [root]
+    for token in tokenize(source):
+        if token.kind == 'text':
+            stack[-1].children.append(html.unescape(token.text))
+        elif token.kind == 'start':
+            attrs = {attr.name.lower(): html.unescape(attr.value or '') for attr in token.attrs}
+            element = Element(token.name, attrs)
+            stack[-1].children.append(element)
+            if token.name not in VOID_ELEMENTS and not token.self_closing:
+                stack.append(element)
+        elif token.kind == 'end':
+            for depth in range(len(stack) - 1, 0, -1):
+                if stack[depth].name == token.name:
+                    del stack[depth:]
+                    break
+    return root
+
+# ---------------------------------------------------------------------------
+# 字段提取
+# ---------------------------------------------------------------------------
+
+def icon_class(element):
+    icon = element.find('i') if element else None
+    return icon.get('class') if icon else ''
+
+def extract_seo(document):
+    seo = {}
+    title = document.find('title')
+    if title and title.text():
+        seo['title'] = title.text()
+    for key, name in (('description', 'description'), ('keywords', 'keywords')):
+        meta = document.find('meta', attrs={'name': name})
+        if meta and meta.get('content'):
+            seo[key] = meta.get('content')
+    canonical = document.find('link', attrs={'rel': 'canonical'})
+    if canonical and canonical.get('href'):
+        seo['canonicalUrl'] = canonical.get('href')
+    og_image = document.find('meta', attrs={'property': 'og:image'})
+    if og_image and og_image.get('content'):
+        seo['ogImage'] = og_image.get('content')
+    return seo
+
+def extract_breadcrumb(document):
+    items = []
+    trail = document.find('ol', 'breadcrumb')
+    for li in trail.find_all('li') if trail else []:
+        link = li.find('a')
+        item = {'name': li.text()}
+        if link and link.get('href'):
+            item['url'] = link.get('href')
+        if 'current' in li.classes or 'active' in li.classes:
+            item['active'] = True
+        items.append(item)
+    return items
+
+def extract_images(document):
+    image = document.find('img', 'main-image')
+    if not image:
+        return None
+    images = [path for path in image.get('data-images').split(',') if path.strip()]
+    main = image.get('src') or (images[0] if images else '')
+    return {'main': main, 'thumbnails': [path.strip() for path in images if path.strip() != main]}
+
+# 规格表中按表头识别的列，其余列均视为指标值
+UNIT_HEADERS = {'单位'}
+STANDARD_HEADERS = {'标准', '检测标准', '执行标准', '检测方法', '试验方法'}
+
+def extract_specifications(document):
+    """规格表按表头归一为 项目/指标/单位/标准 四列；多出的指标列（如优质等级）保存在 grades 中"""
+    table = document.find('table', 'specs-table-compact')
+    if not table:
+        return None
+    headers = [cell.text() for cell in table.find_all('th')]
+    unit_column = next((i for i, header in enumerate(headers) if header in UNIT_HEADERS), None)
+    standard_column = next((i for i, header in enumerate(headers) if header in STANDARD_HEADERS), None)
+    value_columns = [i for i in range(1, len(headers)) if i not in (unit_column, standard_column)]
+
+    def cell(cells, index):
+        return cells[index] if index is not None and index < len(cells) else ''
+
+    data = []
+    for row in table.find_all('tr'):
+        cells = [td.text() for td in row.find_all('td')]
+        if not cells:
+            continue
+        item = {
+            'property': cells[0],
+            'value': cell(cells, value_columns[0] if value_columns else None),
+            'unit': cell(cells, unit_column),
+            'standard': cell(cells, standard_column)
+        }
+        grades = [{'label': headers[i], 'value': cell(cells, i)} for i in value_columns[1:] if cell(cells, i)]
+        if grades:
+            item['grades'] = grades
+        data.append(item)
+    if not data:
+        return None
+
+    header_row = [headers[0] if headers else '项目',
+                  headers[value_columns[0]] if value_columns else '指标',
+                  cell(headers, unit_column) or '单位',
+                  cell(headers, standard_column) or '标准']
+    return {'headers': header_row, 'data': data}
+
+def extract_cards(document, cls, content_cls, title_key):
+    """特点、应用等卡片：图标、标题和说明"""
+    cards = []
+    for card in document.find_all(cls=cls):
+        content = card.find(cls=content_cls) or card
+        heading = content.find('h4')
+        paragraph = content.find('p')
+        cards.append({
+            title_key: heading.text() if heading else '',
+            'icon': icon_class(card),
+            'description': paragraph.text() if paragraph else ''
+        })
+    return cards
+
+def extract_related(document):
+    related = []
+    for card in document.find_all(cls='product-card-compact'):
+        heading = card.find('h4')
+        link = card.find('a')
+        related.append({
+            'name': heading.text() if heading else '',
+            'url': link.get('href') if link else '',
+            'icon': icon_class(card)
+        })
+    return related
+
+def extract_schema_org(document):
+    for script in document.find_all('script', attrs={'type': 'application/ld+json'}):
+        try:
+            return json.loads(script.text())
+        except ValueError:
+            continue
+    return None
+
+def extract_product(document):
+    product = {}
+    title = document.find(cls='product-title')
+    if title and title.text():
+        product['name'] = {'chinese': title.text()}
+
+    description = {}
+    subtitle = document.find(cls='product-subtitle')
+    if subtitle and subtitle.text():
+        description['subtitle'] = subtitle.text()
+    summary = document.find('div', 'product-description')
+    if summary and summary.text():
+        description['summary'] = summary.text()
+    product['description'] = description or None
+
+    # 页面中不存在的区块为 None，合并时保留原值
+    product['breadcrumb'] = extract_breadcrumb(document) or None
+    product['images'] = extract_images(document)
+    product['highlights'] = [
+        {'icon': icon_class(item), 'text': (item.find('span') or item).text()}
+        for item in document.find_all(cls='highlight-item')
+    ] or None
+    summary_specs = document.find(cls='specs-summary')
+    product['quickSpecs'] = [
+        {'label': (item.find(cls='spec-label') or item).text(), 'value': (item.find(cls='spec-value') or item).text()}
+        for item in (summary_specs.find_all(cls='spec-item') if summary_specs else [])
+    ] or None
+    product['specifications'] = extract_specifications(document)
+    product['features'] = extract_cards(document, 'feature-item-compact', 'feature-content', 'title') or None
+    industries = extract_cards(document, 'app-item-compact', 'app-content-compact', 'name')
+    product['applications'] = {'industries': industries} if industries else None
+    product['relatedProducts'] = extract_related(document) or None
+    return product
+
+def extract_page(src_root, filename):
+    """提取单个页面，返回 (文件名, 提取结果)；在工作进程中执行"""
+    path = os.path.join(src_root, PAGES_DIR, filename)
+    with open(path, 'r', encoding='utf-8') as f:
+        document = parse_tree(f.read())
+    stat = os.stat(path)
+    record = {
+        'metadata': {
+            'filename': filename,
+            'lastModified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            'language': LANGUAGE,
+            'fileSize': stat.st_size,
+            'sourceDigest': file_digest(path)
+        },
+        'seo': extract_seo(document),
+        'product': extract_product(document),
+        'schemaOrg': extract_schema_org(document)
+    }
+    return filename, record
+
+# ---------------------------------------------------------------------------
+# 合并与变更记录
+# ---------------------------------------------------------------------------
+
+def merge_record(existing, extracted):
+    """提取结果覆盖原值：对象逐键合并，列表和标量整体替换；提取结果中没有的键（或为 None）保留原值"""
+    if not isinstance(existing, dict) or not isinstance(extracted, dict):
+        return existing if extracted is None else extracted
+    merged = dict(existing)
+    for key, value in extracted.items():
+        if value is not None:
+            merged[key] = merge_record(existing.get(key), value)
+    return merged
+
+def escape_pointer(token):
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+def diff_values(old, new, pointer=''):
+    """比较两个 JSON 值，返回 [{path, old, new}]；对象逐键比较，列表和标量整体比较"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for key in list(old) + [key for key in new if key not in old]:
+            changes.extend(diff_values(old.get(key), new.get(key), f'{pointer}/{escape_pointer(key)}'))
+        return changes
+    if old == new:
+        return []
+    return [{'path': pointer, 'old': old, 'new': new}]
+
+def record_changes(old, new):
+    """记录的字段变化；lastModified、fileSize 和摘要属于来源信息，不计入变更"""
+    ignored = {'/metadata/lastModified', '/metadata/fileSize', '/metadata/sourceDigest'}
+    return [change for change in diff_values(old or {}, new) if change['path'] not in ignored]
+
+def append_changelog(src_root, run):
+    path = os.path.join(src_root, CHANGELOG_FILE)
+    changelog = load_json(path, default={'runs': []})
+    changelog['runs'] = (changelog.get('runs', []) + [run])[-CHANGELOG_RUNS:]
+    save_json(path, changelog)
+
+# ---------------------------------------------------------------------------
+# 增量提取
+# ---------------------------------------------------------------------------
+
+def source_pages(src_root=SITE_ROOT):
+    pages_dir = os.path.join(src_root, PAGES_DIR)
+    if not os.path.isdir(pages_dir):
+        return []
+    return sorted(name for name in os.listdir(pages_dir) if name.endswith('.html'))
+
+def records_by_filename(products):
+    """{源页面文件名: 产品ID}"""
+    return {
+        (record.get('metadata') or {}).get('filename') or f'{product_id}.html': product_id
+        for product_id, record in products.items()
+    }
+
+def plan_extraction(src_root, products, force=False):
+    """返回 (待提取页面, 未变化页面数, 源页面缺失的产品ID)"""
+    by_filename = records_by_filename(products)
+    pending, unchanged = [], 0
+    pages = source_pages(src_root)
+    for filename in pages:
+        product_id = by_filename.get(filename)
+        known = ((products.get(product_id) or {}).get('metadata') or {}).get('sourceDigest')
+        if not force and known and known == file_digest(os.path.join(src_root, PAGES_DIR, filename)):
+            unchanged += 1
+        else:
+            pending.append(filename)
+    missing = sorted(product_id for filename, product_id in by_filename.items() if filename not in pages)
+    return pending, unchanged, missing
+
+def extract_incremental(src_root=SITE_ROOT, force=False, dry_run=False, workers=None):
+    """增量提取并合并，返回统计信息和本次的字段变化"""
+    data_path = os.path.join(src_root, DATA_FILE)
+    data = load_json(data_path, default={'summary': {}, 'products': {}})
+    products = data.get('products', {})
+    by_filename = records_by_filename(products)
+    pending, unchanged, missing = plan_extraction(src_root, products, force)
+
+    extracted, failed = {}, []
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {filename: executor.submit(extract_page, src_root, filename) for filename in pending}
+            for filename, future in futures.items():
+                try:
+                    extracted[filename] = future.result()[1]
+                except (OSError, UnicodeDecodeError) as e:
+                    failed.append({'filename': filename, 'error': str(e)})
+
+    merged_products = dict(products)
+    changes = {}
+    for filename, record in extracted.items():
+        product_id = by_filename.get(filename) or os.path.splitext(filename)[0]
+        previous = products.get(product_id)
+        merged = merge_record(previous or {}, record)
+        merged_products[product_id] = merged
+        product_changes = record_changes(previous, merged)
+        if product_changes:
+            changes[product_id] = product_changes
+
+    stats = {
+        'pages': unchanged + len(pending),
+        'extracted': len(extracted),
+        'unchanged': unchanged,
+        'failed': failed,
+        'changed': len(changes),
+        'missing_sources': missing
+    }
+    if dry_run or not extracted:
+        return stats, changes
+
+    summary = dict(data.get('summary', {}))
+    summary.update({
+        'total_files': len(merged_products),
+        'successful': len(merged_products) - len(failed),
+        'failed': len(failed),
+        'failed_files': [item['filename'] for item in failed],
+        'extraction_time': datetime.now().isoformat()
+    })
+    # 整个数据集在内存中合并完成后一次性原子替换
+    atomic_write_text(data_path, json.dumps({'summary': summary, 'products': dict(sorted(merged_products.items()))},
+                                            ensure_ascii=False, indent=2))
+    stats['shards'] = write_shards(src_root)
+    if changes:
+        append_changelog(src_root, {'time': summary['extraction_time'], 'products': changes})
+    return stats, changes
+
+def print_changes(changes, limit):
+    for product_id, product_changes in sorted(changes.items()):
+        print(f"\n📝 {product_id}: {len(product_changes)} 处变化")
+        for change in product_changes[:limit]:
+            old = json.dumps(change['old'], ensure_ascii=False)
+            new = json.dumps(change['new'], ensure_ascii=False)
+            print(f"   {change['path']}: {old[:60]} → {new[:60]}")
+        if len(product_changes) > limit:
+            print(f"   ... 另有 {len(product_changes) - limit} 处")
+
+def main():
+    parser = argparse.ArgumentParser(description='增量提取产品页面数据')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--force', action='store_true', help='忽略摘要，重新提取全部页面')
+    parser.add_argument('--dry-run', action='store_true', help='只显示字段变化，不写入数据文件')
+    parser.add_argument('--workers', type=int, default=None, help='并行进程数（默认 CPU 核数）')
+    parser.add_argument('--limit', type=int, default=10, help='每个产品最多显示的变化条数')
+    args = parser.parse_args()
+
+    print("🔍 开始增量提取产品数据...")
+    start = time.perf_counter()
+    stats, changes = extract_incremental(os.path.abspath(args.src), args.force, args.dry_run, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print_changes(changes, args.limit)
+    print(f"\n✅ 源页面: {stats['pages']} 个")
+    print(f"🔄 重新提取: {stats['extracted']} 个")
+    print(f"⏭️  内容未变: {stats['unchanged']} 个")
+    print(f"📝 字段变化的产品: {stats['changed']} 个")
+    if stats['missing_sources']:
+        print(f"📦 源页面缺失（保留原记录）: {len(stats['missing_sources'])} 个")
+    if 'shards' in stats:
+        print(f"🧩 分片写入: {stats['shards']['written']} 个")
+    if args.dry_run:
+        print("🧪 预演模式，未写入数据文件")
+    print(f"⏱️  耗时: {elapsed * 1000:.0f} ms")
+
+    if stats['failed']:
+        print(f"\n❌ 提取失败: {len(stats['failed'])} 个")
+        for item in stats['failed']:
+            print(f"   - {item['filename']}: {item['error']}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+产品分面筛选索引
+在构建时为产品中心生成分面索引 data/facet-index.json：分类、应用行业、使用温度档、Al₂O₃ 含量档、徽章。
+每个分面取值对应一个按产品位置编号的位图（32 位整数数组），位序与 data/products.json 中的卡片顺序一致。
+浏览器端（js/product-facets.js）多条件筛选只需对位图做按位与/或，分面计数为位图交集的 popcount。
+
+温度和 Al₂O₃ 优先取卡片规格（"使用温度: 1600-1700℃"、"Al₂O₃: ≥48%"），
+卡片没有时退回数值参数存储（parameter_store.py）中的耐火度、使用温度和 Al₂O₃ 区间。
+"""
+
+import os
+import json
+import math
+import argparse
+
+from build_common import SITE_ROOT, ZH_DIR, atomic_write_text, load_json
+from parameter_store import parse_value, parameter_key
+
+INDEX_VERSION = 1
+INDEX_FILE = os.path.join(ZH_DIR, 'data', 'facet-index.json')
+PRODUCTS_FILE = 'zh/data/products.json'
+NAVIGATION_FILE = 'zh/data/navigation-config.json'
+WORD_BITS = 32
+
+# 应用行业：卡片中的应用标签按关键词归并到行业，一个产品可属于多个行业
+INDUSTRIES = [
+    ('steel', '钢铁冶金', ('钢铁', '冶金', '冶炼', '高炉', '铁水', '精炼', '热风炉')),
+    ('cement', '水泥建材', ('水泥', '建材')),
+    ('glass', '玻璃工业', ('玻璃',)),
+    ('nonferrous', '有色金属', ('有色',)),
+    ('petrochemical', '石化化工', ('石化', '化工', '煤气化')),
+    ('ceramics', '陶瓷工业', ('陶瓷',)),
+    ('coking', '焦化工业', ('焦化', '焦炉')),
+    ('power', '电力工业', ('电力',)),
+    ('insulation', '保温节能', ('保温', '隔热', '节能')),
+    ('repair', '维修施工', ('维修', '修补', '补强', '施工')),
+]
+
+# 最高使用温度档：(值, 名称, 下限（不含）, 上限（含）)
+TEMPERATURE_BANDS = [
+    ('t1300', '1300℃及以下', None, 1300),
+    ('t1500', '1300-1500℃', 1300, 1500),
+    ('t1700', '1500-1700℃', 1500, 1700),
+    ('t1700plus', '1700℃以上', 1700, None),
+]
+# Al₂O₃ 最低含量档：(值, 名称, 下限（含）, 上限（不含）)
+ALUMINA_BANDS = [
+    ('a45', '45%以下', None, 45),
+    ('a65', '45-65%', 45, 65),
+    ('a85', '65-85%', 65, 85),
+    ('a85plus', '85%以上', 85, None),
+]
+
+TEMPERATURE_KEYS = ('service_temperature', 'refractoriness')
+
+def slug_from_href(href):
+    return os.path.splitext(os.path.basename(href or ''))[0]
+
+def card_ranges(product):
+    """卡片规格中可解析的数值区间：{参数键: (下限, 上限)}"""
+    ranges = {}
+    for spec in product.get('specs') or []:
+        label, sep, value = spec.partition(':')
+        key = parameter_key(label) if sep else None
+        parsed = parse_value(value) if key else None
+        if parsed and key not in ranges:
+            ranges[key] = parsed[:2]
+    return ranges
+
+def max_temperature(ranges):
+    """最高使用温度：区间上限，上限未知时取下限"""
+    for key in TEMPERATURE_KEYS:
+        if key in ranges:
+            low, high = ranges[key]
+            return high if not math.isinf(high) else low
+    return None
+
+def min_alumina(ranges):
+    """最低 Al₂O₃ 含量：区间下限，下限未知时取上限"""
+    if 'al2o3' not in ranges:
+        return None
+    low, high = ranges['al2o3']
+    return low if not math.isinf(low) else high
+
+def temperature_band(value):
+    for band, _, lower, upper in TEMPERATURE_BANDS:
+        if (lower is None or value > lower) and (upper is None or value <= upper):
+            return band
+    return None
+
+def alumina_band(value):
+    for band, _, lower, upper in ALUMINA_BANDS:
+        if (lower is None or value >= lower) and (upper is None or value < upper):
+            return band
+    return None
+
+def industries(applications):
+    found = []
+    for value, _, keywords in INDUSTRIES:
+        if any(keyword in application for application in applications for keyword in keywords):
+            found.append(value)
+    return found
+
+# ---------------------------------------------------------------------------
+# 位图
+# ---------------------------------------------------------------------------
+
+def to_bitset(positions, size):
+    words = [0] * ((size + WORD_BITS - 1) // WORD_BITS)
+    for position in positions:
+        words[position // WORD_BITS] |= 1 << (position % WORD_BITS)
+    return words
+
+def from_bitset(words):
+    return [
+        index * WORD_BITS + bit
+        for index, word in enumerate(words)
+        for bit in range(WORD_BITS)
+        if word >> bit & 1
+    ]
+
+def build_facets(src_root=SITE_ROOT, store=None):
+    """返回 (产品ID列表, {分面: {取值: [产品位置...]}})"""
+    products = load_json(os.path.join(src_root, PRODUCTS_FILE), default=[])
+    if store is None:
+        from parameter_store import load_store
+        from product_catalog import open_catalog
+        store = load_store(open_catalog(src_root))
+    fallback = {key: store.ranges(key) for key in TEMPERATURE_KEYS + ('al2o3',) if key in store.keys}
+
+    ids = []
+    facets = {'category': {}, 'industry': {}, 'temperature': {}, 'alumina': {}, 'badge': {}}
+    for position, product in enumerate(products):
+        product_id = slug_from_href(product.get('href')) or str(product.get('id', position))
+        ids.append(product_id)
+        ranges = card_ranges(product)
+        for key, values in fallback.items():
+            if key not in ranges and product_id in values:
+                ranges[key] = values[product_id]
+
+        assignments = {
+            'category': [product.get('category')] if product.get('category') else [],
+            'industry': industries(product.get('applications') or []),
+            'badge': list(dict.fromkeys(product.get('badges') or [])),
+        }
+        temperature = max_temperature(ranges)
+        assignments['temperature'] = [temperature_band(temperature)] if temperature is not None else []
+        alumina = min_alumina(ranges)
+        assignments['alumina'] = [alumina_band(alumina)] if alumina is not None else []
+
+        for facet, values in assignments.items():
+            for value in values:
+                facets[facet].setdefault(value, []).append(position)
+    return ids, facets
+
+def build_index(src_root=SITE_ROOT, store=None):
+    ids, facets = build_facets(src_root, store)
+    navigation = load_json(os.path.join(src_root, NAVIGATION_FILE), default={})
+    category_labels = {value: key for key, value in navigation.get('categoryMapping', {}).items()}
+    # 每个分面的取值顺序与名称
+    definitions = [
+        ('category', '产品分类', [(value, category_labels.get(value, value)) for value in facets['category']]),
+        ('industry', '应用行业', [(value, label) for value, label, _ in INDUSTRIES]),
+        ('temperature', '使用温度', [(value, label) for value, label, _, _ in TEMPERATURE_BANDS]),
+        ('alumina', 'Al₂O₃ 含量', [(value, label) for value, label, _, _ in ALUMINA_BANDS]),
+        ('badge', '产品特色', [(value, value) for value in facets['badge']]),
+    ]
+    return {
+        'version': INDEX_VERSION,
+        'count': len(ids),
+        'wordBits': WORD_BITS,
+        'ids': ids,
+        'facets': [
+            {
+                'key': facet,
+                'label': label,
+                'values': [
+                    {'value': value, 'label': value_label, 'bits': to_bitset(facets[facet][value], len(ids))}
+                    for value, value_label in values if value in facets[facet]
+                ]
+            }
+            for facet, label, values in definitions
+        ]
+    }
+
+def serialize_index(index):
+    return json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+
+# ---------------------------------------------------------------------------
+# 依赖图集成
+# ---------------------------------------------------------------------------
+
+def build_facet_index(node, src_root, out_root):
+    """依赖图动作：生成分面索引"""
+    atomic_write_text(os.path.join(out_root, node.outputs[0]), serialize_index(build_index(src_root)))
+
+def add_facet_index_node(graph):
+    """依赖图扩展：分面索引以产品目录的全部源文件为输入"""
+    from build_graph import BuildNode
+    from product_catalog import source_files
+
+    if not os.path.exists(os.path.join(graph.src_root, PRODUCTS_FILE)):
+        return
+    output = os.path.relpath(INDEX_FILE, SITE_ROOT).replace(os.sep, '/')
+    graph.add_node(BuildNode('facet-index', 'generate', 'facet_index:build_facet_index',
+                             inputs=[('file', path) for path in source_files(graph.src_root)],
+                             outputs=[output]))
+
+def main():
+    parser = argparse.ArgumentParser(description='生成产品中心分面筛选索引')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=INDEX_FILE, help='索引文件（默认 zh/data/facet-index.json）')
+    args = parser.parse_args()
+
+    print("🧮 开始生成分面索引...")
+    index = build_index(os.path.abspath(args.src))
+    data = serialize_index(index)
+    atomic_write_text(args.out, data)
+
+    print(f"\n✅ 产品: {index['count']} 个")
+    for facet in index['facets']:
+        counts = ', '.join(f"{value['label']} {len(from_bitset(value['bits']))}" for value in facet['values'])
+        print(f"   - {facet['label']}: {counts}")
+    print(f"📦 索引大小: {len(data.encode('utf-8')):,} 字节")
+    print(f"📄 已保存到: {args.out}")
+
+if __name__ == '__main__':
+    main()
@@ -6,10 +6,24 @@
 """
 
 import os
-import re
+import sys
 import json
 from datetime import datetime
 
+from page_rules import check_page, check_pages
+from product_catalog import open_catalog, product_page_ids
+
+# 验证使用的规则集（见 page-rules.json）
+RULESET = 'verification'
+# 规则集评分类别 → 报告中的检查项名称
+CHECK_NAMES = {
+    'html': 'html_structure',
+    'images': 'image_config',
+    'javascript': 'javascript',
+    'carousel': 'carousel',
+    'quote': 'quote_function'
+}
+
 def main():
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     products_dir = os.path.join(base_dir, 'products')
@@ -19,8 +33,8 @@ def main():
     print(f"📅 验证时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*80)
 
-    # 获取所有产品页面
-    product_files = [f for f in os.listdir(products_dir) if f.endswith('.html')]
+    # 获取所有产品页面（取自产品目录 product_catalog.py）
+    product_files = [f'{product_id}.html' for product_id in product_page_ids(open_catalog())]
 
     verification_results = {
         'total_products': len(product_files),
@@ -40,6 +54,14 @@ def main():
 
     print("🔍 开始验证...")
 
+    # 所有页面并行检查，每个页面只解析一次
+    paths = [os.path.join(products_dir, filename) for filename in sorted(product_files)]
+    try:
+        page_results = check_pages(paths, RULESET, images_dir)
+    except ValueError as e:
+        print(f"❌ 规则配置错误: {e}")
+        sys.exit(1)
+
     for i, filename in enumerate(sorted(product_files), 1):
         product_id = filename.replace('.html', '')
         is_priority = product_id in priority_products
@@ -47,7 +69,8 @@ def main():
         priority_marker = "⭐" if is_priority else "  "
         print(f"{priority_marker}[{i:2d}/{len(product_files)}] 验证 {product_id}")
 
-        result = verify_product(product_id, products_dir, images_dir)
+        result = verify_product(product_id, products_dir, images_dir,
+                                page_results[os.path.join(products_dir, filename)])
 
         # 分类结果
         if result['score'] >= 95:
@@ -65,8 +88,8 @@ def main():
     # 生成最终报告
     generate_final_report(verification_results, priority_products, base_dir)
 
-def verify_product(product_id, products_dir, images_dir):
-    """验证单个产品页面"""
+def verify_product(product_id, products_dir, images_dir, page_result=None):
+    """验证单个产品页面；page_result 为规则引擎的检查结果（未提供时单独检查该页面）"""
     result = {
         'product_id': product_id,
         'score': 0,
@@ -81,33 +104,14 @@ def verify_product(product_id, products_dir, images_dir):
         result['issues'].append('产品文件不存在')
         return result
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # 1. HTML结构检查 (20分)
-    html_score = check_html_structure(content)
-    result['checks']['html_structure'] = html_score
-    result['score'] += html_score
-
-    # 2. 图片配置检查 (25分)
-    img_score = check_image_configuration(content, images_dir)
-    result['checks']['image_config'] = img_score
-    result['score'] += img_score
-
-    # 3. JavaScript引用检查 (20分)
-    js_score = check_javascript_references(content)
-    result['checks']['javascript'] = js_score
-    result['score'] += js_score
-
-    # 4. 轮播功能检查 (20分)
-    carousel_score = check_carousel_functionality(content)
-    result['checks']['carousel'] = carousel_score
-    result['score'] += carousel_score
-
-    # 5. 获取报价功能检查 (15分)
-    quote_score = check_quote_functionality(content, product_id)
-    result['checks']['quote_function'] = quote_score
-    result['score'] += quote_score
+    # HTML结构(20)、图片配置(25)、JavaScript引用(20)、轮播功能(20)、获取报价(15)
+    # 各项的检查和扣分都在 verification 规则集中配置
+    if page_result is None:
+        page_result = check_page(filepath, RULESET, images_dir)
+    for category, check_name in CHECK_NAMES.items():
+        result['checks'][check_name] = page_result['scores'][category]
+    result['score'] = page_result['score']
+    result['issues'] = [issue['message'] for issue in page_result['issues']]
 
     # 确定状态
     if result['score'] >= 95:
@@ -121,132 +125,6 @@ def verify_product(product_id, products_dir, images_dir):
 
     return result
 
-def check_html_structure(content):
-    """检查HTML结构 (20分)"""
-    score = 20
-    issues = []
-
-    # 检查未闭合的img标签
-    unclosed_img = re.findall(r'<img[^>]*(?<!/)>', content)
-    if unclosed_img:
-        score -= 10
-        issues.append(f'发现{len(unclosed_img)}个未闭合img标签')
-
-    # 检查基本结构元素
-    required_elements = [
-        r'<h1[^>]*class="product-title"',
-        r'<img[^>]*class="main-image"',
-        r'<div[^>]*class="product-info"'
-    ]
-
-    for element in required_elements:
-        if not re.search(element, content):
-            score -= 3
-            issues.append(f'缺少必需元素')
-
-    return max(0, score)
-
-def check_image_configuration(content, images_dir):
-    """检查图片配置 (25分)"""
-    score = 25
-    issues = []
-
-    # 检查主图片
-    main_img_match = re.search(r'<img[^>]*class="main-image"[^>]*src="([^"]*)"', content)
-    if not main_img_match:
-        score -= 10
-        issues.append('缺少主图片')
-        return max(0, score)
-
-    main_img_src = main_img_match.group(1).replace('../images/products/', '')
-
-    # 检查主图片文件是否存在
-    main_img_path = os.path.join(images_dir, main_img_src)
-    if not os.path.exists(main_img_path):
-        score -= 15
-        issues.append('主图片文件不存在')
-
-    # 检查data-images配置
-    data_images_match = re.search(r'data-images="([^"]*)"', content)
-    if data_images_match:
-        data_images = data_images_match.group(1)
-
-        # 检查是否包含placeholder.jpg
-        if 'placeholder.jpg' in data_images:
-            score -= 8
-            issues.append('data-images包含placeholder.jpg')
-
-        # 检查所有配置的图片是否存在
-        if data_images.strip():
-            images = [img.strip().replace('../images/products/', '')
-                     for img in data_images.split(',') if img.strip()]
-
-            for img in images:
-                img_path = os.path.join(images_dir, img)
-                if not os.path.exists(img_path):
-                    score -= 5
-                    issues.append(f'图片文件不存在: {img}')
-
-    return max(0, score)
-
-def check_javascript_references(content):
-    """检查JavaScript引用 (20分)"""
-    score = 20
-    required_scripts = [
-        'multi-image-gallery.js',
-        'modal-components.js',
-        'placeholder-randomizer.js'
-    ]
-
-    for script in required_scripts:
-        if script not in content:
-            score -= 7
-
-    return max(0, score)
-
-def check_carousel_functionality(content):
-    """检查轮播功能 (20分)"""
-    score = 20
-
-    # 检查data-images配置
-    data_images_match = re.search(r'data-images="([^"]*)"', content)
-    if data_images_match:
-        data_images = data_images_match.group(1)
-
-        if data_images.strip():
-            images = [img.strip() for img in data_images.split(',') if img.strip()]
-
-            # 单图片不应该启用复杂轮播
-            if len(images) == 1:
-                # 这是正确的，单图片应该简单显示
-                pass
-            elif len(images) > 1:
-                # 多图片应该有轮播功能
-                if 'multi-image-gallery' not in content:
-                    score -= 10
-        else:
-            # 空配置，检查是否有data-placeholder
-            if 'data-placeholder="true"' not in content:
-                score -= 5
-
-    return max(0, score)
-
-def check_quote_functionality(content, product_id):
-    """检查获取报价功能 (15分)"""
-    score = 15
-
-    # 检查获取报价按钮
-    quote_button_match = re.search(r'openInquiryModal\([\'"]([^\'"]*)[\'"]', content)
-    if not quote_button_match:
-        score -= 8
-        return max(0, score)
-
-    modal_product_id = quote_button_match.group(1)
-    if modal_product_id != product_id:
-        score -= 7
-
-    return max(0, score)
-
 def print_verification_status(product_id, result, is_priority):
     """打印验证状态"""
     status_icons = {
@@ -6,10 +6,13 @@
 """
 
 import os
+import sys
 import json
 import re
 import shutil
-from pathlib import Path
+import argparse
+
+from page_rewriter import edit, rewrite_pages, add_dry_run_argument, RewriteError, print_rewrite_error
 
 # 路径配置
 PROJECT_ROOT = r"D:\ai\新建文件夹\新建文件夹\7788"
@@ -17,6 +20,10 @@ PRODUCTS_DIR = os.path.join(PROJECT_ROOT, "products")
 IMAGES_PRODUCTS = os.path.join(PROJECT_ROOT, "images", "products")
 SCRIPTS_DIR = os.path.join(PROJECT_ROOT, "scripts")
 
+# 诊断结果中的问题类别（见 comprehensive-product-diagnosis.py）
+CATEGORY_A = 'A - 缺少JavaScript'
+CATEGORY_B = 'B - 缺少图片配置'
+
 def load_diagnosis_results():
     """加载诊断结果"""
     report_file = os.path.join(SCRIPTS_DIR, 'comprehensive_product_diagnosis.json')
@@ -27,17 +34,11 @@ def load_diagnosis_results():
         print(f"❌ 无法加载诊断结果: {e}")
         return None
 
-def fix_javascript_references(product_id):
-    """修复JavaScript引用问题 (A类问题)"""
-    html_file = os.path.join(PRODUCTS_DIR, f"{product_id}.html")
-
-    try:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        return False, [f"读取文件失败: {e}"]
+def page_path(product_id):
+    return os.path.join(PRODUCTS_DIR, f"{product_id}.html")
 
-    original_content = content
+def fix_javascript_references(content):
+    """修复JavaScript引用问题 (A类问题)，在内存中处理页面内容，返回 (新内容, 修复项目)"""
     fixes_applied = []
 
     # 检查是否已有multi-image-gallery.js引用
@@ -60,34 +61,16 @@ def fix_javascript_references(product_id):
                 content = re.sub(head_end_pattern, new_script, content)
                 fixes_applied.append("添加multi-image-gallery.js引用")
 
-    # 写回文件
-    if content != original_content:
-        try:
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True, fixes_applied
-        except Exception as e:
-            return False, [f"写入文件失败: {e}"]
-
-    return False, ["无需修复或修复失败"]
-
-def fix_image_configuration(product_id, diagnosis_result):
-    """修复图片配置问题 (B类问题)"""
-    html_file = os.path.join(PRODUCTS_DIR, f"{product_id}.html")
-
-    try:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        return False, [f"读取文件失败: {e}"]
+    return content, fixes_applied
 
-    original_content = content
+def fix_image_configuration(content, product_id, diagnosis_result):
+    """修复图片配置问题 (B类问题)，在内存中处理页面内容，返回 (新内容, 修复项目)"""
     fixes_applied = []
 
     # 获取可用图片
     available_images = diagnosis_result['available_images']
     if not available_images:
-        return False, ["没有可用的图片文件"]
+        return content, []
 
     # 选择最佳图片
     main_image = available_images[0]['path']
@@ -140,25 +123,30 @@ def fix_image_configuration(product_id, diagnosis_result):
         content = re.sub(status_pattern, r'<div class="image-status" style="display: none;"\1>', content)
         fixes_applied.append("隐藏图片状态指示器")
 
-    # 写回文件
-    if content != original_content:
-        try:
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True, fixes_applied
-        except Exception as e:
-            return False, [f"写入文件失败: {e}"]
-
-    return False, fixes_applied if fixes_applied else ["无需修复"]
+    return content, fixes_applied
+
+def category_products(diagnosis_data, category):
+    """诊断结果中属于指定类别的产品"""
+    return [
+        product_id for product_id, result in diagnosis_data['detailed_results'].items()
+        if result['categorization']['category'] == category
+    ]
+
+def plan_fixes(diagnosis_data):
+    """为A类和B类产品生成页面编辑计划"""
+    plan = {}
+    for product_id in category_products(diagnosis_data, CATEGORY_A):
+        plan.setdefault(page_path(product_id), []).append(edit(fix_javascript_references))
+    for product_id in category_products(diagnosis_data, CATEGORY_B):
+        diagnosis_result = diagnosis_data['detailed_results'][product_id]
+        plan.setdefault(page_path(product_id), []).append(edit(fix_image_configuration, product_id, diagnosis_result))
+    return plan
 
-def run_category_a_fixes(diagnosis_data):
-    """修复A类问题：35个缺少JavaScript的产品"""
+def run_category_a_fixes(diagnosis_data, pages, dry_run=False):
+    """报告A类问题修复结果：35个缺少JavaScript的产品"""
     print("🚨 开始修复A类问题：JavaScript缺失")
 
-    category_a_products = []
-    for product_id, result in diagnosis_data['detailed_results'].items():
-        if result['categorization']['category'] == 'A - 缺少JavaScript':
-            category_a_products.append(product_id)
+    category_a_products = category_products(diagnosis_data, CATEGORY_A)
 
     print(f"   需要修复的产品: {len(category_a_products)} 个")
 
@@ -168,28 +156,28 @@ def run_category_a_fixes(diagnosis_data):
     for i, product_id in enumerate(category_a_products, 1):
         print(f"   [{i:2d}/{len(category_a_products)}] 修复: {product_id}")
 
-        success, fixes = fix_javascript_references(product_id)
-        if success:
-            print(f"      ✅ {', '.join(fixes)}")
+        page = pages[page_path(product_id)]
+        if page['changed']:
+            print(f"      {'🔍 将修复' if dry_run else '✅'} {', '.join(page['notes'])}")
             fixed_count += 1
         else:
-            print(f"      ❌ {', '.join(fixes)}")
+            print(f"      ❌ 无需修复或修复失败")
             failed_products.append(product_id)
 
-    print(f"\n   📊 A类修复结果: {fixed_count}/{len(category_a_products)} 成功")
+    if dry_run:
+        print(f"\n   🔍 A类将修复: {fixed_count}/{len(category_a_products)}")
+    else:
+        print(f"\n   📊 A类修复结果: {fixed_count}/{len(category_a_products)} 成功")
     if failed_products:
         print(f"   ❌ 失败的产品: {', '.join(failed_products)}")
 
     return fixed_count, failed_products
 
-def run_category_b_fixes(diagnosis_data):
-    """修复B类问题：4个缺少图片配置的产品"""
+def run_category_b_fixes(diagnosis_data, pages, dry_run=False):
+    """报告B类问题修复结果：4个缺少图片配置的产品"""
     print("\n⚙️ 开始修复B类问题：图片配置缺失")
 
-    category_b_products = []
-    for product_id, result in diagnosis_data['detailed_results'].items():
-        if result['categorization']['category'] == 'B - 缺少图片配置':
-            category_b_products.append(product_id)
+    category_b_products = category_products(diagnosis_data, CATEGORY_B)
 
     print(f"   需要修复的产品: {len(category_b_products)} 个")
 
@@ -199,17 +187,21 @@ def run_category_b_fixes(diagnosis_data):
     for i, product_id in enumerate(category_b_products, 1):
         print(f"   [{i:2d}/{len(category_b_products)}] 修复: {product_id}")
 
-        diagnosis_result = diagnosis_data['detailed_results'][product_id]
-        success, fixes = fix_image_configuration(product_id, diagnosis_result)
-
-        if success:
-            print(f"      ✅ {', '.join(fixes)}")
+        page = pages[page_path(product_id)]
+        if page['changed']:
+            print(f"      {'🔍 将修复' if dry_run else '✅'} {', '.join(page['notes'])}")
             fixed_count += 1
         else:
-            print(f"      ❌ {', '.join(fixes)}")
+            if not diagnosis_data['detailed_results'][product_id]['available_images']:
+                print(f"      ❌ 没有可用的图片文件")
+            else:
+                print(f"      ❌ {', '.join(page['notes']) or '无需修复'}")
             failed_products.append(product_id)
 
-    print(f"\n   📊 B类修复结果: {fixed_count}/{len(category_b_products)} 成功")
+    if dry_run:
+        print(f"\n   🔍 B类将修复: {fixed_count}/{len(category_b_products)}")
+    else:
+        print(f"\n   📊 B类修复结果: {fixed_count}/{len(category_b_products)} 成功")
     if failed_products:
         print(f"   ❌ 失败的产品: {', '.join(failed_products)}")
 
@@ -228,6 +220,10 @@ def create_backup():
 
 def main():
     """主修复流程"""
+    parser = argparse.ArgumentParser(description='修复所有39个产品详情页')
+    add_dry_run_argument(parser)
+    args = parser.parse_args()
+
     print("=" * 80)
     print("🔧 修复所有39个产品详情页")
     print("=" * 80)
@@ -243,19 +239,35 @@ def main():
     for category, count in diagnosis_data['category_counts'].items():
         print(f"   {category}: {count} 个")
 
-    # 2. 创建备份
-    create_backup()
+    # 2. 创建备份（预演时不写文件）
+    if not args.dry_run:
+        create_backup()
 
-    # 3. 修复A类问题 (JavaScript缺失)
-    a_fixed, a_failed = run_category_a_fixes(diagnosis_data)
+    # 3. 所有页面的修复在内存中完成后一次性提交，任一页面失败时不写入任何页面
+    try:
+        pages = rewrite_pages(plan_fixes(diagnosis_data), dry_run=args.dry_run)
+    except RewriteError as e:
+        print_rewrite_error(e)
+        sys.exit(1)
 
-    # 4. 修复B类问题 (图片配置缺失)
-    b_fixed, b_failed = run_category_b_fixes(diagnosis_data)
+    # 4. A类问题 (JavaScript缺失) 和 B类问题 (图片配置缺失) 的修复结果
+    a_fixed, a_failed = run_category_a_fixes(diagnosis_data, pages, args.dry_run)
+    b_fixed, b_failed = run_category_b_fixes(diagnosis_data, pages, args.dry_run)
 
     # 5. 生成修复总结
     total_fixed = a_fixed + b_fixed
     total_products = diagnosis_data['total_products']
 
+    if args.dry_run:
+        print("\n" + "=" * 80)
+        print("🔍 预演总结（未写入任何页面）")
+        print("=" * 80)
+        print(f"   总产品数: {total_products}")
+        print(f"   将修复: {total_fixed} 个产品 (A类 {a_fixed}, B类 {b_fixed})")
+        if a_failed + b_failed:
+            print(f"   无法自动修复: {', '.join(a_failed + b_failed)}")
+        return
+
     print("\n" + "=" * 80)
     print("📊 修复完成总结")
     print("=" * 80)
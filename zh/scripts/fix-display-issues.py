@@ -5,10 +5,13 @@
 """
 
 import os
+import sys
 import glob
 import re
 import json
-from pathlib import Path
+import argparse
+
+from page_rewriter import edit, rewrite_pages, add_dry_run_argument, RewriteError, print_rewrite_error
 
 # 路径配置
 PRODUCTS_DIR = r"D:\ai\新建文件夹\新建文件夹\7788\products"
@@ -26,93 +29,78 @@ def load_diagnostic_results():
     except:
         return None
 
-def fix_html_structure_issues(html_file):
-    """修复HTML结构问题"""
-    product_id = Path(html_file).stem
-
-    try:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        original_content = content
-        fixed_issues = []
-
-        # 1. 修复未关闭的img标签
-        # 查找模式：<img ... data-images="..." onerror="..."
-        # 问题：缺少闭合的 >
-        img_pattern = r'(<img[^>]+class="main-image"[^>]+data-images="[^"]*"[^>]+onerror="[^"]*";)\s*(?!>)'
-
-        def fix_img_tag(match):
-            img_tag = match.group(1)
-            if not img_tag.endswith('>'):
-                return img_tag + '>'
-            return img_tag
-
-        new_content = re.sub(img_pattern, fix_img_tag, content)
-        if new_content != content:
-            fixed_issues.append('修复了未关闭的img标签')
-            content = new_content
-
-        # 2. 修复错误的HTML结构嵌套
-        # 查找在img标签内部错误嵌套的div
-        img_with_nested_div_pattern = r'(<img[^>]+>)\s*(<!--[^>]*-->)?\s*(<div class="image-status)'
-
-        def fix_nested_structure(match):
-            img_tag = match.group(1)
-            comment = match.group(2) if match.group(2) else ''
-            div_tag = match.group(3)
-            return img_tag + '\n                            ' + comment + '\n                            ' + div_tag
-
-        new_content = re.sub(img_with_nested_div_pattern, fix_nested_structure, content)
+def page_path(product_id):
+    return os.path.join(PRODUCTS_DIR, f"{product_id}.html")
+
+def fix_html_structure_issues(content, product_id):
+    """修复HTML结构问题（在内存中处理页面内容），返回 (新内容, 修复项目)"""
+    fixed_issues = []
+
+    # 1. 修复未关闭的img标签
+    # 查找模式：<img ... data-images="..." onerror="..."
+    # 问题：缺少闭合的 >
+    img_pattern = r'(<img[^>]+class="main-image"[^>]+data-images="[^"]*"[^>]+onerror="[^"]*";)\s*(?!>)'
+
+    def fix_img_tag(match):
+        img_tag = match.group(1)
+        if not img_tag.endswith('>'):
+            return img_tag + '>'
+        return img_tag
+
+    new_content = re.sub(img_pattern, fix_img_tag, content)
+    if new_content != content:
+        fixed_issues.append('修复了未关闭的img标签')
+        content = new_content
+
+    # 2. 修复错误的HTML结构嵌套
+    # 查找在img标签内部错误嵌套的div
+    img_with_nested_div_pattern = r'(<img[^>]+>)\s*(<!--[^>]*-->)?\s*(<div class="image-status)'
+
+    def fix_nested_structure(match):
+        img_tag = match.group(1)
+        comment = match.group(2) if match.group(2) else ''
+        div_tag = match.group(3)
+        return img_tag + '\n                            ' + comment + '\n                            ' + div_tag
+
+    new_content = re.sub(img_with_nested_div_pattern, fix_nested_structure, content)
+    if new_content != content:
+        fixed_issues.append('修复了HTML结构嵌套问题')
+        content = new_content
+
+    # 3. 确保图片状态指示器正确隐藏
+    # 将 image-status 从 hidden 改为 style="display: none;"
+    status_pattern = r'<div class="image-status hidden">'
+    new_content = re.sub(status_pattern, '<div class="image-status" style="display: none;">', content)
+    if new_content != content:
+        fixed_issues.append('修复了图片状态指示器')
+        content = new_content
+
+    # 4. 确保正确的缩略图容器结构
+    # 检查缩略图容器是否有正确的结构
+    thumbnails_pattern = r'<div class="image-thumbnails" id="[^"]*">\s*</div>'
+    if re.search(thumbnails_pattern, content):
+        # 缩略图容器是空的，添加注释说明
+        replacement = '''<div class="image-thumbnails" id="image-thumbnails">
+                                <!-- 缩略图将由JavaScript动态生成 -->
+                            </div>'''
+        new_content = re.sub(thumbnails_pattern, replacement, content)
         if new_content != content:
-            fixed_issues.append('修复了HTML结构嵌套问题')
+            fixed_issues.append('添加了缩略图容器说明')
             content = new_content
 
-        # 3. 确保图片状态指示器正确隐藏
-        # 将 image-status 从 hidden 改为 style="display: none;"
-        status_pattern = r'<div class="image-status hidden">'
-        new_content = re.sub(status_pattern, '<div class="image-status" style="display: none;">', content)
+    # 5. 检查并修复data-product-id
+    if f'data-product-id="{product_id}"' not in content:
+        product_images_pattern = r'(<div class="product-images[^"]*")'
+        replacement = f'\\1 data-product-id="{product_id}"'
+        new_content = re.sub(product_images_pattern, replacement, content)
         if new_content != content:
-            fixed_issues.append('修复了图片状态指示器')
+            fixed_issues.append('添加了data-product-id属性')
             content = new_content
 
-        # 4. 确保正确的缩略图容器结构
-        # 检查缩略图容器是否有正确的结构
-        thumbnails_pattern = r'<div class="image-thumbnails" id="[^"]*">\s*</div>'
-        if re.search(thumbnails_pattern, content):
-            # 缩略图容器是空的，添加注释说明
-            replacement = '''<div class="image-thumbnails" id="image-thumbnails">
-                                <!-- 缩略图将由JavaScript动态生成 -->
-                            </div>'''
-            new_content = re.sub(thumbnails_pattern, replacement, content)
-            if new_content != content:
-                fixed_issues.append('添加了缩略图容器说明')
-                content = new_content
-
-        # 5. 检查并修复data-product-id
-        if f'data-product-id="{product_id}"' not in content:
-            product_images_pattern = r'(<div class="product-images[^"]*")'
-            replacement = f'\\1 data-product-id="{product_id}"'
-            new_content = re.sub(product_images_pattern, replacement, content)
-            if new_content != content:
-                fixed_issues.append('添加了data-product-id属性')
-                content = new_content
-
-        # 写回文件（如果有修改）
-        if content != original_content:
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return fixed_issues
-        else:
-            return []
-
-    except Exception as e:
-        return [f'修复失败: {str(e)}']
-
-def fix_missing_configurations(html_file):
-    """修复缺失的图片配置"""
-    product_id = Path(html_file).stem
+    return content, fixed_issues
 
+def fix_missing_configurations(content, product_id):
+    """修复缺失的图片配置（在内存中处理页面内容），返回 (新内容, 配置项目)"""
     # 获取该产品的实际图片
     pattern = os.path.join(IMAGES_DIR, f"{product_id}*")
     image_files = glob.glob(pattern)
@@ -124,7 +112,7 @@ def fix_missing_configurations(html_file):
             valid_images.append(filename)
 
     if not valid_images:
-        return []
+        return content, []
 
     # 按优先级排序
     def sort_key(filename):
@@ -137,55 +125,42 @@ def fix_missing_configurations(html_file):
 
     valid_images = sorted(valid_images, key=sort_key)
 
-    try:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        original_content = content
-        fixed_issues = []
-
-        # 构建图片路径
-        image_paths = [f"../images/products/{img}" for img in valid_images]
-        data_images_value = ",".join(image_paths)
-        main_image_path = image_paths[0]
-
-        # 检查是否需要添加主图片
-        if 'class="main-image"' not in content:
-            # 寻找主图容器并添加img标签
-            container_pattern = r'(<div class="main-image-container">\s*)'
-            img_tag = f'''<img src="{main_image_path}" alt="{product_id}" class="main-image"
+    fixed_issues = []
+
+    # 构建图片路径
+    image_paths = [f"../images/products/{img}" for img in valid_images]
+    data_images_value = ",".join(image_paths)
+    main_image_path = image_paths[0]
+
+    # 检查是否需要添加主图片
+    if 'class="main-image"' not in content:
+        # 寻找主图容器并添加img标签
+        container_pattern = r'(<div class="main-image-container">\s*)'
+        img_tag = f'''<img src="{main_image_path}" alt="{product_id}" class="main-image"
                                  loading="lazy"
                                  data-images="{data_images_value}"
                                  onerror="this.onerror=null; this.src='../images/products/placeholder.jpg';">'''
 
-            replacement = f'\\1\n                            {img_tag}\n                            '
-            new_content = re.sub(container_pattern, replacement, content)
-            if new_content != content:
-                fixed_issues.append('添加了主图片配置')
-                content = new_content
-
-        # 检查是否需要添加data-images
-        elif 'data-images=' not in content:
-            # 在现有的img标签中添加data-images
-            img_pattern = r'(<img[^>]+class="main-image"[^>]*)'
-            replacement = f'\\1 data-images="{data_images_value}"'
-            new_content = re.sub(img_pattern, replacement, content)
-            if new_content != content:
-                fixed_issues.append('添加了data-images配置')
-                content = new_content
-
-        # 写回文件（如果有修改）
-        if content != original_content:
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-        return fixed_issues
-
-    except Exception as e:
-        return [f'配置修复失败: {str(e)}']
-
-def run_comprehensive_fixes():
-    """运行全面修复"""
+        replacement = f'\\1\n                            {img_tag}\n                            '
+        new_content = re.sub(container_pattern, replacement, content)
+        if new_content != content:
+            fixed_issues.append('添加了主图片配置')
+            content = new_content
+
+    # 检查是否需要添加data-images
+    elif 'data-images=' not in content:
+        # 在现有的img标签中添加data-images
+        img_pattern = r'(<img[^>]+class="main-image"[^>]*)'
+        replacement = f'\\1 data-images="{data_images_value}"'
+        new_content = re.sub(img_pattern, replacement, content)
+        if new_content != content:
+            fixed_issues.append('添加了data-images配置')
+            content = new_content
+
+    return content, fixed_issues
+
+def run_comprehensive_fixes(dry_run=False):
+    """运行全面修复；预演时只报告将修复的产品，不写入任何页面"""
     print("=" * 80)
     print("🔧 开始修复产品详情页显示问题")
     print("=" * 80)
@@ -210,36 +185,51 @@ def run_comprehensive_fixes():
     print(f"   🚨 高优先级 - 显示异常: {len(display_issues)}个产品")
     print(f"   ⚙️ 中优先级 - 配置缺失: {len(config_issues)}个产品")
 
+    # 同一页面的全部修复在内存中依次应用，所有页面成功后一次性提交
+    plan = {}
+    for product_id in display_issues:
+        plan.setdefault(page_path(product_id), []).append(edit(fix_html_structure_issues, product_id))
+    for product_id in config_issues:
+        plan.setdefault(page_path(product_id), []).append(edit(fix_missing_configurations, product_id))
+
+    try:
+        pages = rewrite_pages(plan, dry_run=dry_run)
+    except RewriteError as e:
+        print_rewrite_error(e)
+        sys.exit(1)
+
     total_fixed = 0
 
     # 修复显示异常问题
-    print(f"\n🚨 开始修复显示异常问题...")
+    print(f"\n🚨 {'预演' if dry_run else '开始'}修复显示异常问题...")
     for i, product_id in enumerate(display_issues, 1):
-        html_file = os.path.join(PRODUCTS_DIR, f"{product_id}.html")
-
         print(f"[{i:2d}/{len(display_issues)}] 修复: {product_id}")
 
-        fixed_issues = fix_html_structure_issues(html_file)
-        if fixed_issues:
-            print(f"  ✅ 修复项目: {', '.join(fixed_issues)}")
+        page = pages[page_path(product_id)]
+        if page['changed']:
+            print(f"  {'🔍 将修复' if dry_run else '✅ 修复项目'}: {', '.join(page['notes'])}")
             total_fixed += 1
         else:
-            print(f"  ℹ️  无需修复或修复失败")
+            print(f"  ℹ️  无需修复")
 
     # 修复配置缺失问题
     if config_issues:
-        print(f"\n⚙️ 开始修复配置缺失问题...")
+        print(f"\n⚙️ {'预演' if dry_run else '开始'}修复配置缺失问题...")
         for i, product_id in enumerate(config_issues, 1):
-            html_file = os.path.join(PRODUCTS_DIR, f"{product_id}.html")
-
             print(f"[{i:2d}/{len(config_issues)}] 配置: {product_id}")
 
-            fixed_issues = fix_missing_configurations(html_file)
-            if fixed_issues:
-                print(f"  ✅ 配置项目: {', '.join(fixed_issues)}")
+            page = pages[page_path(product_id)]
+            if page['changed']:
+                print(f"  {'🔍 将配置' if dry_run else '✅ 配置项目'}: {', '.join(page['notes'])}")
                 total_fixed += 1
             else:
-                print(f"  ℹ️  无需配置或配置失败")
+                print(f"  ℹ️  无需配置")
+
+    if dry_run:
+        print(f"\n🔍 预演完成（未写入任何页面）:")
+        print(f"   将修复 {total_fixed} 个产品")
+        print(f"   去掉 --dry-run 参数重新运行以写入修复")
+        return
 
     print(f"\n🎯 修复完成:")
     print(f"   总修复产品: {total_fixed}")
@@ -253,4 +243,7 @@ def run_comprehensive_fixes():
     print(f"   4. 运行验证脚本确认修复效果")
 
 if __name__ == "__main__":
-    run_comprehensive_fixes()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='修复产品详情页显示异常问题')
+    add_dry_run_argument(parser)
+    args = parser.parse_args()
+    run_comprehensive_fixes(args.dry_run)
\ No newline at end of file
@@ -6,24 +6,40 @@
 """
 
 import os
-import re
-import json
-from bs4 import BeautifulSoup
+import sys
+import argparse
+
+from html_edits import PageEditor
+from page_rewriter import token_edit, rewrite_pages, add_dry_run_argument, RewriteError, print_rewrite_error
+from product_catalog import open_catalog, card_images, product_page_ids
+
+# 修复说明 → 报告中的修复动作（报告时加“已”或预演时加“将”）
+FIX_ACTIONS = {
+    'list_image_added': '添加列表页图片到详情页轮播',
+    'data_images_added': '为主图片添加data-images配置'
+}
+SKIP_REASONS = {
+    'already_present': '列表页图片已在详情页中'
+}
 
 def main():
+    parser = argparse.ArgumentParser(description='修复产品列表页与详情页图片不一致的问题')
+    add_dry_run_argument(parser)
+    args = parser.parse_args()
+
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    products_html = os.path.join(base_dir, 'products.html')
     products_dir = os.path.join(base_dir, 'products')
     images_dir = os.path.join(base_dir, 'images', 'products')
 
     print("🔍 分析产品列表页与详情页图片一致性...")
 
-    # 解析产品列表页的图片配置
-    product_list_images = extract_product_list_images(products_html)
+    # 读取产品列表页的图片配置
+    conn = open_catalog()
+    product_list_images = extract_product_list_images(conn)
     print(f"📋 产品列表页发现 {len(product_list_images)} 个产品图片")
 
     # 分析详情页图片配置
-    detail_page_images = analyze_detail_pages(products_dir)
+    detail_page_images = analyze_detail_pages(conn, products_dir)
     print(f"📄 详情页分析完成，共 {len(detail_page_images)} 个产品")
 
     # 找出不匹配的产品
@@ -31,66 +47,40 @@ def main():
     print(f"⚠️  发现 {len(mismatches)} 个图片不匹配的产品")
 
     # 修复不匹配问题
-    fix_results = fix_image_mismatches(mismatches, products_dir, images_dir)
+    fix_results = fix_image_mismatches(mismatches, products_dir, images_dir, args.dry_run)
 
     # 输出修复报告
-    print_fix_report(fix_results)
+    print_fix_report(fix_results, args.dry_run)
 
-def extract_product_list_images(products_html_path):
-    """提取产品列表页的图片配置"""
+def extract_product_list_images(conn):
+    """产品列表页的图片配置（卡片由 data/products.json 预渲染，取自产品目录 product_catalog.py）"""
     product_images = {}
-
-    with open(products_html_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    soup = BeautifulSoup(content, 'html.parser')
-
-    # 查找所有产品卡片
-    product_cards = soup.find_all('div', class_='product-card')
-
-    for card in product_cards:
-        # 获取产品链接
-        href = card.get('data-original-href', '')
-        if not href:
-            continue
-
-        # 提取产品ID
-        product_id = href.replace('products/', '').replace('.html', '')
-
-        # 获取产品图片
-        img = card.find('img')
-        if img and img.get('src'):
-            img_src = img['src'].replace('images/products/', '')
-            product_images[product_id] = {
-                'list_image': img_src,
-                'alt': img.get('alt', ''),
-                'href': href
-            }
-
+    for product_id, (path, name, href) in card_images(conn).items():
+        product_images[product_id] = {
+            'list_image': path.split('images/products/', 1)[-1],
+            'alt': name,
+            'href': href
+        }
     return product_images
 
-def analyze_detail_pages(products_dir):
+def analyze_detail_pages(conn, products_dir):
     """分析详情页的图片配置"""
     detail_images = {}
 
-    for filename in os.listdir(products_dir):
-        if not filename.endswith('.html'):
-            continue
-
-        product_id = filename.replace('.html', '')
-        filepath = os.path.join(products_dir, filename)
+    for product_id in product_page_ids(conn):
+        filepath = os.path.join(products_dir, f'{product_id}.html')
 
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # 查找data-images配置
-        data_images_match = re.search(r'data-images="([^"]*)"', content)
-        main_image_match = re.search(r'<img[^>]*src="([^"]*)"[^>]*class="main-image"', content)
+        # 查找主图片的data-images配置（与属性顺序无关）
+        main_image = PageEditor(content).first('img', 'main-image')
+        data_images = main_image.get('data-images') if main_image else None
 
         detail_images[product_id] = {
-            'has_data_images': bool(data_images_match),
-            'data_images': data_images_match.group(1) if data_images_match else '',
-            'main_image': main_image_match.group(1) if main_image_match else '',
+            'has_data_images': data_images is not None,
+            'data_images': data_images or '',
+            'main_image': main_image.get('src', '') if main_image else '',
             'filepath': filepath
         }
 
@@ -124,25 +114,24 @@ def find_image_mismatches(list_images, detail_images):
 
     return mismatches
 
-def fix_image_mismatches(mismatches, products_dir, images_dir):
-    """修复图片不匹配问题"""
+def fix_image_mismatches(mismatches, products_dir, images_dir, dry_run=False):
+    """修复图片不匹配问题；预演时 success 为将被修复的产品"""
     fix_results = {
         'success': [],
         'failed': [],
         'skipped': []
     }
 
+    # 修复策略：将列表页图片添加到详情页data-images的第一位，所有页面一次性提交
+    plan = {}
     for mismatch in mismatches:
         product_id = mismatch['product_id']
         list_image = mismatch['list_image']
-        filepath = mismatch['filepath']
-
-        print(f"\n🔧 修复产品: {product_id}")
-        print(f"   列表页图片: {list_image}")
 
         # 检查列表页图片是否存在
         list_image_path = os.path.join(images_dir, list_image)
         if not os.path.exists(list_image_path):
+            print(f"\n🔧 修复产品: {product_id}")
             print(f"   ❌ 列表页图片文件不存在: {list_image}")
             fix_results['failed'].append({
                 'product_id': product_id,
@@ -150,91 +139,83 @@ def fix_image_mismatches(mismatches, products_dir, images_dir):
             })
             continue
 
-        # 读取详情页内容
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        plan[mismatch['filepath']] = [token_edit(add_list_image_to_detail_page, list_image)]
 
-        # 修复策略：将列表页图片添加到详情页data-images的第一位
-        success = add_list_image_to_detail_page(content, list_image, filepath)
+    try:
+        pages = rewrite_pages(plan, dry_run=dry_run)
+    except RewriteError as e:
+        print_rewrite_error(e)
+        sys.exit(1)
+
+    for mismatch in mismatches:
+        if mismatch['filepath'] not in pages:
+            continue
+        product_id = mismatch['product_id']
+        print(f"\n🔧 修复产品: {product_id}")
+        print(f"   列表页图片: {mismatch['list_image']}")
 
-        if success:
+        page = pages[mismatch['filepath']]
+        notes = page['notes']
+        if notes and notes[0] in SKIP_REASONS:
+            fix_results['skipped'].append({
+                'product_id': product_id,
+                'reason': SKIP_REASONS[notes[0]]
+            })
+            print(f"   ⏭️  {SKIP_REASONS[notes[0]]}")
+        elif notes:
+            action = ('将' if dry_run else '已') + FIX_ACTIONS[notes[0]]
             fix_results['success'].append({
                 'product_id': product_id,
-                'list_image': list_image,
-                'action': '已将列表页图片添加到详情页轮播'
+                'list_image': mismatch['list_image'],
+                'action': action
             })
-            print(f"   ✅ 修复成功")
+            print(f"   {'🔍' if dry_run else '✅'} {action}")
         else:
             fix_results['failed'].append({
                 'product_id': product_id,
-                'reason': '无法修改详情页配置'
+                'reason': '未找到main-image标签'
             })
-            print(f"   ❌ 修复失败")
+            print(f"   ❌ 修复失败: 未找到main-image标签")
 
     return fix_results
 
-def add_list_image_to_detail_page(content, list_image, filepath):
-    """将列表页图片添加到详情页轮播的第一位"""
-    try:
-        # 查找data-images配置
-        data_images_pattern = r'data-images="([^"]*)"'
-        match = re.search(data_images_pattern, content)
-
-        if match:
-            current_images = match.group(1)
-            # 移除路径前缀，统一格式
-            list_image_clean = list_image.replace('../images/products/', '')
-            current_images_clean = current_images.replace('../images/products/', '')
-
-            # 检查是否已经包含了
-            if list_image_clean in current_images_clean:
-                print(f"   📋 列表页图片已在详情页中")
-                return True
-
-            # 添加到第一位
-            new_images = f"../images/products/{list_image_clean},{current_images}"
-            new_content = re.sub(data_images_pattern, f'data-images="{new_images}"', content)
-
-            # 同时更新主图片src
-            main_image_pattern = r'(<img[^>]*src=")([^"]*)"([^>]*class="main-image")'
-            new_content = re.sub(main_image_pattern, f'\\1../images/products/{list_image_clean}"\\3', new_content)
-
-        else:
-            # 如果没有data-images配置，查找main-image并添加data-images
-            main_image_pattern = r'(<img[^>]*src="[^"]*"[^>]*class="main-image"[^>]*)'
-            match = re.search(main_image_pattern, content)
-
-            if match:
-                # 在main-image标签中添加data-images属性
-                img_tag = match.group(1)
-                if 'data-images=' not in img_tag:
-                    # 添加data-images属性
-                    new_img_tag = img_tag.replace('class="main-image"',
-                                                f'class="main-image"\n                                 data-images="../images/products/{list_image}"')
-                    new_content = content.replace(img_tag, new_img_tag)
-                else:
-                    return True
-            else:
-                print(f"   ⚠️  未找到main-image标签")
-                return False
-
-        # 写入文件
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-
-        return True
-
-    except Exception as e:
-        print(f"   ❌ 修复过程中出错: {str(e)}")
-        return False
-
-def print_fix_report(fix_results):
-    """输出修复报告"""
+def add_list_image_to_detail_page(editor, list_image):
+    """将列表页图片添加到详情页轮播的第一位（只修改主图片标签的 src 和 data-images 属性）"""
+    main_image = editor.first('img', 'main-image')
+    if main_image is None:
+        return []
+
+    # 移除路径前缀，统一格式
+    list_image_clean = list_image.replace('../images/products/', '')
+    list_image_src = f'../images/products/{list_image_clean}'
+    current_images = editor.attribute(main_image, 'data-images')
+
+    if current_images is None:
+        # 没有data-images配置：为main-image添加data-images属性
+        editor.set_attribute(main_image, 'data-images', list_image_src)
+        return ['data_images_added']
+
+    # 检查是否已经包含了
+    current_images_clean = [img.strip().replace('../images/products/', '') for img in current_images.split(',')]
+    if list_image_clean in current_images_clean:
+        return ['already_present']
+
+    # 添加到第一位，同时更新主图片src
+    new_images = f'{list_image_src},{current_images}' if current_images.strip() else list_image_src
+    editor.set_attribute(main_image, 'data-images', new_images)
+    editor.set_attribute(main_image, 'src', list_image_src)
+    return ['list_image_added']
+
+def print_fix_report(fix_results, dry_run=False):
+    """输出修复报告；预演时报告将修复的产品，不计算成功率"""
     print("\n" + "="*60)
-    print("📊 修复结果报告")
+    print("📊 修复预演报告（未写入任何页面）" if dry_run else "📊 修复结果报告")
     print("="*60)
 
-    print(f"✅ 修复成功: {len(fix_results['success'])} 个产品")
+    if dry_run:
+        print(f"🔍 将修复 {len(fix_results['success'])} 个产品")
+    else:
+        print(f"✅ 修复成功: {len(fix_results['success'])} 个产品")
     for item in fix_results['success']:
         print(f"   - {item['product_id']}: {item['action']}")
 
@@ -246,6 +227,9 @@ def print_fix_report(fix_results):
     for item in fix_results['skipped']:
         print(f"   - {item['product_id']}: {item['reason']}")
 
+    if dry_run:
+        return
+
     success_rate = len(fix_results['success']) / (len(fix_results['success']) + len(fix_results['failed'])) * 100 if (len(fix_results['success']) + len(fix_results['failed'])) > 0 else 0
     print(f"\n🎯 修复成功率: {success_rate:.1f}%")
 
@@ -7,8 +7,16 @@
 
 import os
 import re
+import argparse
+
+from page_rewriter import edit, rewrite_pages, add_dry_run_argument, RewriteError, print_rewrite_error
+from product_catalog import open_catalog, product_page_ids
 
 def main():
+    parser = argparse.ArgumentParser(description='移除轮播配置中的placeholder.jpg')
+    add_dry_run_argument(parser)
+    args = parser.parse_args()
+
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     products_dir = os.path.join(base_dir, 'products')
 
@@ -24,19 +32,17 @@ def main():
     print(f"⚠️  发现 {len(problematic_files)} 个文件有placeholder配置问题")
 
     # 修复所有问题文件
-    fix_results = fix_placeholder_issues(problematic_files)
+    fix_results = fix_placeholder_issues(problematic_files, args.dry_run)
 
     # 输出修复报告
-    print_fix_report(fix_results)
+    print_fix_report(fix_results, args.dry_run)
 
 def find_placeholder_issues(products_dir):
     """查找所有包含placeholder.jpg的data-images配置"""
     problematic_files = []
 
-    for filename in os.listdir(products_dir):
-        if not filename.endswith('.html'):
-            continue
-
+    for product_id in product_page_ids(open_catalog()):
+        filename = f'{product_id}.html'
         filepath = os.path.join(products_dir, filename)
 
         with open(filepath, 'r', encoding='utf-8') as f:
@@ -47,68 +53,48 @@ def find_placeholder_issues(products_dir):
             problematic_files.append({
                 'filename': filename,
                 'filepath': filepath,
-                'product_id': filename.replace('.html', '')
+                'product_id': filename.replace('.html', ''),
+                'original': re.search(r'data-images="([^"]*)"', content).group(1)
             })
 
     return problematic_files
 
-def fix_placeholder_issues(problematic_files):
-    """修复所有placeholder配置问题"""
+def fix_placeholder_issues(problematic_files, dry_run=False):
+    """修复所有placeholder配置问题；预演时 success 为将被修复的产品"""
     fix_results = {
         'success': [],
         'failed': []
     }
 
+    # 所有页面在内存中修复完成后一次性提交，任一页面失败时不写入任何页面
+    plan = {file_info['filepath']: [edit(fix_data_images_config)] for file_info in problematic_files}
+    try:
+        pages = rewrite_pages(plan, dry_run=dry_run)
+    except RewriteError as e:
+        print_rewrite_error(e)
+        for file_info in problematic_files:
+            fix_results['failed'].append({
+                'product_id': file_info['product_id'],
+                'reason': e.errors.get(file_info['filepath'], '其他页面修复失败，未写入')
+            })
+        return fix_results
+
     for file_info in problematic_files:
-        filepath = file_info['filepath']
         product_id = file_info['product_id']
+        if not pages[file_info['filepath']]['changed']:
+            continue
+        original_config = file_info['original']
+        new_config = re.search(r'data-images="([^"]*)"', fix_data_images_config(f'data-images="{original_config}"')).group(1)
 
         print(f"\n🔧 修复产品: {product_id}")
-
-        try:
-            # 读取文件内容
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # 记录修复前的配置
-            original_match = re.search(r'data-images="([^"]*)"', content)
-            if original_match:
-                original_config = original_match.group(1)
-                print(f"   修复前: {original_config}")
-
-                # 修复配置
-                new_content = fix_data_images_config(content)
-
-                # 验证修复结果
-                new_match = re.search(r'data-images="([^"]*)"', new_content)
-                if new_match:
-                    new_config = new_match.group(1)
-                    print(f"   修复后: {new_config}")
-
-                    # 写入文件
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(new_content)
-
-                    fix_results['success'].append({
-                        'product_id': product_id,
-                        'original': original_config,
-                        'fixed': new_config
-                    })
-                    print(f"   ✅ 修复成功")
-
-                else:
-                    fix_results['failed'].append({
-                        'product_id': product_id,
-                        'reason': '修复后未找到data-images配置'
-                    })
-                    print(f"   ❌ 修复失败")
-
-        except Exception as e:
-            fix_results['failed'].append({
-                'product_id': product_id,
-                'reason': f'文件操作错误: {str(e)}'
-            })
-            print(f"   ❌ 修复失败: {str(e)}")
+        print(f"   修复前: {original_config}")
+        print(f"   修复后: {new_config}")
+        fix_results['success'].append({
+            'product_id': product_id,
+            'original': original_config,
+            'fixed': new_config
+        })
+        print(f"   🔍 将修复" if dry_run else f"   ✅ 修复成功")
 
     return fix_results
 
@@ -133,13 +119,16 @@ def fix_data_images_config(content):
 
     return new_content
 
-def print_fix_report(fix_results):
-    """输出修复报告"""
+def print_fix_report(fix_results, dry_run=False):
+    """输出修复报告；预演时报告将修复的产品，不计算成功率"""
     print("\n" + "="*60)
-    print("📊 Placeholder修复结果报告")
+    print("📊 Placeholder修复预演报告（未写入任何页面）" if dry_run else "📊 Placeholder修复结果报告")
     print("="*60)
 
-    print(f"✅ 修复成功: {len(fix_results['success'])} 个产品")
+    if dry_run:
+        print(f"🔍 将修复 {len(fix_results['success'])} 个产品")
+    else:
+        print(f"✅ 修复成功: {len(fix_results['success'])} 个产品")
     for item in fix_results['success']:
         print(f"   - {item['product_id']}")
         print(f"     原始: {item['original']}")
@@ -149,6 +138,9 @@ def print_fix_report(fix_results):
     for item in fix_results['failed']:
         print(f"   - {item['product_id']}: {item['reason']}")
 
+    if dry_run:
+        return
+
     success_rate = len(fix_results['success']) / (len(fix_results['success']) + len(fix_results['failed'])) * 100 if (len(fix_results['success']) + len(fix_results['failed'])) > 0 else 0
     print(f"\n🎯 修复成功率: {success_rate:.1f}%")
 
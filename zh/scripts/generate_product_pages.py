@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+产品详情页静态生成器
+在构建时根据 data/products-extracted-data.json 渲染全部产品页，取代浏览器端的 PageGenerator。
+模板位于 zh/templates/，首次使用时编译为片段列表并按 mtime 缓存；
+只有输出字节发生变化的页面才会被写入。
+"""
+
+import os
+import re
+import json
+import time
+import argparse
+
+from build_common import ZH_DIR, SITE_ROOT, DIST_DIR, atomic_write_bytes, load_json
+from template_engine import load_template
+import product_shards
+
+TEMPLATES_DIR = os.path.join(ZH_DIR, 'templates')
+PAGE_TEMPLATE = os.path.join(TEMPLATES_DIR, 'product-detail.html')
+PARTIALS_DIR = os.path.join(TEMPLATES_DIR, 'partials')
+DATA_FILE = 'zh/data/products-extracted-data.json'
+PRODUCTS_DIR = 'zh/products'
+IMAGES_DIR = 'zh/images/products'
+PLACEHOLDER_IMAGE = '../images/products/placeholder.jpg'
+
+PRODUCT_IMAGE_PATTERN = re.compile(r'^(?P<id>.+)-(?P<index>\d+)\.(?:png|jpe?g|webp)$', re.IGNORECASE)
+
+CATEGORY_BADGES = {
+    '定形耐火材料': 'badge-quality',
+    '不定型耐火材料': 'badge-hot',
+    '隔热保温材料': 'badge-export',
+}
+DEFAULT_BADGE = 'badge-quality'
+
+TABS = [
+    ('specs', '详细规格'),
+    ('features', '产品特点'),
+    ('applications', '应用领域'),
+    ('related', '相关产品'),
+]
+
+def partial(name, context):
+    return load_template(os.path.join(PARTIALS_DIR, name + '.html'), strip_newline=True).render(context)
+
+def render_each(name, items):
+    return '\n'.join(partial(name, item) for item in items if isinstance(item, dict))
+
+def template_files():
+    """模板及全部片段（相对站点根目录），作为生成节点的输入"""
+    files = [PAGE_TEMPLATE] + [
+        os.path.join(PARTIALS_DIR, name) for name in sorted(os.listdir(PARTIALS_DIR))
+        if name.endswith('.html')
+    ]
+    return [os.path.relpath(path, SITE_ROOT).replace(os.sep, '/') for path in files]
+
+# ---------------------------------------------------------------------------
+# 图片解析
+# ---------------------------------------------------------------------------
+
+# {产品ID: [按序号排列的图片文件名]}，每个进程只扫描一次图片目录
+_image_index = {}
+
+def product_images(src_root):
+    key = os.path.abspath(src_root)
+    if key not in _image_index:
+        index = {}
+        images_dir = os.path.join(src_root, IMAGES_DIR)
+        names = os.listdir(images_dir) if os.path.isdir(images_dir) else []
+        for name in names:
+            match = PRODUCT_IMAGE_PATTERN.match(name)
+            if match:
+                index.setdefault(match.group('id'), []).append((int(match.group('index')), name))
+        _image_index[key] = {pid: [name for _, name in sorted(items)] for pid, items in index.items()}
+    return _image_index[key]
+
+def resolve_images(src_root, product_id, images):
+    """数据中的图片路径存在时直接使用，否则回退到 images/products/<id>-N.png"""
+    page_dir = os.path.join(src_root, PRODUCTS_DIR)
+    declared = [images.get('main')] + list(images.get('thumbnails') or [])
+    resolved = []
+    for path in declared:
+        if path and path not in resolved and os.path.isfile(os.path.normpath(os.path.join(page_dir, path))):
+            resolved.append(path)
+    if not resolved:
+        resolved = [f'../images/products/{name}' for name in product_images(src_root).get(product_id, [])]
+    return resolved
+
+def image_inputs(src_root, product_id, images):
+    """页面用到的图片文件（相对站点根目录），图片增删时页面随之重建"""
+    return [
+        os.path.normpath(os.path.join(PRODUCTS_DIR, path)).replace(os.sep, '/')
+        for path in resolve_images(src_root, product_id, images)
+    ]
+
+# ---------------------------------------------------------------------------
+# 渲染
+# ---------------------------------------------------------------------------
+
+def render_breadcrumb(product, name):
+    items = product.get('breadcrumb') or []
+    if not items:
+        category = (product.get('category') or {}).get('primary')
+        items = [{'name': '首页', 'url': '../index.html'}, {'name': '产品中心', 'url': '../products.html'}]
+        if category:
+            items.append({'name': category})
+        items.append({'name': name, 'active': True})
+
+    lines = []
+    for item in items:
+        if item.get('active'):
+            lines.append(partial('breadcrumb-current', item))
+        else:
+            # 分类层级没有独立页面，链接到产品中心
+            lines.append(partial('breadcrumb-link', {'name': item.get('name'),
+                                                     'url': item.get('url') or '../products.html'}))
+    return '\n'.join(lines)
+
+def render_badges(category):
+    labels = [category.get('primary'), category.get('series')]
+    badges = []
+    for label in labels:
+        if label and label not in [b['text'] for b in badges]:
+            badges.append({'text': label, 'css_class': CATEGORY_BADGES.get(label, DEFAULT_BADGE)})
+    return render_each('badge', badges)
+
+def render_tabs(product_id, product):
+    """只输出有内容的 Tab，第一个设为 active"""
+    specifications = product.get('specifications') or {}
+    industries = (product.get('applications') or {}).get('industries') or []
+    panes = {
+        'specs': specifications.get('data') and {
+            'product_id': product_id,
+            'header_cells': render_each('spec-header-cell', [
+                {'text': header} for header in specifications.get('headers') or ['项目', '指标', '单位', '标准']
+            ]),
+            'rows': render_each('spec-row', specifications['data'])
+        },
+        'features': product.get('features') and {'items': render_each('feature-item', product['features'])},
+        'applications': industries and {'items': render_each('application-item', [
+            {'name': item.get('name', ''), 'icon': item.get('icon', 'fas fa-industry'),
+             'description': item.get('description', '')}
+            for item in industries
+        ])},
+        'related': product.get('relatedProducts') and {'items': render_each('related-item', [
+            {'name': item.get('name', ''), 'url': item.get('url', '#'), 'icon': item.get('icon', 'fas fa-cube')}
+            for item in product['relatedProducts']
+        ])},
+    }
+
+    buttons, contents = [], []
+    for tab, label in TABS:
+        pane = panes[tab]
+        if not pane:
+            continue
+        active_class = ' active' if not buttons else ''
+        buttons.append(partial('tab-button', {'tab': tab, 'label': label, 'active_class': active_class}))
+        contents.append(partial(f'tab-{tab}', dict(pane, active_class=active_class)))
+    return '\n'.join(buttons), '\n\n'.join(contents)
+
+def build_context(product_id, record, src_root=SITE_ROOT):
+    product = record.get('product') or {}
+    names = product.get('name') or {}
+    name = names.get('chinese') or names.get('english') or product_id
+    category = product.get('category') or {}
+    description = product.get('description') or {}
+    summary = description.get('summary') or ''
+    images = resolve_images(src_root, product_id, product.get('images') or {})
+    tab_buttons, tab_panes = render_tabs(product_id, product)
+
+    return {
+        'product_id': product_id,
+        'name': name,
+        'title': (record.get('seo') or {}).get('title') or f'{name} - 河南元达科耐火材料',
+        'description': summary[:160],
+        'keywords': ','.join(filter(None, [name, category.get('primary'), category.get('series'), '耐火材料'])),
+        'schema_json': json.dumps(record.get('schemaOrg') or {}, ensure_ascii=False).replace('</', '<\\/'),
+        'subtitle': description.get('subtitle') or '',
+        'summary': summary,
+        'main_image': images[0] if images else PLACEHOLDER_IMAGE,
+        'data_images': ','.join(images),
+        'breadcrumb': render_breadcrumb(product, name),
+        'badges': render_badges(category),
+        'highlights_section': partial('highlights', {
+            'items': render_each('highlight-item', product['highlights'])
+        }) if product.get('highlights') else '',
+        'quick_specs_section': partial('quick-specs', {
+            'items': render_each('quick-spec-item', product['quickSpecs'])
+        }) if product.get('quickSpecs') else '',
+        'tab_buttons': tab_buttons,
+        'tab_panes': tab_panes,
+    }
+
+def render_product_page(product_id, record, src_root=SITE_ROOT):
+    from site_includes import apply_includes
+    html = load_template(PAGE_TEMPLATE).render(build_context(product_id, record, src_root))
+    return apply_includes(html, output_path(product_id, record), src_root)
+
+def output_path(product_id, record):
+    """输出路径（相对站点根目录），沿用数据中记录的原始文件名"""
+    filename = (record.get('metadata') or {}).get('filename') or f'{product_id}.html'
+    return f'{PRODUCTS_DIR}/{filename}'
+
+def has_spec_data(record):
+    """记录是否包含规格数据（只有名称和图片的存根记录不含）"""
+    product = record.get('product') or {}
+    return bool((product.get('specifications') or {}).get('data'))
+
+def should_generate(product_id, record, src_root=SITE_ROOT):
+    """是否生成该产品页：存根记录不覆盖同名的手写页面，没有手写页面时照常生成"""
+    if has_spec_data(record):
+        return True
+    return not os.path.exists(os.path.join(src_root, output_path(product_id, record)))
+
+def write_if_changed(path, data):
+    """只在字节变化时写入，返回是否写入"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+# 工作进程内复用已解析的数据文件：{路径: (mtime_ns, products)}
+_data_cache = {}
+
+def load_products(path):
+    mtime = os.stat(path).st_mtime_ns
+    cached = _data_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, load_json(path, default={}).get('products', {}))
+        _data_cache[path] = cached
+    return cached[1]
+
+def generate_pages(src_root=SITE_ROOT, out_root=DIST_DIR, data_file=DATA_FILE, minify=True):
+    """生成全部产品页，返回统计信息"""
+    if minify:
+        from html_minifier import minify_html
+    products = load_products(os.path.join(src_root, data_file))
+    stats = {'total': len(products), 'written': 0, 'unchanged': 0, 'kept': 0}
+    for product_id, record in sorted(products.items()):
+        if not should_generate(product_id, record, src_root):
+            stats['kept'] += 1
+            continue
+        html = render_product_page(product_id, record, src_root)
+        if minify:
+            html = minify_html(html)
+        target = os.path.join(out_root, output_path(product_id, record))
+        if write_if_changed(target, html.encode('utf-8')):
+            stats['written'] += 1
+        else:
+            stats['unchanged'] += 1
+    return stats
+
+# ---------------------------------------------------------------------------
+# 依赖图集成
+# ---------------------------------------------------------------------------
+
+def build_product_page(node, src_root, out_root):
+    """依赖图动作：渲染单个产品页（有分片时只读取该产品的分片）"""
+    from html_minifier import minify_html
+    product_id = node.params['product_id']
+    if node.params.get('shard'):
+        record = load_json(os.path.join(src_root, node.params['shard']), default={})
+    else:
+        record = load_products(os.path.join(src_root, DATA_FILE))[product_id]
+    html = render_product_page(product_id, record, src_root)
+    if node.params.get('alternates'):
+        from language_alternates import insert_alternate_links
+        html = insert_alternate_links(html, node.params['alternates'])
+    write_if_changed(os.path.join(out_root, node.outputs[0]), minify_html(html).encode('utf-8'))
+
+def add_product_page_nodes(graph):
+    """依赖图扩展：每个产品记录一个生成节点，覆盖同名的手写页面
+    （存根记录没有规格数据，此时保留手写页面，见 should_generate）
+
+    输入为该产品的分片、模板与片段以及用到的图片。分片由 product_shards.py 显式拆分，
+    建图时只检查是否与数据文件和图片目录同步，不同步时报错而不改写仓库中的源文件。
+    """
+    from build_graph import BuildNode
+
+    if not product_shards.shards_current(graph.src_root):
+        if not os.path.exists(os.path.join(graph.src_root, DATA_FILE)):
+            return
+        raise ValueError('产品分片与数据文件或图片目录不同步，请先运行 python zh/scripts/product_shards.py')
+    manifest = product_shards.load_manifest(graph.src_root)
+    shards = {product_id: entry['shard'] for product_id, entry in manifest['products'].items()}
+    products = {product_id: product_shards.load_product(product_id, graph.src_root) for product_id in shards}
+    if not products:
+        return
+    templates = [('file', path) for path in template_files()]
+    for product_id, record in sorted(products.items()):
+        if not should_generate(product_id, record, graph.src_root):
+            continue
+        output = output_path(product_id, record)
+        images = image_inputs(graph.src_root, product_id, (record.get('product') or {}).get('images') or {})
+        shard = shards[product_id]
+        graph.add_node(BuildNode(
+            f'product:{product_id}', 'generate', 'generate_product_pages:build_product_page',
+            inputs=[('file', shard)] + templates + [('file', path) for path in images],
+            outputs=[output],
+            deps=[f'asset:{path}' for path in images if f'asset:{path}' in graph.nodes],
+            params={'product_id': product_id, 'shard': shard}
+        ))
+
+def main():
+    parser = argparse.ArgumentParser(description='根据提取数据生成产品详情页')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=DIST_DIR, help='输出目录（默认 dist/）')
+    parser.add_argument('--data', default=DATA_FILE, help='产品数据文件（相对源目录）')
+    parser.add_argument('--no-minify', action='store_true', help='输出未压缩的 HTML，便于检查模板')
+    args = parser.parse_args()
+
+    print("🏭 开始生成产品页面...")
+    start = time.perf_counter()
+    stats = generate_pages(os.path.abspath(args.src), os.path.abspath(args.out), args.data,
+                           minify=not args.no_minify)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n✅ 产品记录: {stats['total']} 个")
+    print(f"📝 写入页面: {stats['written']} 个")
+    print(f"⏭️  内容未变: {stats['unchanged']} 个")
+    print(f"📄 保留手写页面: {stats['kept']} 个（数据记录没有规格）")
+    print(f"📁 输出目录: {os.path.join(os.path.abspath(args.out), PRODUCTS_DIR)}")
+    print(f"⏱️  耗时: {elapsed * 1000:.0f} ms")
+
+if __name__ == '__main__':
+    main()
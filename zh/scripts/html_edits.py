@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+无损 HTML 编辑
+页面只用 html_tokens 切分一次，多个修复在同一个标记流上排队属性编辑和元素编辑，
+render() 按偏移量一次拼接出新页面：没有被编辑的字符原样保留（缩进、引号、属性顺序、
+换行符都不变），diff 只包含真正修改的部分。
+
+属性编辑按 (标签, 属性名) 合并，后排队的覆盖先排队的；attribute() 读取时会看到已排队的值，
+因此后面的修复可以在前面修复的基础上继续修改同一个属性。
+元素编辑（插入、替换、删除）互相重叠时 render() 抛出 EditConflict，不会生成错乱的页面。
+"""
+
+from html_tokens import tokenize
+
+class EditConflict(ValueError):
+    """两个编辑修改了重叠的区域"""
+
+def quote_attribute(value, quote='"'):
+    """属性值加引号；值与 html_tokens 一致按原始文本处理（不编码实体），只转义引号本身"""
+    return quote + value.replace(quote, '&quot;' if quote == '"' else '&#39;') + quote
+
+class PageEditor:
+    """页面编辑器；偏移量是解码后文本中的字符位置"""
+
+    def __init__(self, source):
+        self.source = source
+        self.tokens = tokenize(source)
+        # 元素编辑：[开始, 结束, 新文本, 排队序号]
+        self.splices = []
+        # 属性编辑：{(标签开始位置, 小写属性名): (标签, 新值)}，新值为 None 表示删除
+        self.attribute_edits = {}
+        self.edit_count = 0
+
+    # ------------------------------------------------------------------
+    # 查找
+    # ------------------------------------------------------------------
+
+    def find(self, tag, cls=None, **attrs):
+        """按标签名、类名和属性（属性名中的 _ 写作 -，值为 None 时只要求属性存在）查找开始标签"""
+        tag = tag.lower()
+        attrs = {name.replace('_', '-'): value for name, value in attrs.items()}
+        for token in self.tokens:
+            if token.kind != 'start' or token.name != tag:
+                continue
+            if cls and cls not in (token.get('class') or '').split():
+                continue
+            if all(token.get(name) is not None and (value is None or token.get(name) == value)
+                   for name, value in attrs.items()):
+                yield token
+
+    def first(self, tag, cls=None, **attrs):
+        """第一个匹配的开始标签，没有时返回 None"""
+        return next(self.find(tag, cls, **attrs), None)
+
+    def element_end(self, token):
+        """开始标签对应的结束标签（按同名标签的嵌套深度配对），空元素或没有结束标签时返回 None"""
+        if token.self_closing:
+            return None
+        index = self.tokens.index(token)
+        depth = 0
+        for other in self.tokens[index + 1:]:
+            if other.name != token.name:
+                continue
+            if other.kind == 'start' and not other.self_closing:
+                depth += 1
+            elif other.kind == 'end':
+                if depth == 0:
+                    return other
+                depth -= 1
+        return None
+
+    def attribute(self, token, name, default=None):
+        """属性当前值（包含已排队的编辑）"""
+        key = (token.start, name.lower())
+        if key in self.attribute_edits:
+            value = self.attribute_edits[key][1]
+            return default if value is None else value
+        return token.get(name, default)
+
+    # ------------------------------------------------------------------
+    # 属性编辑
+    # ------------------------------------------------------------------
+
+    def set_attribute(self, token, name, value):
+        """设置属性值；属性已存在时只替换值，否则追加在最后一个属性之后"""
+        self.attribute_edits[(token.start, name.lower())] = (token, value)
+        self.edit_count += 1
+
+    def remove_attribute(self, token, name):
+        """删除属性（连同前面的空白）"""
+        self.attribute_edits[(token.start, name.lower())] = (token, None)
+        self.edit_count += 1
+
+    def self_close(self, token):
+        """把 <img ...> 改为 <img .../>；最后一个属性值没有引号时写成 ' /'，避免 / 被并入属性值"""
+        if not token.self_closing:
+            unquoted = token.attrs and token.attrs[-1].value is not None and not token.attrs[-1].quote
+            self.splice(token.end - 1, token.end - 1, ' /' if unquoted else '/')
+
+    # ------------------------------------------------------------------
+    # 元素编辑
+    # ------------------------------------------------------------------
+
+    def splice(self, start, end, text):
+        """把 source[start:end] 替换为 text（start == end 时为插入）"""
+        self.splices.append([start, end, text, len(self.splices)])
+        self.edit_count += 1
+
+    def insert_before(self, token, text):
+        self.splice(token.start, token.start, text)
+
+    def insert_after(self, token, text):
+        self.splice(token.end, token.end, text)
+
+    def replace(self, token, text):
+        """替换单个标记"""
+        self.splice(token.start, token.end, text)
+
+    def replace_element(self, token, text):
+        """替换整个元素（开始标签到对应结束标签）"""
+        end = self.element_end(token)
+        self.splice(token.start, end.end if end else token.end, text)
+
+    def remove_element(self, token):
+        self.replace_element(token, '')
+
+    def _attribute_splices(self):
+        """把属性编辑转换为元素编辑"""
+        splices = []
+        for (_, name), (token, value) in self.attribute_edits.items():
+            attr = next((a for a in token.attrs if a.name.lower() == name), None)
+            if attr is None:
+                if value is None:
+                    continue
+                # 新属性追加在最后一个属性（或标签名）之后
+                position = token.attrs[-1].end if token.attrs else token.start + 1 + len(token.name)
+                splices.append([position, position, f' {name}={quote_attribute(value)}'])
+            elif value is None:
+                start = attr.start
+                while start > token.start and self.source[start - 1].isspace():
+                    start -= 1
+                splices.append([start, attr.end, ''])
+            elif attr.quote:
+                # 保留原引号，只替换引号内的值
+                splices.append([attr.value_start - 1, attr.value_end + 1, quote_attribute(value, attr.quote)])
+            else:
+                splices.append([attr.start, attr.end, f'{attr.name}={quote_attribute(value)}'])
+        return splices
+
+    def render(self):
+        """一次拼接出编辑后的页面"""
+        splices = [splice + [index] for index, splice in enumerate(self._attribute_splices())]
+        splices += [[start, end, text, len(splices) + order] for start, end, text, order in self.splices]
+        splices.sort(key=lambda splice: (splice[0], splice[1], splice[3]))
+
+        parts = []
+        cursor = 0
+        for start, end, text, _ in splices:
+            if start < cursor:
+                raise EditConflict(f'编辑区域重叠: {start}-{end} 与已编辑到 {cursor} 的区域')
+            parts.append(self.source[cursor:start])
+            parts.append(text)
+            cursor = end
+        parts.append(self.source[cursor:])
+        return ''.join(parts)
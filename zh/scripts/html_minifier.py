@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基于标记流的 HTML 压缩工具
+替代 build.js 中 SimpleMinifier 的正则压缩：保留 pre/textarea 原文和脚本语义，
+删除注释和多余的属性引号，压缩内联 CSS/JS，并输出逐文件的压缩前后字节数报告。
+"""
+
+import os
+import re
+import json
+import argparse
+from datetime import datetime
+
+from build_common import SITE_ROOT, DIST_DIR, SCRIPTS_DIR, iter_site_files, atomic_write_bytes, save_json
+from html_tokens import tokenize, VOID_ELEMENTS
+
+REPORT_PATH = os.path.join(SCRIPTS_DIR, 'html_minify_report.json')
+
+# 前后空白可以安全删除的块级元素（svg、iframe、video、audio、canvas、option 等行内/替换元素
+# 与相邻文字之间的空白会被渲染，不能列入）
+BLOCK_ELEMENTS = {
+    'html', 'head', 'body', 'meta', 'link', 'title', 'style', 'script', 'noscript', 'base',
+    'div', 'section', 'article', 'aside', 'header', 'footer', 'nav', 'main', 'address',
+    'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'pre', 'blockquote', 'figure', 'figcaption',
+    'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td',
+    'caption', 'colgroup', 'col', 'form', 'fieldset', 'legend', 'details', 'summary',
+    'dialog', 'source', 'optgroup'
+}
+# 内容必须原样保留的元素
+PRESERVE_ELEMENTS = {'pre', 'textarea'}
+# 需要保留 /> 自闭合写法的外部内容（SVG/MathML）
+FOREIGN_ELEMENTS = {'svg', 'math'}
+JS_TYPES = {'', 'text/javascript', 'application/javascript', 'module', 'text/ecmascript'}
+JSON_TYPES = {'application/ld+json', 'application/json', 'importmap'}
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+UNQUOTED_VALUE_PATTERN = re.compile(r'^[^\s"\'=<>`]+$')
+CSS_PUNCTUATION_PATTERN = re.compile(r'\s*([{};,])\s*')
+CSS_COLON_PATTERN = re.compile(r':\s+')
+
+# 其后出现 / 时表示正则字面量而非除号的字符和关键字
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+JS_WORD_TAIL_PATTERN = re.compile(r'[A-Za-z_$][\w$]*$')
+REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw', 'case', 'do', 'else'}
+
+def _split_css_strings(css):
+    """把 CSS 切分为 (是否字符串, 文本) 片段，并删除字符串外的注释"""
+    segments = []
+    buffer = []
+    i = 0
+    length = len(css)
+    while i < length:
+        ch = css[i]
+        if ch in '"\'':
+            if buffer:
+                segments.append((False, ''.join(buffer)))
+                buffer = []
+            j = i + 1
+            while j < length and css[j] != ch:
+                j += 2 if css[j] == '\\' else 1
+            segments.append((True, css[i:j + 1]))
+            i = j + 1
+        elif css.startswith('/*', i):
+            close = css.find('*/', i + 2)
+            i = length if close == -1 else close + 2
+            buffer.append(' ')
+        else:
+            buffer.append(ch)
+            i += 1
+    if buffer:
+        segments.append((False, ''.join(buffer)))
+    return segments
+
+def minify_css(css):
+    """保守的 CSS 压缩：删除注释、折叠空白、去掉标点周围空白和末尾分号"""
+    parts = []
+    for is_string, text in _split_css_strings(css):
+        if is_string:
+            parts.append(text)
+            continue
+        text = WHITESPACE_PATTERN.sub(' ', text)
+        text = CSS_PUNCTUATION_PATTERN.sub(r'\1', text)
+        # 只去掉冒号之后的空白，冒号之前的空白在选择器中有意义（div :hover）
+        text = CSS_COLON_PATTERN.sub(':', text)
+        parts.append(text)
+    result = ''.join(parts).strip()
+    return result.replace(';}', '}')
+
+def _previous_significant(out):
+    """返回已输出内容中最后一个非空白字符及其所在的单词"""
+    tail = ''.join(out[-16:]).rstrip()
+    if not tail:
+        return '', ''
+    match = JS_WORD_TAIL_PATTERN.search(tail)
+    return tail[-1], match.group(0) if match else ''
+
+def _append_js_whitespace(out, has_newline):
+    """把一段空白折叠为一个空格或一个换行"""
+    if out and out[-1] == ' ' and has_newline:
+        out.pop()
+    if out and out[-1] not in (' ', '\n'):
+        out.append('\n' if has_newline else ' ')
+
+def minify_js(js):
+    """保守的 JS 压缩：删除注释、缩进和空行，折叠空白，但保留换行以免破坏自动分号插入"""
+    out = []
+    i = 0
+    length = len(js)
+    template_depth = []  # 模板字符串中 ${ 的花括号深度栈
+
+    while i < length:
+        ch = js[i]
+
+        if ch in ' \t\r\n':
+            j = i
+            while j < length and js[j] in ' \t\r\n':
+                j += 1
+            _append_js_whitespace(out, '\n' in js[i:j])
+            i = j
+            continue
+
+        if ch in '"\'':
+            j = i + 1
+            while j < length and js[j] != ch and js[j] != '\n':
+                j += 2 if js[j] == '\\' else 1
+            out.append(js[i:j + 1])
+            i = j + 1
+            continue
+
+        if ch == '`' or (ch == '}' and template_depth and template_depth[-1] == 0):
+            if ch == '}':
+                template_depth.pop()
+            j = i + 1
+            while j < length and js[j] != '`':
+                if js[j] == '\\':
+                    j += 2
+                    continue
+                if js.startswith('${', j):
+                    break
+                j += 1
+            if js.startswith('${', j):
+                out.append(js[i:j + 2])
+                template_depth.append(0)
+                i = j + 2
+            else:
+                out.append(js[i:j + 1])
+                i = j + 1
+            continue
+
+        if ch == '{' and template_depth:
+            template_depth[-1] += 1
+        elif ch == '}' and template_depth:
+            template_depth[-1] -= 1
+
+        if ch == '/' and i + 1 < length:
+            nxt = js[i + 1]
+            if nxt == '/':
+                close = js.find('\n', i)
+                i = length if close == -1 else close
+                continue
+            if nxt == '*':
+                close = js.find('*/', i + 2)
+                end = length if close == -1 else close + 2
+                # 注释按空白处理，跨行注释保留一个换行
+                _append_js_whitespace(out, '\n' in js[i:end])
+                i = end
+                continue
+            last_char, last_word = _previous_significant(out)
+            if not last_char or last_char in REGEX_PRECEDERS or last_word in REGEX_KEYWORDS:
+                # 正则字面量：原样复制到未转义的结束斜杠（字符类中的斜杠除外）
+                j = i + 1
+                in_class = False
+                while j < length and js[j] != '\n':
+                    c = js[j]
+                    if c == '\\':
+                        j += 2
+                        continue
+                    if c == '[':
+                        in_class = True
+                    elif c == ']':
+                        in_class = False
+                    elif c == '/' and not in_class:
+                        break
+                    j += 1
+                out.append(js[i:j + 1])
+                i = j + 1
+                continue
+
+        out.append(ch)
+        i += 1
+
+    return ''.join(out).strip()
+
+def minify_inline_script(content, script_type):
+    """根据 type 压缩内联脚本，未知类型原样返回"""
+    script_type = (script_type or '').strip().lower()
+    if script_type in JSON_TYPES:
+        try:
+            return json.dumps(json.loads(content), ensure_ascii=False, separators=(',', ':'))
+        except ValueError:
+            return content.strip()
+    if script_type in JS_TYPES:
+        return minify_js(content)
+    return content
+
+def render_attribute(attr):
+    """输出属性：空值写成布尔形式，安全时去掉引号"""
+    if attr.value is None or attr.value == '':
+        return attr.name
+    value = attr.value
+    if attr.name.lower() == 'style':
+        value = minify_css(value)
+    elif attr.name.lower() == 'class':
+        value = WHITESPACE_PATTERN.sub(' ', value).strip()
+    if value and UNQUOTED_VALUE_PATTERN.match(value) and not value.endswith('/'):
+        return f'{attr.name}={value}'
+    quote = attr.quote or '"'
+    if quote in value:
+        quote = "'" if quote == '"' else '"'
+    return f'{attr.name}={quote}{value}{quote}'
+
+def render_start_tag(token, in_foreign):
+    attrs = ''.join(' ' + render_attribute(attr) for attr in token.attrs)
+    raw_name = token.text[1:1 + len(token.name)]
+    closing = '/' if token.self_closing and (in_foreign or token.name not in VOID_ELEMENTS) else ''
+    # 最后一个属性值没有引号时 / 会被并入属性值，需要用空格隔开
+    if closing and token.attrs and not attrs.endswith(('"', "'", f' {token.attrs[-1].name}')):
+        closing = ' /'
+    return f'<{raw_name}{attrs}{closing}>'
+
+def _is_block_boundary(token):
+    if token is None:
+        return True
+    if token.kind in ('comment', 'declaration'):
+        return True
+    return token.kind in ('start', 'end') and token.name in BLOCK_ELEMENTS
+
+def minify_html(source):
+    """压缩整个 HTML 页面"""
+    tokens = [token for token in tokenize(source)
+              if not (token.kind == 'comment' and not token.text.startswith('<!--['))]
+    out = []
+    preserve_depth = 0
+    foreign_depth = 0
+    raw_parent = None
+
+    for index, token in enumerate(tokens):
+        if token.kind == 'start':
+            out.append(render_start_tag(token, foreign_depth > 0))
+            if token.name in PRESERVE_ELEMENTS:
+                preserve_depth += 1
+            if token.name in FOREIGN_ELEMENTS and not token.self_closing:
+                foreign_depth += 1
+            if token.name in ('script', 'style') and not token.self_closing:
+                raw_parent = token
+            continue
+
+        if token.kind == 'end':
+            if token.name in PRESERVE_ELEMENTS and preserve_depth:
+                preserve_depth -= 1
+            if token.name in FOREIGN_ELEMENTS and foreign_depth:
+                foreign_depth -= 1
+            if raw_parent is not None and token.name == raw_parent.name:
+                raw_parent = None
+            out.append(f'</{token.text[2:2 + len(token.name)]}>')
+            continue
+
+        if token.kind != 'text':
+            out.append(token.text)
+            continue
+
+        text = token.text
+        if raw_parent is not None:
+            if raw_parent.name == 'style':
+                out.append(minify_css(text))
+            else:
+                out.append(minify_inline_script(text, raw_parent.get('type')))
+            continue
+        if preserve_depth:
+            out.append(text)
+            continue
+
+        previous = tokens[index - 1] if index > 0 else None
+        following = tokens[index + 1] if index + 1 < len(tokens) else None
+        collapsed = WHITESPACE_PATTERN.sub(' ', text)
+        if _is_block_boundary(previous):
+            collapsed = collapsed.lstrip(' ')
+        if _is_block_boundary(following):
+            collapsed = collapsed.rstrip(' ')
+        out.append(collapsed)
+
+    return ''.join(out)
+
+def minify_site(src_root=SITE_ROOT, out_root=DIST_DIR):
+    """构建阶段入口：压缩 src_root 下所有 HTML 页面到 out_root，返回逐文件报告"""
+    files = []
+    for rel_path in iter_site_files(src_root):
+        if not rel_path.lower().endswith(('.html', '.htm')):
+            continue
+        with open(os.path.join(src_root, rel_path), 'rb') as f:
+            original = f.read()
+        minified = minify_html(original.decode('utf-8', errors='surrogateescape'))
+        data = minified.encode('utf-8', errors='surrogateescape')
+        atomic_write_bytes(os.path.join(out_root, rel_path), data)
+        files.append({'file': rel_path, 'before': len(original), 'after': len(data)})
+
+    before = sum(item['before'] for item in files)
+    after = sum(item['after'] for item in files)
+    return {
+        'generated': datetime.now().isoformat(),
+        'total_files': len(files),
+        'bytes_before': before,
+        'bytes_after': after,
+        'savings_percent': round((before - after) / before * 100, 2) if before else 0.0,
+        'files': files
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='基于标记流的 HTML 压缩')
+    parser.add_argument('--src', default=SITE_ROOT, help='源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=DIST_DIR, help='输出目录（默认 dist/，可与 --src 相同以原地压缩）')
+    args = parser.parse_args()
+
+    print("🗜️  开始压缩 HTML 页面...")
+    report = minify_site(os.path.abspath(args.src), os.path.abspath(args.out))
+
+    for item in sorted(report['files'], key=lambda x: x['before'] - x['after'], reverse=True)[:10]:
+        saved = item['before'] - item['after']
+        print(f"   {item['file']}: {item['before']:,} → {item['after']:,} 字节 (-{saved:,})")
+
+    print(f"\n✅ 压缩页面: {report['total_files']} 个")
+    print(f"💾 总大小: {report['bytes_before']:,} → {report['bytes_after']:,} 字节 "
+          f"(节省 {report['savings_percent']}%)")
+
+    save_json(REPORT_PATH, report)
+    print(f"📄 逐文件报告已保存到: {REPORT_PATH}")
+
+if __name__ == '__main__':
+    main()
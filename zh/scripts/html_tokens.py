@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML 词法切分模块
+把页面切分为带偏移量的标记流（文本、开始标签、结束标签、注释、声明），
+script/style/textarea/title 的内容按原始文本处理。标记偏移量覆盖整个输入，
+把所有标记的原文按顺序拼接即可得到原始页面。
+"""
+
+import re
+
+# 内容不按标签解析的元素
+RAW_TEXT_ELEMENTS = {'script', 'style', 'textarea', 'title'}
+# 空元素（没有结束标签）
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr'
+}
+
+TAG_OPEN_PATTERN = re.compile(r'<([a-zA-Z][^\s/>]*)')
+END_TAG_PATTERN = re.compile(r'</([a-zA-Z][^\s/>]*)\s*>')
+ATTRIBUTE_PATTERN = re.compile(
+    r'\s*([^\s"\'>/=]+)'
+    r'(?:\s*=\s*(?:"(?P<dq>[^"]*)"|\'(?P<sq>[^\']*)\'|(?P<uq>[^\s>"\'=<`]+)))?'
+)
+TAG_CLOSE_PATTERN = re.compile(r'\s*(/?)\s*>')
+
+class Attribute:
+    """标签属性；value 为原始文本（未解码实体），quote 为原引号（'"'、"'" 或 ''）"""
+
+    __slots__ = ('name', 'value', 'quote', 'start', 'end', 'value_start', 'value_end')
+
+    def __init__(self, name, value, quote, start, end, value_start, value_end):
+        self.name = name
+        self.value = value
+        self.quote = quote
+        self.start = start
+        self.end = end
+        self.value_start = value_start
+        self.value_end = value_end
+
+    def __repr__(self):
+        return f'Attribute({self.name!r}, {self.value!r})'
+
+class Token:
+    """标记；kind 取值 text / start / end / comment / declaration"""
+
+    __slots__ = ('kind', 'start', 'end', 'name', 'attrs', 'self_closing', 'source')
+
+    def __init__(self, kind, start, end, source, name=None, attrs=None, self_closing=False):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.source = source
+        self.name = name
+        self.attrs = attrs or []
+        self.self_closing = self_closing
+
+    @property
+    def text(self):
+        return self.source[self.start:self.end]
+
+    def get(self, name, default=None):
+        """按名称（不区分大小写）取属性值"""
+        name = name.lower()
+        for attr in self.attrs:
+            if attr.name.lower() == name:
+                return attr.value
+        return default
+
+    def __repr__(self):
+        label = self.name or self.text[:20]
+        return f'Token({self.kind}, {label!r}, {self.start}:{self.end})'
+
+def _parse_start_tag(source, pos):
+    """从 pos 处解析开始标签，失败时返回 None"""
+    match = TAG_OPEN_PATTERN.match(source, pos)
+    if not match:
+        return None
+
+    name = match.group(1).lower()
+    attrs = []
+    cursor = match.end()
+    while True:
+        close = TAG_CLOSE_PATTERN.match(source, cursor)
+        if close:
+            token = Token('start', pos, close.end(), source, name, attrs, bool(close.group(1)))
+            return token
+
+        attr_match = ATTRIBUTE_PATTERN.match(source, cursor)
+        if not attr_match or attr_match.end() == cursor:
+            # 孤立的 / 等异常字符：跳过一个字符继续
+            if cursor < len(source) and source[cursor] not in '<':
+                cursor += 1
+                continue
+            return None
+
+        for group, quote in (('dq', '"'), ('sq', "'"), ('uq', '')):
+            if attr_match.group(group) is not None:
+                value = attr_match.group(group)
+                value_start, value_end = attr_match.span(group)
+                break
+        else:
+            value, quote = None, None
+            value_start = value_end = attr_match.end()
+
+        name_start = attr_match.start(1)
+        attrs.append(Attribute(attr_match.group(1), value, quote, name_start,
+                               attr_match.end(), value_start, value_end))
+        cursor = attr_match.end()
+
+def tokenize(source):
+    """把 HTML 文本切分为标记列表"""
+    tokens = []
+    pos = 0
+    length = len(source)
+    text_start = 0
+
+    def flush_text(end):
+        if end > text_start:
+            tokens.append(Token('text', text_start, end, source))
+
+    while pos < length:
+        lt = source.find('<', pos)
+        if lt == -1:
+            break
+
+        token = None
+        if source.startswith('<!--', lt):
+            close = source.find('-->', lt + 4)
+            end = length if close == -1 else close + 3
+            token = Token('comment', lt, end, source)
+        elif source.startswith('<!', lt) or source.startswith('<?', lt):
+            close = source.find('>', lt)
+            end = length if close == -1 else close + 1
+            token = Token('declaration', lt, end, source)
+        elif source.startswith('</', lt):
+            match = END_TAG_PATTERN.match(source, lt)
+            if match:
+                token = Token('end', lt, match.end(), source, match.group(1).lower())
+        else:
+            token = _parse_start_tag(source, lt)
+
+        if token is None:
+            # 不是合法标签的 "<" 按文本处理
+            pos = lt + 1
+            continue
+
+        flush_text(lt)
+        tokens.append(token)
+        pos = token.end
+        text_start = pos
+
+        # 原始文本元素：内容直到对应结束标签为止
+        if token.kind == 'start' and token.name in RAW_TEXT_ELEMENTS and not token.self_closing:
+            close_pattern = re.compile(r'</' + re.escape(token.name) + r'\s*>', re.IGNORECASE)
+            close = close_pattern.search(source, pos)
+            content_end = length if close is None else close.start()
+            if content_end > pos:
+                tokens.append(Token('text', pos, content_end, source))
+            if close is not None:
+                tokens.append(Token('end', close.start(), close.end(), source, token.name))
+                pos = close.end()
+            else:
+                pos = length
+            text_start = pos
+
+    flush_text(length)
+    return tokens
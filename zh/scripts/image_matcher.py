@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+图片文件名模糊匹配
+为一组图片文件名预先建立词和三字符片段（trigram）的倒排索引，查找缺失图片的替代品时
+只对共享词或片段的候选图片打分，不再对每个缺失引用扫描整个图片列表。
+
+文件名先归一化：去掉扩展名、转小写，按 -、_、空格、点切分为词，再去掉末尾的
+official/new/real 后缀和编号（如 corundum-brick-official-1.png → corundum brick），
+后缀和编号只用于同分时排序：official → new → real → 编号图片 → 其他。
+"""
+
+import os
+import re
+from collections import Counter
+
+# 文件名中的版本后缀，越靠前越优先
+VARIANT_WORDS = ('official', 'new', 'real')
+NUMBERED_RANK = len(VARIANT_WORDS)
+PLAIN_RANK = NUMBERED_RANK + 1
+# 词重合度和片段相似度在总分中的权重
+TOKEN_WEIGHT = 0.6
+GRAM_WEIGHT = 0.4
+# best() 接受的最低分数
+MIN_SCORE = 0.3
+
+SPLIT_PATTERN = re.compile(r'[\W_]+')
+
+def normalize(filename):
+    """返回 (核心词元组, 版本排序值, 编号)；编号不存在时为 0"""
+    stem = os.path.splitext(os.path.basename(filename))[0].lower()
+    tokens = [token for token in SPLIT_PATTERN.split(stem) if token]
+    variant, number, numbered = PLAIN_RANK, 0, False
+    while tokens and (tokens[-1].isdigit() or tokens[-1] in VARIANT_WORDS):
+        token = tokens.pop()
+        if token.isdigit():
+            if not numbered:
+                number, numbered = int(token), True
+        else:
+            variant = min(variant, VARIANT_WORDS.index(token))
+    if numbered and variant == PLAIN_RANK:
+        variant = NUMBERED_RANK
+    return tuple(tokens), variant, number
+
+def trigrams(core):
+    """核心词连接后的三字符片段集合（两端补空格，短词也至少有一个片段）"""
+    text = f" {' '.join(core)} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class ImageMatcher:
+    """图片文件名索引；entries 为文件名列表或 {键: 文件名}，查询结果返回对应的键"""
+
+    def __init__(self, entries):
+        if not isinstance(entries, dict):
+            entries = {name: name for name in entries}
+        self.keys = []
+        self.cores = []
+        self.orders = []
+        self.gram_counts = []
+        self.token_index = {}
+        self.gram_index = {}
+        self.core_index = {}
+
+        for key, filename in entries.items():
+            core, variant, number = normalize(filename)
+            entry = len(self.keys)
+            grams = trigrams(core)
+            self.keys.append(key)
+            self.cores.append(set(core))
+            self.orders.append((variant, number, filename))
+            self.gram_counts.append(len(grams))
+            for token in set(core):
+                self.token_index.setdefault(token, []).append(entry)
+            for gram in grams:
+                self.gram_index.setdefault(gram, []).append(entry)
+            self.core_index.setdefault(core, []).append(entry)
+
+        for entry_ids in self.core_index.values():
+            entry_ids.sort(key=self.orders.__getitem__)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def search(self, query, limit=5, min_score=0.0):
+        """按相似度从高到低返回 [(键, 分数)]；核心词完全相同的分数为 1.0"""
+        core, _, _ = normalize(query)
+        query_tokens = set(core)
+        query_grams = trigrams(core)
+
+        shared_tokens = Counter()
+        for token in query_tokens:
+            shared_tokens.update(self.token_index.get(token, ()))
+        shared_grams = Counter()
+        for gram in query_grams:
+            shared_grams.update(self.gram_index.get(gram, ()))
+
+        scored = []
+        for entry, gram_hits in shared_grams.items():
+            if self.cores[entry] == query_tokens:
+                score = 1.0
+            else:
+                token_hits = shared_tokens[entry]
+                token_union = len(query_tokens) + len(self.cores[entry]) - token_hits
+                token_score = token_hits / token_union if token_union else 0.0
+                gram_score = 2 * gram_hits / (len(query_grams) + self.gram_counts[entry])
+                score = TOKEN_WEIGHT * token_score + GRAM_WEIGHT * gram_score
+            if score >= min_score:
+                scored.append((-score, self.orders[entry], entry))
+
+        scored.sort()
+        return [(self.keys[entry], -score) for score, _, entry in scored[:limit]]
+
+    def for_product(self, product_id):
+        """核心词与产品ID相同的全部图片，按 official → new → real → 编号 → 其他排序"""
+        core, _, _ = normalize(product_id)
+        return [self.keys[entry] for entry in self.core_index.get(core, ())]
+
+    def best(self, query, min_score=MIN_SCORE):
+        """最佳匹配的键：优先核心词相同的图片，否则取最相似且不低于 min_score 的一张"""
+        matches = self.search(query, limit=1, min_score=min_score)
+        return matches[0][0] if matches else None
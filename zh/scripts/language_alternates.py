@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+中英文页面对照
+按相对路径配对 zh/ 与 en/ 下的页面（zh/x.html ↔ en/x.html），构建时：
+1. 生成对照表 shared/data/language-alternates.json；
+2. 在每个页面的 </head> 前写入 <link rel="alternate" hreflang="...">（包含指向自身的一条）。
+语言切换器直接读取页面中的 hreflang 链接跳转，不再用 HEAD 请求探测目标页面是否存在；
+未经构建的页面没有 hreflang 链接，切换器改为查询仓库中提交的对照表。
+"""
+
+import os
+import json
+import argparse
+
+from build_common import SITE_ROOT, iter_site_files, atomic_write_text
+from html_tokens import tokenize
+
+MAP_VERSION = 1
+MAP_FILE = 'shared/data/language-alternates.json'
+# 语言目录 → hreflang
+LOCALES = {'zh': 'zh-CN', 'en': 'en'}
+# 不是完整页面的目录（组件片段等）
+EXCLUDED_PARTS = {'components', 'templates'}
+DEFAULT_SITE_URL = 'https://www.ydkfirebrick.com'
+
+def site_url(src_root=SITE_ROOT):
+    """站点地址：取 CNAME，没有时使用默认域名"""
+    cname = os.path.join(src_root, 'CNAME')
+    if os.path.exists(cname):
+        with open(cname, 'r', encoding='utf-8') as f:
+            domain = f.read().strip()
+        if domain:
+            return f'https://{domain}'
+    return DEFAULT_SITE_URL
+
+def split_locale(rel_path):
+    """返回 (语言目录, 目录内路径)，不是可配对页面时返回 (None, None)"""
+    locale, sep, page = rel_path.partition('/')
+    if not sep or locale not in LOCALES or not page.endswith('.html'):
+        return None, None
+    if EXCLUDED_PARTS & set(page.split('/')[:-1]):
+        return None, None
+    return locale, page
+
+def page_pairs(rel_paths):
+    """{目录内路径: {语言目录: 页面路径}}，只有一种语言的页面也包含在内"""
+    pages = {}
+    for rel_path in rel_paths:
+        locale, page = split_locale(rel_path)
+        if locale:
+            pages.setdefault(page, {})[locale] = rel_path
+    return pages
+
+def build_alternates(rel_paths, base_url):
+    """{页面路径: {hreflang: 绝对地址}}"""
+    alternates = {}
+    for versions in page_pairs(rel_paths).values():
+        links = {LOCALES[locale]: f'{base_url}/{path}' for locale, path in sorted(versions.items())}
+        for path in versions.values():
+            alternates[path] = links
+    return alternates
+
+def build_map(rel_paths):
+    pages = page_pairs(rel_paths)
+    return {
+        'version': MAP_VERSION,
+        'hreflang': LOCALES,
+        'pairs': sorted([versions['zh'], versions['en']] for versions in pages.values() if len(versions) == len(LOCALES))
+    }
+
+def serialize_map(alternate_map):
+    return json.dumps(alternate_map, ensure_ascii=False, separators=(',', ':'))
+
+# ---------------------------------------------------------------------------
+# 写入页面
+# ---------------------------------------------------------------------------
+
+def insert_alternate_links(html, alternates):
+    """在 </head> 前写入 hreflang 链接；页面已有 hreflang 链接或没有 </head> 时原样返回"""
+    head_end = None
+    for token in tokenize(html):
+        if token.kind == 'start' and token.name == 'link' and token.get('hreflang') is not None:
+            return html
+        if token.kind == 'end' and token.name == 'head':
+            head_end = token.start
+            break
+    if head_end is None:
+        return html
+    links = ''.join(
+        f'    <link rel="alternate" hreflang="{hreflang}" href="{url}">\n'
+        for hreflang, url in alternates.items()
+    )
+    return html[:head_end] + links + html[head_end:]
+
+# ---------------------------------------------------------------------------
+# 依赖图集成
+# ---------------------------------------------------------------------------
+
+def build_language_map(node, src_root, out_root):
+    """依赖图动作：写出对照表（对照关系在建图时已计算，放在参数中）"""
+    atomic_write_text(os.path.join(out_root, node.outputs[0]), serialize_map(node.params['map']))
+
+def add_language_alternates(graph):
+    """依赖图扩展：为页面节点设置 alternates 参数，对照关系变化时页面随之重建，并生成对照表"""
+    from build_graph import BuildNode
+
+    page_nodes = [node for node in graph.nodes.values()
+                  if node.stage in ('page', 'generate') and node.outputs and node.outputs[0].endswith('.html')]
+    rel_paths = [node.outputs[0] for node in page_nodes]
+    alternates = build_alternates(rel_paths, site_url(graph.src_root))
+    for node in page_nodes:
+        if node.outputs[0] in alternates:
+            node.params['alternates'] = alternates[node.outputs[0]]
+    graph.add_node(BuildNode('language-alternates', 'generate', 'language_alternates:build_language_map',
+                             inputs=[], outputs=[MAP_FILE], params={'map': build_map(rel_paths)}))
+
+def main():
+    parser = argparse.ArgumentParser(description='生成中英文页面对照表')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=os.path.join(SITE_ROOT, MAP_FILE), help='对照表文件')
+    args = parser.parse_args()
+
+    src_root = os.path.abspath(args.src)
+    print("🌐 开始生成中英文页面对照表...")
+    rel_paths = list(iter_site_files(src_root))
+    alternate_map = build_map(rel_paths)
+    atomic_write_text(args.out, serialize_map(alternate_map))
+
+    pages = page_pairs(rel_paths)
+    print(f"\n✅ 中英文对照: {len(alternate_map['pairs'])} 对")
+    for locale in LOCALES:
+        only = sorted(versions[locale] for versions in pages.values() if list(versions) == [locale])
+        if only:
+            print(f"⚠️  只有 {locale} 版本: {len(only)} 个")
+            for path in only:
+                print(f"   - {path}")
+    print(f"📄 已保存到: {args.out}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+中英文页面一致性检查
+按 language_alternates 的规则配对 zh/ 与 en/ 下的页面，在进程池中提取每个页面的结构骨架
+（图片引用、data-images、脚本、样式表、规格表格的行列形状），只比较骨架而不比较译文，
+报告两种语言版本之间的结构漂移。
+
+同时比较 zh/ 与 en/ 下同路径的 JS/CSS 文件摘要：内容完全相同的文件列为共享候选，
+可以只在 shared/ 下保留一份；内容不同或只有一种语言的文件单独列出。
+"""
+
+import os
+import sys
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from build_common import SITE_ROOT, SCRIPTS_DIR, iter_site_files, file_digest, save_json
+from html_tokens import tokenize
+from language_alternates import LOCALES, page_pairs
+
+REPORT_PATH = os.path.join(SCRIPTS_DIR, 'locale_consistency_report.json')
+# 默认检查的页面目录
+SECTIONS = ('products/', 'applications/')
+# 参与共享比较的静态资源
+SHARED_EXTENSIONS = ('.js', '.css')
+SHARED_ROOT = 'shared'
+# 骨架中按多重集合比较的字段
+LIST_FIELDS = ('images', 'data_images', 'scripts', 'stylesheets')
+# 表格单元格
+CELL_TAGS = ('td', 'th')
+
+def resource_path(url):
+    """去掉查询参数、锚点和开头的 ./，得到用于比较的引用路径"""
+    path = url.strip().split('?')[0].split('#')[0]
+    while path.startswith('./'):
+        path = path[2:]
+    return path
+
+def page_skeleton(content):
+    """一次遍历提取页面结构骨架"""
+    skeleton = {field: [] for field in LIST_FIELDS}
+    skeleton['tables'] = []
+    # 正在解析的表格：[[每行单元格数], ...]，支持嵌套
+    tables = []
+
+    for token in tokenize(content):
+        if token.kind == 'start':
+            if token.name == 'img' and token.get('src'):
+                skeleton['images'].append(resource_path(token.get('src')))
+            elif token.name == 'script' and token.get('src'):
+                skeleton['scripts'].append(resource_path(token.get('src')))
+            elif token.name == 'link' and 'stylesheet' in (token.get('rel') or '').lower().split() and token.get('href'):
+                skeleton['stylesheets'].append(resource_path(token.get('href')))
+            elif token.name == 'table' and not token.self_closing:
+                tables.append([])
+            elif token.name == 'tr' and tables:
+                tables[-1].append(0)
+            elif token.name in CELL_TAGS and tables and tables[-1]:
+                tables[-1][-1] += 1
+
+            data_images = token.get('data-images')
+            if data_images is not None:
+                skeleton['data_images'].extend(resource_path(item) for item in data_images.split(',') if item.strip())
+        elif token.kind == 'end' and token.name == 'table' and tables:
+            skeleton['tables'].append(table_shape(tables.pop()))
+
+    # 没有结束标签的表格也计入
+    skeleton['tables'].extend(table_shape(rows) for rows in reversed(tables))
+    return skeleton
+
+def table_shape(rows):
+    """表格形状：行数 x 最大列数"""
+    return f'{len(rows)}x{max(rows, default=0)}'
+
+def read_skeleton(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return page_skeleton(f.read())
+
+def diff_skeletons(zh, en):
+    """比较两个骨架，返回 {字段: {'zh': [只在中文版], 'en': [只在英文版]}}（没有差异的字段不出现）"""
+    drift = {}
+    for field in LIST_FIELDS:
+        zh_items, en_items = Counter(zh[field]), Counter(en[field])
+        only_zh = sorted((zh_items - en_items).elements())
+        only_en = sorted((en_items - zh_items).elements())
+        if only_zh or only_en:
+            drift[field] = {'zh': only_zh, 'en': only_en}
+    if zh['tables'] != en['tables']:
+        drift['tables'] = {'zh': zh['tables'], 'en': en['tables']}
+    return drift
+
+def compare_pair(zh_path, en_path):
+    """比较一对页面（在子进程中执行）"""
+    return diff_skeletons(read_skeleton(zh_path), read_skeleton(en_path))
+
+def compare_pages(pairs, src_root=SITE_ROOT, workers=None):
+    """并行比较页面对，pairs 为 [(目录内路径, 中文页面, 英文页面)]，返回 {目录内路径: 差异}"""
+    paths = [(page, os.path.join(src_root, zh), os.path.join(src_root, en)) for page, zh, en in pairs]
+    if workers == 1 or len(paths) < 2:
+        return {page: compare_pair(zh, en) for page, zh, en in paths}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {page: executor.submit(compare_pair, zh, en) for page, zh, en in paths}
+        return {page: future.result() for page, future in futures.items()}
+
+# ---------------------------------------------------------------------------
+# 共享资源
+# ---------------------------------------------------------------------------
+
+def shared_asset_report(rel_paths, src_root=SITE_ROOT):
+    """
+    比较 zh/ 与 en/ 下同路径的 JS/CSS 文件，返回
+    {'identical': [...], 'different': [...], 'only': {语言目录: [...]}}；
+    identical 中每项含目录内路径、摘要、大小和建议的共享路径
+    """
+    assets = {}
+    for rel_path in rel_paths:
+        locale, sep, path = rel_path.partition('/')
+        if sep and locale in LOCALES and path.endswith(SHARED_EXTENSIONS):
+            assets.setdefault(path, {})[locale] = rel_path
+
+    report = {'identical': [], 'different': [], 'only': {locale: [] for locale in LOCALES}}
+    for path, versions in sorted(assets.items()):
+        if len(versions) < len(LOCALES):
+            for locale in versions:
+                report['only'][locale].append(path)
+            continue
+        digests = {locale: file_digest(os.path.join(src_root, rel_path)) for locale, rel_path in versions.items()}
+        if len(set(digests.values())) == 1:
+            report['identical'].append({
+                'path': path,
+                'digest': digests['zh'],
+                'size': os.path.getsize(os.path.join(src_root, versions['zh'])),
+                'shared_path': f'{SHARED_ROOT}/{path}'
+            })
+        else:
+            report['different'].append(path)
+    return report
+
+# ---------------------------------------------------------------------------
+# 报告
+# ---------------------------------------------------------------------------
+
+def select_pairs(rel_paths, sections):
+    """按目录筛选页面对，返回 ([(目录内路径, 中文页面, 英文页面)], {语言目录: [只有该语言的页面]})"""
+    pairs, unpaired = [], {locale: [] for locale in LOCALES}
+    for page, versions in sorted(page_pairs(rel_paths).items()):
+        if sections and not page.startswith(tuple(sections)):
+            continue
+        if len(versions) == len(LOCALES):
+            pairs.append((page, versions['zh'], versions['en']))
+        else:
+            for locale, path in versions.items():
+                unpaired[locale].append(path)
+    return pairs, unpaired
+
+def print_report(drift, unpaired, assets, limit=5):
+    drifted = {page: fields for page, fields in drift.items() if fields}
+    print(f"\n📊 页面对: {len(drift)} 对，结构一致 {len(drift) - len(drifted)} 对，存在差异 {len(drifted)} 对")
+
+    by_field = Counter(field for fields in drifted.values() for field in fields)
+    for field, count in by_field.most_common():
+        print(f"   {count:>4}  {field}")
+
+    for page, fields in drifted.items():
+        print(f"\n⚠️  {page}")
+        for field, sides in fields.items():
+            if field == 'tables':
+                print(f"   tables: zh {sides['zh']} ≠ en {sides['en']}")
+                continue
+            for locale in LOCALES:
+                items = sides[locale]
+                if items:
+                    more = f" 等 {len(items)} 项" if len(items) > limit else ''
+                    print(f"   {field} 只在 {locale}: {', '.join(items[:limit])}{more}")
+
+    for locale, pages in unpaired.items():
+        if pages:
+            print(f"\n📄 只有 {locale} 版本: {len(pages)} 个")
+            for path in pages:
+                print(f"   - {path}")
+
+    shared_bytes = sum(item['size'] for item in assets['identical'])
+    print(f"\n🔗 JS/CSS: 内容相同 {len(assets['identical'])} 个（可从 {SHARED_ROOT}/ 共享，节省 {shared_bytes / 1024:.1f} KB），"
+          f"内容不同 {len(assets['different'])} 个")
+    for locale, paths in assets['only'].items():
+        if paths:
+            print(f"   只有 {locale}: {len(paths)} 个")
+
+def main():
+    parser = argparse.ArgumentParser(description='检查中英文页面结构和共享资源的一致性')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--section', action='append', help='只检查该目录下的页面（可重复，默认 products/ 和 applications/）')
+    parser.add_argument('--all', action='store_true', help='检查全部配对页面')
+    parser.add_argument('--workers', type=int, default=None, help='并行进程数')
+    parser.add_argument('--report', default=REPORT_PATH, help='JSON 报告路径')
+    parser.add_argument('--strict', action='store_true', help='存在结构差异时以非零状态退出')
+    args = parser.parse_args()
+
+    src_root = os.path.abspath(args.src)
+    sections = None if args.all else [s.rstrip('/') + '/' for s in (args.section or SECTIONS)]
+
+    print("🌐 开始检查中英文页面一致性...")
+    rel_paths = list(iter_site_files(src_root))
+    pairs, unpaired = select_pairs(rel_paths, sections)
+    drift = compare_pages(pairs, src_root, args.workers)
+    assets = shared_asset_report(rel_paths, src_root)
+
+    print_report(drift, unpaired, assets)
+    save_json(args.report, {
+        'sections': sections,
+        'pairs': len(pairs),
+        'drift': {page: fields for page, fields in drift.items() if fields},
+        'unpaired': unpaired,
+        'shared_assets': assets
+    })
+    print(f"\n📄 报告已保存到: {args.report}")
+
+    if args.strict and any(drift.values()):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+产品页面事务式批量改写
+修复脚本为每个页面给出一组编辑操作，本模块在进程池中读取页面并在内存中依次应用，
+所有页面都计算成功后才提交：先把新内容写入各页面同目录的临时文件并记录提交日志，
+再逐个 os.replace 到位。任一页面读取或编辑失败时不写任何文件；提交中途断电或进程被杀时，
+下次运行会先按提交日志把剩余的临时文件替换到位，页面集合只会处于“全部未改”或“全部已改”。
+
+编辑操作用 edit(func, *args) 描述：func(content, *args) 返回新内容，或 (新内容, [修复说明])。
+只返回新内容的操作改动了页面时以 label（默认函数名）作为修复说明。
+token_edit(func, *args) 描述基于标记流的无损编辑：func(editor, *args) 在 html_edits.PageEditor 上
+排队属性和元素编辑，返回 [修复说明] 或 None（排队了编辑时以 label 作为修复说明）；
+相邻的 token_edit 共用一次切分，最后一次拼接输出，未编辑的字符保持原样。
+操作需要是模块级函数，进程池按名称把它传给子进程。
+
+预演模式（rewrite_pages(..., dry_run=True)，修复脚本用 add_dry_run_argument 提供 --dry-run 参数）：
+同样并行计算全部编辑，输出统一 diff 和汇总统计，不写入任何文件，也不处理提交日志。
+预演时结果中的 changed 表示“将被修改”，脚本据此报告将修复的页面。
+"""
+
+import os
+import sys
+import json
+import difflib
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from build_common import file_digest, bytes_digest, atomic_write_text, file_mode
+from html_edits import PageEditor
+
+JOURNAL_NAME = '.page-rewrite-journal.json'
+STAGE_PREFIX = '.rewrite-'
+
+class RewriteError(Exception):
+    """页面改写失败，没有写入任何页面；errors 为 {页面路径: 错误信息}"""
+
+    def __init__(self, message, errors=None):
+        super().__init__(message)
+        self.errors = errors or {}
+
+def edit(func, *args, label=None):
+    """描述一个文本编辑操作"""
+    return (label or func.__name__, func, args, False)
+
+def token_edit(func, *args, label=None):
+    """描述一个标记流编辑操作"""
+    return (label or func.__name__, func, args, True)
+
+def apply_edits(content, operations):
+    """在内存中依次应用编辑操作，返回 (新内容, 修复说明)"""
+    notes = []
+    editor = None
+    for label, func, args, on_tokens in operations:
+        if on_tokens:
+            # 相邻的标记流编辑共用一个编辑器
+            if editor is None:
+                editor = PageEditor(content)
+            queued = editor.edit_count
+            op_notes = func(editor, *args)
+            if op_notes is not None:
+                notes.extend(op_notes)
+            elif editor.edit_count != queued:
+                notes.append(label)
+            continue
+
+        if editor is not None:
+            content, editor = editor.render(), None
+        result = func(content, *args)
+        if isinstance(result, tuple):
+            result, op_notes = result
+            notes.extend(op_notes)
+        elif result != content:
+            notes.append(label)
+        content = result
+
+    if editor is not None:
+        content = editor.render()
+    return content, notes
+
+def add_dry_run_argument(parser):
+    """为修复脚本的 argparse 解析器添加 --dry-run 参数"""
+    parser.add_argument('--dry-run', action='store_true', help='预演：输出 diff 和统计，不写入任何页面')
+
+def page_diff(original, content, name):
+    """统一 diff 文本及增删行数"""
+    lines = list(difflib.unified_diff(original.splitlines(keepends=True), content.splitlines(keepends=True),
+                                      fromfile=f'a/{name}', tofile=f'b/{name}'))
+    added = sum(1 for line in lines if line.startswith('+') and not line.startswith('+++'))
+    removed = sum(1 for line in lines if line.startswith('-') and not line.startswith('---'))
+    # 没有结尾换行的行补上换行，避免与下一行连在一起
+    text = ''.join(line if line.endswith('\n') else line + '\n\\ No newline at end of file\n' for line in lines)
+    return text, added, removed
+
+def rewrite_page(path, operations, with_diff=False, diff_name=None):
+    """读取单个页面并应用编辑（在子进程中执行），内容没有变化时 content 为 None"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    # 按字节读取再解码，保留页面原有的换行符
+    original = data.decode('utf-8')
+    content, notes = apply_edits(original, operations)
+    result = {
+        'digest': bytes_digest(data),
+        'content': content if content != original else None,
+        'notes': notes
+    }
+    if with_diff and content != original:
+        result['diff'], result['added'], result['removed'] = page_diff(original, content, diff_name or path)
+    return result
+
+def compute_rewrites(plan, workers=None, with_diff=False, diff_root=None):
+    """并行计算每个页面的新内容，返回 ({页面: 结果}, {页面: 错误信息})"""
+    results, errors = {}, {}
+
+    def diff_name(path):
+        return os.path.relpath(path, diff_root).replace(os.sep, '/') if diff_root else path
+
+    if workers == 1 or len(plan) < 2:
+        for path, operations in plan.items():
+            try:
+                results[path] = rewrite_page(path, operations, with_diff, diff_name(path))
+            except Exception as e:
+                errors[path] = f'{type(e).__name__}: {e}'
+        return results, errors
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            path: executor.submit(rewrite_page, path, operations, with_diff, diff_name(path))
+            for path, operations in plan.items()
+        }
+        for path, future in futures.items():
+            try:
+                results[path] = future.result()
+            except Exception as e:
+                errors[path] = f'{type(e).__name__}: {e}'
+    return results, errors
+
+# ---------------------------------------------------------------------------
+# 提交
+# ---------------------------------------------------------------------------
+
+def stage_file(path, data):
+    """把新内容写入页面同目录的临时文件（与目标在同一文件系统，os.replace 才是原子的），权限与原页面一致"""
+    fd, staged_path = tempfile.mkstemp(prefix=STAGE_PREFIX, suffix='.tmp', dir=os.path.dirname(path) or '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(staged_path, file_mode(path))
+    except BaseException:
+        os.remove(staged_path)
+        raise
+    return staged_path
+
+def recover_journal(journal_dir):
+    """完成上次中断的提交，返回补替换的页面数"""
+    journal_path = os.path.join(journal_dir, JOURNAL_NAME)
+    if not os.path.exists(journal_path):
+        return 0
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    replaced = 0
+    for staged_path, path in entries:
+        if os.path.exists(staged_path):
+            os.replace(staged_path, path)
+            replaced += 1
+    os.remove(journal_path)
+    return replaced
+
+def commit_rewrites(changes, journal_dir):
+    """changes 为 {页面: (读取时的摘要, 新内容)}；页面在计算期间被其他程序修改时放弃整个提交"""
+    staged = {}
+    journal_path = os.path.join(journal_dir, JOURNAL_NAME)
+    try:
+        for path, (digest, content) in changes.items():
+            if file_digest(path) != digest:
+                raise RewriteError(f'页面在修复期间被修改: {path}', {path: '内容已变化'})
+            staged[path] = stage_file(path, content.encode('utf-8'))
+        atomic_write_text(journal_path, json.dumps([[staged_path, path] for path, staged_path in staged.items()],
+                                                   ensure_ascii=False))
+    except BaseException:
+        for staged_path in staged.values():
+            if os.path.exists(staged_path):
+                os.remove(staged_path)
+        raise
+
+    for path, staged_path in staged.items():
+        os.replace(staged_path, path)
+    os.remove(journal_path)
+
+def rewrite_pages(plan, workers=None, journal_dir=None, dry_run=False):
+    """
+    plan 为 {页面路径: [编辑操作]}，返回 {页面路径: {'changed': bool, 'notes': [修复说明]}}。
+    任一页面失败时抛出 RewriteError，磁盘上的页面保持原样。
+    dry_run 为 True 时只预演：打印 diff 和统计，不写入任何文件，结果另含 diff/added/removed。
+    """
+    if not plan:
+        return {}
+    if journal_dir is None:
+        journal_dir = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in plan])
+
+    if dry_run:
+        results, errors = compute_rewrites(plan, workers, with_diff=True, diff_root=journal_dir)
+        pages = {
+            path: dict(result, changed=result['content'] is not None)
+            for path, result in results.items()
+        }
+        for page in pages.values():
+            del page['content'], page['digest']
+        print_dry_run(pages, errors)
+        if errors:
+            raise RewriteError(f'{len(errors)} 个页面修复失败', errors)
+        return pages
+
+    recovered = recover_journal(journal_dir)
+    if recovered:
+        print(f"♻️  已完成上次中断的提交: {recovered} 个页面")
+
+    results, errors = compute_rewrites(plan, workers)
+    if errors:
+        raise RewriteError(f'{len(errors)} 个页面修复失败，未写入任何页面', errors)
+
+    commit_rewrites({
+        path: (result['digest'], result['content'])
+        for path, result in results.items()
+        if result['content'] is not None
+    }, journal_dir)
+    return {
+        path: {'changed': result['content'] is not None, 'notes': result['notes']}
+        for path, result in results.items()
+    }
+
+def print_dry_run(pages, errors=None):
+    """打印预演结果：逐页 diff 和汇总统计"""
+    changed = {path: page for path, page in sorted(pages.items()) if page['changed']}
+    for page in changed.values():
+        sys.stdout.write(page['diff'])
+
+    notes = Counter(note for page in pages.values() for note in page['notes'])
+    print("\n" + "=" * 60)
+    print("🔍 预演结果（未写入任何文件）")
+    print("=" * 60)
+    print(f"   检查页面: {len(pages) + len(errors or {})} 个")
+    print(f"   将被修改: {len(changed)} 个")
+    print(f"   增加行数: +{sum(page['added'] for page in changed.values())}")
+    print(f"   删除行数: -{sum(page['removed'] for page in changed.values())}")
+    if notes:
+        print("   修复项目:")
+        for note, count in notes.most_common():
+            print(f"     {count:>4}  {note}")
+    if errors:
+        print(f"   失败页面: {len(errors)} 个")
+
+def print_rewrite_error(error):
+    """打印 RewriteError 的逐页错误"""
+    print(f"❌ {error}")
+    for path, message in sorted(error.errors.items()):
+        print(f"   - {os.path.basename(path)}: {message}")
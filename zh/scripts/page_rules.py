@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+产品页面检查规则引擎
+检查规则在 scripts/page-rules.json 中声明，每条规则订阅自己需要的元素（标签名）和属性事件，
+引擎用 html_tokens 把每个页面切分一次，按标记依次分发给订阅了该标签或属性的规则，
+遍历结束后由各规则给出结论。新增规则不会增加对页面的遍历次数。
+
+规则集（rulesets）引用规则 ID：comprehensive-product-audit.py、final-verification.py 和
+validate-all-39-products.py 分别使用 audit、verification、validation 规则集；
+规则集可以配置各类别满分（scores）和规则扣分（penalties），用于页面评分。扣分可以是整数，
+也可以是 {"points": 分数, "per_item": 是否按问题条数累计, "category": 计入的类别}。
+
+消息中的 {count}、{items}、{product_id} 等占位符由规则在页面检查结束时填入。
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from build_common import ZH_DIR
+from html_tokens import tokenize
+
+RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'page-rules.json')
+SEVERITIES = ('critical', 'warning', 'info')
+
+# 规则类型注册表：{类型名: 规则类}
+RULE_TYPES = {}
+
+def rule_type(name):
+    """注册规则类型"""
+    def register(cls):
+        RULE_TYPES[name] = cls
+        return cls
+    return register
+
+def split_list(value, prefix=''):
+    """逗号分隔的属性值 → 列表（去掉公共前缀）"""
+    items = [item.strip() for item in (value or '').split(',') if item.strip()]
+    return [item[len(prefix):] if prefix and item.startswith(prefix) else item for item in items]
+
+def resource_name(url):
+    """资源文件名（去掉目录和查询参数）"""
+    return url.split('?')[0].split('#')[0].rstrip('/').split('/')[-1]
+
+class Selector:
+    """元素选择条件：tag、class（包含该类名）和 attrs（{属性: 值}，值为 null 时只要求属性存在）"""
+
+    def __init__(self, config):
+        self.tag = config['tag'].lower()
+        self.cls = config.get('class')
+        self.attrs = config.get('attrs', {})
+
+    def matches(self, token):
+        if token.name != self.tag:
+            return False
+        if self.cls and self.cls not in (token.get('class') or '').split():
+            return False
+        for name, value in self.attrs.items():
+            actual = token.get(name)
+            if actual is None or (value is not None and actual != value):
+                return False
+        return True
+
+# ---------------------------------------------------------------------------
+# 规则类型
+# ---------------------------------------------------------------------------
+
+class Rule:
+    """
+    规则基类。elements 为订阅的标签名，attributes 为订阅的属性名（出现在任意标签上时触发），
+    capture_text 为 True 时引擎在订阅元素结束时调用 element_text 并传入元素内的文本。
+    每个页面的检查状态放在 new_state() 返回的字典中，规则对象本身可在页面间复用。
+    finish() 返回 None 表示通过，否则返回用于填充消息的字段（n 为问题条数，用于按条扣分）。
+    """
+
+    elements = ()
+    attributes = ()
+    capture_text = False
+
+    def __init__(self, rule_id, config):
+        self.id = rule_id
+        self.config = config
+        self.severity = config.get('severity', 'warning')
+        self.category = config.get('category', 'general')
+        self.message = config.get('message', rule_id)
+        if self.severity not in SEVERITIES:
+            raise ValueError(f'规则 {rule_id}: 未知的严重程度 {self.severity}')
+
+    def new_state(self):
+        return {}
+
+    def start(self, state, token, context):
+        pass
+
+    def element_text(self, state, token, text, context):
+        pass
+
+    def attribute(self, state, token, attr, context):
+        pass
+
+    def finish(self, state, context):
+        return None
+
+class ElementRule(Rule):
+    """作用于选择器匹配的元素（默认只看第一个匹配元素）；状态中记录匹配数和第一个匹配元素的属性"""
+
+    def __init__(self, rule_id, config):
+        super().__init__(rule_id, config)
+        self.selector = Selector(config['element'])
+        self.elements = (self.selector.tag,)
+        self.first_only = config.get('first', True)
+
+    def new_state(self):
+        return {'found': 0, 'attrs': {}}
+
+    def start(self, state, token, context):
+        if not self.selector.matches(token):
+            return
+        state['found'] += 1
+        if state['found'] == 1:
+            state['attrs'] = {attr.name.lower(): attr.value for attr in token.attrs}
+        if state['found'] == 1 or not self.first_only:
+            self.element(state, token, context)
+
+    def element(self, state, token, context):
+        pass
+
+@rule_type('required-element')
+class RequiredElementRule(ElementRule):
+    """页面必须包含匹配的元素"""
+
+    def finish(self, state, context):
+        return None if state['found'] else {}
+
+@rule_type('attribute')
+class AttributeRule(ElementRule):
+    """
+    匹配元素必须带有 attribute 属性；配置 equals 时值必须等于该模板（可用 {product_id}），
+    配置 required 为 true 时页面没有匹配元素也算不通过
+    """
+
+    def __init__(self, rule_id, config):
+        super().__init__(rule_id, config)
+        self.name = config['attribute']
+        self.equals = config.get('equals')
+        self.required = config.get('required', False)
+
+    def new_state(self):
+        return dict(super().new_state(), value=None)
+
+    def element(self, state, token, context):
+        state['value'] = token.get(self.name)
+
+    def finish(self, state, context):
+        if not state['found']:
+            return {} if self.required else None
+        value = state['value']
+        if value is None or (self.equals is not None and value != self.equals.format(**context)):
+            return {'value': value or ''}
+        return None
+
+@rule_type('unclosed-tag')
+class UnclosedTagRule(Rule):
+    """空元素标签没有以 /> 结尾"""
+
+    def __init__(self, rule_id, config):
+        super().__init__(rule_id, config)
+        self.elements = (config.get('tag', 'img').lower(),)
+
+    def new_state(self):
+        return {'count': 0, 'examples': []}
+
+    def start(self, state, token, context):
+        if not token.self_closing:
+            state['count'] += 1
+            if len(state['examples']) < 5:
+                text = token.text
+                state['examples'].append(text[:50] + '...' if len(text) > 50 else text)
+
+    def finish(self, state, context):
+        return {'count': state['count'], 'n': state['count']} if state['count'] else None
+
+@rule_type('hidden-element')
+class HiddenElementRule(ElementRule):
+    """匹配元素必须隐藏（style 含 display: none 或带 hidden 类）"""
+
+    def new_state(self):
+        return dict(super().new_state(), hidden=False)
+
+    def element(self, state, token, context):
+        style = (token.get('style') or '').replace(' ', '').lower()
+        state['hidden'] = 'display:none' in style or 'hidden' in (token.get('class') or '').split()
+
+    def finish(self, state, context):
+        return {} if state['found'] and not state['hidden'] else None
+
+class ListAttributeRule(ElementRule):
+    """匹配元素的逗号分隔属性（如 data-images），prefix 为需要去掉的路径前缀"""
+
+    def __init__(self, rule_id, config):
+        super().__init__(rule_id, config)
+        self.name = config.get('attribute', 'data-images')
+        self.prefix = config.get('prefix', '')
+
+    def new_state(self):
+        return dict(super().new_state(), values=[])
+
+    def element(self, state, token, context):
+        state['values'] = split_list(token.get(self.name), self.prefix)
+
+    def result(self, items):
+        return {'items': ', '.join(items), 'n': len(items)} if items else None
+
+@rule_type('list-files-exist')
+class ListFilesExistRule(ListAttributeRule):
+    """列表中的每个文件都必须存在于 context['images_dir']"""
+
+    def finish(self, state, context):
+        images_dir = context.get('images_dir')
+        if not images_dir:
+            return None
+        return self.result([item for item in state['values'] if not os.path.exists(os.path.join(images_dir, item))])
+
+@rule_type('list-duplicates')
+class ListDuplicatesRule(ListAttributeRule):
+    """列表中不能有重复项"""
+
+    def finish(self, state, context):
+        return self.result([item for item, count in Counter(state['values']).items() if count > 1])
+
+@rule_type('list-forbidden')
+class ListForbiddenRule(ListAttributeRule):
+    """列表中不能出现以 forbidden 中任一名称结尾的项"""
+
+    def finish(self, state, context):
+        forbidden = tuple(self.config['forbidden'])
+        return self.result([item for item in state['values'] if item.endswith(forbidden)])
+
+@rule_type('required-resources')
+class RequiredResourcesRule(Rule):
+    """页面必须引用 required 中的全部脚本（kind=script）或样式表（kind=stylesheet）"""
+
+    def __init__(self, rule_id, config):
+        super().__init__(rule_id, config)
+        self.kind = config.get('kind', 'script')
+        self.required = config['required']
+        self.elements = ('script',) if self.kind == 'script' else ('link',)
+
+    def new_state(self):
+        return {'found': []}
+
+    def start(self, state, token, context):
+        url = token.get('src') if self.kind == 'script' else token.get('href')
+        if url and (self.kind == 'script' or resource_name(url).endswith('.css')):
+            state['found'].append(resource_name(url))
+
+    def finish(self, state, context):
+        missing = [name for name in self.required if name not in state['found']]
+        return {'items': ', '.join(missing), 'n': len(missing)} if missing else None
+
+@rule_type('carousel')
+class CarouselRule(Rule):
+    """
+    轮播配置（主图 data-images 与多图轮播组件是否匹配），when 取值：
+    single-with-gallery（单图却启用轮播）、multi-without-gallery（多图未启用轮播）、
+    placeholder（主图配置为占位符产品）、empty-without-placeholder（data-images 为空且不是占位符产品）
+    """
+
+    attributes = ('src', 'href', 'class')
+    GALLERY = 'multi-image-gallery'
+
+    def __init__(self, rule_id, config):
+        super().__init__(rule_id, config)
+        self.selector = Selector(config.get('element', {'tag': 'img', 'class': 'main-image'}))
+        self.when = config['when']
+        self.elements = (self.selector.tag,)
+
+    def new_state(self):
+        return {'found': False, 'data_images': None, 'placeholder': False, 'gallery': False}
+
+    def start(self, state, token, context):
+        if not state['found'] and self.selector.matches(token):
+            state['found'] = True
+            state['data_images'] = token.get('data-images')
+            state['placeholder'] = token.get('data-placeholder') == 'true'
+
+    def attribute(self, state, token, attr, context):
+        if self.GALLERY in attr.value:
+            state['gallery'] = True
+
+    def finish(self, state, context):
+        count = len(split_list(state['data_images']))
+        failed = {
+            'single-with-gallery': count == 1 and state['gallery'],
+            'multi-without-gallery': count > 1 and not state['gallery'],
+            'placeholder': state['placeholder'],
+            'empty-without-placeholder': state['data_images'] is not None and count == 0 and not state['placeholder']
+        }[self.when]
+        return {'count': count} if failed else None
+
+@rule_type('quote-button')
+class QuoteButtonRule(Rule):
+    """
+    获取报价按钮（文本匹配 text_pattern 的按钮或任意 onclick 调用 openInquiryModal），when 取值：
+    missing（没有报价入口）、wrong-product（报价入口都没有使用本产品ID）、
+    image-missing（有报价按钮但主图文件不在 context['images_dir'] 中，报价弹窗会显示破图；prefix 为主图路径前缀）
+    """
+
+    elements = ('button', 'img')
+    attributes = ('onclick',)
+    capture_text = True
+    CALL_PATTERN = re.compile(r'openInquiryModal\([\'"]([^\'"]*)[\'"]')
+
+    def __init__(self, rule_id, config):
+        super().__init__(rule_id, config)
+        self.when = config['when']
+        self.text_pattern = re.compile(config.get('text_pattern', '获取报价|报价'))
+        self.main_image = Selector({'tag': 'img', 'class': 'main-image'})
+        self.prefix = config.get('prefix', '../images/products/')
+
+    def new_state(self):
+        return {'buttons': 0, 'calls': [], 'main_src': None}
+
+    def start(self, state, token, context):
+        if state['main_src'] is None and self.main_image.matches(token):
+            state['main_src'] = token.get('src') or ''
+
+    def element_text(self, state, token, text, context):
+        if token.name == 'button' and self.text_pattern.search(text):
+            state['buttons'] += 1
+
+    def attribute(self, state, token, attr, context):
+        match = self.CALL_PATTERN.search(attr.value)
+        if match:
+            state['calls'].append(match.group(1))
+
+    def finish(self, state, context):
+        has_entry = bool(state['buttons'] or state['calls'])
+        if self.when == 'missing':
+            failed = not has_entry
+        elif self.when == 'wrong-product':
+            failed = has_entry and context.get('product_id') not in state['calls']
+        else:
+            src = state['main_src'] or ''
+            images_dir = context.get('images_dir')
+            failed = (bool(state['buttons']) and bool(images_dir) and src.startswith(self.prefix)
+                      and not os.path.exists(os.path.join(images_dir, src[len(self.prefix):])))
+        return {'calls': ', '.join(dict.fromkeys(state['calls'])), 'src': state['main_src'] or ''} if failed else None
+
+# ---------------------------------------------------------------------------
+# 引擎
+# ---------------------------------------------------------------------------
+
+class RuleEngine:
+    """按订阅关系分发标记：每个页面只切分和遍历一次"""
+
+    def __init__(self, rules, scores=None, penalties=None):
+        self.rules = rules
+        self.scores = scores or {}
+        self.penalties = penalties or {}
+        self.by_element = {}
+        self.by_attribute = {}
+        for rule in rules:
+            for name in rule.elements:
+                self.by_element.setdefault(name, []).append(rule)
+            for name in rule.attributes:
+                self.by_attribute.setdefault(name, []).append(rule)
+
+    def check(self, content, context):
+        """检查页面内容，返回 {'issues': [...], 'facts': {规则ID: 状态}}，规则集配置了评分时另含 score/scores"""
+        states = {rule.id: rule.new_state() for rule in self.rules}
+        # 正在收集文本的元素：[规则, 开始标记, 嵌套深度, 文本片段]
+        captures = []
+
+        for token in tokenize(content):
+            if token.kind == 'start':
+                for capture in captures:
+                    if capture[1].name == token.name and not token.self_closing:
+                        capture[2] += 1
+                for rule in self.by_element.get(token.name, ()):
+                    rule.start(states[rule.id], token, context)
+                    if rule.capture_text and not token.self_closing:
+                        captures.append([rule, token, 1, []])
+                for attr in token.attrs:
+                    for rule in self.by_attribute.get(attr.name.lower(), ()):
+                        rule.attribute(states[rule.id], token, attr, context)
+            elif token.kind == 'text' and captures:
+                for capture in captures:
+                    capture[3].append(token.text)
+            elif token.kind == 'end' and captures:
+                remaining = []
+                for capture in captures:
+                    rule, start, depth, parts = capture
+                    if start.name == token.name:
+                        capture[2] -= 1
+                        if capture[2] == 0:
+                            rule.element_text(states[rule.id], start, ''.join(parts), context)
+                            continue
+                    remaining.append(capture)
+                captures = remaining
+
+        issues = []
+        penalties = Counter()
+        for rule in self.rules:
+            fields = rule.finish(states[rule.id], context)
+            if fields is None:
+                continue
+            issues.append({
+                'rule': rule.id,
+                'type': rule.severity,
+                'category': rule.category,
+                'message': rule.message.format(**dict(context, **fields))
+            })
+            penalty = self.penalties.get(rule.id)
+            if penalty:
+                if not isinstance(penalty, dict):
+                    penalty = {'points': penalty}
+                points = penalty['points'] * (fields.get('n', 1) if penalty.get('per_item') else 1)
+                penalties[penalty.get('category', rule.category)] += points
+
+        result = {'issues': issues, 'facts': states}
+        if self.scores:
+            result['scores'] = {category: max(0, full - penalties[category]) for category, full in self.scores.items()}
+            result['score'] = sum(result['scores'].values())
+        return result
+
+def load_engine(ruleset, rules_file=RULES_FILE):
+    """按规则集名称构造引擎；配置错误时抛出 ValueError"""
+    with open(rules_file, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    definitions = config.get('rules', {})
+    if ruleset not in config.get('rulesets', {}):
+        raise ValueError(f'未知的规则集: {ruleset}')
+    settings = config['rulesets'][ruleset]
+
+    rules = []
+    for rule_id in settings['rules']:
+        if rule_id not in definitions:
+            raise ValueError(f'规则集 {ruleset} 引用了未定义的规则: {rule_id}')
+        definition = definitions[rule_id]
+        if definition.get('type') not in RULE_TYPES:
+            raise ValueError(f'规则 {rule_id}: 未知的规则类型 {definition.get("type")}')
+        rules.append(RULE_TYPES[definition['type']](rule_id, definition))
+    return RuleEngine(rules, settings.get('scores'), settings.get('penalties'))
+
+# 每个进程按 (规则文件, 规则集) 只构造一次引擎
+_engine_cache = {}
+
+def check_page(path, ruleset, images_dir=None, rules_file=RULES_FILE):
+    """检查单个页面（可在子进程中执行）；产品ID取文件名"""
+    key = (rules_file, ruleset)
+    if key not in _engine_cache:
+        _engine_cache[key] = load_engine(ruleset, rules_file)
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    context = {'product_id': os.path.splitext(os.path.basename(path))[0], 'images_dir': images_dir}
+    return _engine_cache[key].check(content, context)
+
+def check_pages(paths, ruleset, images_dir=None, rules_file=RULES_FILE, workers=None):
+    """并行检查多个页面，返回 {页面路径: 结果}（按传入顺序）"""
+    load_engine(ruleset, rules_file)  # 配置错误在主进程中尽早报出
+    if workers == 1 or len(paths) < 2:
+        return {path: check_page(path, ruleset, images_dir, rules_file) for path in paths}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(check_page, path, ruleset, images_dir, rules_file) for path in paths]
+        return {path: future.result() for path, future in zip(paths, futures)}
+
+def main():
+    parser = argparse.ArgumentParser(description='按规则集检查产品页面')
+    parser.add_argument('--ruleset', default='audit', help='规则集名称（默认 audit）')
+    parser.add_argument('--pages', default=os.path.join(ZH_DIR, 'products'), help='页面目录（默认 zh/products）')
+    parser.add_argument('--images', default=os.path.join(ZH_DIR, 'images', 'products'), help='图片目录')
+    parser.add_argument('--rules', default=RULES_FILE, help='规则文件（默认 scripts/page-rules.json）')
+    parser.add_argument('--workers', type=int, default=None, help='并行进程数')
+    args = parser.parse_args()
+
+    paths = sorted(os.path.join(args.pages, name) for name in os.listdir(args.pages) if name.endswith('.html'))
+    try:
+        results = check_pages(paths, args.ruleset, args.images, args.rules, args.workers)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"🔍 规则集 {args.ruleset}: 检查 {len(paths)} 个页面")
+    by_rule = Counter()
+    for path, result in results.items():
+        if not result['issues']:
+            continue
+        score = f" {result['score']}分" if 'score' in result else ''
+        print(f"\n📄 {os.path.basename(path)}{score}")
+        for issue in result['issues']:
+            by_rule[issue['rule']] += 1
+            print(f"   [{issue['type']}] {issue['message']}")
+
+    print(f"\n📊 各规则命中页面数:")
+    for rule_id, count in by_rule.most_common():
+        print(f"   {count:>4}  {rule_id}")
+    if not by_rule:
+        print("   ✅ 全部通过")
+
+if __name__ == '__main__':
+    main()
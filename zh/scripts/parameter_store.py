@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+数值参数存储
+把产品目录（product_catalog.py）中以文本记录的参数值（"48%-85%"、"1750-1790"、"≥50"、"±1.0"）
+解析为带类型的 [下限, 上限] 区间并统一单位（°C、MPa、g/cm³、%、W/(m·K)），按列存放：
+产品序号、参数序号、下限、上限、单位序号各一个数组。安装了 NumPy 时使用 NumPy 数组做向量化区间查询，
+否则退回标准库 array 逐行比较，结果相同。
+
+比较运算符要求整个区间满足条件：">= 60" 要求下限 ≥ 60，"<= 0.5" 要求上限 ≤ 0.5，"= X" 要求区间包含 X；
+Al₂O₃ "≥48%" 的产品不满足 "al2o3 >= 99"。运算符前加 ~（"~>="、"~<" 等）改为"区间有交集"：
+耐火度 "1580-1750" 的产品满足 "refractoriness ~>= 1750"（上限可达 1750）。
+同一产品同一参数有多条记录时任一条满足即可。
+"""
+
+import re
+import math
+import time
+import argparse
+import unicodedata
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from product_catalog import open_catalog
+
+# 参数中文名（去掉括号中的测试条件、"含量"后缀）-> 参数键
+PARAMETER_KEYS = {
+    '耐火度': 'refractoriness',
+    '荷重软化温度': 'load_softening_temperature',
+    '荷重软化开始温度': 'load_softening_temperature',
+    '使用温度': 'service_temperature',
+    '最高使用温度': 'service_temperature',
+    '常温耐压强度': 'cold_crushing_strength',
+    '抗压强度': 'cold_crushing_strength',
+    '高温耐压强度': 'hot_crushing_strength',
+    '常温抗折强度': 'flexural_strength',
+    '高温抗折强度': 'hot_flexural_strength',
+    '体积密度': 'bulk_density',
+    '密度': 'bulk_density',
+    '真密度': 'true_density',
+    '显气孔率': 'porosity',
+    '气孔率': 'porosity',
+    '线变化率': 'linear_change',
+    '重烧线变化': 'linear_change',
+    '导热系数': 'thermal_conductivity',
+    '抗热震性': 'thermal_shock_cycles',
+    '热震稳定性': 'thermal_shock_cycles',
+    'al2o3': 'al2o3',
+    'sio2': 'sio2',
+    'fe2o3': 'fe2o3',
+    'cao': 'cao',
+    'mgo': 'mgo',
+    'cr2o3': 'cr2o3',
+    'na2o': 'na2o',
+}
+
+# 各参数的标准单位；记录中没有单位时按标准单位处理，无法换算的单位丢弃
+KEY_UNITS = {
+    'refractoriness': '°C',
+    'load_softening_temperature': '°C',
+    'service_temperature': '°C',
+    'cold_crushing_strength': 'MPa',
+    'hot_crushing_strength': 'MPa',
+    'flexural_strength': 'MPa',
+    'hot_flexural_strength': 'MPa',
+    'bulk_density': 'g/cm³',
+    'true_density': 'g/cm³',
+    'porosity': '%',
+    'linear_change': '%',
+    'thermal_conductivity': 'W/(m·K)',
+    'thermal_shock_cycles': '次',
+}
+DEFAULT_UNIT = '%'
+
+# NFKC 归一化后的单位写法 -> (标准单位, 换算系数)
+UNIT_ALIASES = {
+    '°C': ('°C', 1), '度': ('°C', 1),
+    'MPa': ('MPa', 1), 'mpa': ('MPa', 1), 'GPa': ('MPa', 1000), 'kPa': ('MPa', 0.001),
+    'g/cm3': ('g/cm³', 1), 'kg/m3': ('g/cm³', 0.001), 't/m3': ('g/cm³', 1),
+    '%': ('%', 1),
+    'W/(m·K)': ('W/(m·K)', 1), 'W/m·K': ('W/(m·K)', 1), 'W/(m.K)': ('W/(m·K)', 1), 'W/m.K': ('W/(m·K)', 1),
+    '次': ('次', 1),
+    'h': ('h', 1),
+}
+
+NUMBER = r'\d+(?:\.\d+)?'
+VALUE_PATTERN = re.compile(
+    rf'^(?P<op>[≥≤><~≈±])?\s*(?P<low>{NUMBER})\s*(?:%|°C)?\s*'
+    rf'(?:-\s*(?P<high>{NUMBER}))?\s*(?P<unit>[^\d\s(]*)\s*(?:\(.*)?$'
+)
+CONDITION_PATTERN = re.compile(r'\(.*?\)')
+QUERY_PATTERN = re.compile(rf'^\s*(?P<name>[^<>=≥≤~\s]+)\s*(?P<op>~?(?:>=|<=|==|=|>|<|≥|≤))\s*(?P<value>-?{NUMBER})\s*$')
+QUERY_OPERATORS = {'≥': '>=', '≤': '<=', '==': '='}
+# 运算符 -> (比较的区间端点, 比较方式)；~ 前缀为区间有交集
+ROW_TESTS = {
+    '>=': ('low', '>='), '>': ('low', '>'), '<=': ('high', '<='), '<': ('high', '<'),
+    '~>=': ('high', '>='), '~>': ('high', '>'), '~<=': ('low', '<='), '~<': ('low', '<'),
+}
+
+def normalize(text):
+    return unicodedata.normalize('NFKC', text or '').strip()
+
+def parameter_key(name_cn, name_en=''):
+    """参数名 -> 参数键，未收录的参数（分级标准、矿物组成等文本参数）返回 None"""
+    name = CONDITION_PATTERN.sub('', normalize(name_cn)).strip()
+    if name.endswith('含量'):
+        name = name[:-2]
+    return PARAMETER_KEYS.get(name) or PARAMETER_KEYS.get(name.lower())
+
+def parse_value(text):
+    """"48%-85%" -> (48, 85, '%')；"≥50" -> (50, inf, '')；无法解析为数值时返回 None"""
+    text = normalize(text).replace('–', '-').replace('—', '-')
+    match = VALUE_PATTERN.match(text)
+    if not match:
+        return None
+    low = float(match.group('low'))
+    high = float(match.group('high')) if match.group('high') else low
+    op = match.group('op')
+    if op in ('≥', '>'):
+        low, high = low, math.inf
+    elif op in ('≤', '<'):
+        low, high = -math.inf, low
+    elif op == '±':
+        low, high = -low, low
+    unit = match.group('unit')
+    if not unit and '%' in text:
+        unit = '%'
+    return low, high, unit
+
+def normalize_unit(key, unit):
+    """返回 (标准单位, 换算系数)；单位与该参数的标准单位无法换算时返回 None"""
+    expected = KEY_UNITS.get(key, DEFAULT_UNIT)
+    unit = normalize(unit)
+    if not unit:
+        return expected, 1
+    canonical = UNIT_ALIASES.get(unit)
+    if canonical is None or canonical[0] != expected:
+        return None
+    return canonical
+
+class ParameterStore:
+    """按列存放的数值参数区间"""
+
+    def __init__(self):
+        self.product_ids = []
+        self.keys = []
+        self.units = []
+        self._product_index = {}
+        self._key_index = {}
+        self._unit_index = {}
+        self.product = array('i')
+        self.key = array('i')
+        self.low = array('d')
+        self.high = array('d')
+        self.unit = array('i')
+        self.skipped = 0
+
+    @staticmethod
+    def _intern(value, values, index):
+        if value not in index:
+            index[value] = len(values)
+            values.append(value)
+        return index[value]
+
+    def add(self, product_id, key, low, high, unit):
+        self.product.append(self._intern(product_id, self.product_ids, self._product_index))
+        self.key.append(self._intern(key, self.keys, self._key_index))
+        self.low.append(low)
+        self.high.append(high)
+        self.unit.append(self._intern(unit, self.units, self._unit_index))
+
+    def freeze(self):
+        """录入完成后转换为 NumPy 数组（未安装 NumPy 时保持 array）"""
+        if numpy is not None:
+            self.product = numpy.frombuffer(self.product, dtype=numpy.int32).copy()
+            self.key = numpy.frombuffer(self.key, dtype=numpy.int32).copy()
+            self.low = numpy.frombuffer(self.low, dtype=numpy.float64).copy()
+            self.high = numpy.frombuffer(self.high, dtype=numpy.float64).copy()
+            self.unit = numpy.frombuffer(self.unit, dtype=numpy.int32).copy()
+        return self
+
+    def __len__(self):
+        return len(self.low)
+
+    def key_for(self, name):
+        """查询中的参数名：参数键或中文参数名"""
+        key = name if name in self._key_index else parameter_key(name)
+        if key not in self._key_index:
+            raise ValueError(f'未知参数: {name}')
+        return key
+
+    def _matching_rows(self, key, op, value):
+        """满足单个条件的记录序号（NumPy 时为布尔掩码）"""
+        key_id = self._key_index[key]
+        if op in ('=', '~='):
+            if numpy is not None:
+                return (self.key == key_id) & (self.low <= value) & (self.high >= value)
+            return [i for i in range(len(self.key)) if self.key[i] == key_id and self.low[i] <= value <= self.high[i]]
+
+        bound, comparison = ROW_TESTS[op]
+        column = getattr(self, bound)
+        compare = {
+            '>=': lambda x: x >= value,
+            '>': lambda x: x > value,
+            '<=': lambda x: x <= value,
+            '<': lambda x: x < value,
+        }[comparison]
+        if numpy is not None:
+            return (self.key == key_id) & compare(column)
+        return [i for i in range(len(self.key)) if self.key[i] == key_id and compare(column[i])]
+
+    def query(self, conditions):
+        """conditions 为 [(参数名, 运算符, 数值)]，返回同时满足全部条件的产品 ID（按 ID 排序）"""
+        if numpy is not None:
+            matched = numpy.ones(len(self.product_ids), dtype=bool)
+            for name, op, value in conditions:
+                hits = numpy.zeros(len(self.product_ids), dtype=bool)
+                hits[self.product[self._matching_rows(self.key_for(name), op, value)]] = True
+                matched &= hits
+            return sorted(self.product_ids[i] for i in numpy.flatnonzero(matched))
+
+        matched = set(range(len(self.product_ids)))
+        for name, op, value in conditions:
+            matched &= {self.product[i] for i in self._matching_rows(self.key_for(name), op, value)}
+        return sorted(self.product_ids[i] for i in matched)
+
+    def ranges(self, name):
+        """{产品ID: (下限, 上限)}，同一产品多条记录取最宽区间"""
+        key_id = self._key_index.get(self.key_for(name))
+        result = {}
+        for i in range(len(self.low)):
+            if self.key[i] != key_id:
+                continue
+            product_id = self.product_ids[self.product[i]]
+            low, high = float(self.low[i]), float(self.high[i])
+            if product_id in result:
+                low = min(low, result[product_id][0])
+                high = max(high, result[product_id][1])
+            result[product_id] = (low, high)
+        return result
+
+def load_store(conn=None):
+    """从产品目录录入全部可解析的数值参数"""
+    conn = conn or open_catalog()
+    store = ParameterStore()
+    rows = conn.execute('SELECT product_id, name_cn, name_en, value, unit FROM parameters '
+                        'WHERE product_id IS NOT NULL ORDER BY product_id')
+    for product_id, name_cn, name_en, value, unit in rows:
+        key = parameter_key(name_cn, name_en)
+        parsed = parse_value(value) if key else None
+        if parsed is None:
+            continue
+        low, high, value_unit = parsed
+        normalized = normalize_unit(key, unit or value_unit)
+        if normalized is None:
+            store.skipped += 1
+            continue
+        canonical, factor = normalized
+        store.add(product_id, key, low * factor, high * factor, canonical)
+    return store.freeze()
+
+def parse_query(text):
+    """"refractoriness >= 1700 and al2o3 >= 60" -> [('refractoriness', '>=', 1700.0), ('al2o3', '>=', 60.0)]"""
+    conditions = []
+    for part in re.split(r'\s+and\s+|\s*[,，;；&]\s*|\s*且\s*', normalize(text), flags=re.IGNORECASE):
+        if not part:
+            continue
+        match = QUERY_PATTERN.match(part)
+        if not match:
+            raise ValueError(f'无法解析的查询条件: {part}')
+        op = match.group('op')
+        prefix, op = ('~', op[1:]) if op.startswith('~') else ('', op)
+        op = prefix + QUERY_OPERATORS.get(op, op)
+        conditions.append((match.group('name'), op, float(match.group('value'))))
+    return conditions
+
+def format_range(low, high, unit):
+    if math.isinf(high) and math.isinf(low):
+        return '-'
+    if math.isinf(high):
+        return f'≥{low:g}{unit}'
+    if math.isinf(low):
+        return f'≤{high:g}{unit}'
+    if low == high:
+        return f'{low:g}{unit}'
+    return f'{low:g}-{high:g}{unit}'
+
+def main():
+    parser = argparse.ArgumentParser(description='数值参数区间查询')
+    parser.add_argument('query', nargs='?', help='查询条件，如 "refractoriness>=1700 and al2o3>=60"，~>= 等表示区间有交集')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    store = load_store()
+    elapsed = time.perf_counter() - start
+    backend = 'NumPy' if numpy is not None else 'array（未安装 NumPy）'
+    print(f"🔢 数值参数: {len(store)} 条，产品 {len(store.product_ids)} 个，参数 {len(store.keys)} 种")
+    print(f"⚙️  计算后端: {backend}，录入耗时 {elapsed * 1000:.0f} ms")
+    if store.skipped:
+        print(f"⚠️  单位无法换算而跳过: {store.skipped} 条")
+    if not args.query:
+        print(f"📋 可用参数: {', '.join(store.keys)}")
+        return
+
+    conditions = parse_query(args.query)
+    start = time.perf_counter()
+    results = store.query(conditions)
+    elapsed = time.perf_counter() - start
+    print(f"\n🔍 查询: {args.query}")
+    print(f"✅ 满足条件的产品: {len(results)} 个（{elapsed * 1000:.2f} ms）")
+    columns = [store.key_for(name) for name, _, _ in conditions]
+    ranges = {key: store.ranges(key) for key in columns}
+    for product_id in results:
+        values = ', '.join(
+            f"{key}={format_range(*ranges[key][product_id], KEY_UNITS.get(key, DEFAULT_UNIT))}"
+            for key in columns
+        )
+        print(f"   - {product_id}: {values}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+多模式路径替换
+把映射表中的全部旧路径编译为一个按字典树合并公共前缀的正则（等价于 Aho-Corasick 的一次扫描），
+每个文件只扫描一次即可完成全部替换，并按映射统计命中次数。映射表增加到数千条时，
+扫描开销只与文件长度和实际匹配的前缀深度有关，与映射条数基本无关。
+
+同一位置有多个旧路径匹配时取最长的一个；替换结果不会再次参与匹配（不会出现链式替换）。
+"""
+
+import re
+from collections import Counter
+
+END = ''
+
+def compile_literals(words):
+    """把一组字面量编译为单个正则：按字典树合并公共前缀，同一位置优先匹配更长的字面量"""
+    trie = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[END] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char != END]
+        if not branches:
+            return ''
+        if len(branches) == 1 and END not in node:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        # 当前节点本身是一个完整字面量时，后续分支可选；量词是贪婪的，因此优先更长的匹配
+        return group + '?' if END in node else group
+
+    pattern = build(trie)
+    # 空映射表：返回永不匹配的正则
+    return re.compile(pattern if pattern else r'(?!)')
+
+class PathRewriter:
+    """按映射表一次扫描完成替换；prefix 同时加在旧路径和新路径前（如 "../images/products/"）"""
+
+    def __init__(self, mappings, prefix=''):
+        self.mappings = dict(mappings)
+        self.prefix = prefix
+        self.replacements = {prefix + old: prefix + new for old, new in self.mappings.items()}
+        self.pattern = compile_literals(self.replacements)
+        self.hits = Counter()
+
+    def rewrite(self, text):
+        """返回 (替换后的文本, 本次各映射的命中次数)；命中次数同时累加到 self.hits"""
+        counts = Counter()
+        prefix_length = len(self.prefix)
+
+        def replace(match):
+            old = match.group(0)
+            counts[old[prefix_length:]] += 1
+            return self.replacements[old]
+
+        result = self.pattern.sub(replace, text)
+        self.hits.update(counts)
+        return result, counts
+
+    def unused(self):
+        """没有命中过的映射（旧路径）"""
+        return [old for old in self.mappings if not self.hits[old]]
+
+    def report(self, limit=None):
+        """按命中次数从高到低打印各映射的命中情况"""
+        print(f"\n📊 映射命中统计（{len(self.mappings)} 条映射，命中 {sum(self.hits.values())} 处）:")
+        for old, count in self.hits.most_common(limit):
+            print(f"   {count:>4}  {old} → {self.mappings[old]}")
+        unused = self.unused()
+        if unused:
+            print(f"   未命中: {len(unused)} 条")
+
+def match_prefix(pattern, text):
+    """用 compile_literals 编译的正则匹配 text 开头的最长字面量，没有时返回 None"""
+    match = pattern.match(text)
+    return match.group(0) if match else None
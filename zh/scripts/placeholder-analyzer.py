@@ -9,6 +9,8 @@ import os
 import re
 from datetime import datetime
 
+from product_catalog import open_catalog, product_page_ids
+
 def main():
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     products_dir = os.path.join(base_dir, 'products')
@@ -19,8 +21,8 @@ def main():
     print(f"📁 产品目录: {products_dir}")
     print("="*80)
 
-    # 获取所有产品页面
-    product_files = [f for f in os.listdir(products_dir) if f.endswith('.html')]
+    # 获取所有产品页面（取自产品目录 product_catalog.py）
+    product_files = [f'{product_id}.html' for product_id in product_page_ids(open_catalog())]
     product_files.sort()
 
     # 分析结果
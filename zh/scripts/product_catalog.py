@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+产品目录编译器
+把分散在各处的产品数据编译为一个带索引的 SQLite 目录 .build-cache/product-catalog.sqlite：
+  - zh/data/products.json                    产品中心卡片
+  - zh/data/products-extracted-data.json     详情页提取数据
+  - zh/products_parameters*.csv              技术参数及资料来源
+  - zh/scripts/image_catalog.json            图片目录
+  - product-image-mapping.json               产品图片映射
+  - zh/products/*.html、en/products/*.html   产品页面
+表：products、parameters、images、pages、refs（资料来源）。
+源文件摘要（含产品图片目录列表）与上次编译一致时直接复用已有目录；审计和修复脚本通过 open_catalog() 查询，不必各自解析源文件
+（构建时的生成步骤按文件或分片登记依赖，仍直接读取数据文件）。
+"""
+
+import os
+import csv
+import json
+import time
+import sqlite3
+import argparse
+from html import unescape
+
+from build_common import SITE_ROOT, CACHE_DIR, bytes_digest, file_digest, load_json
+from html_tokens import tokenize
+
+CATALOG_VERSION = 1
+CATALOG_FILE = os.path.join(CACHE_DIR, 'product-catalog.sqlite')
+
+CARDS_FILE = 'zh/data/products.json'
+EXTRACTED_FILE = 'zh/data/products-extracted-data.json'
+NAVIGATION_FILE = 'zh/data/navigation-config.json'
+# 完整版在前：两份 CSV 中相同的参数只保留完整版的记录
+PARAMETER_FILES = ['zh/products_parameters_complete.csv', 'zh/products_parameters.csv']
+IMAGE_CATALOG_FILE = 'zh/scripts/image_catalog.json'
+IMAGE_MAPPING_FILE = 'product-image-mapping.json'
+PAGE_DIRS = ['zh/products', 'en/products']
+# images.present 按这些目录中的文件计算，目录列表（含大小和修改时间）计入源文件摘要
+IMAGE_DIRS = ['zh/images/products', 'en/images/products']
+
+# CSV 中与页面名称写法不同的产品名
+NAME_ALIASES = {
+    '黏土砖': '粘土砖',
+    '刚玉质耐火浇注料': '刚玉系列耐火浇注料',
+}
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE products (
+    id TEXT PRIMARY KEY,
+    name_cn TEXT, name_en TEXT,
+    category TEXT, category_label TEXT, series TEXT,
+    description TEXT, page TEXT,
+    card_id INTEGER, csv_id TEXT
+);
+CREATE TABLE parameters (
+    product_id TEXT, csv_id TEXT,
+    name_cn TEXT, name_en TEXT, value TEXT, unit TEXT,
+    source TEXT, ref_id INTEGER
+);
+CREATE TABLE images (
+    product_id TEXT, path TEXT, role TEXT, source TEXT,
+    category TEXT, pattern TEXT, size INTEGER, present INTEGER
+);
+CREATE TABLE pages (
+    path TEXT PRIMARY KEY, locale TEXT, product_id TEXT,
+    title TEXT, size INTEGER, digest TEXT
+);
+CREATE TABLE refs (
+    id INTEGER PRIMARY KEY,
+    url TEXT, source_type TEXT, language TEXT, date TEXT,
+    excerpt TEXT, method TEXT, confidence TEXT, notes TEXT
+);
+CREATE INDEX products_category ON products (category);
+CREATE INDEX products_name ON products (name_cn);
+CREATE INDEX parameters_product ON parameters (product_id);
+CREATE INDEX parameters_name ON parameters (name_en);
+CREATE INDEX images_product ON images (product_id);
+CREATE INDEX images_path ON images (path);
+CREATE INDEX pages_product ON pages (product_id);
+"""
+
+def slug_from_href(href):
+    return os.path.splitext(os.path.basename(href or ''))[0]
+
+def split_bilingual(name):
+    """"耐火度 / Refractoriness" -> ("耐火度", "Refractoriness")"""
+    chinese, sep, english = name.partition(' / ')
+    return chinese.strip(), english.strip() if sep else ''
+
+def site_image_path(page_dir, src):
+    """页面中的图片地址转换为相对站点根目录的路径，外部地址返回 None"""
+    src = unescape(src or '').split('?')[0].split('#')[0]
+    if not src or src.startswith(('http:', 'https:', 'data:', '//')):
+        return None
+    return os.path.normpath(os.path.join(page_dir, src)).replace(os.sep, '/')
+
+# ---------------------------------------------------------------------------
+# 源文件
+# ---------------------------------------------------------------------------
+
+def source_files(src_root=SITE_ROOT):
+    """参与编译的全部源文件（相对站点根目录）"""
+    files = [CARDS_FILE, EXTRACTED_FILE, NAVIGATION_FILE, *PARAMETER_FILES, IMAGE_CATALOG_FILE, IMAGE_MAPPING_FILE]
+    for page_dir in PAGE_DIRS:
+        directory = os.path.join(src_root, page_dir)
+        if os.path.isdir(directory):
+            files.extend(f'{page_dir}/{name}' for name in sorted(os.listdir(directory)) if name.endswith('.html'))
+    return [path for path in files if os.path.isfile(os.path.join(src_root, path))]
+
+def image_listing(src_root=SITE_ROOT):
+    """产品图片目录中的文件：[(相对路径, 大小, 修改时间)]，图片增删或替换时目录需要重新编译"""
+    listing = []
+    for image_dir in IMAGE_DIRS:
+        for root, dirs, names in os.walk(os.path.join(src_root, image_dir)):
+            dirs.sort()
+            for name in sorted(names):
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                listing.append((os.path.relpath(path, src_root).replace(os.sep, '/'), stat.st_size, stat.st_mtime_ns))
+    return listing
+
+def sources_digest(src_root, files):
+    parts = [str(CATALOG_VERSION)]
+    parts.extend(f'{path}:{file_digest(os.path.join(src_root, path))}' for path in files)
+    parts.extend(f'{path}:{size}:{mtime}' for path, size, mtime in image_listing(src_root))
+    return bytes_digest('\n'.join(parts).encode('utf-8'))
+
+# ---------------------------------------------------------------------------
+# 编译
+# ---------------------------------------------------------------------------
+
+def load_products(conn, src_root):
+    """合并卡片数据与提取数据，返回 {中文名: 产品ID} 供 CSV 对齐"""
+    navigation = load_json(os.path.join(src_root, NAVIGATION_FILE), default={})
+    category_labels = {value: key for key, value in navigation.get('categoryMapping', {}).items()}
+    rows = {}
+
+    def row(product_id):
+        return rows.setdefault(product_id, {
+            'id': product_id, 'name_cn': '', 'name_en': '', 'category': '', 'category_label': '',
+            'series': '', 'description': '', 'page': '', 'card_id': None, 'csv_id': None
+        })
+
+    for card in load_json(os.path.join(src_root, CARDS_FILE), default=[]):
+        product_id = slug_from_href(card.get('href'))
+        if not product_id:
+            continue
+        item = row(product_id)
+        item.update({
+            'name_cn': card.get('title', ''),
+            'category': card.get('category', ''),
+            'category_label': category_labels.get(card.get('category'), ''),
+            'description': card.get('description', ''),
+            'page': f"zh/{card.get('href')}",
+            'card_id': card.get('id')
+        })
+        conn.execute('INSERT INTO images VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (
+            product_id, site_image_path('zh', card.get('image')), 'card', CARDS_FILE,
+            card.get('category', ''), None, None, None
+        ))
+
+    extracted = load_json(os.path.join(src_root, EXTRACTED_FILE), default={}).get('products', {})
+    for key, record in extracted.items():
+        product_id = slug_from_href((record.get('metadata') or {}).get('filename')) or key
+        product = record.get('product') or {}
+        names = product.get('name') or {}
+        category = product.get('category') or {}
+        item = row(product_id)
+        item['name_cn'] = item['name_cn'] or names.get('chinese', '')
+        item['name_en'] = item['name_en'] or names.get('english', '')
+        item['category_label'] = item['category_label'] or category.get('primary', '')
+        item['series'] = category.get('series', '')
+        item['description'] = item['description'] or (product.get('description') or {}).get('summary', '')
+        item['page'] = item['page'] or f'zh/products/{product_id}.html'
+        images = product.get('images') or {}
+        for role, paths in (('main', [images.get('main')]), ('thumbnail', images.get('thumbnails') or [])):
+            for path in paths:
+                if path:
+                    conn.execute('INSERT INTO images VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (
+                        product_id, site_image_path('zh/products', path), role, EXTRACTED_FILE,
+                        None, None, None, None
+                    ))
+        for spec in (product.get('specifications') or {}).get('data') or []:
+            conn.execute('INSERT INTO parameters VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (
+                product_id, None, spec.get('property', ''), '', spec.get('value', ''), spec.get('unit', ''),
+                EXTRACTED_FILE, None
+            ))
+
+    conn.executemany(
+        'INSERT INTO products VALUES (:id, :name_cn, :name_en, :category, :category_label, :series, '
+        ':description, :page, :card_id, :csv_id)',
+        rows.values()
+    )
+    names = {}
+    for product_id, item in sorted(rows.items()):
+        names.setdefault(item['name_cn'], product_id)
+    return names
+
+def load_parameters(conn, src_root, names):
+    """导入 CSV 参数，资料来源去重后写入 refs 表；返回未能对齐到产品的 CSV 产品名"""
+    ref_ids = {}
+    seen = set()
+    unmatched = set()
+    for rel_path in PARAMETER_FILES:
+        path = os.path.join(src_root, rel_path)
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            for record in csv.DictReader(f):
+                name = record.get('product_name_cn', '')
+                product_id = names.get(NAME_ALIASES.get(name, name))
+                if product_id is None:
+                    unmatched.add(name)
+                else:
+                    conn.execute('UPDATE products SET csv_id = ?, name_en = COALESCE(NULLIF(name_en, \'\'), ?) '
+                                 'WHERE id = ?', (record['product_id'], record.get('product_name_en', ''), product_id))
+
+                key = (record['product_id'], record['parameter_name'], record['parameter_value'])
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                ref_key = (record.get('source_url', ''), record.get('quote_excerpt', ''))
+                if ref_key not in ref_ids:
+                    ref_ids[ref_key] = len(ref_ids) + 1
+                    conn.execute('INSERT INTO refs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', (
+                        ref_ids[ref_key], record.get('source_url', ''), record.get('source_type', ''),
+                        record.get('source_language', ''), record.get('source_date', ''),
+                        record.get('quote_excerpt', ''), record.get('extraction_method', ''),
+                        record.get('confidence_rating', ''), record.get('notes', '')
+                    ))
+                name_cn, name_en = split_bilingual(record['parameter_name'])
+                conn.execute('INSERT INTO parameters VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (
+                    product_id, record['product_id'], name_cn, name_en, record['parameter_value'],
+                    record.get('unit', ''), rel_path, ref_ids[ref_key]
+                ))
+    return sorted(unmatched)
+
+def load_images(conn, src_root):
+    """导入图片目录和产品图片映射"""
+    catalog = load_json(os.path.join(src_root, IMAGE_CATALOG_FILE), default={}).get('products', {})
+    for name, info in sorted(catalog.items()):
+        path = 'zh/' + info.get('path', f'images/products/{name}')
+        conn.execute('INSERT INTO images VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (
+            None, path, 'catalog', IMAGE_CATALOG_FILE, info.get('category'), info.get('pattern'),
+            info.get('size'), None
+        ))
+
+    mapping = load_json(os.path.join(src_root, IMAGE_MAPPING_FILE), default={})
+    for product_id, info in sorted(mapping.items()):
+        for name in info.get('images') or []:
+            conn.execute('INSERT INTO images VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (
+                product_id, f'zh/images/products/{name}', 'mapped', IMAGE_MAPPING_FILE, None, None, None, None
+            ))
+
+def load_pages(conn, src_root):
+    """导入产品页面：标题、大小、摘要以及页面引用的图片"""
+    for page_dir in PAGE_DIRS:
+        directory = os.path.join(src_root, page_dir)
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith('.html'):
+                continue
+            rel_path = f'{page_dir}/{name}'
+            with open(os.path.join(directory, name), 'rb') as f:
+                data = f.read()
+            html = data.decode('utf-8', errors='replace')
+            product_id = slug_from_href(name)
+            title = ''
+            images = []
+            tokens = tokenize(html)
+            for index, token in enumerate(tokens):
+                if token.kind != 'start':
+                    continue
+                if token.name == 'title' and not title and index + 1 < len(tokens):
+                    title = unescape(tokens[index + 1].text).strip() if tokens[index + 1].kind == 'text' else ''
+                elif token.name == 'img':
+                    path = site_image_path(page_dir, token.get('src'))
+                    if path and path not in images:
+                        images.append(path)
+            conn.execute('INSERT INTO pages VALUES (?, ?, ?, ?, ?, ?)', (
+                rel_path, page_dir.split('/')[0], product_id, title, len(data), bytes_digest(data)
+            ))
+            conn.executemany('INSERT INTO images VALUES (?, ?, ?, ?, ?, ?, ?, ?)', [
+                (product_id, path, 'page', rel_path, None, None, None, None) for path in images
+            ])
+
+def compile_catalog(src_root=SITE_ROOT, catalog_file=CATALOG_FILE, force=False):
+    """编译目录；源文件未变化时跳过。返回统计信息"""
+    files = source_files(src_root)
+    digest = sources_digest(src_root, files)
+    if not force and os.path.exists(catalog_file):
+        try:
+            with sqlite3.connect(catalog_file) as conn:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'sources'").fetchone()
+            if row and row[0] == digest:
+                return {'compiled': False, 'sources': len(files)}
+        except sqlite3.DatabaseError:
+            pass
+
+    os.makedirs(os.path.dirname(catalog_file), exist_ok=True)
+    tmp_path = catalog_file + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        names = load_products(conn, src_root)
+        unmatched = load_parameters(conn, src_root, names)
+        load_images(conn, src_root)
+        load_pages(conn, src_root)
+        # 标记图片文件是否存在（同一路径只检查一次）
+        paths = [row[0] for row in conn.execute('SELECT DISTINCT path FROM images WHERE path IS NOT NULL')]
+        conn.executemany('UPDATE images SET present = ? WHERE path = ?', [
+            (int(os.path.isfile(os.path.join(src_root, path))), path) for path in paths
+        ])
+        conn.executemany('INSERT INTO meta VALUES (?, ?)', [
+            ('version', str(CATALOG_VERSION)),
+            ('sources', digest),
+            ('unmatched', json.dumps(unmatched, ensure_ascii=False))
+        ])
+        counts = {table: conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                  for table in ('products', 'parameters', 'images', 'pages', 'refs')}
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, catalog_file)
+    return {'compiled': True, 'sources': len(files), 'counts': counts, 'unmatched': unmatched}
+
+# ---------------------------------------------------------------------------
+# 查询
+# ---------------------------------------------------------------------------
+
+def open_catalog(src_root=SITE_ROOT, catalog_file=CATALOG_FILE):
+    """打开目录（源文件有变化时先重新编译），返回以 sqlite3.Row 为行类型的连接"""
+    compile_catalog(src_root, catalog_file)
+    conn = sqlite3.connect(catalog_file)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def product_page_ids(conn, locale='zh'):
+    """有产品页面的产品 ID（按 ID 排序）"""
+    rows = conn.execute('SELECT product_id FROM pages WHERE locale = ? ORDER BY product_id', (locale,))
+    return [row[0] for row in rows]
+
+def card_images(conn):
+    """产品中心卡片：{产品ID: (图片路径（相对站点根目录）, 名称, 页面链接（相对 zh/）)}"""
+    rows = conn.execute("SELECT i.product_id, i.path, p.name_cn, p.page FROM images i "
+                        "JOIN products p ON p.id = i.product_id WHERE i.role = 'card' AND i.path IS NOT NULL")
+    return {product_id: (path, name, (page or '').split('/', 1)[-1]) for product_id, path, name, page in rows}
+
+def get_product(conn, product_id):
+    return conn.execute('SELECT * FROM products WHERE id = ?', (product_id,)).fetchone()
+
+def products_by_category(conn, category):
+    """按分类 ID（shaped 等）或中文分类名查询"""
+    return conn.execute('SELECT * FROM products WHERE category = ? OR category_label = ? ORDER BY id',
+                        (category, category)).fetchall()
+
+def products_using_image(conn, path):
+    """引用某张图片（相对站点根目录）的产品及引用方式"""
+    return conn.execute('SELECT DISTINCT product_id, role, source FROM images '
+                        'WHERE path = ? AND product_id IS NOT NULL ORDER BY product_id', (path,)).fetchall()
+
+def parameter_values(conn, name):
+    """按参数名（中文或英文，子串匹配）查询各产品的参数值"""
+    pattern = f'%{name}%'
+    return conn.execute('SELECT product_id, name_cn, name_en, value, unit, source FROM parameters '
+                        'WHERE name_cn LIKE ? OR name_en LIKE ? ORDER BY product_id', (pattern, pattern)).fetchall()
+
+def missing_images(conn):
+    """数据中引用但文件不存在的图片"""
+    return conn.execute('SELECT DISTINCT product_id, path, role, source FROM images '
+                        'WHERE present = 0 AND product_id IS NOT NULL ORDER BY product_id, path').fetchall()
+
+def main():
+    parser = argparse.ArgumentParser(description='编译产品目录 SQLite 数据库')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=CATALOG_FILE, help='目录文件（默认 .build-cache/product-catalog.sqlite）')
+    parser.add_argument('--force', action='store_true', help='忽略源文件摘要，强制重新编译')
+    args = parser.parse_args()
+
+    print("🗂️  开始编译产品目录...")
+    start = time.perf_counter()
+    stats = compile_catalog(os.path.abspath(args.src), os.path.abspath(args.out), force=args.force)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n📚 源文件: {stats['sources']} 个")
+    if not stats['compiled']:
+        print("⏭️  源文件未变化，沿用现有目录")
+    else:
+        for table, count in stats['counts'].items():
+            print(f"   - {table}: {count}")
+        if stats['unmatched']:
+            print(f"⚠️  未对齐到产品的 CSV 产品名: {', '.join(stats['unmatched'])}")
+    print(f"📄 目录文件: {os.path.abspath(args.out)}")
+    print(f"⏱️  耗时: {elapsed * 1000:.0f} ms")
+
+if __name__ == '__main__':
+    main()
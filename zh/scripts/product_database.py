@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+产品技术资料数据库生成
+根据 data/product-database.json 生成 js/product-database.js：数据以紧凑 JSON 嵌入模板
+templates/product-database.js，并预先计算按 ID、中文名、英文名（小写）和分类的索引，
+浏览器加载后直接构造为 Map；输出经 html_minifier.minify_js 压缩。
+
+重复的产品 ID 和缺少 name/englishName/category 的产品在生成时报错，不再留到页面运行时检查。
+"""
+
+import os
+import sys
+import json
+import argparse
+
+from build_common import SITE_ROOT, ZH_DIR, atomic_write_text
+from html_minifier import minify_js
+from template_engine import load_template
+
+DATA_FILE = 'zh/data/product-database.json'
+TEMPLATE_FILE = 'zh/templates/product-database.js'
+OUTPUT_FILE = 'zh/js/product-database.js'
+REQUIRED_FIELDS = ('name', 'englishName', 'category')
+BANNER = '/* 产品技术资料数据库 - 由 scripts/product_database.py 根据 data/product-database.json 生成，请勿直接修改 */\n'
+
+def _reject_duplicates(pairs):
+    seen, duplicates = set(), set()
+    for key, _ in pairs:
+        (duplicates if key in seen else seen).add(key)
+    if duplicates:
+        raise ValueError(f"重复的键: {', '.join(sorted(duplicates))}")
+    return dict(pairs)
+
+def load_products(src_root=SITE_ROOT):
+    """读取产品数据，存在重复 ID 或缺少基本信息时抛出 ValueError"""
+    with open(os.path.join(src_root, DATA_FILE), 'r', encoding='utf-8') as f:
+        products = json.load(f, object_pairs_hook=_reject_duplicates)
+    errors = [
+        f'{product_id}: 缺少 {field}'
+        for product_id, product in products.items()
+        for field in REQUIRED_FIELDS
+        if not product.get(field)
+    ]
+    if errors:
+        raise ValueError('产品数据结构不完整: ' + '; '.join(errors))
+    return products
+
+def build_payload(products):
+    """嵌入页面的数据：产品列表和预先计算的索引条目，同名产品保留第一个"""
+    names, english_names, categories = {}, {}, {}
+    for product_id, product in products.items():
+        names.setdefault(product['name'], product_id)
+        english_names.setdefault(product['englishName'].lower(), product_id)
+        categories.setdefault(product['category'], []).append(product_id)
+    return {
+        'products': list(products.items()),
+        'names': list(names.items()),
+        'englishNames': list(english_names.items()),
+        'categories': list(categories.items())
+    }
+
+def render_database(products, src_root=SITE_ROOT):
+    payload = build_payload(products)
+    data = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+    script = load_template(os.path.join(src_root, TEMPLATE_FILE)).render({'data': data})
+    return BANNER + minify_js(script) + '\n'
+
+# ---------------------------------------------------------------------------
+# 依赖图集成
+# ---------------------------------------------------------------------------
+
+def build_product_database(node, src_root, out_root):
+    """依赖图动作：生成产品数据库脚本"""
+    atomic_write_text(os.path.join(out_root, node.outputs[0]), render_database(load_products(src_root), src_root))
+
+def add_product_database_node(graph):
+    """依赖图扩展：产品数据库脚本由数据文件和模板生成，替代仓库中已提交脚本的直接复制"""
+    from build_graph import BuildNode
+
+    if not os.path.exists(os.path.join(graph.src_root, DATA_FILE)):
+        return
+    graph.add_node(BuildNode('product-database', 'generate', 'product_database:build_product_database',
+                             inputs=[('file', DATA_FILE), ('file', TEMPLATE_FILE)],
+                             outputs=[OUTPUT_FILE]))
+
+def main():
+    parser = argparse.ArgumentParser(description='生成产品技术资料数据库脚本')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=os.path.join(ZH_DIR, 'js', 'product-database.js'),
+                        help='输出脚本（默认 zh/js/product-database.js）')
+    args = parser.parse_args()
+
+    src_root = os.path.abspath(args.src)
+    print("🗃️  开始生成产品数据库脚本...")
+    try:
+        products = load_products(src_root)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    script = render_database(products, src_root)
+    atomic_write_text(args.out, script)
+
+    print(f"\n✅ 产品: {len(products)} 个")
+    print(f"📦 脚本大小: {len(script.encode('utf-8')):,} 字节")
+    print(f"📄 已保存到: {args.out}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+产品数据分片
+把 data/products-extracted-data.json 拆分为每个产品一个分片 data/products/<id>.json，
+并生成轻量清单 data/products-manifest.json（ID、名称、分类、主图、分片路径和分片摘要）。
+读取单个产品只需解析清单和一个分片；重新拆分时只写入摘要发生变化的分片。
+主图取决于哪些图片文件存在，清单同时记录产品图片目录的文件列表摘要，图片增删后分片同样视为不同步。
+拆分是显式步骤（本脚本或 extract_products.py），构建时只检查是否同步，不改写源文件。
+"""
+
+import os
+import json
+import time
+import argparse
+
+from build_common import SITE_ROOT, bytes_digest, file_digest, atomic_write_bytes, load_json, save_json
+
+MANIFEST_VERSION = 1
+DATA_FILE = 'zh/data/products-extracted-data.json'
+SHARDS_DIR = 'zh/data/products'
+MANIFEST_FILE = 'zh/data/products-manifest.json'
+
+def shard_path(product_id):
+    """分片路径（相对站点根目录）"""
+    return f'{SHARDS_DIR}/{product_id}.json'
+
+def serialize_shard(record):
+    """分片格式与仓库数据文件一致（缩进 2、不转义中文），摘要按该字节内容计算"""
+    return (json.dumps(record, ensure_ascii=False, indent=2) + '\n').encode('utf-8')
+
+def images_digest(src_root=SITE_ROOT):
+    """产品图片目录的文件列表摘要（主图解析只关心文件是否存在）"""
+    from generate_product_pages import IMAGES_DIR
+
+    images_dir = os.path.join(src_root, IMAGES_DIR)
+    names = sorted(os.listdir(images_dir)) if os.path.isdir(images_dir) else []
+    return bytes_digest('\n'.join(names).encode('utf-8'))
+
+def main_image(src_root, product_id, record):
+    """页面实际使用的主图（相对 zh/ 目录），没有可用图片时为空字符串"""
+    from generate_product_pages import resolve_images
+
+    images = resolve_images(src_root, product_id, (record.get('product') or {}).get('images') or {})
+    return images[0][len('../'):] if images else ''
+
+def manifest_entry(src_root, product_id, record, digest):
+    product = record.get('product') or {}
+    names = product.get('name') or {}
+    category = product.get('category') or {}
+    return {
+        'name': names.get('chinese') or names.get('english') or product_id,
+        'category': category.get('primary', ''),
+        'image': main_image(src_root, product_id, record),
+        'page': (record.get('metadata') or {}).get('filename') or f'{product_id}.html',
+        'shard': shard_path(product_id),
+        'digest': digest
+    }
+
+# ---------------------------------------------------------------------------
+# 读取
+# ---------------------------------------------------------------------------
+
+# 进程内缓存：{路径: (mtime_ns, 内容)}
+_json_cache = {}
+
+def _cached_json(path):
+    mtime = os.stat(path).st_mtime_ns
+    cached = _json_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, load_json(path, default={}))
+        _json_cache[path] = cached
+    return cached[1]
+
+def load_manifest(src_root=SITE_ROOT):
+    """读取清单，不存在时返回 None"""
+    path = os.path.join(src_root, MANIFEST_FILE)
+    return _cached_json(path) if os.path.exists(path) else None
+
+def shards_current(src_root=SITE_ROOT, manifest=None):
+    """分片是否与数据文件同步：数据文件不存在时分片即为权威数据，否则比较清单记录的来源摘要和图片列表摘要"""
+    manifest = manifest if manifest is not None else load_manifest(src_root)
+    if not manifest:
+        return False
+    data_path = os.path.join(src_root, DATA_FILE)
+    if not os.path.exists(data_path):
+        return True
+    return manifest.get('source') == file_digest(data_path) and manifest.get('images') == images_digest(src_root)
+
+def load_product(product_id, src_root=SITE_ROOT):
+    """读取单个产品记录，清单中没有该产品时返回 None"""
+    manifest = load_manifest(src_root) or {}
+    entry = manifest.get('products', {}).get(product_id)
+    if entry is None:
+        return None
+    return _cached_json(os.path.join(src_root, entry['shard']))
+
+# ---------------------------------------------------------------------------
+# 拆分
+# ---------------------------------------------------------------------------
+
+def write_shards(src_root=SITE_ROOT, data_file=DATA_FILE):
+    """按数据文件更新分片和清单，返回统计信息"""
+    data_path = os.path.join(src_root, data_file)
+    data = load_json(data_path, default={})
+    products = data.get('products', {})
+    previous = (load_manifest(src_root) or {}).get('products', {})
+
+    stats = {'total': len(products), 'written': 0, 'unchanged': 0, 'removed': 0}
+    entries = {}
+    for product_id, record in sorted(products.items()):
+        payload = serialize_shard(record)
+        digest = bytes_digest(payload)
+        target = os.path.join(src_root, shard_path(product_id))
+        if previous.get(product_id, {}).get('digest') == digest and os.path.exists(target):
+            stats['unchanged'] += 1
+        else:
+            atomic_write_bytes(target, payload)
+            stats['written'] += 1
+        entries[product_id] = manifest_entry(src_root, product_id, record, digest)
+
+    for product_id, entry in previous.items():
+        if product_id not in entries:
+            stale = os.path.join(src_root, entry['shard'])
+            if os.path.exists(stale):
+                os.remove(stale)
+            stats['removed'] += 1
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'source': file_digest(data_path),
+        'images': images_digest(src_root),
+        'summary': data.get('summary', {}),
+        'products': entries
+    }
+    if manifest != load_manifest(src_root):
+        save_json(os.path.join(src_root, MANIFEST_FILE), manifest)
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description='把提取数据拆分为单产品分片和清单')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--data', default=DATA_FILE, help='提取数据文件（相对源目录）')
+    args = parser.parse_args()
+
+    src_root = os.path.abspath(args.src)
+    print("🧩 开始拆分产品数据...")
+    start = time.perf_counter()
+    stats = write_shards(src_root, args.data)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n✅ 产品记录: {stats['total']} 个")
+    print(f"📝 写入分片: {stats['written']} 个")
+    print(f"⏭️  内容未变: {stats['unchanged']} 个")
+    print(f"🗑️  删除分片: {stats['removed']} 个")
+    print(f"📄 清单: {os.path.join(src_root, MANIFEST_FILE)}")
+    print(f"⏱️  耗时: {elapsed * 1000:.0f} ms")
+
+if __name__ == '__main__':
+    main()
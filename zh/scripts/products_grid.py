@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+产品中心卡片预渲染
+在构建时根据 data/products.json 渲染 products.html 中 #productsGrid 的全部产品卡片，
+并同步各分类的数量统计。页面打开即可看到完整的产品网格，
+运行时的 js/products-renderer.js 只在现有 DOM 上绑定筛选、搜索和排序。
+"""
+
+import os
+import time
+import argparse
+from collections import Counter
+
+from build_common import ZH_DIR, SITE_ROOT, DIST_DIR, atomic_write_bytes, load_json
+from template_engine import load_template
+from html_tokens import tokenize
+from site_includes import closing_index, apply_includes
+
+PAGE_FILE = 'zh/products.html'
+DATA_FILE = 'zh/data/products.json'
+PARTIALS_DIR = os.path.join(ZH_DIR, 'templates', 'partials')
+CARD_PARTIALS = ['product-card', 'product-card-badge', 'product-card-app', 'product-card-spec']
+GRID_ID = 'productsGrid'
+PLACEHOLDER_IMAGE = 'images/products/placeholder.jpg'
+
+# 与页面中现有卡片保持一致的徽章样式
+BADGE_CLASSES = {
+    '热门': 'badge-hot',
+    '热销': 'badge-hot',
+    '热门产品': 'badge-hot',
+    '新品上市': 'badge-new',
+    '经典产品': 'badge-classic',
+    '可靠性高': 'badge-reliable',
+    '久经考验': 'badge-reliable',
+    '稳定性好': 'badge-reliable',
+    '创新技术': 'badge-innovation',
+    '工艺创新': 'badge-innovation',
+    '技术先进': 'badge-innovation',
+    '绿色材料': 'badge-eco',
+    '环保首选': 'badge-eco',
+    '节能环保': 'badge-eco',
+    '工业标准': 'badge-industrial',
+    '节能首选': 'badge-energy',
+}
+DEFAULT_BADGE = 'badge-premium'
+
+def partial(name, context):
+    return load_template(os.path.join(PARTIALS_DIR, name + '.html'), strip_newline=True).render(context)
+
+def partial_files():
+    return [
+        os.path.relpath(os.path.join(PARTIALS_DIR, name + '.html'), SITE_ROOT).replace(os.sep, '/')
+        for name in CARD_PARTIALS
+    ]
+
+def resolve_image(src_root, product):
+    """数据中的图片存在时直接使用，否则回退到 images/products/<页面名>-1.png，再回退到占位图"""
+    from generate_product_pages import product_images
+
+    image = product.get('image') or ''
+    if image and os.path.isfile(os.path.join(src_root, 'zh', image)):
+        return image
+    slug = os.path.splitext(os.path.basename(product.get('href') or ''))[0]
+    images = product_images(src_root).get(slug)
+    return f'images/products/{images[0]}' if images else PLACEHOLDER_IMAGE
+
+def split_spec(spec):
+    """"耐火度: 1750℃" -> ("耐火度:", "1750℃")"""
+    label, sep, value = spec.partition(':')
+    if not sep:
+        return '', spec.strip()
+    return label.strip() + ':', value.strip()
+
+def render_card(src_root, product):
+    title = product.get('title', '')
+    return partial('product-card', {
+        'id': product.get('id', ''),
+        'href': product.get('href', '#'),
+        'category': product.get('category', ''),
+        'image': resolve_image(src_root, product),
+        'alt': product.get('alt') or title,
+        'title': title,
+        'quote_title': title.replace('\\', '\\\\').replace("'", "\\'"),
+        'description': product.get('description', ''),
+        'badges': '\n'.join(
+            partial('product-card-badge', {'text': badge, 'css_class': BADGE_CLASSES.get(badge, DEFAULT_BADGE)})
+            for badge in product.get('badges') or []
+        ),
+        'applications': '\n'.join(
+            partial('product-card-app', {'text': app}) for app in product.get('applications') or []
+        ),
+        'specs': '\n'.join(
+            partial('product-card-spec', dict(zip(('label', 'value'), split_spec(spec))))
+            for spec in product.get('specs') or []
+        ),
+    })
+
+def render_grid(src_root, products):
+    return '\n\n'.join(render_card(src_root, product) for product in products)
+
+def apply_products_grid(html, src_root=SITE_ROOT):
+    """用预渲染的卡片替换 #productsGrid 的内容，并更新 data-stat 统计数字"""
+    products = load_json(os.path.join(src_root, DATA_FILE), default=[])
+    if not products:
+        return html
+
+    counts = Counter(product.get('category') for product in products)
+    stats = dict(counts, total=len(products))
+
+    tokens = tokenize(html)
+    # (起始偏移, 结束偏移, 替换文本)
+    edits = []
+    for index, token in enumerate(tokens):
+        if token.kind != 'start':
+            continue
+        if token.get('id') == GRID_ID:
+            closing = closing_index(tokens, index)
+            if closing is not None:
+                edits.append((token.end, tokens[closing].start,
+                              '\n' + render_grid(src_root, products) + '\n        '))
+        stat = token.get('data-stat')
+        if stat in stats and index + 2 < len(tokens) and tokens[index + 1].kind == 'text' \
+                and tokens[index + 2].kind == 'end':
+            edits.append((tokens[index + 1].start, tokens[index + 1].end, str(stats[stat])))
+
+    if not edits:
+        return html
+    parts = []
+    last_end = 0
+    for start, end, text in sorted(edits):
+        parts.append(html[last_end:start])
+        parts.append(text)
+        last_end = end
+    parts.append(html[last_end:])
+    return ''.join(parts)
+
+# ---------------------------------------------------------------------------
+# 依赖图集成
+# ---------------------------------------------------------------------------
+
+def build_products_page(node, src_root, out_root):
+    """依赖图动作：插入组件、预渲染产品卡片并压缩 products.html"""
+    from html_minifier import minify_html
+
+    with open(os.path.join(src_root, PAGE_FILE), 'r', encoding='utf-8', errors='surrogateescape') as f:
+        html = f.read()
+    html = apply_includes(apply_products_grid(html, src_root), PAGE_FILE, src_root)
+    data = minify_html(html).encode('utf-8', errors='surrogateescape')
+    atomic_write_bytes(os.path.join(out_root, PAGE_FILE), data)
+
+def add_products_grid_inputs(graph):
+    """依赖图扩展：products.html 改用预渲染动作，产品数据和卡片模板作为输入"""
+    node = graph.nodes.get(f'page:{PAGE_FILE}')
+    if node is None or not os.path.exists(os.path.join(graph.src_root, DATA_FILE)):
+        return
+    node.action = 'products_grid:build_products_page'
+    existing = {spec[1] for spec in node.inputs}
+    node.inputs.extend(('file', path) for path in [DATA_FILE] + partial_files() if path not in existing)
+
+def main():
+    parser = argparse.ArgumentParser(description='预渲染产品中心卡片网格')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=DIST_DIR, help='输出目录（默认 dist/）')
+    args = parser.parse_args()
+
+    src_root = os.path.abspath(args.src)
+    print("🧱 开始预渲染产品卡片...")
+    start = time.perf_counter()
+    with open(os.path.join(src_root, PAGE_FILE), 'r', encoding='utf-8', errors='surrogateescape') as f:
+        html = f.read()
+    result = apply_products_grid(html, src_root)
+    target = os.path.join(os.path.abspath(args.out), PAGE_FILE)
+    atomic_write_bytes(target, result.encode('utf-8', errors='surrogateescape'))
+    elapsed = time.perf_counter() - start
+
+    products = load_json(os.path.join(src_root, DATA_FILE), default=[])
+    print(f"\n✅ 产品卡片: {len(products)} 个")
+    for category, count in sorted(Counter(p.get('category') for p in products).items()):
+        print(f"   - {category}: {count}")
+    print(f"📄 输出页面（未压缩）: {target}")
+    print(f"⏱️  耗时: {elapsed * 1000:.0f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -7,9 +7,28 @@
 
 import os
 import re
+import argparse
 from datetime import datetime
 
+from page_rewriter import edit, rewrite_pages, add_dry_run_argument, RewriteError, print_rewrite_error
+
+# 匹配占位符块（包括可能的缩进和换行）
+PLACEHOLDER_PATTERN = re.compile(r'\s*<div[^>]*class="[^"]*product-placeholder[^"]*"[^>]*>.*?</div>\s*', re.DOTALL)
+
+def remove_manual_placeholder(content):
+    """移除手动占位符（在内存中处理页面内容），返回 (新内容, 被移除占位符的文字)"""
+    removed = []
+    for match in PLACEHOLDER_PATTERN.finditer(content):
+        # 提取占位符文本用于确认
+        zh_match = re.search(r'<span class="zh">(.*?)</span>', match.group(0))
+        removed.append(zh_match.group(1) if zh_match else '')
+    return PLACEHOLDER_PATTERN.sub('', content), removed
+
 def main():
+    parser = argparse.ArgumentParser(description='批量移除产品页面不必要的手动占位符')
+    add_dry_run_argument(parser)
+    args = parser.parse_args()
+
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     products_dir = os.path.join(base_dir, 'products')
 
@@ -31,6 +50,21 @@ def main():
     success_count = 0
     failed_products = []
 
+    # 所有页面在内存中处理完成后一次性提交，任一页面失败时不写入任何页面
+    plan = {}
+    for product_file in products_to_fix:
+        filepath = os.path.join(products_dir, product_file)
+        if os.path.exists(filepath):
+            plan[filepath] = [edit(remove_manual_placeholder)]
+
+    try:
+        pages = rewrite_pages(plan, dry_run=args.dry_run)
+    except RewriteError as e:
+        print_rewrite_error(e)
+        pages = {}
+        for filepath in plan:
+            failed_products.append((os.path.basename(filepath), e.errors.get(filepath, '其他页面处理失败，未写入')))
+
     for i, product_file in enumerate(products_to_fix, 1):
         print(f"[{i:2d}/{len(products_to_fix)}] 处理 {product_file}")
 
@@ -41,43 +75,31 @@ def main():
             failed_products.append((product_file, "文件不存在"))
             continue
 
-        try:
-            # 读取文件内容
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # 查找并移除手动占位符
-            original_content = content
-
-            # 匹配占位符块（包括可能的缩进和换行）
-            placeholder_pattern = r'\s*<div[^>]*class="[^"]*product-placeholder[^"]*"[^>]*>.*?</div>\s*'
-
-            # 移除占位符
-            new_content = re.sub(placeholder_pattern, '', content, flags=re.DOTALL)
-
-            # 检查是否有变化
-            if new_content == original_content:
-                print(f"   ⚠️  未找到占位符元素")
-                continue
-
-            # 写入文件
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-
-            print(f"   ✅ 成功移除占位符")
-            success_count += 1
+        if filepath not in pages:
+            print(f"   ❌ 处理失败")
+            continue
 
-            # 显示移除的内容摘要
-            removed_content = original_content.replace(new_content, '').strip()
-            if removed_content:
-                # 提取占位符文本用于确认
-                zh_match = re.search(r'<span class="zh">(.*?)</span>', removed_content)
-                if zh_match:
-                    print(f"      🗑️  移除内容: {zh_match.group(1)}")
+        # 检查是否有变化
+        if not pages[filepath]['changed']:
+            print(f"   ⚠️  未找到占位符元素")
+            continue
 
-        except Exception as e:
-            print(f"   ❌ 处理失败: {str(e)}")
-            failed_products.append((product_file, str(e)))
+        print(f"   🔍 将移除占位符" if args.dry_run else f"   ✅ 成功移除占位符")
+        success_count += 1
+
+        # 显示移除的内容摘要
+        for removed_text in pages[filepath]['notes']:
+            if removed_text:
+                print(f"      🗑️  移除内容: {removed_text}")
+
+    if args.dry_run:
+        print("\n" + "="*80)
+        print("🔍 占位符移除预演（未写入任何页面）")
+        print("="*80)
+        print(f"   将移除: {success_count} 个产品的占位符")
+        if failed_products:
+            print(f"   无法处理: {', '.join(product for product, _ in failed_products)}")
+        return
 
     # 生成处理报告
     print("\n" + "="*80)
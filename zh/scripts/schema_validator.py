@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+产品数据结构校验
+把 data/product-schema.json（JSON Schema draft-07）编译为嵌套的校验函数，一次遍历校验全部产品记录，
+错误以 JSON Pointer 定位（如 /products/alumina-castable/product/category/primary）。
+
+记录来源优先使用分片清单（product_shards.py），否则读取整个提取数据文件；
+每条记录的摘要和校验结果缓存在 .build-cache/schema-validation.json，
+只有摘要变化的记录（或 schema 本身变化时的全部记录）才会重新校验。
+
+支持的关键字：type、enum、const、required、properties、patternProperties、additionalProperties、
+items、additionalItems、minItems、maxItems、uniqueItems、minLength、maxLength、pattern、
+minimum、maximum、exclusiveMinimum、exclusiveMaximum、multipleOf、allOf、anyOf、oneOf、not、
+$ref（文档内引用）、format（date-time、date、uri、uri-reference、email）。
+遇到不支持的关键字时编译报错，不会静默跳过。
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from datetime import date, datetime
+from urllib.parse import urlsplit
+
+from build_common import SITE_ROOT, CACHE_DIR, bytes_digest, file_digest, load_json, save_json
+
+SCHEMA_FILE = 'zh/data/product-schema.json'
+DATA_FILE = 'zh/data/products-extracted-data.json'
+CACHE_FILE = os.path.join(CACHE_DIR, 'schema-validation.json')
+CACHE_VERSION = 1
+
+# 只作说明、不参与校验的关键字
+ANNOTATION_KEYWORDS = {'$schema', '$id', '$comment', 'title', 'description', 'default', 'examples', 'definitions'}
+
+JSON_TYPES = {
+    'object': lambda value: isinstance(value, dict),
+    'array': lambda value: isinstance(value, list),
+    'string': lambda value: isinstance(value, str),
+    'integer': lambda value: isinstance(value, int) and not isinstance(value, bool)
+               or isinstance(value, float) and value.is_integer(),
+    'number': lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    'boolean': lambda value: isinstance(value, bool),
+    'null': lambda value: value is None,
+}
+
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+def _is_datetime(value):
+    # 按 ISO 8601 解析，时区偏移可省略（提取数据记录的是本地时间）
+    try:
+        datetime.fromisoformat(value.replace('Z', '+00:00'))
+        return True
+    except ValueError:
+        return False
+
+def _is_date(value):
+    try:
+        date.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
+def _is_uri(value):
+    parts = urlsplit(value)
+    return bool(parts.scheme) and ' ' not in value
+
+def _is_uri_reference(value):
+    return ' ' not in value.strip()
+
+FORMATS = {
+    'date-time': _is_datetime,
+    'date': _is_date,
+    'uri': _is_uri,
+    'uri-reference': _is_uri_reference,
+    'email': lambda value: bool(EMAIL_PATTERN.match(value)),
+}
+
+def escape_pointer(token):
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+def resolve_pointer(document, pointer):
+    """解析文档内引用 "#/definitions/xxx" """
+    node = document
+    for token in pointer.lstrip('#').split('/')[1:]:
+        token = token.replace('~1', '/').replace('~0', '~')
+        node = node[int(token)] if isinstance(node, list) else node[token]
+    return node
+
+def describe(value):
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= 40 else text[:37] + '...'
+
+# ---------------------------------------------------------------------------
+# 编译
+# ---------------------------------------------------------------------------
+
+class SchemaCompiler:
+    """把 schema 编译为 check(value, pointer, errors) 函数；$ref 按目标路径只编译一次"""
+
+    def __init__(self, root):
+        self.root = root
+        self._refs = {}
+
+    def compile(self, schema):
+        if schema is True or schema == {}:
+            return lambda value, pointer, errors: None
+        if schema is False:
+            return lambda value, pointer, errors: errors.append((pointer, '不允许任何值'))
+
+        unknown = set(schema) - ANNOTATION_KEYWORDS - set(KEYWORD_COMPILERS)
+        if unknown:
+            raise ValueError(f'不支持的 schema 关键字: {", ".join(sorted(unknown))}')
+
+        checks = []
+        for keyword, compiler in KEYWORD_COMPILERS.items():
+            if keyword in schema:
+                check = compiler(self, schema[keyword], schema)
+                if check is not None:
+                    checks.append(check)
+
+        if len(checks) == 1:
+            return checks[0]
+
+        def check_all(value, pointer, errors):
+            for check in checks:
+                check(value, pointer, errors)
+        return check_all
+
+    def compile_ref(self, ref, schema):
+        if not ref.startswith('#'):
+            raise ValueError(f'只支持文档内引用: {ref}')
+        if ref not in self._refs:
+            # 先放入占位函数，支持递归引用
+            holder = []
+            self._refs[ref] = lambda value, pointer, errors: holder[0](value, pointer, errors)
+            holder.append(self.compile(resolve_pointer(self.root, ref)))
+        return self._refs[ref]
+
+def _compile_type(compiler, expected, schema):
+    names = expected if isinstance(expected, list) else [expected]
+    tests = [JSON_TYPES[name] for name in names]
+    label = ' 或 '.join(names)
+
+    def check(value, pointer, errors):
+        if not any(test(value) for test in tests):
+            errors.append((pointer, f'类型应为 {label}，实际为 {describe(value)}'))
+    return check
+
+def _compile_enum(compiler, options, schema):
+    def check(value, pointer, errors):
+        if value not in options:
+            errors.append((pointer, f'取值 {describe(value)} 不在允许范围内: {describe(options)}'))
+    return check
+
+def _compile_const(compiler, expected, schema):
+    def check(value, pointer, errors):
+        if value != expected:
+            errors.append((pointer, f'取值应为 {describe(expected)}'))
+    return check
+
+def _compile_required(compiler, names, schema):
+    def check(value, pointer, errors):
+        if isinstance(value, dict):
+            for name in names:
+                if name not in value:
+                    errors.append((f'{pointer}/{escape_pointer(name)}', '缺少必填字段'))
+    return check
+
+def _compile_properties(compiler, properties, schema):
+    compiled = {name: compiler.compile(subschema) for name, subschema in properties.items()}
+
+    def check(value, pointer, errors):
+        if not isinstance(value, dict):
+            return
+        for name, property_check in compiled.items():
+            if name in value:
+                property_check(value[name], f'{pointer}/{escape_pointer(name)}', errors)
+    return check
+
+def _compile_pattern_properties(compiler, patterns, schema):
+    compiled = [(re.compile(pattern), compiler.compile(subschema)) for pattern, subschema in patterns.items()]
+
+    def check(value, pointer, errors):
+        if not isinstance(value, dict):
+            return
+        for name, item in value.items():
+            for pattern, property_check in compiled:
+                if pattern.search(name):
+                    property_check(item, f'{pointer}/{escape_pointer(name)}', errors)
+    return check
+
+def _compile_additional_properties(compiler, additional, schema):
+    known = set(schema.get('properties', {}))
+    patterns = [re.compile(pattern) for pattern in schema.get('patternProperties', {})]
+    extra_check = None if additional is False else compiler.compile(additional)
+
+    def check(value, pointer, errors):
+        if not isinstance(value, dict):
+            return
+        for name, item in value.items():
+            if name in known or any(pattern.search(name) for pattern in patterns):
+                continue
+            if extra_check is None:
+                errors.append((f'{pointer}/{escape_pointer(name)}', '不允许的字段'))
+            else:
+                extra_check(item, f'{pointer}/{escape_pointer(name)}', errors)
+    return check
+
+def _compile_items(compiler, items, schema):
+    if isinstance(items, list):
+        compiled = [compiler.compile(subschema) for subschema in items]
+        additional = schema.get('additionalItems', True)
+        extra_check = None if additional is False else compiler.compile(additional)
+
+        def check_tuple(value, pointer, errors):
+            if not isinstance(value, list):
+                return
+            for index, item in enumerate(value):
+                if index < len(compiled):
+                    compiled[index](item, f'{pointer}/{index}', errors)
+                elif extra_check is None:
+                    errors.append((f'{pointer}/{index}', '不允许的数组元素'))
+                else:
+                    extra_check(item, f'{pointer}/{index}', errors)
+        return check_tuple
+
+    item_check = compiler.compile(items)
+
+    def check(value, pointer, errors):
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                item_check(item, f'{pointer}/{index}', errors)
+    return check
+
+def _compile_bound(test, message, applies):
+    def compile_keyword(compiler, limit, schema):
+        def check(value, pointer, errors):
+            if applies(value) and not test(value, limit):
+                errors.append((pointer, message.format(limit=limit)))
+        return check
+    return compile_keyword
+
+def _is_number(value):
+    return JSON_TYPES['number'](value)
+
+def _compile_unique_items(compiler, unique, schema):
+    if not unique:
+        return None
+
+    def check(value, pointer, errors):
+        if isinstance(value, list):
+            seen = set()
+            for item in value:
+                key = json.dumps(item, sort_keys=True)
+                if key in seen:
+                    errors.append((pointer, f'数组元素重复: {describe(item)}'))
+                    return
+                seen.add(key)
+    return check
+
+def _compile_pattern(compiler, pattern, schema):
+    regex = re.compile(pattern)
+
+    def check(value, pointer, errors):
+        if isinstance(value, str) and not regex.search(value):
+            errors.append((pointer, f'不符合格式 {pattern}'))
+    return check
+
+def _compile_format(compiler, name, schema):
+    test = FORMATS.get(name)
+    if test is None:
+        return None
+
+    def check(value, pointer, errors):
+        if isinstance(value, str) and not test(value):
+            errors.append((pointer, f'不是有效的 {name}: {describe(value)}'))
+    return check
+
+def _compile_all_of(compiler, subschemas, schema):
+    compiled = [compiler.compile(subschema) for subschema in subschemas]
+
+    def check(value, pointer, errors):
+        for subcheck in compiled:
+            subcheck(value, pointer, errors)
+    return check
+
+def _count_matches(compiled, value, pointer):
+    return sum(1 for subcheck in compiled if _passes(subcheck, value, pointer))
+
+def _passes(check, value, pointer):
+    errors = []
+    check(value, pointer, errors)
+    return not errors
+
+def _compile_any_of(compiler, subschemas, schema):
+    compiled = [compiler.compile(subschema) for subschema in subschemas]
+
+    def check(value, pointer, errors):
+        if not any(_passes(subcheck, value, pointer) for subcheck in compiled):
+            errors.append((pointer, '不满足 anyOf 中的任何一个结构'))
+    return check
+
+def _compile_one_of(compiler, subschemas, schema):
+    compiled = [compiler.compile(subschema) for subschema in subschemas]
+
+    def check(value, pointer, errors):
+        matches = _count_matches(compiled, value, pointer)
+        if matches != 1:
+            errors.append((pointer, f'应恰好满足 oneOf 中的一个结构，实际满足 {matches} 个'))
+    return check
+
+def _compile_not(compiler, subschema, schema):
+    compiled = compiler.compile(subschema)
+
+    def check(value, pointer, errors):
+        if _passes(compiled, value, pointer):
+            errors.append((pointer, '不应满足 not 中的结构'))
+    return check
+
+def _compile_ref(compiler, ref, schema):
+    return compiler.compile_ref(ref, schema)
+
+# 关键字 -> 编译函数（按此顺序执行检查，类型错误最先报告）
+KEYWORD_COMPILERS = {
+    '$ref': _compile_ref,
+    'type': _compile_type,
+    'enum': _compile_enum,
+    'const': _compile_const,
+    'required': _compile_required,
+    'properties': _compile_properties,
+    'patternProperties': _compile_pattern_properties,
+    'additionalProperties': _compile_additional_properties,
+    'items': _compile_items,
+    'additionalItems': lambda compiler, value, schema: None,  # 由 items 一并处理
+    'minItems': _compile_bound(lambda v, n: len(v) >= n, '数组元素不应少于 {limit} 个',
+                               lambda v: isinstance(v, list)),
+    'maxItems': _compile_bound(lambda v, n: len(v) <= n, '数组元素不应多于 {limit} 个',
+                               lambda v: isinstance(v, list)),
+    'uniqueItems': _compile_unique_items,
+    'minLength': _compile_bound(lambda v, n: len(v) >= n, '长度不应小于 {limit}', lambda v: isinstance(v, str)),
+    'maxLength': _compile_bound(lambda v, n: len(v) <= n, '长度不应大于 {limit}', lambda v: isinstance(v, str)),
+    'pattern': _compile_pattern,
+    'minimum': _compile_bound(lambda v, n: v >= n, '不应小于 {limit}', _is_number),
+    'maximum': _compile_bound(lambda v, n: v <= n, '不应大于 {limit}', _is_number),
+    'exclusiveMinimum': _compile_bound(lambda v, n: v > n, '应大于 {limit}', _is_number),
+    'exclusiveMaximum': _compile_bound(lambda v, n: v < n, '应小于 {limit}', _is_number),
+    'multipleOf': _compile_bound(lambda v, n: (v / n).is_integer(), '应为 {limit} 的倍数', _is_number),
+    'format': _compile_format,
+    'allOf': _compile_all_of,
+    'anyOf': _compile_any_of,
+    'oneOf': _compile_one_of,
+    'not': _compile_not,
+}
+
+def compile_schema(schema):
+    """编译 schema，返回 validate(value, pointer='') -> [(JSON Pointer, 错误信息)]"""
+    check = SchemaCompiler(schema).compile(schema)
+
+    def validate(value, pointer=''):
+        errors = []
+        check(value, pointer, errors)
+        return errors
+    return validate
+
+# ---------------------------------------------------------------------------
+# 增量校验
+# ---------------------------------------------------------------------------
+
+def iter_records(src_root=SITE_ROOT):
+    """[(产品ID, 记录摘要, 读取记录的函数)]；分片同步时用清单中的分片摘要，不必读取记录本身"""
+    import product_shards
+
+    manifest = product_shards.load_manifest(src_root)
+    if product_shards.shards_current(src_root, manifest):
+        return [
+            (product_id, entry['digest'],
+             lambda product_id=product_id: product_shards.load_product(product_id, src_root))
+            for product_id, entry in sorted(manifest['products'].items())
+        ]
+
+    products = load_json(os.path.join(src_root, DATA_FILE), default={}).get('products', {})
+    return [
+        (product_id, bytes_digest(json.dumps(record, ensure_ascii=False, sort_keys=True).encode('utf-8')),
+         lambda record=record: record)
+        for product_id, record in sorted(products.items())
+    ]
+
+def validate_records(src_root=SITE_ROOT, cache_file=CACHE_FILE, force=False):
+    """校验全部记录，返回 (结果 {产品ID: [[pointer, message], ...]}, 统计信息)"""
+    schema_path = os.path.join(src_root, SCHEMA_FILE)
+    schema_digest = file_digest(schema_path)
+    cache = load_json(cache_file, default={}) if not force else {}
+    if cache.get('version') != CACHE_VERSION or cache.get('schema') != schema_digest:
+        cache = {}
+    cached = cache.get('records', {})
+
+    validate = None
+    results = {}
+    records = {}
+    stats = {'total': 0, 'validated': 0, 'cached': 0}
+    for product_id, digest, load_record in iter_records(src_root):
+        stats['total'] += 1
+        entry = cached.get(product_id)
+        if entry and entry['digest'] == digest:
+            stats['cached'] += 1
+            errors = entry['errors']
+        else:
+            if validate is None:
+                validate = compile_schema(load_json(schema_path))
+            errors = [list(error) for error in validate(load_record(), f'/products/{escape_pointer(product_id)}')]
+            stats['validated'] += 1
+        results[product_id] = errors
+        records[product_id] = {'digest': digest, 'errors': errors}
+
+    if records != cached or cache.get('schema') != schema_digest:
+        save_json(cache_file, {'version': CACHE_VERSION, 'schema': schema_digest, 'records': records})
+    return results, stats
+
+def main():
+    parser = argparse.ArgumentParser(description='按 product-schema.json 校验产品数据')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--force', action='store_true', help='忽略缓存，重新校验全部记录')
+    parser.add_argument('--limit', type=int, default=20, help='每个产品最多显示的错误数')
+    args = parser.parse_args()
+
+    print("🧪 开始校验产品数据结构...")
+    start = time.perf_counter()
+    results, stats = validate_records(os.path.abspath(args.src), force=args.force)
+    elapsed = time.perf_counter() - start
+
+    invalid = {product_id: errors for product_id, errors in results.items() if errors}
+    for product_id, errors in sorted(invalid.items()):
+        print(f"\n❌ {product_id}: {len(errors)} 个错误")
+        for pointer, message in errors[:args.limit]:
+            print(f"   {pointer}: {message}")
+        if len(errors) > args.limit:
+            print(f"   ... 另有 {len(errors) - args.limit} 个错误")
+
+    print(f"\n📋 记录: {stats['total']} 个（重新校验 {stats['validated']} 个，沿用缓存 {stats['cached']} 个）")
+    print(f"✅ 通过: {stats['total'] - len(invalid)} 个")
+    print(f"❌ 未通过: {len(invalid)} 个")
+    print(f"⏱️  耗时: {elapsed * 1000:.0f} ms")
+    if invalid:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
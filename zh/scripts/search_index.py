@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+产品搜索索引生成器
+把 data/products.json、data/products-extracted-data.json 与 data/product-database.json 合并为一个紧凑的倒排索引
+data/search-index.json（技术资料数据库中没有产品页的产品也收录，ProductDatabase.searchProducts 按索引检索）。
+中文按相邻两字（bigram）切分，英文和数字按单词切分；词项按字典序排列，前端用二分查找支持前缀匹配。
+每个词项的倒排表记录 [文档序号, 得分]，得分为该词出现的各字段权重之和，检索结果按得分排序；
+名称或页面名与查询完全一致的产品排在最前（名称更长的产品在规格、分类中也常含查询词，单靠得分会排到前面）。
+"""
+
+import os
+import re
+import json
+import argparse
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+
+from build_common import SITE_ROOT, ZH_DIR, atomic_write_text, load_json
+
+INDEX_VERSION = 1
+INDEX_FILE = os.path.join(ZH_DIR, 'data', 'search-index.json')
+PRODUCTS_FILE = 'zh/data/products.json'
+EXTRACTED_FILE = 'zh/data/products-extracted-data.json'
+NAVIGATION_FILE = 'zh/data/navigation-config.json'
+DATABASE_FILE = 'zh/data/product-database.json'
+
+# 字段权重：名称命中远比描述命中重要
+FIELD_WEIGHTS = {
+    'title': 10,
+    'category': 4,
+    'specs': 3,
+    'applications': 2,
+    'description': 1,
+}
+
+CJK_PATTERN = re.compile(r'[㐀-䶿一-鿿豈-﫿]+')
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+def normalize(text):
+    """NFKC 归一化并转小写：全角字符、下标数字（Al₂O₃ -> al2o3）统一为半角"""
+    return unicodedata.normalize('NFKC', text or '').lower()
+
+def tokenize(text):
+    """切分为词项：中文取相邻两字，另把每段末字单独收录；英文和数字取整词
+
+    这样每个汉字都是某个词项的开头，单字查询用前缀匹配即可命中（如"砖"命中"高铝砖"的末字）。
+    """
+    text = normalize(text)
+    terms = []
+    for run in CJK_PATTERN.findall(text):
+        terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+        terms.append(run[-1])
+    terms.extend(WORD_PATTERN.findall(text))
+    return terms
+
+# ---------------------------------------------------------------------------
+# 文档收集
+# ---------------------------------------------------------------------------
+
+def slug_from_href(href):
+    return os.path.splitext(os.path.basename(href or ''))[0]
+
+def collect_documents(src_root=SITE_ROOT):
+    """按页面名合并三份数据，返回 {slug: {'title','href','category','fields': {字段: [文本...]}}}"""
+    navigation = load_json(os.path.join(src_root, NAVIGATION_FILE), default={})
+    category_labels = {value: key for key, value in navigation.get('categoryMapping', {}).items()}
+    documents = {}
+
+    def document(slug):
+        if slug not in documents:
+            documents[slug] = {
+                'title': '', 'href': f'products/{slug}.html', 'category': '',
+                'fields': defaultdict(list)
+            }
+        return documents[slug]
+
+    for product in load_json(os.path.join(src_root, PRODUCTS_FILE), default=[]):
+        slug = slug_from_href(product.get('href'))
+        if not slug:
+            continue
+        doc = document(slug)
+        doc['title'] = product.get('title') or doc['title']
+        doc['href'] = product.get('href') or doc['href']
+        doc['category'] = product.get('category') or doc['category']
+        fields = doc['fields']
+        fields['title'].append(product.get('title', ''))
+        fields['category'].extend([product.get('category', ''), category_labels.get(product.get('category'), '')])
+        fields['specs'].extend(product.get('specs') or [])
+        fields['applications'].extend(product.get('applications') or [])
+        fields['description'].append(product.get('description', ''))
+
+    extracted = load_json(os.path.join(src_root, EXTRACTED_FILE), default={}).get('products', {})
+    for key, record in extracted.items():
+        # 页面名以提取时记录的文件名为准，与 products.json 的 href 对齐
+        slug = slug_from_href((record.get('metadata') or {}).get('filename')) or key
+        product = record.get('product') or {}
+        doc = document(slug)
+        names = product.get('name') or {}
+        doc['title'] = doc['title'] or names.get('chinese') or names.get('english') or slug
+        category = product.get('category') or {}
+        fields = doc['fields']
+        fields['title'].extend([names.get('chinese', ''), names.get('english', ''), slug.replace('-', ' ')])
+        fields['category'].extend([category.get('primary', ''), category.get('secondary', ''),
+                                   category.get('series', '')])
+        for spec in product.get('quickSpecs') or []:
+            fields['specs'].append(f"{spec.get('label', '')} {spec.get('value', '')}")
+        for row in (product.get('specifications') or {}).get('data') or []:
+            fields['specs'].append(row.get('property', ''))
+        for industry in (product.get('applications') or {}).get('industries') or []:
+            fields['applications'].append(industry.get('name', ''))
+        fields['description'].append((product.get('description') or {}).get('summary', ''))
+
+    for product_id, product in load_json(os.path.join(src_root, DATABASE_FILE), default={}).items():
+        new = product_id not in documents
+        doc = document(product_id)
+        if new and not os.path.exists(os.path.join(src_root, 'zh', doc['href'])):
+            # 只在技术资料数据库中出现、没有产品页的产品不给链接
+            doc['href'] = ''
+        doc['title'] = doc['title'] or product.get('name') or product.get('englishName') or product_id
+        doc['category'] = doc['category'] or product.get('category', '')
+        fields = doc['fields']
+        fields['title'].extend([product.get('name', ''), product.get('englishName', ''), product_id.replace('-', ' ')])
+        fields['category'].extend([product.get('category', ''), product.get('subcategory', '')])
+        for spec in (product.get('specifications') or {}).values():
+            if isinstance(spec, dict):
+                fields['specs'].append(f"{spec.get('label', '')} {spec.get('value', '')}")
+        fields['applications'].extend(product.get('applications') or [])
+        fields['description'].extend(product.get('features') or [])
+
+    return documents
+
+# ---------------------------------------------------------------------------
+# 索引
+# ---------------------------------------------------------------------------
+
+def build_index(src_root=SITE_ROOT):
+    documents = collect_documents(src_root)
+    slugs = sorted(documents)
+    scores = defaultdict(dict)
+    for doc_index, slug in enumerate(slugs):
+        for field, texts in documents[slug]['fields'].items():
+            weight = FIELD_WEIGHTS[field]
+            # 同一字段内重复出现只计一次，避免长描述刷分
+            for term in set(tokenize(' '.join(texts))):
+                postings = scores[term]
+                postings[doc_index] = postings.get(doc_index, 0) + weight
+
+    terms = sorted(scores)
+    return {
+        'version': INDEX_VERSION,
+        'weights': FIELD_WEIGHTS,
+        # 文档表：[页面名, 名称, 链接, 分类]
+        'docs': [
+            [slug, documents[slug]['title'], documents[slug]['href'], documents[slug]['category']]
+            for slug in slugs
+        ],
+        'terms': terms,
+        # 与 terms 一一对应的扁平倒排表：[文档序号, 得分, 文档序号, 得分, ...]
+        'postings': [
+            [value for doc_index in sorted(scores[term]) for value in (doc_index, scores[term][doc_index])]
+            for term in terms
+        ],
+    }
+
+def serialize_index(index):
+    return json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+
+# ---------------------------------------------------------------------------
+# 检索（与 js/product-search.js 的算法保持一致，便于命令行核对结果）
+# ---------------------------------------------------------------------------
+
+def lookup(index, term, prefix=False):
+    """返回 {文档序号: 得分}；prefix=True 时合并所有以 term 开头的词项"""
+    terms = index['terms']
+    position = bisect_left(terms, term)
+    result = {}
+    while position < len(terms) and (terms[position] == term or (prefix and terms[position].startswith(term))):
+        postings = index['postings'][position]
+        for i in range(0, len(postings), 2):
+            result[postings[i]] = max(result.get(postings[i], 0), postings[i + 1])
+        if not prefix:
+            break
+        position += 1
+    return result
+
+def is_exact_match(doc, text):
+    """名称或页面名（- 视为空格）与归一化后的查询完全一致"""
+    slug, title = doc[0], doc[1]
+    return normalize(title) == text or slug.replace('-', ' ') == text
+
+def search(index, query, limit=20):
+    """所有查询词都必须命中（AND），完全匹配名称的排在最前，其余按得分降序返回 [(页面名, 名称, 得分)]"""
+    text = normalize(query)
+    groups = []
+    for run in CJK_PATTERN.findall(text):
+        if len(run) == 1:
+            groups.append(lookup(index, run, prefix=True))
+        else:
+            groups.extend(lookup(index, run[i:i + 2]) for i in range(len(run) - 1))
+    words = WORD_PATTERN.findall(text)
+    for position, word in enumerate(words):
+        # 最后一个英文词按前缀匹配，便于边输入边搜索
+        groups.append(lookup(index, word, prefix=position == len(words) - 1))
+    if not groups:
+        return []
+
+    totals = dict(groups[0])
+    for group in groups[1:]:
+        totals = {doc: score + group[doc] for doc, score in totals.items() if doc in group}
+    exact = normalize(' '.join(query.split()))
+    ranked = sorted(totals.items(), key=lambda item: (not is_exact_match(index['docs'][item[0]], exact),
+                                                      -item[1], item[0]))[:limit]
+    return [(index['docs'][doc][0], index['docs'][doc][1], score) for doc, score in ranked]
+
+# ---------------------------------------------------------------------------
+# 依赖图集成
+# ---------------------------------------------------------------------------
+
+def build_search_index(node, src_root, out_root):
+    """依赖图动作：生成搜索索引"""
+    atomic_write_text(os.path.join(out_root, node.outputs[0]), serialize_index(build_index(src_root)))
+
+def add_search_index_node(graph):
+    """依赖图扩展：搜索索引由数据文件生成，替代仓库中已提交索引的直接复制"""
+    from build_graph import BuildNode
+
+    output = os.path.relpath(INDEX_FILE, SITE_ROOT).replace(os.sep, '/')
+    inputs = [('file', path) for path in (PRODUCTS_FILE, EXTRACTED_FILE, NAVIGATION_FILE, DATABASE_FILE)
+              if os.path.exists(os.path.join(graph.src_root, path))]
+    graph.add_node(BuildNode('search-index', 'generate', 'search_index:build_search_index',
+                             inputs=inputs, outputs=[output]))
+
+def main():
+    parser = argparse.ArgumentParser(description='生成产品搜索倒排索引')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=INDEX_FILE, help='索引文件（默认 zh/data/search-index.json）')
+    parser.add_argument('--query', help='生成后用该查询词检索并打印结果')
+    args = parser.parse_args()
+
+    print("🔎 开始生成搜索索引...")
+    index = build_index(os.path.abspath(args.src))
+    data = serialize_index(index)
+    atomic_write_text(args.out, data)
+
+    posting_count = sum(len(postings) // 2 for postings in index['postings'])
+    print(f"\n✅ 文档: {len(index['docs'])} 个")
+    print(f"🔤 词项: {len(index['terms'])} 个，倒排记录: {posting_count} 条")
+    print(f"📦 索引大小: {len(data.encode('utf-8')):,} 字节")
+    print(f"📄 已保存到: {args.out}")
+
+    if args.query:
+        print(f"\n🔍 查询: {args.query}")
+        for slug, title, score in search(index, args.query):
+            print(f"   {score:>4}  {title} ({slug})")
+
+if __name__ == '__main__':
+    main()
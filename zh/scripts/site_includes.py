@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+构建时组件插入
+把导航栏、页脚和浮动按钮直接渲染进页面 HTML，省去运行时的组件请求和布局跳动。
+导航栏由 <语言>/data/navigation-config.json 渲染，页脚取自 <语言>/js/ydk-footer.js 中的内联模板
+（未构建的页面由该脚本自行渲染，两者共用一份标记），浮动按钮取自 <语言>/components/floating-buttons.html。
+只有引用了对应脚本（ydk-navbar.js / ydk-footer.js / floating-buttons-loader.js）且尚未包含该组件的页面才会插入；
+运行时脚本检测到已插入的组件后只负责绑定交互。
+"""
+
+import os
+import re
+import argparse
+import textwrap
+from collections import Counter
+
+from build_common import ZH_DIR, SITE_ROOT, iter_site_files, atomic_write_bytes, load_json
+from template_engine import load_template
+from html_tokens import tokenize
+
+INCLUDES_DIR = os.path.join(ZH_DIR, 'templates', 'includes')
+NAVBAR_TEMPLATE = os.path.join(INCLUDES_DIR, 'ydk-navbar.html')
+NAV_ITEM_TEMPLATE = os.path.join(INCLUDES_DIR, 'ydk-nav-item.html')
+CONFIG_FILE = 'data/navigation-config.json'
+FOOTER_SOURCE = 'js/ydk-footer.js'
+FLOATING_COMPONENT = 'components/floating-buttons.html'
+
+# ydk-footer.js 中的页脚模板
+FOOTER_TEMPLATE_PATTERN = re.compile(r'const FOOTER_HTML = `(.*?)`;', re.DOTALL)
+
+NAVBAR_SCRIPT = 'ydk-navbar.js'
+FOOTER_SCRIPT = 'ydk-footer.js'
+FLOATING_SCRIPT = 'floating-buttons-loader.js'
+
+# 已插入组件的识别类名（与运行时脚本中的检测保持一致）
+NAVBAR_CLASS = 'ydk-navbar'
+FOOTER_CLASS = 'ydk-footer'
+FLOATING_CLASS = 'floating-buttons-container'
+
+# 进程内缓存：{路径: (mtime_ns, 内容)}
+_file_cache = {}
+
+def _cached(path, loader):
+    mtime = os.stat(path).st_mtime_ns
+    cached = _file_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, loader(path))
+        _file_cache[path] = cached
+    return cached[1]
+
+def _read_text(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().strip()
+
+def locale_root(rel_path):
+    """页面所属语言目录（zh、en），不在语言目录下时返回 None"""
+    locale, sep, _ = rel_path.partition('/')
+    return locale if sep else None
+
+def include_sources(src_root, locale):
+    """某语言目录下插入组件用到的全部源文件（相对站点根目录），该语言没有导航配置时返回空列表"""
+    if not locale:
+        return []
+    sources = [f'{locale}/{CONFIG_FILE}', f'{locale}/{FOOTER_SOURCE}', f'{locale}/{FLOATING_COMPONENT}']
+    if not os.path.exists(os.path.join(src_root, sources[0])):
+        return []
+    templates = [os.path.relpath(path, SITE_ROOT).replace(os.sep, '/')
+                 for path in (NAVBAR_TEMPLATE, NAV_ITEM_TEMPLATE)]
+    return sources + templates
+
+# ---------------------------------------------------------------------------
+# 渲染
+# ---------------------------------------------------------------------------
+
+def render_navbar(src_root, locale, rel_path):
+    """按导航配置渲染导航栏；链接按页面所在层级加 ../ 前缀，当前页面链接标记为 active"""
+    config = _cached(os.path.join(src_root, locale, CONFIG_FILE), lambda path: load_json(path, default={}))
+    navigation = config.get('navigation', {})
+    logo = navigation.get('logo', {})
+    page = rel_path.split('/', 1)[1]
+    prefix = '../' * page.count('/')
+
+    item_template = load_template(NAV_ITEM_TEMPLATE, strip_newline=True)
+    items = []
+    for item in navigation.get('mainMenu', []):
+        css_class = 'ydk-nav-link active' if item.get('href') == page else 'ydk-nav-link'
+        items.append(item_template.render({
+            'href': prefix + item.get('href', ''),
+            'css_class': css_class,
+            'title': item.get('title', '')
+        }))
+
+    return load_template(NAVBAR_TEMPLATE, strip_newline=True).render({
+        'home_href': prefix + logo.get('href', 'index.html'),
+        'logo_src': prefix + logo.get('src', 'images/logo-new.jpg'),
+        'logo_alt': logo.get('alt', 'YDK'),
+        'tagline': logo.get('tagline', ''),
+        'menu_items': '\n'.join(items)
+    })
+
+def read_component(src_root, locale, component):
+    return _cached(os.path.join(src_root, locale, component), _read_text)
+
+def _read_footer_template(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        match = FOOTER_TEMPLATE_PATTERN.search(f.read())
+    if not match:
+        raise ValueError(f'{path} 中没有 FOOTER_HTML 模板')
+    return textwrap.dedent(match.group(1)).strip()
+
+def read_footer(src_root, locale):
+    """页脚标记：与运行时脚本的内联模板相同"""
+    return _cached(os.path.join(src_root, locale, FOOTER_SOURCE), _read_footer_template)
+
+# ---------------------------------------------------------------------------
+# 插入
+# ---------------------------------------------------------------------------
+
+def closing_index(tokens, index):
+    """与 tokens[index] 开始标签配对的结束标签下标，找不到时返回 None"""
+    name = tokens[index].name
+    depth = 0
+    for position in range(index, len(tokens)):
+        token = tokens[position]
+        if token.name != name:
+            continue
+        if token.kind == 'start' and not token.self_closing:
+            depth += 1
+        elif token.kind == 'end':
+            depth -= 1
+            if depth == 0:
+                return position
+    return None
+
+def _has_class(token, class_name):
+    return class_name in (token.get('class') or '').split()
+
+def apply_includes(html, rel_path, src_root=SITE_ROOT):
+    """把导航栏、页脚和浮动按钮插入页面，返回新的 HTML"""
+    locale = locale_root(rel_path)
+    if not locale or not os.path.exists(os.path.join(src_root, locale, CONFIG_FILE)):
+        return html
+
+    tokens = tokenize(html)
+    scripts = set()
+    present = set()
+    body = body_end = header = footer_container = None
+    for index, token in enumerate(tokens):
+        if token.kind == 'end' and token.name == 'body':
+            body_end = token
+            continue
+        if token.kind != 'start':
+            continue
+        if token.name == 'script' and token.get('src'):
+            scripts.add(os.path.basename(token.get('src').split('?')[0]))
+        elif token.name == 'body' and body is None:
+            body = token
+        elif token.name == 'header' and header is None:
+            header = index
+        if token.get('id') == 'footer-container' and footer_container is None:
+            footer_container = index
+        for class_name in (NAVBAR_CLASS, FOOTER_CLASS, FLOATING_CLASS):
+            if _has_class(token, class_name):
+                present.add(class_name)
+
+    if body is None or body_end is None:
+        return html
+
+    # (起始偏移, 结束偏移, 替换文本)，最后按偏移倒序拼接
+    edits = []
+    tail = []
+
+    if NAVBAR_SCRIPT in scripts and NAVBAR_CLASS not in present:
+        navbar = render_navbar(src_root, locale, rel_path)
+        closing = closing_index(tokens, header) if header is not None else None
+        if closing is not None:
+            # 与运行时一致：已有 <header> 时替换其内容
+            edits.append((tokens[header].end, tokens[closing].start, '\n    ' + navbar + '\n    '))
+        else:
+            edits.append((body.end, body.end, '\n    ' + navbar + '\n'))
+
+    if FOOTER_SCRIPT in scripts and FOOTER_CLASS not in present:
+        footer = read_footer(src_root, locale)
+        closing = closing_index(tokens, footer_container) if footer_container is not None else None
+        if closing is not None:
+            edits.append((tokens[footer_container].end, tokens[closing].start, '\n' + footer + '\n'))
+        else:
+            tail.append('<div id="footer-container">\n' + footer + '\n</div>')
+
+    if FLOATING_SCRIPT in scripts and FLOATING_CLASS not in present:
+        tail.append(read_component(src_root, locale, FLOATING_COMPONENT))
+
+    if tail:
+        edits.append((body_end.start, body_end.start, '\n'.join(tail) + '\n'))
+    if not edits:
+        return html
+
+    parts = []
+    last_end = len(html)
+    for start, end, text in sorted(edits, key=lambda edit: edit[0], reverse=True):
+        parts.append(html[end:last_end])
+        parts.append(text)
+        last_end = start
+    parts.append(html[:last_end])
+    return ''.join(reversed(parts))
+
+# ---------------------------------------------------------------------------
+# 依赖图集成
+# ---------------------------------------------------------------------------
+
+def add_include_inputs(graph):
+    """依赖图扩展：导航配置、组件和模板作为同一语言目录下所有页面的输入，修改后页面随之重建"""
+    sources_by_locale = {}
+    for node in graph.nodes.values():
+        if node.stage not in ('page', 'generate'):
+            continue
+        locale = locale_root(node.outputs[0])
+        if locale not in sources_by_locale:
+            sources_by_locale[locale] = include_sources(graph.src_root, locale)
+        existing = {spec[1] for spec in node.inputs}
+        node.inputs.extend(('file', path) for path in sources_by_locale[locale] if path not in existing)
+
+def main():
+    parser = argparse.ArgumentParser(description='检查构建时组件插入结果（不写入文件，除非指定 --out）')
+    parser.add_argument('--src', default=SITE_ROOT, help='站点源目录（默认仓库根目录）')
+    parser.add_argument('--out', default=None, help='输出目录；指定时写入插入组件后的页面（不压缩）')
+    args = parser.parse_args()
+
+    src_root = os.path.abspath(args.src)
+    counts = Counter()
+    for rel_path in iter_site_files(src_root):
+        if not rel_path.endswith('.html'):
+            continue
+        with open(os.path.join(src_root, rel_path), 'r', encoding='utf-8', errors='surrogateescape') as f:
+            html = f.read()
+        result = apply_includes(html, rel_path, src_root)
+        if result == html:
+            continue
+        counts['pages'] += 1
+        for class_name in (NAVBAR_CLASS, FOOTER_CLASS, FLOATING_CLASS):
+            if f'class="{class_name}"' in result and f'class="{class_name}"' not in html:
+                counts[class_name] += 1
+        if args.out:
+            atomic_write_bytes(os.path.join(os.path.abspath(args.out), rel_path),
+                               result.encode('utf-8', errors='surrogateescape'))
+
+    print("🧩 构建时组件插入")
+    print(f"📄 插入组件的页面: {counts['pages']} 个")
+    print(f"   - 导航栏: {counts[NAVBAR_CLASS]}")
+    print(f"   - 页脚: {counts[FOOTER_CLASS]}")
+    print(f"   - 浮动按钮: {counts[FLOATING_CLASS]}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+构建时模板引擎
+模板只支持 {{ 字段 }}（转义输出）和 {{ 字段|safe }}（原样输出，用于已渲染的片段）。
+模板首次使用时编译为字面量与占位符交替的片段列表，并按 mtime 缓存在进程内。
+"""
+
+import os
+import re
+from html import escape
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*(\w+)(\|safe)?\s*\}\}')
+
+class Template:
+    """编译后的模板：字面量与占位符交替的片段列表，渲染时只做一次 join"""
+
+    def __init__(self, source):
+        self.segments = []
+        last_end = 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            self.segments.append(source[last_end:match.start()])
+            self.segments.append((match.group(1), bool(match.group(2))))
+            last_end = match.end()
+        self.segments.append(source[last_end:])
+
+    def render(self, context):
+        parts = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+            name, safe = segment
+            value = context.get(name)
+            value = '' if value is None else str(value)
+            parts.append(value if safe else escape(value))
+        return ''.join(parts)
+
+# 编译缓存：{路径: (mtime_ns, Template)}，模板被修改后自动重新编译
+_template_cache = {}
+
+def load_template(path, strip_newline=False):
+    """加载并编译模板；strip_newline 去掉文件末尾的换行，便于片段逐行拼接"""
+    mtime = os.stat(path).st_mtime_ns
+    cached = _template_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    if strip_newline and source.endswith('\n'):
+        source = source[:-1]
+    template = Template(source)
+    _template_cache[path] = (mtime, template)
+    return template
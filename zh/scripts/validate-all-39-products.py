@@ -6,18 +6,29 @@
 """
 
 import os
+import sys
 import json
-import re
 from pathlib import Path
 
+from page_rules import check_page, check_pages
+from product_catalog import open_catalog, product_page_ids
+
 # 路径配置
 PROJECT_ROOT = r"D:\ai\新建文件夹\新建文件夹\7788"
 PRODUCTS_DIR = os.path.join(PROJECT_ROOT, "products")
 IMAGES_PRODUCTS = os.path.join(PROJECT_ROOT, "images", "products")
 SCRIPTS_DIR = os.path.join(PROJECT_ROOT, "scripts")
 
-def validate_product_page(product_id):
-    """验证单个产品页面的配置和文件"""
+# 验证使用的规则集（见 page-rules.json）
+RULESET = 'validation'
+# 规则 → 修复建议
+FIXES_NEEDED = {
+    'gallery-script': '添加多图轮播JavaScript引用',
+    'main-image': '添加main-image标签'
+}
+
+def validate_product_page(product_id, page_result=None):
+    """验证单个产品页面的配置和文件；page_result 为规则引擎的检查结果（未提供时单独检查该页面）"""
     html_file = os.path.join(PRODUCTS_DIR, f"{product_id}.html")
 
     if not os.path.exists(html_file):
@@ -27,16 +38,6 @@ def validate_product_page(product_id):
             'issues': ['HTML文件缺失']
         }
 
-    try:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        return {
-            'status': 'error',
-            'error': f'读取文件失败: {e}',
-            'issues': ['文件读取错误']
-        }
-
     validation_result = {
         'status': 'success',
         'issues': [],
@@ -48,84 +49,43 @@ def validate_product_page(product_id):
         'available_images': []
     }
 
-    # 1. JavaScript引用检查
-    js_scripts = []
-    script_pattern = r'<script src="([^"]*)" defer></script>'
-    scripts = re.findall(script_pattern, content)
+    # 1-3, 5. JavaScript引用、主图片配置、图片状态指示器、data-product-id 由 validation 规则集在一次遍历中检查
+    if page_result is None:
+        page_result = check_page(html_file, RULESET)
+    facts = page_result['facts']
+    failed = {issue['rule'] for issue in page_result['issues']}
 
-    for script in scripts:
-        js_scripts.append(script)
-
-    has_multi_gallery = any('multi-image-gallery.js' in script for script in js_scripts)
-    has_product_db = any('product-database.js' in script for script in js_scripts)
+    for issue in page_result['issues']:
+        if issue['type'] == 'critical':
+            validation_result['issues'].append(issue['message'])
+        else:
+            validation_result['warnings'].append(issue['message'])
+        if issue['rule'] in FIXES_NEEDED:
+            validation_result['fixes_needed'].append(FIXES_NEEDED[issue['rule']])
 
+    has_multi_gallery = 'gallery-script' not in failed
     validation_result['javascript_check'] = {
-        'scripts_found': js_scripts,
+        'scripts_found': facts['gallery-script']['found'],
         'has_multi_gallery': has_multi_gallery,
-        'has_product_database': has_product_db,
+        'has_product_database': 'product-database.js' in facts['gallery-script']['found'],
         'status': 'ok' if has_multi_gallery else 'missing_gallery_js'
     }
 
-    if not has_multi_gallery:
-        validation_result['issues'].append('缺少multi-image-gallery.js引用')
-        validation_result['fixes_needed'].append('添加多图轮播JavaScript引用')
-
-    # 2. 主图片配置检查
-    main_image_pattern = r'<img[^>]+class="main-image"[^>]*>'
-    main_image_match = re.search(main_image_pattern, content)
-
-    has_main_image = bool(main_image_match)
-    has_data_images = False
-    main_image_src = None
-    data_images = []
-
-    if main_image_match:
-        img_tag = main_image_match.group(0)
-        # 检查src
-        src_pattern = r'src="([^"]*)"'
-        src_match = re.search(src_pattern, img_tag)
-        if src_match:
-            main_image_src = src_match.group(1)
-
-        # 检查data-images
-        data_images_pattern = r'data-images="([^"]*)"'
-        data_match = re.search(data_images_pattern, img_tag)
-        if data_match:
-            has_data_images = True
-            data_images = data_match.group(1).split(',')
-
+    main_image = facts['main-image']
+    data_images = main_image['attrs'].get('data-images')
     validation_result['image_check'] = {
-        'has_main_image': has_main_image,
-        'main_image_src': main_image_src,
-        'has_data_images': has_data_images,
-        'data_images_count': len(data_images),
-        'data_images': data_images
+        'has_main_image': bool(main_image['found']),
+        'main_image_src': main_image['attrs'].get('src'),
+        'has_data_images': data_images is not None,
+        'data_images_count': len(data_images.split(',')) if data_images is not None else 0,
+        'data_images': data_images.split(',') if data_images is not None else []
     }
 
-    if not has_main_image:
-        validation_result['issues'].append('缺少主图片标签')
-        validation_result['fixes_needed'].append('添加main-image标签')
-
-    if has_main_image and not has_data_images:
-        validation_result['warnings'].append('主图片存在但缺少data-images配置')
-
-    # 3. 图片状态指示器检查
-    status_pattern = r'<div class="image-status"[^>]*>'
-    status_match = re.search(status_pattern, content)
-    status_hidden = False
-
-    if status_match:
-        status_tag = status_match.group(0)
-        status_hidden = 'display: none' in status_tag or 'style="display: none;"' in status_tag
-
     validation_result['html_structure'] = {
-        'has_image_status': bool(status_match),
-        'status_hidden': status_hidden
+        'has_image_status': bool(facts['image-status-hidden']['found']),
+        'status_hidden': facts['image-status-hidden']['hidden']
     }
 
-    if status_match and not status_hidden:
-        validation_result['warnings'].append('图片状态指示器未隐藏，可能显示占位符文本')
-
     # 4. 检查实际图片文件
     product_image_dir = os.path.join(IMAGES_PRODUCTS, product_id)
     available_images = []
@@ -146,14 +106,6 @@ def validate_product_page(product_id):
     if not available_images:
         validation_result['warnings'].append('产品图片目录无图片文件')
 
-    # 5. 检查data-product-id
-    product_images_pattern = r'<div class="product-images[^"]*"[^>]*data-product-id="([^"]*)"'
-    product_id_match = re.search(product_images_pattern, content)
-    has_product_id = bool(product_id_match)
-
-    if not has_product_id:
-        validation_result['warnings'].append('缺少data-product-id配置')
-
     # 确定总体状态
     if validation_result['issues']:
         validation_result['status'] = 'needs_fix'
@@ -165,13 +117,8 @@ def validate_product_page(product_id):
     return validation_result
 
 def get_all_product_ids():
-    """获取所有产品ID"""
-    products = []
-    for file in os.listdir(PRODUCTS_DIR):
-        if file.endswith('.html'):
-            product_id = file[:-5]  # 移除.html
-            products.append(product_id)
-    return sorted(products)
+    """获取所有产品ID（取自产品目录 product_catalog.py）"""
+    return product_page_ids(open_catalog())
 
 def categorize_validation_results(results):
     """对验证结果进行分类"""
@@ -296,13 +243,21 @@ def main():
     product_ids = get_all_product_ids()
     print(f"   发现 {len(product_ids)} 个产品页面")
 
+    # 所有页面并行检查，每个页面只解析一次
+    paths = [os.path.join(PRODUCTS_DIR, f"{product_id}.html") for product_id in product_ids]
+    try:
+        page_results = check_pages(paths, RULESET)
+    except ValueError as e:
+        print(f"❌ 规则配置错误: {e}")
+        sys.exit(1)
+
     # 验证每个产品
     results = {}
 
-    for i, product_id in enumerate(product_ids, 1):
+    for i, (product_id, path) in enumerate(zip(product_ids, paths), 1):
         print(f"   [{i:2d}/{len(product_ids)}] 验证: {product_id}")
 
-        result = validate_product_page(product_id)
+        result = validate_product_page(product_id, page_results[path])
         results[product_id] = result
 
         # 简单状态显示
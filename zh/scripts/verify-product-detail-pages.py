@@ -10,6 +10,8 @@ import re
 import json
 from pathlib import Path
 
+from image_matcher import ImageMatcher
+
 # 路径配置
 PROJECT_ROOT = r"D:\ai\新建文件夹\新建文件夹\7788"
 PRODUCTS_DIR = os.path.join(PROJECT_ROOT, "products")
@@ -27,9 +29,11 @@ def get_available_images():
 
     return available_images
 
-def analyze_product_page(html_file, available_images):
+def analyze_product_page(html_file, available_images, matcher=None):
     """分析单个产品页面"""
     product_id = Path(html_file).stem
+    if matcher is None:
+        matcher = ImageMatcher(list(available_images))
 
     try:
         with open(html_file, 'r', encoding='utf-8') as f:
@@ -57,7 +61,7 @@ def analyze_product_page(html_file, available_images):
             if img_filename not in available_images:
                 issues.append(f'主图片文件不存在: {img_filename}')
                 # 查找替代图片
-                potential_match = find_best_image_match(product_id, available_images)
+                potential_match = find_best_image_match(product_id, available_images, matcher)
                 if potential_match:
                     recommendations.append({
                         'type': 'replace_main_image',
@@ -110,7 +114,7 @@ def analyze_product_page(html_file, available_images):
     # 5. 推荐图片配置
     if not configured_images or len(configured_images) == 0:
         # 查找该产品的所有相关图片
-        product_images = find_product_images(product_id, available_images)
+        product_images = find_product_images(product_id, available_images, matcher)
         if product_images:
             recommendations.append({
                 'type': 'add_image_configuration',
@@ -144,55 +148,20 @@ def analyze_product_page(html_file, available_images):
         'image_count': len(configured_images)
     }
 
-def find_best_image_match(product_id, available_images):
+def find_best_image_match(product_id, available_images, matcher=None):
     """为产品查找最佳匹配的图片"""
-    # 优先级：official > new > numbered > 其他
-    patterns = [
-        f"{product_id}-official-1.png",
-        f"{product_id}-official-1.jpg",
-        f"{product_id}-new-1.png",
-        f"{product_id}-new-1.jpg",
-        f"{product_id}-1.png",
-        f"{product_id}-1.jpg",
-        f"{product_id}.png",
-        f"{product_id}.jpg"
-    ]
-
-    for pattern in patterns:
-        if pattern in available_images:
-            return available_images[pattern]
-
-    # 模糊匹配
-    for img_name in available_images:
-        if product_id.replace('-', '_') in img_name.replace('-', '_'):
-            return available_images[img_name]
-
-    return None
-
-def find_product_images(product_id, available_images):
-    """查找产品的所有相关图片"""
-    product_images = []
-
-    # 精确匹配
-    for img_name, img_path in available_images.items():
-        img_base = img_name.lower().replace('.png', '').replace('.jpg', '').replace('.jpeg', '')
-
-        if img_base.startswith(product_id.lower()):
-            product_images.append(img_path)
-
-    # 按优先级排序
-    def sort_priority(img_path):
-        filename = os.path.basename(img_path).lower()
-        if 'official' in filename:
-            return 0
-        elif 'new' in filename:
-            return 1
-        elif re.search(r'-\d+\.', filename):
-            return 2
-        else:
-            return 3
+    # 优先级：产品自己的图片（official > new > real > numbered > 其他）> 最相似的其他图片
+    if matcher is None:
+        matcher = ImageMatcher(list(available_images))
+    img_name = matcher.best(product_id)
+    return available_images[img_name] if img_name else None
 
-    product_images.sort(key=sort_priority)
+def find_product_images(product_id, available_images, matcher=None):
+    """查找产品的所有相关图片"""
+    if matcher is None:
+        matcher = ImageMatcher(list(available_images))
+    # 已按 official > new > real > numbered > 其他 排序
+    product_images = [available_images[img_name] for img_name in matcher.for_product(product_id)]
     return product_images[:6]  # 最多6张图片
 
 def fix_product_page(html_file, analysis, available_images):
@@ -288,6 +257,7 @@ def main():
     # 获取可用图片
     available_images = get_available_images()
     print(f"📁 发现 {len(available_images)} 个可用图片")
+    matcher = ImageMatcher(list(available_images))
 
     # 获取所有产品页面
     product_files = glob.glob(os.path.join(PRODUCTS_DIR, "*.html"))
@@ -310,7 +280,7 @@ def main():
         print(f"[{i:2d}/{len(product_files)}] 分析: {product_id}")
 
         # 分析页面
-        analysis = analyze_product_page(html_file, available_images)
+        analysis = analyze_product_page(html_file, available_images, matcher)
         results[analysis['status']].append({
             'product_id': product_id,
             'analysis': analysis
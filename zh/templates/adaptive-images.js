@@ -0,0 +1,169 @@
+/**
+ * 自适应产品图片展示系统
+ * 根据图片资源情况自动调整展示模式
+ * 每个产品使用哪张图片由 scripts/adaptive_images.py 在构建时按图片目录确定：
+ * IMAGE_MAP 为 { 产品ID: 图片地址 }，值为 null 表示该产品没有可用图片；
+ * 页面不再逐张探测图片是否存在，也不会等待探测超时。
+ */
+
+(function() {
+    'use strict';
+
+    const IMAGE_MAP = {{ image_map|safe }};
+    const DEFAULT_IMAGE = {{ default_image|safe }};
+
+    class AdaptiveImageSystem {
+        constructor() {
+            this.imageMap = IMAGE_MAP;
+            this.defaultImage = DEFAULT_IMAGE;
+            this.init();
+        }
+
+        /**
+         * 初始化系统
+         */
+        init() {
+            document.addEventListener('DOMContentLoaded', () => {
+                this.initializeAdaptiveImages();
+            });
+        }
+
+        /**
+         * 初始化所有自适应图片容器
+         */
+        initializeAdaptiveImages() {
+            const containers = document.querySelectorAll('.adaptive-images');
+            containers.forEach(container => {
+                this.setupImageContainer(container);
+            });
+        }
+
+        /**
+         * 设置单个图片容器
+         */
+        setupImageContainer(container) {
+            const productId = container.dataset.productId || 'default';
+
+            // 获取主图元素
+            const mainImage = container.querySelector('.main-image');
+            const statusIndicator = container.querySelector('.image-status');
+            const noImagesPlaceholder = container.querySelector('.no-images-placeholder');
+
+            if (!mainImage) return;
+
+            const imagePath = this.getImagePath(productId);
+            if (!imagePath) {
+                // 无可用图片 - 显示占位符
+                this.showNoImagesState(container, noImagesPlaceholder, statusIndicator);
+                return;
+            }
+
+            this.showLoadingState(statusIndicator, mainImage);
+            this.setupSingleImageMode(container, mainImage, {
+                path: imagePath,
+                name: imagePath.split('/').pop()
+            }, statusIndicator);
+        }
+
+        /**
+         * 产品图片地址：映射中没有的产品使用默认图片，映射值为 null 时返回 null
+         */
+        getImagePath(productId) {
+            return Object.prototype.hasOwnProperty.call(this.imageMap, productId)
+                ? this.imageMap[productId]
+                : this.defaultImage;
+        }
+
+        /**
+         * 显示加载状态
+         */
+        showLoadingState(statusIndicator, mainImage) {
+            if (statusIndicator) {
+                statusIndicator.innerHTML = `
+                    <i class="fas fa-spinner fa-spin"></i>
+                    <span>图片加载中...</span>
+                `;
+                statusIndicator.classList.remove('hidden');
+            }
+            if (mainImage) {
+                mainImage.classList.add('loading');
+            }
+        }
+
+        /**
+         * 显示无图片状态
+         */
+        showNoImagesState(container, placeholder, statusIndicator) {
+            // 隐藏主图和缩略图
+            const mainImageContainer = container.querySelector('.main-image-container');
+            const thumbnailsContainer = container.querySelector('.image-thumbnails-container');
+
+            if (mainImageContainer) mainImageContainer.style.display = 'none';
+            if (thumbnailsContainer) thumbnailsContainer.style.display = 'none';
+
+            // 显示占位符
+            if (placeholder) {
+                placeholder.classList.remove('hidden');
+                placeholder.classList.add('fade-in');
+            }
+
+            // 隐藏状态指示器
+            if (statusIndicator) {
+                statusIndicator.classList.add('hidden');
+            }
+        }
+
+        /**
+         * 设置单图模式
+         */
+        setupSingleImageMode(container, mainImage, imageData, statusIndicator) {
+            container.classList.add('single-image');
+
+            // 图片加载完成后的处理
+            mainImage.onload = () => {
+                mainImage.classList.remove('loading');
+                if (statusIndicator) {
+                    statusIndicator.classList.add('hidden');
+                }
+                mainImage.classList.add('fade-in');
+            };
+
+            mainImage.onerror = () => {
+                this.showNoImagesState(container, container.querySelector('.no-images-placeholder'), statusIndicator);
+            };
+
+            // 设置主图
+            mainImage.src = imageData.path;
+            mainImage.alt = `产品图片 - ${imageData.name}`;
+        }
+
+        /**
+         * 刷新指定产品的图片展示
+         */
+        refreshProduct(productId) {
+            const container = document.querySelector(`[data-product-id="${productId}"]`);
+            if (container) {
+                this.setupImageContainer(container);
+            }
+        }
+
+        /**
+         * 批量刷新所有产品图片
+         */
+        refreshAll() {
+            this.initializeAdaptiveImages();
+        }
+    }
+
+    // 全局实例化
+    window.AdaptiveImageSystem = new AdaptiveImageSystem();
+
+    // 暴露全局方法供外部调用
+    window.refreshProductImages = (productId) => {
+        window.AdaptiveImageSystem.refreshProduct(productId);
+    };
+
+    window.refreshAllProductImages = () => {
+        window.AdaptiveImageSystem.refreshAll();
+    };
+})();
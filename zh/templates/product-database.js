@@ -0,0 +1,172 @@
+/**
+ * 产品技术资料数据库系统
+ * 管理每个产品的技术规格、资料文档等信息
+ * 数据和索引由 scripts/product_database.py 在构建时根据 data/product-database.json 生成：
+ * products 为 [ID, 产品] 列表，names/englishNames 为 [名称, ID] 列表，categories 为 [分类, [ID...]] 列表，
+ * 加载时直接构造为 Map，各查询均为 O(1) 查找。
+ */
+
+(function() {
+    'use strict';
+
+    const DATA = {{ data|safe }};
+
+    function summarize(id, product) {
+        return {
+            id,
+            name: product.name,
+            englishName: product.englishName,
+            category: product.category
+        };
+    }
+
+    class ProductDatabase {
+        constructor() {
+            this.products = new Map(DATA.products);
+            this.byChineseName = new Map(DATA.names);
+            this.byEnglishName = new Map(DATA.englishNames);
+            this.byCategory = new Map(DATA.categories);
+        }
+
+        /**
+         * 获取产品信息
+         */
+        getProduct(productId) {
+            return this.products.get(productId) || null;
+        }
+
+        /**
+         * 获取产品技术规格
+         */
+        getProductSpecifications(productId) {
+            const product = this.getProduct(productId);
+            return product ? product.specifications : null;
+        }
+
+        /**
+         * 获取产品可用文档列表
+         */
+        getAvailableDocuments(productId) {
+            const product = this.getProduct(productId);
+            if (!product || !product.documents) return [];
+
+            return Object.entries(product.documents)
+                .filter(([key, doc]) => doc.available)
+                .map(([key, doc]) => ({
+                    key,
+                    filename: doc.filename,
+                    description: doc.description
+                }));
+        }
+
+        /**
+         * 检查文档是否可用
+         */
+        isDocumentAvailable(productId, documentType) {
+            const product = this.getProduct(productId);
+            if (!product || !product.documents || !product.documents[documentType]) {
+                return false;
+            }
+            return product.documents[documentType].available;
+        }
+
+        /**
+         * 获取产品特点
+         */
+        getProductFeatures(productId) {
+            const product = this.getProduct(productId);
+            return product ? product.features : [];
+        }
+
+        /**
+         * 获取产品应用领域
+         */
+        getProductApplications(productId) {
+            const product = this.getProduct(productId);
+            return product ? product.applications : [];
+        }
+
+        /**
+         * 获取所有产品列表
+         */
+        getAllProducts() {
+            return Array.from(this.products, ([id, product]) => summarize(id, product));
+        }
+
+        /**
+         * 按类别获取产品
+         */
+        getProductsByCategory(category) {
+            return (this.byCategory.get(category) || []).map(id => {
+                const product = this.products.get(id);
+                return { id, name: product.name, englishName: product.englishName };
+            });
+        }
+
+        /**
+         * 根据中文名称获取产品（同名产品取数据文件中的第一个）
+         */
+        getProductByChineseName(chineseName) {
+            const id = this.byChineseName.get(chineseName);
+            return id ? { id, ...this.products.get(id) } : null;
+        }
+
+        /**
+         * 根据英文名称获取产品（不区分大小写）
+         */
+        getProductByEnglishName(englishName) {
+            const id = this.byEnglishName.get(String(englishName).toLowerCase());
+            return id ? { id, ...this.products.get(id) } : null;
+        }
+
+        /**
+         * 搜索产品
+         * 已加载 js/product-search.js 的搜索索引时按索引检索（支持中文片段，结果按相关度排序），
+         * 否则逐条匹配中英文名称
+         */
+        searchProducts(keyword) {
+            const ranked = window.productSearchIndex ? window.productSearchIndex.search(keyword) : null;
+            if (ranked) {
+                return ranked
+                    .filter(result => this.products.has(result.slug))
+                    .map(result => summarize(result.slug, this.products.get(result.slug)));
+            }
+
+            const lowerKeyword = keyword.toLowerCase();
+            const results = [];
+            this.products.forEach((product, id) => {
+                if (product.name.toLowerCase().includes(lowerKeyword) ||
+                    product.englishName.toLowerCase().includes(lowerKeyword)) {
+                    results.push(summarize(id, product));
+                }
+            });
+            return results;
+        }
+
+        /**
+         * 数据库完整性报告
+         * 重复 ID 和缺少基本信息在构建时已检查（存在时构建失败），这里只统计关键产品是否存在
+         */
+        validateProductData() {
+            const criticalProducts = ['insulating-material', 'thermal-insulation-brick', 'wear-resistant-ceramic'];
+            const missing = criticalProducts.filter(id => !this.products.has(id));
+            return {
+                totalProducts: this.products.size,
+                duplicates: 0,
+                missing: missing.length,
+                structureErrors: 0,
+                isValid: true
+            };
+        }
+    }
+
+    // 全局实例化
+    window.ProductDatabase = new ProductDatabase();
+
+    // 暴露常用方法
+    window.getProductInfo = (productId) => window.ProductDatabase.getProduct(productId);
+    window.getProductByName = (chineseName) => window.ProductDatabase.getProductByChineseName(chineseName);
+    window.getProductSpecs = (productId) => window.ProductDatabase.getProductSpecifications(productId);
+    window.getAvailableDocs = (productId) => window.ProductDatabase.getAvailableDocuments(productId);
+    window.isDocAvailable = (productId, docType) => window.ProductDatabase.isDocumentAvailable(productId, docType);
+})();